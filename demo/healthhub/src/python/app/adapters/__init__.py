@@ -1,6 +1,7 @@
 """Adapter implementations for protocols."""
 
 from app.adapters.asyncpg_pool import AsyncPgPoolAdapter
+from app.adapters.instrumented_pool import InstrumentedDatabasePool
 from app.adapters.prometheus_observability import PrometheusObservabilityAdapter
 
-__all__ = ["AsyncPgPoolAdapter", "PrometheusObservabilityAdapter"]
+__all__ = ["AsyncPgPoolAdapter", "InstrumentedDatabasePool", "PrometheusObservabilityAdapter"]
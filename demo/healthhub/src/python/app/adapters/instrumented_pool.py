@@ -0,0 +1,120 @@
+"""Instrumented database pool adapter implementing DatabasePool protocol.
+
+Boundary: OUTSIDE_PROOF
+Target-Language: N/A (assumed correct)
+
+Wraps any DatabasePool and records per-statement metrics (SQL fingerprint
+latency, rows, pool acquire wait, slow-query samples) through effectful's
+QueryInstrumentation. Interpreters keep calling execute/fetch/fetchrow/fetchval
+unchanged, so multi-statement effects such as appointment transitions show
+which statement is slow.
+
+Assumptions:
+- [Library] asyncpg pool query methods acquire, run, and release one connection
+- [Protocol] DatabasePool interface matches asyncpg behavior
+"""
+
+import time
+from collections.abc import Awaitable, Callable
+from typing import AsyncContextManager
+
+import asyncpg
+
+from effectful.observability.query_instrumentation import (
+    QueryInstrumentation,
+    QueryOperation,
+    rows_from_status,
+)
+
+from app.protocols.database import DatabasePool
+
+
+class InstrumentedDatabasePool:
+    """Database pool decorator that instruments every statement.
+
+    Implements DatabasePool protocol via structural typing. Statement methods
+    acquire a connection explicitly so acquire wait and execution time are
+    measured separately. Connections handed out by acquire() are passed through
+    uninstrumented.
+
+    Testing: Mock the wrapped pool with mocker.AsyncMock(spec=DatabasePool)
+    """
+
+    def __init__(self, pool: DatabasePool, instrumentation: QueryInstrumentation) -> None:
+        """Initialize adapter with wrapped pool and shared instrumentation."""
+        self._pool = pool
+        self._instrumentation = instrumentation
+
+    def acquire(self) -> AsyncContextManager[asyncpg.Connection]:
+        """Acquire connection from pool (implements DatabasePool.acquire)."""
+        return self._pool.acquire()
+
+    async def close(self) -> None:
+        """Close the pool (implements DatabasePool.close)."""
+        await self._pool.close()
+
+    async def execute(self, query: str, *args: object) -> str:
+        """Execute query (implements DatabasePool.execute)."""
+        return await self._run(
+            "execute", query, args, lambda conn: conn.execute(query, *args), rows_from_status
+        )
+
+    async def fetch(self, query: str, *args: object) -> list[asyncpg.Record]:
+        """Fetch all rows (implements DatabasePool.fetch)."""
+        return await self._run("fetch", query, args, lambda conn: conn.fetch(query, *args), len)
+
+    async def fetchrow(self, query: str, *args: object) -> asyncpg.Record | None:
+        """Fetch single row (implements DatabasePool.fetchrow)."""
+        return await self._run(
+            "fetchrow",
+            query,
+            args,
+            lambda conn: conn.fetchrow(query, *args),
+            lambda row: 0 if row is None else 1,
+        )
+
+    async def fetchval(self, query: str, *args: object) -> object:
+        """Fetch single value (implements DatabasePool.fetchval)."""
+        return await self._run(
+            "fetchval", query, args, lambda conn: conn.fetchval(query, *args), lambda _: 1
+        )
+
+    async def _run[
+        T
+    ](
+        self,
+        operation: QueryOperation,
+        query: str,
+        args: tuple[object, ...],
+        statement: Callable[[asyncpg.Connection], Awaitable[T]],
+        count_rows: Callable[[T], int | None],
+    ) -> T:
+        """Run one statement on a pooled connection and record its metrics."""
+        acquire_started = time.perf_counter()
+        async with self._pool.acquire() as conn:
+            started = time.perf_counter()
+            try:
+                result = await statement(conn)
+                finished = time.perf_counter()
+            except Exception:
+                await self._instrumentation.record_query(
+                    operation=operation,
+                    query=query,
+                    args=args,
+                    duration_seconds=time.perf_counter() - started,
+                    rows=None,
+                    acquire_wait_seconds=started - acquire_started,
+                    succeeded=False,
+                )
+                raise
+
+        await self._instrumentation.record_query(
+            operation=operation,
+            query=query,
+            args=args,
+            duration_seconds=finished - started,
+            rows=count_rows(result),
+            acquire_wait_seconds=started - acquire_started,
+            succeeded=True,
+        )
+        return result
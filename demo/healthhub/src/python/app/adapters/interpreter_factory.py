@@ -16,12 +16,14 @@ from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
 
 import redis.asyncio as redis
+from effectful.infrastructure.cache import NegativeLookupCache
 
 from app.interpreters.auditing_interpreter import (
     AuditContext,
     AuditedCompositeInterpreter,
 )
 from app.interpreters.composite_interpreter import CompositeInterpreter
+from app.interpreters.healthcare_interpreter import HealthcareLookupMiss
 from app.protocols.database import DatabasePool
 from app.protocols.observability import ObservabilityInterpreter
 from app.protocols.redis_factory import RedisClientFactory
@@ -52,6 +54,7 @@ class ProductionInterpreterFactory:
         database_pool: DatabasePool,
         redis_factory: RedisClientFactory,
         observability_interpreter: ObservabilityInterpreter,
+        negative_cache: NegativeLookupCache[HealthcareLookupMiss] | None = None,
     ) -> None:
         """Initialize interpreter factory with protocol dependencies.
 
@@ -59,10 +62,12 @@ class ProductionInterpreterFactory:
             database_pool: Database pool protocol for data access.
             redis_factory: Factory for creating Redis clients.
             observability_interpreter: Observability interpreter protocol for metrics.
+            negative_cache: Optional cache of lookup misses shared by every interpreter.
         """
         self._database_pool = database_pool
         self._redis_factory = redis_factory
         self._observability_interpreter = observability_interpreter
+        self._negative_cache = negative_cache
 
     @asynccontextmanager
     async def create_composite(self) -> AsyncIterator[CompositeInterpreter]:
@@ -85,6 +90,7 @@ class ProductionInterpreterFactory:
                 pool=self._database_pool,
                 redis_client=redis_client,
                 observability_interpreter=self._observability_interpreter,
+                negative_cache=self._negative_cache,
             )
             yield interpreter
 
@@ -116,6 +122,7 @@ class ProductionInterpreterFactory:
                 pool=self._database_pool,
                 redis_client=redis_client,
                 observability_interpreter=self._observability_interpreter,
+                negative_cache=self._negative_cache,
             )
             audited_interpreter = AuditedCompositeInterpreter(base_interpreter, audit_context)
             yield audited_interpreter
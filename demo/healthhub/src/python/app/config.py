@@ -31,6 +31,10 @@ class Settings(BaseSettings):
     postgres_db: str
     postgres_user: str
     postgres_password: str
+    db_query_instrumentation_enabled: bool = False
+    db_slow_query_threshold_ms: float = 100.0
+    # Remember patient/doctor lookup misses per process; 0 disables
+    negative_lookup_ttl_seconds: float = 0.0
 
     # Redis
     redis_host: str
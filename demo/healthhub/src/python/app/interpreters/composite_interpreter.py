@@ -16,6 +16,8 @@ from __future__ import annotations
 
 from typing import TypeGuard
 
+from effectful.infrastructure.cache import NegativeLookupCache
+
 from app.protocols.database import DatabasePool
 from app.protocols.observability import ObservabilityInterpreter as ObservabilityProtocol
 from app.protocols.redis import RedisClient
@@ -59,7 +61,7 @@ from app.effects.notification import (
     LogAuditEvent,
 )
 from app.effects.observability import IncrementCounter, ObserveHistogram, ObservabilityEffect
-from app.interpreters.healthcare_interpreter import HealthcareInterpreter
+from app.interpreters.healthcare_interpreter import HealthcareInterpreter, HealthcareLookupMiss
 from app.interpreters.notification_interpreter import NotificationInterpreter
 
 
@@ -132,6 +134,7 @@ class CompositeInterpreter:
         pool: DatabasePool,
         redis_client: RedisClient,
         observability_interpreter: ObservabilityProtocol,
+        negative_cache: NegativeLookupCache[HealthcareLookupMiss] | None = None,
     ) -> None:
         """Initialize composite interpreter with protocol implementations.
 
@@ -139,10 +142,11 @@ class CompositeInterpreter:
             pool: Database pool protocol (production or test mock)
             redis_client: Redis client protocol (production or test mock)
             observability_interpreter: Observability interpreter protocol (production or test mock)
+            negative_cache: Optional app-lifetime cache of patient/doctor lookup misses
 
         Testing: Inject pytest-mock mocks with spec=Protocol
         """
-        self.healthcare_interpreter = HealthcareInterpreter(pool)
+        self.healthcare_interpreter = HealthcareInterpreter(pool, negative_cache)
         self.observability_interpreter = observability_interpreter
         self.notification_interpreter = NotificationInterpreter(
             pool, redis_client, self.observability_interpreter
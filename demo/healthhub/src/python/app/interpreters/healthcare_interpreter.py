@@ -89,6 +89,7 @@ from app.domain.lookup_result import (
     UserLookupResult,
     UserMissingByEmail,
 )
+from effectful.infrastructure.cache import NegativeLookupCache
 from effectful.domain.optional_value import (
     Absent,
     OptionalValue,
@@ -134,20 +135,35 @@ from app.repositories.doctor_repository import DoctorRepository
 from app.repositories.patient_repository import PatientRepository
 from app.repositories.user_repository import UserRepository
 
+type HealthcareLookupMiss = (
+    PatientMissingById | PatientMissingByUserId | DoctorMissingById | DoctorMissingByUserId
+)
+"""Not-found lookup results remembered by the optional negative cache."""
+
 
 class HealthcareInterpreter:
     """Interpreter for healthcare effects.
 
     Delegates to repositories and domain services to execute healthcare operations.
+
+    With a negative cache, patient and doctor lookups that found nothing are
+    remembered for the cache's short TTL; CreatePatient forgets the entry
+    for its user. The cache must outlive a single request to be useful.
     """
 
-    def __init__(self, pool: DatabasePool) -> None:
+    def __init__(
+        self,
+        pool: DatabasePool,
+        negative_cache: NegativeLookupCache[HealthcareLookupMiss] | None = None,
+    ) -> None:
         """Initialize interpreter with database pool.
 
         Args:
             pool: Database pool protocol (production or test mock)
+            negative_cache: Optional short-lived cache of patient/doctor misses
         """
         self.pool = pool
+        self.negative_cache = negative_cache
         self.patient_repo = PatientRepository(pool)
         self.doctor_repo = DoctorRepository(pool)
         self.user_repo = UserRepository(pool)
@@ -365,15 +381,25 @@ class HealthcareInterpreter:
     # Patient operations
     async def _get_patient_by_id(self, patient_id: UUID) -> PatientLookupResult:
         """Get patient by ID."""
+        key = f"patient:id:{patient_id}"
+        match await self._remembered_miss(key):
+            case Provided(value=PatientMissingById() as remembered):
+                return remembered
         patient = await self.patient_repo.get_by_id(patient_id)
         match patient:
             case Provided(value=found_patient):
                 return PatientFound(patient=found_patient)
             case Absent():
-                return PatientMissingById(patient_id=patient_id)
+                missing = PatientMissingById(patient_id=patient_id)
+                await self._remember_miss(key, missing)
+                return missing
 
     async def _get_patient_by_user_id(self, user_id: UUID) -> PatientLookupResult:
         """Get patient by user ID."""
+        key = f"patient:user:{user_id}"
+        match await self._remembered_miss(key):
+            case Provided(value=PatientMissingByUserId() as remembered):
+                return remembered
         row = await self.pool.fetchrow(
             """
             SELECT id, user_id, first_name, last_name, date_of_birth,
@@ -386,7 +412,9 @@ class HealthcareInterpreter:
         )
 
         if row is None:
-            return PatientMissingByUserId(user_id=user_id)
+            missing = PatientMissingByUserId(user_id=user_id)
+            await self._remember_miss(key, missing)
+            return missing
 
         return PatientFound(patient=self._row_to_patient(row))
 
@@ -449,6 +477,7 @@ class HealthcareInterpreter:
 
         assert row is not None, "Database insert returned no patient row"
 
+        await self._forget_miss(f"patient:user:{user_id}")
         return self._row_to_patient(row)
 
     async def _update_patient(
@@ -567,21 +596,61 @@ class HealthcareInterpreter:
     # Doctor operations
     async def _get_doctor_by_id(self, doctor_id: UUID) -> DoctorLookupResult:
         """Get doctor by ID."""
+        key = f"doctor:id:{doctor_id}"
+        match await self._remembered_miss(key):
+            case Provided(value=DoctorMissingById() as remembered):
+                return remembered
         doctor = await self.doctor_repo.get_by_id(doctor_id)
         match doctor:
             case Provided(value=found_doctor):
                 return DoctorFound(doctor=found_doctor)
             case Absent():
-                return DoctorMissingById(doctor_id=doctor_id)
+                missing = DoctorMissingById(doctor_id=doctor_id)
+                await self._remember_miss(key, missing)
+                return missing
 
     async def _get_doctor_by_user_id(self, user_id: UUID) -> DoctorLookupResult:
         """Get doctor by user ID."""
+        key = f"doctor:user:{user_id}"
+        match await self._remembered_miss(key):
+            case Provided(value=DoctorMissingByUserId() as remembered):
+                return remembered
         doctor = await self.doctor_repo.get_by_user_id(user_id)
         match doctor:
             case Provided(value=found_doctor):
                 return DoctorFound(doctor=found_doctor)
             case Absent():
-                return DoctorMissingByUserId(user_id=user_id)
+                missing = DoctorMissingByUserId(user_id=user_id)
+                await self._remember_miss(key, missing)
+                return missing
+
+    # Negative cache
+    async def _remembered_miss(self, key: str) -> OptionalValue[HealthcareLookupMiss]:
+        """Look up a remembered not-found result; cache failures count as absent."""
+        if self.negative_cache is None:
+            return Absent(reason="negative_cache_disabled")
+        try:
+            return await self.negative_cache.get_miss(key)
+        except Exception:
+            return Absent(reason="negative_cache_unavailable")
+
+    async def _remember_miss(self, key: str, missing: HealthcareLookupMiss) -> None:
+        """Remember a not-found result (best effort)."""
+        if self.negative_cache is None:
+            return
+        try:
+            await self.negative_cache.put_miss(key, missing)
+        except Exception:
+            pass
+
+    async def _forget_miss(self, key: str) -> None:
+        """Forget a not-found result for a record that now exists (best effort)."""
+        if self.negative_cache is None:
+            return
+        try:
+            await self.negative_cache.forget(key)
+        except Exception:
+            pass
 
     async def _get_user_by_email(self, email: str) -> UserLookupResult:
         """Get user by email."""
@@ -9,15 +9,22 @@ from typing import AsyncIterator
 
 from fastapi import FastAPI
 
+from effectful.adapters.negative_cache import InMemoryNegativeCache
+from effectful.adapters.prometheus_metrics import PrometheusMetricsCollector
 from effectful.algebraic.result import Err, Ok
 from effectful.effects.runtime import ResourceHandle
+from effectful.observability.framework_metrics import FRAMEWORK_METRICS
+from effectful.observability.query_instrumentation import QueryInstrumentation
 from effectful.programs.runners import run_ws_program
 
 from app.config import Settings
 from app.container import ApplicationContainer
 from app.adapters.asyncpg_pool import AsyncPgPoolAdapter
+from app.adapters.instrumented_pool import InstrumentedDatabasePool
 from app.adapters.interpreter_factory import ProductionInterpreterFactory
+from app.interpreters.healthcare_interpreter import HealthcareLookupMiss
 from app.interpreters.runtime_interpreter import build_runtime_interpreter
+from app.protocols.database import DatabasePool
 from app.programs.startup import (
     HandleTypeMismatch,
     RouterSpec,
@@ -36,6 +43,11 @@ from app.api import (
     invoices_router,
 )
 
+# Per-statement SQL metrics share the default Prometheus registry with /metrics.
+# One collector per process: prometheus_client rejects a second registration of
+# the same metric names, so every app and lifespan reuses this one.
+_QUERY_METRICS_COLLECTOR = PrometheusMetricsCollector()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -120,13 +132,30 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             raise StartupFailure(error)
 
     # Create protocol adapters
-    database_pool_adapter = AsyncPgPoolAdapter(pool)
+    database_pool_adapter: DatabasePool = AsyncPgPoolAdapter(pool)
+    if settings.db_query_instrumentation_enabled:
+        # Idempotent: a later lifespan finds the metrics already registered
+        await _QUERY_METRICS_COLLECTOR.register_metrics(FRAMEWORK_METRICS)
+        database_pool_adapter = InstrumentedDatabasePool(
+            database_pool_adapter,
+            QueryInstrumentation(
+                _QUERY_METRICS_COLLECTOR,
+                slow_query_threshold_seconds=settings.db_slow_query_threshold_ms / 1000,
+            ),
+        )
+
+    negative_cache: InMemoryNegativeCache[HealthcareLookupMiss] | None = (
+        InMemoryNegativeCache(ttl_seconds=settings.negative_lookup_ttl_seconds)
+        if settings.negative_lookup_ttl_seconds > 0
+        else None
+    )
 
     # Create factories
     interpreter_factory = ProductionInterpreterFactory(
         database_pool=database_pool_adapter,
         redis_factory=redis_factory,
         observability_interpreter=observability_adapter,
+        negative_cache=negative_cache,
     )
 
     # Create container with protocol implementations
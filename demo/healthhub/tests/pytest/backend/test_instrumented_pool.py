@@ -0,0 +1,80 @@
+"""Unit tests for InstrumentedDatabasePool.
+
+Tests that statements run on an explicitly acquired connection and that
+per-statement metrics are recorded through QueryInstrumentation.
+"""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import asyncpg
+import pytest
+from pytest_mock import MockerFixture
+
+from effectful.observability.query_instrumentation import QueryInstrumentation
+
+from app.adapters.instrumented_pool import InstrumentedDatabasePool
+from app.protocols.database import DatabasePool
+
+
+def _pool_with_connection(mocker: MockerFixture, conn: asyncpg.Connection) -> DatabasePool:
+    """Build a mocked DatabasePool whose acquire() yields conn."""
+
+    @asynccontextmanager
+    async def acquire() -> AsyncIterator[asyncpg.Connection]:
+        yield conn
+
+    pool = mocker.AsyncMock(spec=DatabasePool)
+    pool.acquire = mocker.MagicMock(side_effect=acquire)
+    return pool
+
+
+class TestInstrumentedDatabasePool:
+    """Test per-statement instrumentation of the database pool."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_records_rows_and_acquire_wait(self, mocker: MockerFixture) -> None:
+        """fetch returns the driver result and records its row count."""
+        conn = mocker.AsyncMock(spec=asyncpg.Connection)
+        conn.fetch.return_value = [mocker.MagicMock(), mocker.MagicMock()]
+        instrumentation = mocker.AsyncMock(spec=QueryInstrumentation)
+        pool = InstrumentedDatabasePool(_pool_with_connection(mocker, conn), instrumentation)
+
+        rows = await pool.fetch("SELECT * FROM patients WHERE doctor_id = $1", "doctor")
+
+        assert len(rows) == 2
+        conn.fetch.assert_awaited_once_with("SELECT * FROM patients WHERE doctor_id = $1", "doctor")
+        recorded = instrumentation.record_query.call_args.kwargs
+        assert recorded["operation"] == "fetch"
+        assert recorded["args"] == ("doctor",)
+        assert recorded["rows"] == 2
+        assert recorded["acquire_wait_seconds"] >= 0.0
+        assert recorded["succeeded"] is True
+
+    @pytest.mark.asyncio
+    async def test_execute_counts_affected_rows(self, mocker: MockerFixture) -> None:
+        """execute reads the affected-row count from the status tag."""
+        conn = mocker.AsyncMock(spec=asyncpg.Connection)
+        conn.execute.return_value = "UPDATE 3"
+        instrumentation = mocker.AsyncMock(spec=QueryInstrumentation)
+        pool = InstrumentedDatabasePool(_pool_with_connection(mocker, conn), instrumentation)
+
+        status = await pool.execute("UPDATE appointments SET status = $1", "confirmed")
+
+        assert status == "UPDATE 3"
+        assert instrumentation.record_query.call_args.kwargs["rows"] == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_statement_recorded_and_reraised(self, mocker: MockerFixture) -> None:
+        """A driver error is recorded as a failed statement and propagated."""
+        conn = mocker.AsyncMock(spec=asyncpg.Connection)
+        conn.fetchrow.side_effect = asyncpg.PostgresError("boom")
+        instrumentation = mocker.AsyncMock(spec=QueryInstrumentation)
+        pool = InstrumentedDatabasePool(_pool_with_connection(mocker, conn), instrumentation)
+
+        with pytest.raises(asyncpg.PostgresError):
+            await pool.fetchrow("SELECT * FROM invoices WHERE id = $1", "invoice")
+
+        recorded = instrumentation.record_query.call_args.kwargs
+        assert recorded["succeeded"] is False
+        assert recorded["rows"] is None
@@ -24,6 +24,13 @@ class _StubSettings:
     redis_port = 6379
     redis_db = 0
     frontend_build_path = "/tmp/frontend"
+    db_query_instrumentation_enabled = False
+    db_slow_query_threshold_ms = 100.0
+    negative_lookup_ttl_seconds = 0.0
+
+
+class _InstrumentedStubSettings(_StubSettings):
+    db_query_instrumentation_enabled = True
 
 
 class _FakeObservability:
@@ -69,6 +76,30 @@ async def test_lifespan_stores_handles_and_runs_shutdown(monkeypatch: pytest.Mon
     assert calls == ["startup", "shutdown"]
 
 
+@pytest.mark.asyncio
+async def test_lifespan_registers_query_metrics_once_per_process(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    startup_assembly = StartupAssembly(
+        app_handle=ResourceHandle(kind="app", resource=object()),
+        database_pool=ResourceHandle(kind="database_pool", resource=object()),
+        redis_factory=ResourceHandle(kind="redis_factory", resource=object()),
+        observability=ResourceHandle(kind="observability", resource=_FakeObservability()),
+    )
+
+    async def fake_run(program: object, interpreter: object) -> Ok[StartupAssembly]:
+        return Ok(startup_assembly)
+
+    monkeypatch.setattr(main, "Settings", _InstrumentedStubSettings)
+    monkeypatch.setattr(main, "build_runtime_interpreter", lambda: object())
+    monkeypatch.setattr(main, "run_ws_program", fake_run)
+
+    # Two apps in one process must not register the SQL metrics twice
+    for app_instance in (FastAPI(lifespan=main.lifespan), FastAPI(lifespan=main.lifespan)):
+        async with main.lifespan(app_instance):
+            assert app_instance.state.container.database_pool is not None
+
+
 @pytest.mark.asyncio
 async def test_lifespan_raises_on_startup_err(monkeypatch: pytest.MonkeyPatch) -> None:
     async def fake_run(program: object, interpreter: object) -> Err[str]:
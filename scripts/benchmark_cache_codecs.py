@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark cache codecs on ProfileData and large byte values.
+
+Compares the legacy JSON/raw format with the binary CacheCodec format,
+uncompressed and compressed, reporting stored size and encode/decode time.
+
+Usage:
+    PYTHONPATH=src/python python scripts/benchmark_cache_codecs.py [--iterations N]
+"""
+
+import argparse
+import json
+import timeit
+from collections.abc import Callable
+from uuid import uuid4
+
+from effectful.adapters.cache_codecs import ZSTD_AVAILABLE, CacheCodec
+from effectful.domain.profile import ProfileData
+
+
+def _codecs() -> dict[str, CacheCodec]:
+    """Codec variants to compare, keyed by display name."""
+    variants = {
+        "legacy": CacheCodec(binary_writes=False),
+        "binary": CacheCodec(compression="none"),
+        "binary+zlib": CacheCodec(compression="zlib", compress_threshold_bytes=512),
+    }
+    if ZSTD_AVAILABLE:
+        variants["binary+zstd"] = CacheCodec(compression="zstd", compress_threshold_bytes=512)
+    return variants
+
+
+def _large_value() -> bytes:
+    """A ~64 KiB JSON document resembling a cached list response."""
+    rows = [{"id": str(uuid4()), "name": f"User {i}", "active": i % 3 == 0} for i in range(800)]
+    return json.dumps(rows).encode("utf-8")
+
+
+def _time_us(fn: Callable[[], object], iterations: int) -> float:
+    """Mean microseconds per call over the best of three runs."""
+    return min(timeit.repeat(fn, number=iterations, repeat=3)) / iterations * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    profile = ProfileData(id=str(uuid4()), name="Alice Smith")
+    large = _large_value()
+    large_iterations = max(1, args.iterations // 100)
+
+    print(f"{'payload':<10} {'codec':<12} {'bytes':>8} {'encode us':>10} {'decode us':>10}")
+    for name, codec in _codecs().items():
+        encoded_profile = codec.encode_profile(profile)
+        print(
+            f"{'profile':<10} {name:<12} {len(encoded_profile):>8} "
+            f"{_time_us(lambda: codec.encode_profile(profile), args.iterations):>10.2f} "
+            f"{_time_us(lambda: codec.decode_profile(encoded_profile), args.iterations):>10.2f}"
+        )
+    for name, codec in _codecs().items():
+        encoded_value = codec.encode_value(large)
+        print(
+            f"{'64k value':<10} {name:<12} {len(encoded_value):>8} "
+            f"{_time_us(lambda: codec.encode_value(large), large_iterations):>10.2f} "
+            f"{_time_us(lambda: codec.decode_value(encoded_value), large_iterations):>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
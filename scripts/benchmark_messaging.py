@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Benchmark message throughput through MessagingInterpreter.
+
+Publishes messages with PublishMessages and consumes them with ConsumeBatch
+and cumulative AcknowledgeBatch, all on the in-process broker, reporting
+messages per second for each phase.
+
+Usage:
+    PYTHONPATH=src/python python scripts/benchmark_messaging.py [--messages N] [--batch N]
+"""
+
+import argparse
+import asyncio
+import time
+
+from effectful.adapters.in_memory_messaging import (
+    InMemoryBroker,
+    InMemoryMessageConsumer,
+    InMemoryMessageProducer,
+)
+from effectful.algebraic.effect_return import EffectReturn
+from effectful.algebraic.result import Ok
+from effectful.effects.messaging import AcknowledgeBatch, ConsumeBatch, PublishMessages
+from effectful.interpreters.messaging import MessagingInterpreter
+
+_SUBSCRIPTION = "bench/consumers"
+
+
+async def _publish(interpreter: MessagingInterpreter, messages: int, batch: int) -> float:
+    """Publish messages in batches; return elapsed seconds."""
+    payloads = [b"x" * 256] * batch
+    started = time.perf_counter()
+    for _ in range(messages // batch):
+        await interpreter.interpret(PublishMessages(topic="bench", payloads=payloads))
+    return time.perf_counter() - started
+
+
+async def _consume(interpreter: MessagingInterpreter, messages: int, batch: int) -> float:
+    """Consume and acknowledge messages in batches; return elapsed seconds."""
+    received = 0
+    started = time.perf_counter()
+    while received < messages:
+        result = await interpreter.interpret(
+            ConsumeBatch(subscription=_SUBSCRIPTION, max_messages=batch, max_wait_ms=0)
+        )
+        match result:
+            case Ok(EffectReturn(value=tuple() as envelopes, effect_name=_)) if envelopes:
+                received += len(envelopes)
+                await interpreter.interpret(
+                    AcknowledgeBatch(message_ids=[envelopes[-1].message_id], cumulative=True)
+                )
+            case _:
+                break
+    return time.perf_counter() - started
+
+
+async def _run(messages: int, batch: int) -> None:
+    """Run both phases and print a results table."""
+    broker = InMemoryBroker()
+    interpreter = MessagingInterpreter(
+        producer=InMemoryMessageProducer(broker), consumer=InMemoryMessageConsumer(broker)
+    )
+    # Create the subscription first so messages fan out to it as they are published
+    await interpreter.interpret(
+        ConsumeBatch(subscription=_SUBSCRIPTION, max_messages=1, max_wait_ms=0)
+    )
+    total = messages // batch * batch
+
+    print(f"{'phase':<10} {'messages':>10} {'seconds':>9} {'msg/s':>12}")
+    for phase, elapsed in (
+        ("publish", await _publish(interpreter, total, batch)),
+        ("consume", await _consume(interpreter, total, batch)),
+    ):
+        print(f"{phase:<10} {total:>10} {elapsed:>9.2f} {total / elapsed:>12,.0f}")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(_run(args.messages, args.batch))
+
+
+if __name__ == "__main__":
+    main()
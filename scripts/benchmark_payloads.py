@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark large-payload handling with and without copies.
+
+For 1, 5 and 10 MB payloads, compares slicing a MessageEnvelope payload as
+bytes against slicing payload_view, and uploading the slice through
+S3ObjectStorage.put_object, reporting microseconds per operation and peak
+bytes allocated (tracemalloc) for each variant. The S3 client reads the
+request body in 1 MB chunks, as botocore does when streaming an upload, and
+discards it, so no network is involved.
+
+Usage:
+    PYTHONPATH=src/python python scripts/benchmark_payloads.py [--repeat N]
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from collections.abc import Buffer, Callable
+from datetime import UTC, datetime
+from typing import IO
+
+from effectful.adapters.s3_storage import S3ObjectStorage
+from effectful.domain.message_envelope import MessageEnvelope
+from effectful.domain.optional_value import Absent
+
+_HEADER = 64
+_SIZES_MB = (1, 5, 10)
+_CHUNK = 1024 * 1024
+
+
+class _DiscardingClient:
+    """S3 client stand-in that reads and drops the request body."""
+
+    def put_object(self, *, Bucket: str, Key: str, Body: bytes | IO[bytes]) -> dict[str, str]:
+        if isinstance(Body, bytes | bytearray):
+            return {}
+        while Body.read(_CHUNK):
+            pass
+        return {}
+
+
+def _measure(operation: Callable[[], object], repeat: int) -> tuple[float, int]:
+    """Return (microseconds per call, peak bytes allocated by one call)."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        operation()
+    elapsed = (time.perf_counter() - started) / repeat * 1e6
+
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def _upload(storage: S3ObjectStorage, slice_body: Callable[[], Buffer]) -> Callable[[], object]:
+    """Operation slicing the payload and uploading the slice."""
+    return lambda: asyncio.run(
+        storage.put_object("bench", "blob", slice_body(), Absent(), Absent())
+    )
+
+
+def main() -> None:
+    """Parse arguments and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    storage = S3ObjectStorage(_DiscardingClient())  # type: ignore[arg-type]
+
+    print(f"{'size':>6} {'operation':<22} {'us/op':>10} {'allocated':>12}")
+    for size_mb in _SIZES_MB:
+        envelope = MessageEnvelope(
+            message_id="m",
+            payload=bytes(size_mb * 1024 * 1024),
+            properties={},
+            publish_time=datetime.now(UTC),
+            topic="blobs",
+        )
+        for name, operation in (
+            ("slice bytes", lambda: envelope.payload[_HEADER:]),
+            ("slice payload_view", lambda: envelope.payload_view[_HEADER:]),
+            ("upload bytes slice", _upload(storage, lambda: envelope.payload[_HEADER:])),
+            ("upload view slice", _upload(storage, lambda: envelope.payload_view[_HEADER:])),
+        ):
+            elapsed, peak = _measure(operation, args.repeat)
+            print(f"{size_mb:>4}MB {name:<22} {elapsed:>10.1f} {peak:>12,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,7 @@ Public API organized by category:
 
 1. Core Program Execution:
    - run_ws_program: Execute effect programs to completion
+   - MessageWorker: Run a program per message from a subscription
 
 2. Result Types (Algebraic Data Types):
    - Ok, Err: Result[T, E] constructors for explicit error handling
@@ -57,6 +58,7 @@ See README.md and documents/ for comprehensive guides and tutorials.
 # Infrastructure adapters - Real implementations
 from effectful.adapters.postgres import (
     PostgresChatMessageRepository,
+    PostgresTransactionManager,
     PostgresUserRepository,
 )
 from effectful.adapters.redis_cache import RedisProfileCache
@@ -90,9 +92,11 @@ from effectful.domain.token_result import (
 
 # Domain models - Messaging
 from effectful.domain.message_envelope import (
+    ConsumeBatchResult,
     ConsumeResult,
     ConsumeTimeout,
     MessageEnvelope,
+    MessageValue,
     PublishFailure,
     PublishResult,
     PublishSuccess,
@@ -109,18 +113,27 @@ from effectful.domain.s3_object import (
 # Domain models - User
 from effectful.domain.user import (
     User,
+    UserEmailExists,
     UserFound,
     UserLookupResult,
     UserNotFound,
+    UserUpdateResult,
+    UserUpsertResult,
+    UserVersionConflict,
 )
 
 # Effect definitions - Cache
 from effectful.effects.cache import (
     GetCachedProfile,
     GetCachedValue,
+    GetCachedValues,
+    GetOrCompute,
     InvalidateCache,
+    InvalidateMany,
+    InvalidateTag,
     PutCachedProfile,
     PutCachedValue,
+    PutCachedValues,
 )
 
 # Effect definitions - Database
@@ -131,7 +144,10 @@ from effectful.effects.database import (
     ListMessagesForUser,
     ListUsers,
     SaveChatMessage,
+    Transaction,
     UpdateUser,
+    UpdateUserIf,
+    UpsertUser,
 )
 
 # Effect definitions - Auth
@@ -147,10 +163,14 @@ from effectful.effects.auth import (
 
 # Effect definitions - Messaging
 from effectful.effects.messaging import (
+    AcknowledgeBatch,
     AcknowledgeMessage,
+    ConsumeBatch,
     ConsumeMessage,
     NegativeAcknowledge,
     PublishMessage,
+    PublishMessages,
+    PublishValue,
 )
 
 # Effect definitions - Storage
@@ -173,10 +193,12 @@ from effectful.effects.websocket import (
     SendText,
 )
 from effectful.infrastructure.auth import AuthService
-from effectful.infrastructure.cache import ProfileCache
+from effectful.infrastructure.cache import CacheLock, NegativeLookupCache, ProfileCache
 from effectful.infrastructure.messaging import MessageConsumer, MessageProducer
 from effectful.infrastructure.repositories import (
     ChatMessageRepository,
+    TransactionManager,
+    UnitOfWork,
     UserRepository,
 )
 from effectful.infrastructure.storage import ObjectStorage
@@ -204,11 +226,15 @@ from effectful.interpreters.errors import (
     WebSocketClosedError,
 )
 from effectful.interpreters.messaging import MessagingInterpreter
+from effectful.interpreters.read_through import ReadThroughCacheInterpreter
 from effectful.interpreters.storage import StorageInterpreter
 
 # Interpreters - Individual (for testing/customization)
 from effectful.interpreters.websocket import WebSocketInterpreter
 
+# Message processing runtime
+from effectful.programs.message_worker import MessageWorker
+
 # Program types
 from effectful.programs.program_types import (
     AllEffects,
@@ -220,6 +246,7 @@ from effectful.programs.runners import run_ws_program
 __all__ = [
     # Core execution
     "run_ws_program",
+    "MessageWorker",
     # Result types
     "Ok",
     "Err",
@@ -241,6 +268,11 @@ __all__ = [
     "GetCachedValue",
     "PutCachedValue",
     "InvalidateCache",
+    "GetCachedValues",
+    "PutCachedValues",
+    "InvalidateMany",
+    "InvalidateTag",
+    "GetOrCompute",
     # Database effects
     "GetUserById",
     "SaveChatMessage",
@@ -249,10 +281,17 @@ __all__ = [
     "CreateUser",
     "UpdateUser",
     "DeleteUser",
+    "UpsertUser",
+    "UpdateUserIf",
+    "Transaction",
     # Messaging effects
     "PublishMessage",
+    "PublishMessages",
+    "PublishValue",
     "ConsumeMessage",
+    "ConsumeBatch",
     "AcknowledgeMessage",
+    "AcknowledgeBatch",
     "NegativeAcknowledge",
     # Storage effects
     "GetObject",
@@ -279,6 +318,8 @@ __all__ = [
     "MessageEnvelope",
     "ConsumeTimeout",
     "ConsumeResult",
+    "ConsumeBatchResult",
+    "MessageValue",
     "PublishSuccess",
     "PublishFailure",
     "PublishResult",
@@ -301,12 +342,17 @@ __all__ = [
     "UserFound",
     "UserNotFound",
     "UserLookupResult",
+    "UserVersionConflict",
+    "UserUpdateResult",
+    "UserEmailExists",
+    "UserUpsertResult",
     # Interpreters
     "create_composite_interpreter",
     "AuthInterpreter",
     "CacheInterpreter",
     "DatabaseInterpreter",
     "MessagingInterpreter",
+    "ReadThroughCacheInterpreter",
     "StorageInterpreter",
     "WebSocketInterpreter",
     # Errors
@@ -328,7 +374,11 @@ __all__ = [
     "WebSocketConnection",
     "UserRepository",
     "ChatMessageRepository",
+    "TransactionManager",
+    "UnitOfWork",
     "ProfileCache",
+    "CacheLock",
+    "NegativeLookupCache",
     "AuthService",
     "MessageProducer",
     "MessageConsumer",
@@ -336,6 +386,7 @@ __all__ = [
     # Infrastructure adapters (real implementations)
     "PostgresUserRepository",
     "PostgresChatMessageRepository",
+    "PostgresTransactionManager",
     "RedisProfileCache",
     "RealWebSocketConnection",
 ]
@@ -2,23 +2,71 @@
 
 This module provides production-ready implementations of the infrastructure protocols:
 - PostgreSQL repositories using asyncpg
+- Group-commit batching for chat message writes
+- Indexed in-memory repositories for load and benchmark runs
+- In-process message broker for load and benchmark runs
+- Message payload codecs selectable per topic
 - Redis cache using redis-py
+- Compact binary codecs for cached values
+- Two-tier cache with an in-process L1 in front of Redis
+- In-process negative cache for not-found lookups
+- Metrics-emitting cache decorator with a hot-key sampler
 - WebSocket connections using websockets library
 
 These adapters are the "real" implementations that connect to actual infrastructure.
 For testing, use pytest mocks (mocker.AsyncMock) instead of custom fakes.
 """
 
+from effectful.adapters.cache_codecs import CacheCodec
+from effectful.adapters.chat_message_batcher import BatchingChatMessageRepository
+from effectful.adapters.in_memory_messaging import (
+    InMemoryBroker,
+    InMemoryMessageConsumer,
+    InMemoryMessageProducer,
+)
+from effectful.adapters.in_memory_repositories import (
+    InMemoryChatMessageRepository,
+    InMemoryUserRepository,
+)
+from effectful.adapters.instrumented_cache import HotKeySampler, InstrumentedProfileCache
+from effectful.adapters.message_codecs import (
+    JsonMessageCodec,
+    MsgpackMessageCodec,
+    SchemaTaggedCodec,
+    TopicCodecRegistry,
+)
+from effectful.adapters.negative_cache import InMemoryNegativeCache
 from effectful.adapters.postgres import (
     PostgresChatMessageRepository,
+    PostgresTransactionManager,
     PostgresUserRepository,
+    migrate_users_version,
 )
-from effectful.adapters.redis_cache import RedisProfileCache
+from effectful.adapters.redis_cache import RedisCacheLock, RedisProfileCache
+from effectful.adapters.tiered_cache import TieredProfileCache
 from effectful.adapters.websocket_connection import RealWebSocketConnection
 
 __all__ = [
     "PostgresUserRepository",
     "PostgresChatMessageRepository",
+    "PostgresTransactionManager",
+    "migrate_users_version",
+    "BatchingChatMessageRepository",
+    "InMemoryUserRepository",
+    "InMemoryChatMessageRepository",
+    "InMemoryBroker",
+    "InMemoryMessageProducer",
+    "InMemoryMessageConsumer",
+    "JsonMessageCodec",
+    "MsgpackMessageCodec",
+    "SchemaTaggedCodec",
+    "TopicCodecRegistry",
     "RedisProfileCache",
+    "RedisCacheLock",
+    "CacheCodec",
+    "TieredProfileCache",
+    "InMemoryNegativeCache",
+    "InstrumentedProfileCache",
+    "HotKeySampler",
     "RealWebSocketConnection",
 ]
@@ -0,0 +1,254 @@
+"""Compact binary codecs for cached values.
+
+This module provides CacheCodec, which serializes ProfileData and raw byte
+values for cache adapters such as RedisProfileCache.
+
+Binary payloads start with a 3-byte header so readers can tell them apart from
+legacy JSON and from future formats:
+
+    byte 0   MAGIC (0xEC, never the first byte of a JSON document)
+    byte 1   FORMAT_VERSION
+    byte 2   flags: bits 0-1 compression (0 none, 1 zlib, 2 zstd),
+             bit 2 profile id packed as a 16-byte UUID
+    byte 3+  body (compressed when the flags say so)
+
+A ProfileData body is the id (16 raw UUID bytes, or a 2-byte length and UTF-8
+text when the id is not a canonical UUID) followed by the UTF-8 name. Bodies
+of at least compress_threshold_bytes are compressed with zstd when the
+zstandard package is installed, and zlib otherwise.
+
+Rollout: every codec reads legacy and binary payloads, but only writes binary
+when binary_writes is True. Deploy with binary_writes=False first, then enable
+it once no instance runs a codec-unaware reader.
+
+A codec never writes a raw value starting with MAGIC, so every payload it
+writes is read back unchanged: with binary_writes=False such values (e.g.
+UTF-8 text starting with U+C000-U+CFFF) are framed anyway, uncompressed.
+Legacy values written without a codec that start with MAGIC are ambiguous
+and are decoded as frames.
+
+Example:
+    >>> codec = CacheCodec(binary_writes=True, compress_threshold_bytes=512)
+    >>> cache = RedisProfileCache(redis_client, codec=codec)
+"""
+
+import importlib.util
+import json
+import struct
+import zlib
+from typing import Literal
+
+from effectful.domain.profile import ProfileData
+
+MAGIC = 0xEC
+FORMAT_VERSION = 1
+
+_MAGIC_BYTE = bytes([MAGIC])
+
+type Compression = Literal["auto", "none", "zlib", "zstd"]
+
+_HEADER = struct.Struct("!BBB")
+_ID_LENGTH = struct.Struct("!H")
+_COMPRESSION_MASK = 0b011
+_FLAG_UUID_ID = 0b100
+_COMPRESSION_IDS: dict[Literal["none", "zlib", "zstd"], int] = {"none": 0, "zlib": 1, "zstd": 2}
+
+ZSTD_AVAILABLE = importlib.util.find_spec("zstandard") is not None
+
+
+class UnsupportedCacheFormat(ValueError):
+    """Cached payload was written in a format this codec cannot read.
+
+    Raised for a newer FORMAT_VERSION or an unavailable compression, so
+    adapters can treat the entry as a miss instead of failing the lookup.
+    """
+
+
+class CacheCodec:
+    """Encoder/decoder for cached profiles and byte values.
+
+    Attributes:
+        _binary_writes: Whether encode_* emits the binary format (else legacy)
+        _compression: Compression used for bodies above the threshold
+        _compress_threshold_bytes: Smallest body size worth compressing
+        _level: Compression level (zlib 1-9, zstd 1-22)
+    """
+
+    def __init__(
+        self,
+        binary_writes: bool = True,
+        compression: Compression = "auto",
+        compress_threshold_bytes: int = 1024,
+        level: int = 3,
+    ) -> None:
+        """Initialize codec.
+
+        Args:
+            binary_writes: Write the binary format; False keeps writing legacy
+                JSON profiles and raw values while still reading both
+            compression: "auto" picks zstd when installed, otherwise zlib
+            compress_threshold_bytes: Compress bodies at least this large (>= 0)
+            level: Compression level
+
+        Raises:
+            ValueError: If compress_threshold_bytes < 0
+            ImportError: If compression="zstd" and zstandard is not installed
+        """
+        if compress_threshold_bytes < 0:
+            raise ValueError(
+                f"compress_threshold_bytes must be >= 0, got {compress_threshold_bytes}"
+            )
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise ImportError(
+                "zstd compression requires the zstandard library. "
+                "Install with: pip install zstandard"
+            )
+
+        self._binary_writes = binary_writes
+        self._compression: Literal["none", "zlib", "zstd"] = (
+            ("zstd" if ZSTD_AVAILABLE else "zlib") if compression == "auto" else compression
+        )
+        self._compress_threshold_bytes = compress_threshold_bytes
+        self._level = level
+
+    def encode_profile(self, profile: ProfileData) -> bytes:
+        """Serialize a profile for storage.
+
+        Args:
+            profile: ProfileData to serialize
+
+        Returns:
+            Binary payload, or legacy JSON when binary_writes is False
+        """
+        if not self._binary_writes:
+            return json.dumps({"id": profile.id, "name": profile.name}).encode("utf-8")
+
+        name = profile.name.encode("utf-8")
+        packed_id = _pack_uuid(profile.id)
+        if packed_id is not None:
+            return self._frame(packed_id + name, _FLAG_UUID_ID)
+
+        encoded_id = profile.id.encode("utf-8")
+        return self._frame(_ID_LENGTH.pack(len(encoded_id)) + encoded_id + name, 0)
+
+    def decode_profile(self, data: bytes | str) -> ProfileData:
+        """Deserialize a stored profile (binary or legacy JSON).
+
+        Args:
+            data: Stored payload
+
+        Returns:
+            The decoded ProfileData
+
+        Raises:
+            UnsupportedCacheFormat: If the payload uses an unknown format
+        """
+        if isinstance(data, str) or not _is_framed(data):
+            profile_dict = json.loads(data)
+            return ProfileData(id=profile_dict["id"], name=profile_dict["name"])
+
+        flags, body = self._unframe(data)
+        if flags & _FLAG_UUID_ID:
+            return ProfileData(id=_unpack_uuid(body[:16]), name=body[16:].decode("utf-8"))
+
+        (id_length,) = _ID_LENGTH.unpack_from(body)
+        id_end = _ID_LENGTH.size + id_length
+        return ProfileData(
+            id=body[_ID_LENGTH.size : id_end].decode("utf-8"),
+            name=body[id_end:].decode("utf-8"),
+        )
+
+    def encode_value(self, value: bytes) -> bytes:
+        """Serialize a raw byte value, compressing it above the threshold.
+
+        Args:
+            value: Bytes to store
+
+        Returns:
+            Binary payload, or value unchanged when binary_writes is False
+            (unless it starts with MAGIC, which only a frame may)
+        """
+        if not self._binary_writes:
+            return self._frame(value, 0, compress=False) if value[:1] == _MAGIC_BYTE else value
+        return self._frame(value, 0)
+
+    def decode_value(self, data: bytes | str) -> bytes:
+        """Deserialize a stored byte value (binary or legacy raw bytes).
+
+        Args:
+            data: Stored payload
+
+        Returns:
+            The original bytes
+
+        Raises:
+            UnsupportedCacheFormat: If the payload uses an unknown format
+        """
+        if isinstance(data, str):
+            return data.encode("utf-8")
+        if not _is_framed(data):
+            return data
+        _, body = self._unframe(data)
+        return body
+
+    def _frame(self, body: bytes, flags: int, compress: bool = True) -> bytes:
+        """Prefix body with the header, compressing it when large enough."""
+        compression: Literal["none", "zlib", "zstd"] = (
+            self._compression
+            if compress and len(body) >= self._compress_threshold_bytes
+            else "none"
+        )
+        match compression:
+            case "zlib":
+                body = zlib.compress(body, self._level)
+            case "zstd":
+                import zstandard
+
+                body = zstandard.ZstdCompressor(level=self._level).compress(body)
+            case "none":
+                pass
+        return _HEADER.pack(MAGIC, FORMAT_VERSION, flags | _COMPRESSION_IDS[compression]) + body
+
+    def _unframe(self, data: bytes) -> tuple[int, bytes]:
+        """Validate the header and return (flags, decompressed body)."""
+        _, version, flags = _HEADER.unpack_from(data)
+        if version != FORMAT_VERSION:
+            raise UnsupportedCacheFormat(f"Unsupported cache format version {version}")
+
+        body = data[_HEADER.size :]
+        match flags & _COMPRESSION_MASK:
+            case 0:
+                return flags, body
+            case 1:
+                return flags, zlib.decompress(body)
+            case 2 if ZSTD_AVAILABLE:
+                import zstandard
+
+                return flags, zstandard.ZstdDecompressor().decompress(body)
+            case compression_id:
+                raise UnsupportedCacheFormat(f"Unsupported cache compression {compression_id}")
+
+
+def _is_framed(data: bytes) -> bool:
+    """Whether data starts with the binary header magic."""
+    return len(data) >= _HEADER.size and data[0] == MAGIC
+
+
+def _pack_uuid(value: str) -> bytes | None:
+    """Return the 16 UUID bytes if value is a canonical (lowercase, dashed) UUID string.
+
+    Uses hex slicing rather than uuid.UUID, which is several times slower.
+    """
+    if len(value) != 36:
+        return None
+    try:
+        packed = bytes.fromhex(value.replace("-", ""))
+    except ValueError:
+        return None
+    return packed if len(packed) == 16 and _unpack_uuid(packed) == value else None
+
+
+def _unpack_uuid(packed: bytes) -> str:
+    """Format 16 UUID bytes as a canonical UUID string."""
+    digits = packed.hex()
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
@@ -0,0 +1,271 @@
+"""Group-commit batching for chat message writes.
+
+This module provides BatchingChatMessageRepository, a ChatMessageRepository
+decorator that coalesces concurrent save_message calls into multi-row inserts.
+
+Each caller still receives its own ChatMessage, but the rows of many callers are
+written by one statement and one commit. A batch is flushed when it reaches
+max_batch_size rows or when its oldest row has waited max_delay_ms, so the extra
+latency per save is bounded by max_delay_ms plus one batch write.
+
+When a batch insert fails, the batch is split in half and each half retried,
+down to single rows, so one bad row fails only its own caller. A failure that
+hits every row (such as a lost connection) costs up to 2n - 1 inserts for n rows.
+
+Example:
+    >>> repo = BatchingChatMessageRepository(
+    ...     PostgresChatMessageRepository(conn),
+    ...     max_batch_size=200,
+    ...     max_delay_ms=5.0,
+    ...     metrics_collector=prometheus_collector,  # FRAMEWORK_METRICS registered
+    ... )
+    >>> interpreter = DatabaseInterpreter(user_repo=user_repo, message_repo=repo)
+    >>> ...
+    >>> await repo.close()  # Flush-on-shutdown
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Literal
+from uuid import UUID
+
+from effectful.domain.message import ChatMessage
+from effectful.infrastructure.metrics import MetricsCollector
+from effectful.infrastructure.repositories import (
+    BulkChatMessageRepository,
+    ChatMessageRepository,
+)
+
+# What caused a batch to be flushed (used as a metrics label)
+type FlushTrigger = Literal["size", "timer", "shutdown"]
+
+
+@dataclass(frozen=True)
+class _PendingSave:
+    """A save_message call waiting for its batch to be written."""
+
+    user_id: UUID
+    text: str
+    created_at: datetime
+    enqueued_at: float
+    future: asyncio.Future[ChatMessage]
+
+
+class BatchingChatMessageRepository(ChatMessageRepository):
+    """Chat message repository that group-commits concurrent saves.
+
+    Implements ChatMessageRepository protocol on top of a BulkChatMessageRepository.
+    Batches are written one at a time, so saves arriving during a write form the
+    next batch instead of competing for the connection.
+
+    Attributes:
+        _repository: Underlying repository performing multi-row inserts and reads
+        _max_batch_size: Row count that triggers an immediate flush
+        _max_delay_ms: Longest time a row waits for more rows before flushing
+        _metrics_collector: Optional collector for batch metrics (FRAMEWORK_METRICS)
+        _pending: Saves accumulated for the next batch
+        _timer: Scheduled delay-based flush for the current batch
+        _flushes: Batch writes in progress
+        _write_lock: Serializes batch writes on the underlying repository
+        _closed: Whether close() has been called
+    """
+
+    def __init__(
+        self,
+        repository: BulkChatMessageRepository,
+        max_batch_size: int = 100,
+        max_delay_ms: float = 5.0,
+        metrics_collector: MetricsCollector | None = None,
+    ) -> None:
+        """Initialize batching repository.
+
+        Args:
+            repository: Repository used for batch inserts and message listing
+            max_batch_size: Flush as soon as this many saves are pending (>= 1)
+            max_delay_ms: Flush a partial batch after this many milliseconds (>= 0)
+            metrics_collector: Optional collector with FRAMEWORK_METRICS registered
+
+        Raises:
+            ValueError: If max_batch_size < 1 or max_delay_ms < 0
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be >= 1, got {max_batch_size}")
+        if max_delay_ms < 0:
+            raise ValueError(f"max_delay_ms must be >= 0, got {max_delay_ms}")
+
+        self._repository = repository
+        self._max_batch_size = max_batch_size
+        self._max_delay_ms = max_delay_ms
+        self._metrics_collector = metrics_collector
+        self._pending: list[_PendingSave] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+        self._write_lock = asyncio.Lock()
+        self._closed = False
+
+    async def save_message(self, user_id: UUID, text: str) -> ChatMessage:
+        """Queue a chat message and wait until its batch is written.
+
+        Args:
+            user_id: UUID of the user sending the message
+            text: Message content
+
+        Returns:
+            The saved ChatMessage with generated ID and timestamp
+
+        Raises:
+            RuntimeError: If the repository has been closed
+            Exception: Whatever the insert of this message alone raised
+        """
+        if self._closed:
+            raise RuntimeError("BatchingChatMessageRepository is closed")
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ChatMessage] = loop.create_future()
+        self._pending.append(
+            _PendingSave(
+                user_id=user_id,
+                text=text,
+                created_at=datetime.now(UTC),
+                enqueued_at=time.perf_counter(),
+                future=future,
+            )
+        )
+
+        if len(self._pending) >= self._max_batch_size:
+            self._start_flush("size")
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay_ms / 1000, self._start_flush, "timer")
+
+        return await future
+
+    async def list_messages_for_user(self, user_id: UUID) -> list[ChatMessage]:
+        """List all messages for a given user.
+
+        Delegates to the underlying repository. Saves still waiting in the
+        current batch are not visible until that batch is flushed.
+
+        Args:
+            user_id: UUID of the user
+
+        Returns:
+            List of ChatMessages (may be empty)
+        """
+        return await self._repository.list_messages_for_user(user_id)
+
+    async def close(self) -> None:
+        """Flush pending saves and wait for all in-flight batch writes.
+
+        After close() new saves are rejected; every save accepted before it
+        is written (or fails with its own error).
+        """
+        self._closed = True
+        self._start_flush("shutdown")
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _start_flush(self, trigger: FlushTrigger) -> None:
+        """Detach the pending saves as a batch and schedule its write."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._write_batch(batch, trigger))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _write_batch(self, batch: list[_PendingSave], trigger: FlushTrigger) -> None:
+        """Write one batch and resolve each caller's future."""
+        try:
+            async with self._write_lock:
+                started = time.perf_counter()
+                result: Literal["ok", "error"] = "ok" if await self._write_rows(batch) else "error"
+                finished = time.perf_counter()
+        finally:
+            # Flush cancelled (e.g. on shutdown) - never leave a caller waiting
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.cancel()
+
+        await self._record_metrics(
+            trigger=trigger,
+            result=result,
+            size=len(batch),
+            wait_seconds=started - batch[0].enqueued_at,
+            flush_seconds=finished - started,
+        )
+
+    async def _write_rows(self, rows: list[_PendingSave]) -> bool:
+        """Insert rows with one call, bisecting on failure to isolate bad rows.
+
+        Returns:
+            True if every row was written, False if any caller got an exception
+        """
+        try:
+            saved = await self._repository.save_messages(
+                [(pending.user_id, pending.text, pending.created_at) for pending in rows]
+            )
+        except Exception as e:
+            if len(rows) > 1:
+                middle = len(rows) // 2
+                first_written = await self._write_rows(rows[:middle])
+                second_written = await self._write_rows(rows[middle:])
+                return first_written and second_written
+            _fail(rows, e)
+            return False
+
+        if len(saved) != len(rows):
+            # Some rows may be stored, so retrying could duplicate them
+            _fail(rows, RuntimeError(f"Batch insert returned {len(saved)} rows for {len(rows)}"))
+            return False
+        for pending, message in zip(rows, saved, strict=True):
+            if not pending.future.done():
+                pending.future.set_result(message)
+        return True
+
+    async def _record_metrics(
+        self,
+        trigger: FlushTrigger,
+        result: Literal["ok", "error"],
+        size: int,
+        wait_seconds: float,
+        flush_seconds: float,
+    ) -> None:
+        """Record batch metrics (fire-and-forget - failures are ignored)."""
+        if self._metrics_collector is None:
+            return
+
+        await self._metrics_collector.increment_counter(
+            metric_name="effectful_chat_message_batches_total",
+            labels={"trigger": trigger, "result": result},
+            value=1.0,
+        )
+        await self._metrics_collector.observe_histogram(
+            metric_name="effectful_chat_message_batch_size",
+            labels={"trigger": trigger},
+            value=float(size),
+        )
+        await self._metrics_collector.observe_histogram(
+            metric_name="effectful_chat_message_batch_wait_seconds",
+            labels={"trigger": trigger},
+            value=wait_seconds,
+        )
+        await self._metrics_collector.observe_histogram(
+            metric_name="effectful_chat_message_batch_flush_seconds",
+            labels={"result": result},
+            value=flush_seconds,
+        )
+
+
+def _fail(rows: list[_PendingSave], error: Exception) -> None:
+    """Raise error in every caller still waiting for one of rows."""
+    # Cancelled callers are skipped so no exception goes unretrieved
+    for pending in rows:
+        if not pending.future.done():
+            pending.future.set_exception(error)
@@ -0,0 +1,478 @@
+"""In-process message broker for load tests and benchmarks.
+
+This module provides InMemoryBroker together with InMemoryMessageProducer and
+InMemoryMessageConsumer, dependency-free implementations of the messaging
+protocols that let consumer programs run at full speed without Pulsar:
+
+- Topics fan out every published message to each of their subscriptions
+- Subscriptions are "shared" (consumers compete for messages) or
+  "exclusive" (one consumer at a time; others get ConsumeFailure)
+- Nacked messages are redelivered after their delay; messages still
+  unacknowledged when a consumer is closed are redelivered at once
+- Messages published before a topic has any subscription are kept and handed
+  to its first subscription (like subscribing at the earliest position)
+
+Subscription names follow the Pulsar adapter: "topic/subscription-name".
+
+Every call on a producer or consumer first awaits an optional latency
+sampler (see in_memory_repositories), so benchmarks can model broker
+round-trips. Without one, publishing and receiving ready messages never
+suspend, which is what lets millions of messages flow through
+MessagingInterpreter in a benchmark run.
+
+For unit tests of programs and interpreters, keep using pytest mocks
+(mocker.AsyncMock with spec).
+
+Example:
+    >>> broker = InMemoryBroker()
+    >>> interpreter = MessagingInterpreter(
+    ...     producer=InMemoryMessageProducer(broker),
+    ...     consumer=InMemoryMessageConsumer(broker, latency=fixed_latency(0.0005)),
+    ... )
+"""
+
+import asyncio
+import heapq
+import itertools
+from collections import deque
+from collections.abc import Buffer, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Literal
+
+from effectful.adapters.in_memory_repositories import LatencySampler
+from effectful.domain.message_envelope import (
+    AcknowledgeFailure,
+    AcknowledgeResult,
+    AcknowledgeSuccess,
+    ConsumeBatchResult,
+    ConsumeFailure,
+    ConsumeResult,
+    ConsumeTimeout,
+    MessageEnvelope,
+    NackFailure,
+    NackResult,
+    NackSuccess,
+    PublishResult,
+    PublishSuccess,
+)
+from effectful.infrastructure.messaging import MessageConsumer, MessageProducer
+
+# How a subscription hands messages to its consumers
+type SubscriptionType = Literal["shared", "exclusive"]
+
+
+async def _simulate_latency(latency: LatencySampler | None) -> None:
+    """Sleep for one sampled latency (no-op without a sampler)."""
+    if latency is not None:
+        await asyncio.sleep(latency())
+
+
+@dataclass
+class _Subscription:
+    """Messages of one subscription awaiting delivery or acknowledgement.
+
+    Attributes:
+        name: Full subscription name ("topic/subscription-name")
+        subscription_type: Shared or exclusive
+        ready: Messages waiting to be received, in delivery order
+        delayed: Heap of (due time, sequence, message) for nacked messages
+        owner: Consumer holding an exclusive subscription
+        arrived: Set whenever messages become ready
+    """
+
+    name: str
+    subscription_type: SubscriptionType
+    ready: deque[MessageEnvelope] = field(default_factory=deque)
+    delayed: list[tuple[float, int, MessageEnvelope]] = field(default_factory=list)
+    owner: "InMemoryMessageConsumer | None" = None
+    arrived: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def release_due(self, now: float) -> None:
+        """Move nacked messages whose delay has passed to the ready queue."""
+        while self.delayed and self.delayed[0][0] <= now:
+            self.ready.append(heapq.heappop(self.delayed)[2])
+
+
+@dataclass
+class _Topic:
+    """Subscriptions of one topic and messages published before the first one."""
+
+    subscriptions: dict[str, _Subscription] = field(default_factory=dict)
+    retained: deque[MessageEnvelope] = field(default_factory=deque)
+
+
+@dataclass(frozen=True)
+class _Delivery:
+    """A received message awaiting ack/nack by the consumer that got it."""
+
+    subscription: _Subscription
+    envelope: MessageEnvelope
+    sequence: int
+
+
+class InMemoryBroker:
+    """Topics and subscriptions shared by in-memory producers and consumers.
+
+    Attributes:
+        _topics: Topics keyed by name
+        _message_ids: Source of broker-wide message sequence numbers
+        _redeliveries: Source of tie-breakers for the delayed-message heaps
+    """
+
+    def __init__(self) -> None:
+        """Initialize broker with no topics."""
+        self._topics: dict[str, _Topic] = {}
+        self._message_ids = itertools.count()
+        self._redeliveries = itertools.count()
+
+    def backlog(self, subscription: str) -> int:
+        """Return the number of messages waiting to be received on subscription.
+
+        Args:
+            subscription: Subscription name ("topic/subscription-name")
+
+        Returns:
+            Ready plus delayed messages (0 for an unknown subscription)
+        """
+        topic = self._topics.get(_topic_of(subscription))
+        if topic is None or subscription not in topic.subscriptions:
+            return 0
+        sub = topic.subscriptions[subscription]
+        return len(sub.ready) + len(sub.delayed)
+
+    def publish(self, topic: str, payload: Buffer, properties: dict[str, str]) -> str:
+        """Append a message to every subscription of topic.
+
+        Args:
+            topic: Topic name
+            payload: Message payload (buffers other than bytes are copied, as a
+                broker would, so later changes by the publisher are not seen)
+            properties: Message properties
+
+        Returns:
+            The message ID
+        """
+        message_id = f"{topic}:{next(self._message_ids)}"
+        envelope = MessageEnvelope(
+            message_id=message_id,
+            payload=payload if isinstance(payload, bytes) else bytes(payload),
+            properties=properties,
+            publish_time=datetime.now(UTC),
+            topic=topic,
+        )
+        state = self._topics.setdefault(topic, _Topic())
+        if not state.subscriptions:
+            state.retained.append(envelope)
+        for sub in state.subscriptions.values():
+            sub.ready.append(envelope)
+            sub.arrived.set()
+        return message_id
+
+    def subscription(
+        self, subscription: str, subscription_type: SubscriptionType
+    ) -> _Subscription | None:
+        """Get or create a subscription; None if it exists with another type."""
+        state = self._topics.setdefault(_topic_of(subscription), _Topic())
+        sub = state.subscriptions.get(subscription)
+        if sub is None:
+            sub = _Subscription(name=subscription, subscription_type=subscription_type)
+            if not state.subscriptions:
+                sub.ready, state.retained = state.retained, deque()
+            state.subscriptions[subscription] = sub
+        if sub.subscription_type != subscription_type:
+            return None
+        return sub
+
+    def redeliver(self, sub: _Subscription, envelope: MessageEnvelope, delay_ms: int) -> None:
+        """Make envelope receivable again on sub after delay_ms."""
+        if delay_ms <= 0:
+            sub.ready.append(envelope)
+        else:
+            due = asyncio.get_running_loop().time() + delay_ms / 1000
+            heapq.heappush(sub.delayed, (due, next(self._redeliveries), envelope))
+        # Waiting receivers re-check, shortening their wait to the new due time
+        sub.arrived.set()
+
+
+def _topic_of(subscription: str) -> str:
+    """Topic part of a "topic/subscription-name" subscription."""
+    return subscription.split("/")[0]
+
+
+class InMemoryMessageProducer(MessageProducer):
+    """Producer publishing to an InMemoryBroker.
+
+    Implements MessageProducer protocol. Publishing never fails.
+
+    Attributes:
+        _broker: Broker messages are published to
+        _latency: Optional sampler awaited before every call
+    """
+
+    def __init__(self, broker: InMemoryBroker, latency: LatencySampler | None = None) -> None:
+        """Initialize producer.
+
+        Args:
+            broker: Broker messages are published to
+            latency: Optional sampler awaited before every call
+        """
+        self._broker = broker
+        self._latency = latency
+
+    async def publish(
+        self,
+        topic: str,
+        payload: Buffer,
+        properties: dict[str, str] | None = None,
+    ) -> PublishResult:
+        """Publish message to topic.
+
+        Args:
+            topic: Topic name to publish to
+            payload: Message payload (bytes, bytearray, memoryview, ...)
+            properties: Optional message properties
+
+        Returns:
+            PublishSuccess with the broker-assigned message ID
+        """
+        await _simulate_latency(self._latency)
+        message_id = self._broker.publish(topic, payload, properties or {})
+        return PublishSuccess(message_id=message_id, topic=topic)
+
+    async def publish_many(
+        self,
+        topic: str,
+        payloads: Sequence[Buffer],
+        properties: dict[str, str] | None = None,
+    ) -> tuple[PublishResult, ...]:
+        """Publish many messages to one topic in one call.
+
+        Args:
+            topic: Topic name to publish to
+            payloads: Message payloads, published in order
+            properties: Optional properties attached to every message
+
+        Returns:
+            One PublishSuccess per payload, in the same order
+        """
+        await _simulate_latency(self._latency)
+        resolved = properties or {}
+        return tuple(
+            PublishSuccess(message_id=self._broker.publish(topic, payload, resolved), topic=topic)
+            for payload in payloads
+        )
+
+
+class InMemoryMessageConsumer(MessageConsumer):
+    """Consumer receiving from an InMemoryBroker.
+
+    Implements MessageConsumer protocol. Each instance acts as one consumer:
+    instances on the same shared subscription compete for its messages, and
+    only one instance at a time may consume an exclusive subscription.
+
+    Attributes:
+        _broker: Broker messages are received from
+        _subscription_type: Type used when this consumer creates a subscription
+        _latency: Optional sampler awaited before every call
+        _delivered: Received messages awaiting ack/nack by message ID
+        _deliveries: Source of receive-order sequence numbers
+        _owned: Exclusive subscriptions held by this consumer by name
+        _closed: Whether close() has been called
+    """
+
+    def __init__(
+        self,
+        broker: InMemoryBroker,
+        subscription_type: SubscriptionType = "shared",
+        latency: LatencySampler | None = None,
+    ) -> None:
+        """Initialize consumer.
+
+        Args:
+            broker: Broker messages are received from
+            subscription_type: "shared" or "exclusive" (must match an existing
+                subscription's type)
+            latency: Optional sampler awaited before every call
+        """
+        self._broker = broker
+        self._subscription_type = subscription_type
+        self._latency = latency
+        self._delivered: dict[str, _Delivery] = {}
+        self._deliveries = itertools.count()
+        self._owned: dict[str, _Subscription] = {}
+        self._closed = False
+
+    async def receive(self, subscription: str, timeout_ms: int) -> ConsumeResult:
+        """Receive one message, waiting up to timeout_ms for it to arrive.
+
+        Args:
+            subscription: Subscription name ("topic/subscription-name")
+            timeout_ms: Timeout in milliseconds
+
+        Returns:
+            MessageEnvelope if a message was received before the timeout.
+            ConsumeTimeout if none arrived.
+            ConsumeFailure if the consumer is closed or the subscription is
+            held by another exclusive consumer or has another type.
+        """
+        result = await self._take(subscription, 1, timeout_ms)
+        match result:
+            case ConsumeFailure():
+                return result
+            case (envelope,):
+                return envelope
+            case _:
+                return ConsumeTimeout(subscription=subscription, timeout_ms=timeout_ms)
+
+    async def receive_batch(
+        self, subscription: str, max_messages: int, max_wait_ms: int
+    ) -> ConsumeBatchResult:
+        """Receive up to max_messages ready messages.
+
+        Returns as soon as any message is ready rather than waiting for the
+        batch to fill.
+
+        Args:
+            subscription: Subscription name ("topic/subscription-name")
+            max_messages: Largest number of messages to return
+            max_wait_ms: Longest time to wait for the first message in milliseconds
+
+        Returns:
+            Tuple of MessageEnvelopes (empty if nothing arrived in time).
+            ConsumeFailure under the same conditions as receive.
+        """
+        return await self._take(subscription, max_messages, max_wait_ms)
+
+    async def acknowledge(self, message_id: str) -> AcknowledgeResult:
+        """Acknowledge a received message.
+
+        Args:
+            message_id: ID of a message received by this consumer
+
+        Returns:
+            AcknowledgeSuccess, or AcknowledgeFailure("message_not_found") if
+            the message is not awaiting ack/nack here.
+        """
+        await _simulate_latency(self._latency)
+        if self._delivered.pop(message_id, None) is None:
+            return AcknowledgeFailure(message_id=message_id, reason="message_not_found")
+        return AcknowledgeSuccess(message_id=message_id)
+
+    async def acknowledge_batch(
+        self, message_ids: Sequence[str], cumulative: bool = False
+    ) -> tuple[AcknowledgeResult, ...]:
+        """Acknowledge many received messages.
+
+        Args:
+            message_ids: Message IDs to acknowledge, in receive order
+            cumulative: Acknowledge every message this consumer received from
+                the last ID's subscription up to and including the last ID
+
+        Returns:
+            One AcknowledgeSuccess or AcknowledgeFailure per ID, in the same order.
+            With cumulative=True every ID shares the outcome of the last one.
+        """
+        await _simulate_latency(self._latency)
+        if not cumulative:
+            return tuple(
+                (
+                    AcknowledgeSuccess(message_id=message_id)
+                    if self._delivered.pop(message_id, None) is not None
+                    else AcknowledgeFailure(message_id=message_id, reason="message_not_found")
+                )
+                for message_id in message_ids
+            )
+        if not message_ids:
+            return ()
+
+        last = self._delivered.get(message_ids[-1])
+        if last is None:
+            return tuple(
+                AcknowledgeFailure(message_id=message_id, reason="message_not_found")
+                for message_id in message_ids
+            )
+        covered = [
+            message_id
+            for message_id, delivery in self._delivered.items()
+            if delivery.subscription is last.subscription and delivery.sequence <= last.sequence
+        ]
+        for message_id in covered:
+            del self._delivered[message_id]
+        return tuple(AcknowledgeSuccess(message_id=message_id) for message_id in message_ids)
+
+    async def negative_acknowledge(self, message_id: str, delay_ms: int = 0) -> NackResult:
+        """Return a received message to its subscription for redelivery.
+
+        Args:
+            message_id: ID of a message received by this consumer
+            delay_ms: Redelivery delay in milliseconds (0 = immediate)
+
+        Returns:
+            NackSuccess, or NackFailure("message_not_found") if the message is
+            not awaiting ack/nack here.
+        """
+        await _simulate_latency(self._latency)
+        delivery = self._delivered.pop(message_id, None)
+        if delivery is None:
+            return NackFailure(message_id=message_id, reason="message_not_found")
+        self._broker.redeliver(delivery.subscription, delivery.envelope, delay_ms)
+        return NackSuccess(message_id=message_id)
+
+    async def close(self) -> None:
+        """Release exclusive subscriptions and redeliver unacknowledged messages.
+
+        Async like PulsarMessageConsumer.close, so either consumer can be
+        closed the same way on shutdown.
+        """
+        self._closed = True
+        for delivery in self._delivered.values():
+            self._broker.redeliver(delivery.subscription, delivery.envelope, 0)
+        for sub in self._owned.values():
+            sub.owner = None
+        self._delivered = {}
+        self._owned = {}
+
+    async def _take(
+        self, subscription: str, max_messages: int, timeout_ms: int
+    ) -> ConsumeBatchResult:
+        """Receive up to max_messages, waiting up to timeout_ms for the first."""
+        await _simulate_latency(self._latency)
+        if self._closed:
+            return ConsumeFailure(subscription=subscription, reason="consumer_closed")
+
+        sub = self._broker.subscription(subscription, self._subscription_type)
+        if sub is None or sub.owner not in (None, self):
+            return ConsumeFailure(subscription=subscription, reason="subscription_not_found")
+        if sub.subscription_type == "exclusive":
+            sub.owner = self
+            self._owned[sub.name] = sub
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_ms / 1000
+        while True:
+            now = loop.time()
+            sub.release_due(now)
+            if sub.ready:
+                return tuple(
+                    self._deliver(sub, sub.ready.popleft())
+                    for _ in range(min(max_messages, len(sub.ready)))
+                )
+
+            wait = deadline - now
+            if sub.delayed:
+                wait = min(wait, sub.delayed[0][0] - now)
+            if deadline <= now:
+                return ()
+            sub.arrived.clear()
+            try:
+                await asyncio.wait_for(sub.arrived.wait(), timeout=max(wait, 0.0))
+            except TimeoutError:
+                pass
+
+    def _deliver(self, sub: _Subscription, envelope: MessageEnvelope) -> MessageEnvelope:
+        """Track envelope as awaiting ack/nack and return it."""
+        self._delivered[envelope.message_id] = _Delivery(
+            subscription=sub, envelope=envelope, sequence=next(self._deliveries)
+        )
+        return envelope
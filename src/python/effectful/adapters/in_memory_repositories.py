@@ -0,0 +1,423 @@
+"""Indexed in-memory repositories for load tests and benchmarks.
+
+This module provides InMemoryUserRepository and InMemoryChatMessageRepository,
+dependency-free implementations of the repository protocols that stay fast at
+millions of rows:
+
+- Users: hash indexes on id and email, plus a name-sorted index for list_users
+  kept sorted on every write, so list_users is O(offset + limit)
+- Messages: a per-user index kept sorted by (created_at, id), so listing a user's
+  messages is O(k) and list_messages_page is O(log n + k)
+
+Both accept an optional latency sampler that is awaited before every call, so
+benchmarks can model network and database round-trips without a database.
+
+These are real implementations for load runs. For unit tests of programs and
+interpreters, keep using pytest mocks (mocker.AsyncMock with spec).
+
+Example:
+    >>> user_repo = InMemoryUserRepository(latency=lognormal_latency(0.002, 0.5, seed=7))
+    >>> message_repo = InMemoryChatMessageRepository(latency=fixed_latency(0.001))
+    >>> interpreter = DatabaseInterpreter(user_repo=user_repo, message_repo=message_repo)
+"""
+
+import asyncio
+import random
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+from effectful.domain.message import ChatMessage
+from effectful.domain.optional_value import OptionalValue, from_optional_value
+from effectful.domain.user import (
+    User,
+    UserEmailExists,
+    UserFound,
+    UserLookupResult,
+    UserNotFound,
+    UserUpdateResult,
+    UserUpsertResult,
+    UserVersionConflict,
+)
+from effectful.infrastructure.repositories import BulkChatMessageRepository, UserRepository
+
+# Returns the simulated latency (in seconds) for one repository call
+type LatencySampler = Callable[[], float]
+
+# Keyset position of a message: (created_at, id) of the last message of a page
+type MessageCursor = tuple[datetime, UUID]
+
+
+def fixed_latency(seconds: float) -> LatencySampler:
+    """Create a sampler that always returns the same latency.
+
+    Args:
+        seconds: Latency per call
+
+    Returns:
+        LatencySampler returning seconds
+    """
+    return lambda: seconds
+
+
+def lognormal_latency(
+    median_seconds: float, sigma: float, seed: int | None = None
+) -> LatencySampler:
+    """Create a sampler with a log-normal latency distribution.
+
+    Log-normal latencies have the long right tail typical of database calls.
+
+    Args:
+        median_seconds: Median latency per call (must be > 0)
+        sigma: Shape parameter; larger values give a heavier tail
+        seed: Optional seed for reproducible benchmark runs
+
+    Returns:
+        LatencySampler drawing from the distribution
+
+    Raises:
+        ValueError: If median_seconds <= 0
+    """
+    if median_seconds <= 0:
+        raise ValueError(f"median_seconds must be > 0, got {median_seconds}")
+
+    rng = random.Random(seed)
+    return lambda: median_seconds * rng.lognormvariate(0.0, sigma)
+
+
+async def _simulate_latency(latency: LatencySampler | None) -> None:
+    """Sleep for one sampled latency (no-op without a sampler)."""
+    if latency is not None:
+        await asyncio.sleep(latency())
+
+
+class InMemoryUserRepository(UserRepository):
+    """Indexed in-memory user repository.
+
+    Implements UserRepository protocol. Lookups by id and email are O(1).
+    list_users slices an index sorted by (name, id), matching the ORDER BY name
+    of the PostgreSQL adapter. Writes keep that index sorted (a binary search
+    plus one list insert or delete), so list_users never re-sorts.
+
+    Attributes:
+        _latency: Optional sampler awaited before every call
+        _users: Users keyed by id
+        _ids_by_email: Email hash index
+        _password_hashes: Password hashes keyed by user id
+        _name_index: (name, id) pairs of all users in sorted order
+    """
+
+    def __init__(self, latency: LatencySampler | None = None) -> None:
+        """Initialize empty repository.
+
+        Args:
+            latency: Optional sampler awaited before every call
+        """
+        self._latency = latency
+        self._users: dict[UUID, User] = {}
+        self._ids_by_email: dict[str, UUID] = {}
+        self._password_hashes: dict[UUID, str] = {}
+        self._name_index: list[tuple[str, UUID]] = []
+
+    def __len__(self) -> int:
+        """Return number of stored users."""
+        return len(self._users)
+
+    async def get_by_id(self, user_id: UUID) -> UserLookupResult:
+        """Fetch user by ID.
+
+        Args:
+            user_id: UUID of the user to fetch
+
+        Returns:
+            UserFound with source="database" if user exists, UserNotFound otherwise
+        """
+        await _simulate_latency(self._latency)
+        user = self._users.get(user_id)
+        if user is None:
+            return UserNotFound(user_id=user_id, reason="does_not_exist")
+        return UserFound(user=user, source="database")
+
+    async def get_by_email(self, email: str) -> UserLookupResult:
+        """Fetch user by email.
+
+        Args:
+            email: Email address to search for
+
+        Returns:
+            UserFound if user exists, UserNotFound otherwise
+        """
+        await _simulate_latency(self._latency)
+        user_id = self._ids_by_email.get(email)
+        if user_id is None:
+            # Use uuid4() as placeholder since we don't have a user_id
+            return UserNotFound(user_id=uuid4(), reason="does_not_exist")
+        return UserFound(user=self._users[user_id], source="database")
+
+    async def list_users(self, limit: OptionalValue[int], offset: OptionalValue[int]) -> list[User]:
+        """List users ordered by name with optional pagination.
+
+        Args:
+            limit: Maximum number of users to return
+            offset: Number of users to skip
+
+        Returns:
+            List of User objects
+        """
+        await _simulate_latency(self._latency)
+        start = from_optional_value(offset) or 0
+        resolved_limit = from_optional_value(limit)
+        stop = None if resolved_limit is None else start + resolved_limit
+        return [self._users[user_id] for _, user_id in self._name_index[start:stop]]
+
+    async def create_user(self, email: str, name: str, password_hash: str) -> User:
+        """Create new user.
+
+        Args:
+            email: User email address
+            name: User name
+            password_hash: Bcrypt password hash
+
+        Returns:
+            The created User with generated ID
+
+        Raises:
+            ValueError: If the email is already taken (unique constraint)
+        """
+        await _simulate_latency(self._latency)
+        if email in self._ids_by_email:
+            raise ValueError(f"duplicate key value violates unique constraint: email={email}")
+
+        user = User(id=uuid4(), email=email, name=name)
+        self._users[user.id] = user
+        self._ids_by_email[email] = user.id
+        self._password_hashes[user.id] = password_hash
+        insort(self._name_index, (name, user.id))
+        return user
+
+    async def update_user(
+        self, user_id: UUID, email: OptionalValue[str], name: OptionalValue[str]
+    ) -> UserLookupResult:
+        """Update user fields, keeping all indexes consistent.
+
+        Args:
+            user_id: UUID of user to update
+            email: New email (Absent to keep current)
+            name: New name (Absent to keep current)
+
+        Returns:
+            UserFound with updated user, UserNotFound if not found
+
+        Raises:
+            ValueError: If the new email belongs to another user
+        """
+        await _simulate_latency(self._latency)
+        current = self._users.get(user_id)
+        if current is None:
+            return UserNotFound(user_id=user_id, reason="does_not_exist")
+        if from_optional_value(email) is None and from_optional_value(name) is None:
+            # No updates, just return current user
+            return UserFound(user=current, source="database")
+        return UserFound(user=self._apply_update(current, email, name), source="database")
+
+    async def delete_user(self, user_id: UUID) -> None:
+        """Delete user by ID (no-op if absent).
+
+        Args:
+            user_id: UUID of user to delete
+        """
+        await _simulate_latency(self._latency)
+        user = self._users.pop(user_id, None)
+        if user is None:
+            return
+        del self._ids_by_email[user.email]
+        del self._password_hashes[user_id]
+        self._unindex_name(user)
+
+    async def upsert_user(self, email: str, name: str, password_hash: str) -> UserUpsertResult:
+        """Create user unless a user with this email exists.
+
+        Args:
+            email: User email address (conflict key)
+            name: User name
+            password_hash: Bcrypt password hash
+
+        Returns:
+            The created User, or UserEmailExists with the untouched existing user
+        """
+        await _simulate_latency(self._latency)
+        existing_id = self._ids_by_email.get(email)
+        if existing_id is not None:
+            return UserEmailExists(email=email, current=self._users[existing_id])
+
+        user = User(id=uuid4(), email=email, name=name)
+        self._users[user.id] = user
+        self._ids_by_email[email] = user.id
+        self._password_hashes[user.id] = password_hash
+        insort(self._name_index, (name, user.id))
+        return user
+
+    async def update_user_if(
+        self,
+        user_id: UUID,
+        expected_version: int,
+        email: OptionalValue[str],
+        name: OptionalValue[str],
+    ) -> UserUpdateResult:
+        """Update user fields only if the stored version equals expected_version.
+
+        Args:
+            user_id: UUID of user to update
+            expected_version: Version the caller read
+            email: New email (Absent to keep current)
+            name: New name (Absent to keep current)
+
+        Returns:
+            UserFound with updated user, UserNotFound if not found,
+            UserVersionConflict with the current user if the version changed
+
+        Raises:
+            ValueError: If the new email belongs to another user
+        """
+        await _simulate_latency(self._latency)
+        current = self._users.get(user_id)
+        if current is None:
+            return UserNotFound(user_id=user_id, reason="does_not_exist")
+        if current.version != expected_version:
+            return UserVersionConflict(
+                user_id=user_id, expected_version=expected_version, current=current
+            )
+        return UserFound(user=self._apply_update(current, email, name), source="database")
+
+    def _apply_update(
+        self, current: User, email: OptionalValue[str], name: OptionalValue[str]
+    ) -> User:
+        """Store an updated copy of current with its version bumped."""
+        resolved_email = from_optional_value(email)
+        resolved_name = from_optional_value(name)
+        new_email = current.email if resolved_email is None else resolved_email
+        new_name = current.name if resolved_name is None else resolved_name
+        if self._ids_by_email.get(new_email, current.id) != current.id:
+            raise ValueError(f"duplicate key value violates unique constraint: email={new_email}")
+
+        updated = User(id=current.id, email=new_email, name=new_name, version=current.version + 1)
+        self._users[current.id] = updated
+        del self._ids_by_email[current.email]
+        self._ids_by_email[new_email] = current.id
+        if new_name != current.name:
+            self._unindex_name(current)
+            insort(self._name_index, (new_name, current.id))
+        return updated
+
+    def _unindex_name(self, user: User) -> None:
+        """Remove user's entry from the name index by binary search."""
+        position = bisect_left(self._name_index, (user.name, user.id))
+        del self._name_index[position]
+
+
+def _message_position(message: ChatMessage) -> MessageCursor:
+    """Sort key and keyset cursor of a message."""
+    return (message.created_at, message.id)
+
+
+class InMemoryChatMessageRepository(BulkChatMessageRepository):
+    """Indexed in-memory chat message repository.
+
+    Implements ChatMessageRepository and BulkChatMessageRepository protocols.
+    Messages are indexed per user and kept sorted by (created_at, id), so reads
+    never scan other users' messages and ties on created_at have a stable order.
+
+    Attributes:
+        _latency: Optional sampler awaited before every call
+        _messages_by_user: Per-user message lists sorted by (created_at, id)
+        _count: Total number of stored messages
+    """
+
+    def __init__(self, latency: LatencySampler | None = None) -> None:
+        """Initialize empty repository.
+
+        Args:
+            latency: Optional sampler awaited before every call
+        """
+        self._latency = latency
+        self._messages_by_user: dict[UUID, list[ChatMessage]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return number of stored messages."""
+        return self._count
+
+    async def save_message(self, user_id: UUID, text: str) -> ChatMessage:
+        """Save a new chat message.
+
+        Args:
+            user_id: UUID of the user sending the message
+            text: Message content
+
+        Returns:
+            The saved ChatMessage with generated ID and timestamp
+        """
+        await _simulate_latency(self._latency)
+        return self._insert(user_id, text, datetime.now(UTC))
+
+    async def save_messages(self, messages: list[tuple[UUID, str, datetime]]) -> list[ChatMessage]:
+        """Save several chat messages in one call.
+
+        Args:
+            messages: (user_id, text, created_at) triples to insert
+
+        Returns:
+            Saved ChatMessages in the same order as the input
+        """
+        await _simulate_latency(self._latency)
+        return [self._insert(user_id, text, created_at) for user_id, text, created_at in messages]
+
+    async def list_messages_for_user(self, user_id: UUID) -> list[ChatMessage]:
+        """List all messages for a given user.
+
+        Args:
+            user_id: UUID of the user
+
+        Returns:
+            List of ChatMessages ordered by created_at (may be empty)
+        """
+        await _simulate_latency(self._latency)
+        return list(self._messages_by_user.get(user_id, ()))
+
+    async def list_messages_page(
+        self, user_id: UUID, after: OptionalValue[MessageCursor], limit: int
+    ) -> list[ChatMessage]:
+        """List one page of a user's messages using keyset pagination.
+
+        The page start is found by binary search, so cost does not grow with
+        how deep into the history the page is.
+
+        Args:
+            user_id: UUID of the user
+            after: Return only messages strictly after this (created_at, id)
+                position, i.e. that of the last message of the previous page
+                (Absent for the first page). Messages sharing that created_at
+                are not skipped.
+            limit: Maximum number of messages to return
+
+        Returns:
+            List of ChatMessages ordered by created_at (may be empty)
+        """
+        await _simulate_latency(self._latency)
+        messages = self._messages_by_user.get(user_id, [])
+        cursor = from_optional_value(after)
+        start = 0 if cursor is None else bisect_right(messages, cursor, key=_message_position)
+        return messages[start : start + limit]
+
+    def _insert(self, user_id: UUID, text: str, created_at: datetime) -> ChatMessage:
+        """Insert one message into its user's sorted index."""
+        message = ChatMessage(id=uuid4(), user_id=user_id, text=text, created_at=created_at)
+        messages = self._messages_by_user.setdefault(user_id, [])
+        # Messages almost always arrive in timestamp order - append without searching
+        if not messages or _message_position(messages[-1]) <= _message_position(message):
+            messages.append(message)
+        else:
+            insort(messages, message, key=_message_position)
+        self._count += 1
+        return message
@@ -0,0 +1,435 @@
+"""Metrics-emitting ProfileCache decorator.
+
+This module provides InstrumentedProfileCache, a ProfileCache decorator that
+records hit ratios, miss reasons, payload sizes, and per-operation latency for
+any cache it wraps, and HotKeySampler, which tracks the most frequently read
+keys in bounded memory.
+
+Keys are reduced to a prefix before being used as a metric label (see
+key_prefix), so label cardinality stays bounded no matter how many distinct
+keys are cached. Individual keys are only reported by the hot-key sampler.
+
+Metrics recorded (all in FRAMEWORK_METRICS):
+- effectful_cache_hits_total: Counter with label (prefix)
+- effectful_cache_misses_total: Counter with labels (prefix, reason)
+- effectful_cache_bytes_total: Counter with labels (prefix, direction)
+- effectful_cache_operation_duration_seconds: Histogram with labels (prefix, operation)
+
+Byte counts cover raw values only; profiles are passed to the wrapped cache
+as ProfileData and their stored size is not visible at this layer.
+
+Example:
+    >>> hot_keys = HotKeySampler(capacity=1024, sample_rate=0.1)
+    >>> cache = InstrumentedProfileCache(
+    ...     RedisProfileCache(redis_client),
+    ...     metrics_collector=prometheus_collector,  # FRAMEWORK_METRICS registered
+    ...     hot_keys=hot_keys,
+    ... )
+    >>> interpreter = CacheInterpreter(cache=cache)
+    >>> ...
+    >>> hot_keys.top(10)
+    (HotKey(key='profile:...', accesses=412, overestimate=0), ...)
+"""
+
+import heapq
+import random
+import re
+import time
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Literal
+from uuid import UUID
+
+from effectful.domain.cache_result import CacheHit, CacheLookupResult, CacheMiss
+from effectful.domain.profile import ProfileData
+from effectful.infrastructure.cache import ProfileCache
+from effectful.infrastructure.metrics import MetricsCollector
+
+# ProfileCache method being timed (used as a metrics label)
+type CacheOperation = Literal[
+    "get_profile",
+    "put_profile",
+    "get_value",
+    "put_value",
+    "get_values",
+    "put_values",
+    "invalidate",
+    "invalidate_many",
+    "invalidate_tag",
+]
+
+# (key, lookup result, bytes read) for one key of a lookup
+type _Lookup = tuple[str, CacheLookupResult[ProfileData] | CacheLookupResult[bytes], int]
+
+# Label used for keys without a prefix, and for batches spanning several prefixes
+_NO_PREFIX = "other"
+_MIXED_PREFIX = "mixed"
+
+# Segments kept in a prefix: names such as "db" or "read_through", never IDs
+_NAME_SEGMENT = re.compile(r"[A-Za-z_-]+")
+
+
+def key_prefix(key: str, max_segments: int = 2) -> str:
+    """Reduce a cache key to a low-cardinality prefix.
+
+    The last ":"-separated segment, and every other segment that is not a
+    plain name (letters, "_" and "-" only, so any UUID, number, hash or
+    email), is treated as a variable part and dropped; at most max_segments
+    of the remaining segments are kept. Keys embedding purely alphabetic
+    variables (e.g. usernames) need their own key_prefix function.
+
+    Args:
+        key: Cache key
+        max_segments: Maximum number of segments in the prefix
+
+    Returns:
+        Prefix suitable for use as a metric label ("other" if key has none)
+
+    Example:
+        >>> key_prefix("profile:6f1c...")
+        'profile'
+        >>> key_prefix("db:users:10:20")
+        'db:users'
+        >>> key_prefix("tenant:42:profile:6f1c...")
+        'tenant:profile'
+    """
+    names = [segment for segment in key.split(":")[:-1] if _NAME_SEGMENT.fullmatch(segment)]
+    return ":".join(names[:max_segments]) or _NO_PREFIX
+
+
+@dataclass(frozen=True)
+class HotKey:
+    """A frequently read cache key.
+
+    Attributes:
+        key: Cache key
+        accesses: Estimated (sampled) read count, an upper bound
+        overestimate: Maximum amount accesses may exceed the true sampled count by
+    """
+
+    key: str
+    accesses: int
+    overestimate: int
+
+
+class HotKeySampler:
+    """Top-N key tracker using the Space-Saving algorithm.
+
+    At most capacity keys are tracked. When a new key arrives and the table
+    is full, the least-read key is replaced and the newcomer inherits its
+    count, so every key read more than total/capacity times is guaranteed to
+    be present. Set sample_rate below 1 to record only a fraction of reads
+    on very hot paths.
+
+    Keys are grouped into buckets by count (the Stream-Summary structure),
+    so recording a read is O(1) whether or not it evicts a key.
+
+    Attributes:
+        _capacity: Maximum number of tracked keys
+        _sample_rate: Fraction of reads that are recorded
+        _rng: Source of uniform floats in [0, 1) for sampling
+        _counts: Estimated read count per tracked key
+        _overestimates: Count inherited from the evicted key, per tracked key
+        _buckets: Tracked keys by count, oldest first (dicts as ordered sets)
+        _min_count: Smallest count of any tracked key (0 when empty)
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        sample_rate: float = 1.0,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        """Initialize sampler.
+
+        Args:
+            capacity: Maximum number of tracked keys (>= 1)
+            sample_rate: Fraction of reads to record, in (0, 1]
+            rng: Source of uniform floats in [0, 1) (injectable for tests)
+
+        Raises:
+            ValueError: If capacity < 1 or sample_rate is outside (0, 1]
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        if not 0.0 < sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be in (0, 1], got {sample_rate}")
+
+        self._capacity = capacity
+        self._sample_rate = sample_rate
+        self._rng = rng
+        self._counts: dict[str, int] = {}
+        self._overestimates: dict[str, int] = {}
+        self._buckets: dict[int, dict[str, None]] = {}
+        self._min_count = 0
+
+    def record(self, key: str) -> None:
+        """Record one read of key (subject to sampling).
+
+        Args:
+            key: Cache key that was read
+        """
+        if self._sample_rate < 1.0 and self._rng() >= self._sample_rate:
+            return
+
+        if key in self._counts:
+            count = self._counts[key]
+            self._unbucket(key, count)
+            self._bucket(key, count + 1)
+        elif len(self._counts) < self._capacity:
+            self._overestimates[key] = 0
+            self._bucket(key, 1)
+        else:
+            floor = self._min_count
+            victim = next(iter(self._buckets[floor]))
+            self._unbucket(victim, floor)
+            del self._counts[victim]
+            del self._overestimates[victim]
+            self._overestimates[key] = floor
+            self._bucket(key, floor + 1)
+
+    def _bucket(self, key: str, count: int) -> None:
+        """Track key with count, keeping _min_count current."""
+        self._counts[key] = count
+        self._buckets.setdefault(count, {})[key] = None
+        if count == 1 or self._min_count not in self._buckets:
+            # A new key starts at 1; otherwise the key just left the min bucket
+            self._min_count = count
+
+    def _unbucket(self, key: str, count: int) -> None:
+        """Remove key from the bucket for count (its count entry is left)."""
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+
+    def top(self, n: int = 10) -> tuple[HotKey, ...]:
+        """Return the n most-read keys, most-read first.
+
+        Args:
+            n: Number of keys to return
+
+        Returns:
+            Up to n HotKey samples
+        """
+        return tuple(
+            HotKey(key=key, accesses=count, overestimate=self._overestimates[key])
+            for key, count in heapq.nlargest(n, self._counts.items(), key=lambda item: item[1])
+        )
+
+    def reset(self) -> None:
+        """Forget every tracked key (e.g. at the start of a reporting window)."""
+        self._counts.clear()
+        self._overestimates.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+
+class InstrumentedProfileCache(ProfileCache):
+    """Profile cache decorator that records cache effectiveness metrics.
+
+    Implements ProfileCache protocol by delegating every call to the wrapped
+    cache unchanged. Metrics recording is fire-and-forget: collector results
+    are ignored, and exceptions from the wrapped cache propagate after their
+    latency is recorded.
+
+    Attributes:
+        _inner: Wrapped cache
+        _metrics_collector: Collector with FRAMEWORK_METRICS registered
+        _key_prefix: Maps a key (or tag) to its metric label
+        _hot_keys: Optional sampler fed with every key read
+    """
+
+    def __init__(
+        self,
+        inner: ProfileCache,
+        metrics_collector: MetricsCollector,
+        key_prefix: Callable[[str], str] = key_prefix,
+        hot_keys: HotKeySampler | None = None,
+    ) -> None:
+        """Initialize instrumented cache.
+
+        Args:
+            inner: Cache to instrument (e.g. RedisProfileCache, TieredProfileCache)
+            metrics_collector: Collector with FRAMEWORK_METRICS registered
+            key_prefix: Maps a key to a bounded-cardinality label
+            hot_keys: Optional sampler tracking the most-read keys
+        """
+        self._inner = inner
+        self._metrics_collector = metrics_collector
+        self._key_prefix = key_prefix
+        self._hot_keys = hot_keys
+
+    async def get_profile(self, user_id: UUID) -> CacheLookupResult[ProfileData]:
+        """Get cached profile, recording the lookup."""
+        key = f"profile:{user_id}"
+        prefix = self._key_prefix(key)
+        started = time.perf_counter()
+        try:
+            result = await self._inner.get_profile(user_id)
+        finally:
+            await self._observe_duration(prefix, "get_profile", started)
+
+        await self._record_lookups(((key, result, 0),))
+        return result
+
+    async def put_profile(
+        self, user_id: UUID, data: ProfileData, ttl_seconds: int, tags: Sequence[str] = ()
+    ) -> None:
+        """Store profile, recording the write latency."""
+        started = time.perf_counter()
+        try:
+            await self._inner.put_profile(user_id, data, ttl_seconds, tags)
+        finally:
+            await self._observe_duration(
+                self._key_prefix(f"profile:{user_id}"), "put_profile", started
+            )
+
+    async def get_value(self, key: str) -> CacheLookupResult[bytes]:
+        """Get cached value, recording the lookup and bytes read."""
+        started = time.perf_counter()
+        try:
+            result = await self._inner.get_value(key)
+        finally:
+            await self._observe_duration(self._key_prefix(key), "get_value", started)
+
+        await self._record_lookups(((key, result, _payload_size(result)),))
+        return result
+
+    async def put_value(
+        self, key: str, value: bytes, ttl_seconds: int, tags: Sequence[str] = ()
+    ) -> None:
+        """Store value, recording the write latency and bytes written."""
+        prefix = self._key_prefix(key)
+        started = time.perf_counter()
+        try:
+            await self._inner.put_value(key, value, ttl_seconds, tags)
+        finally:
+            await self._observe_duration(prefix, "put_value", started)
+
+        await self._record_bytes(Counter({prefix: len(value)}), "written")
+
+    async def invalidate(self, key: str) -> bool:
+        """Invalidate key, recording the latency."""
+        started = time.perf_counter()
+        try:
+            return await self._inner.invalidate(key)
+        finally:
+            await self._observe_duration(self._key_prefix(key), "invalidate", started)
+
+    async def get_values(self, keys: Sequence[str]) -> tuple[CacheLookupResult[bytes], ...]:
+        """Get many values, recording every lookup and the bytes read."""
+        started = time.perf_counter()
+        try:
+            results = await self._inner.get_values(keys)
+        finally:
+            await self._observe_duration(self._batch_prefix(keys), "get_values", started)
+
+        await self._record_lookups(
+            tuple((key, result, _payload_size(result)) for key, result in zip(keys, results))
+        )
+        return results
+
+    async def put_values(
+        self, entries: Sequence[tuple[str, bytes]], ttl_seconds: int, tags: Sequence[str] = ()
+    ) -> None:
+        """Store many values, recording the write latency and bytes written."""
+        keys = [key for key, _ in entries]
+        started = time.perf_counter()
+        try:
+            await self._inner.put_values(entries, ttl_seconds, tags)
+        finally:
+            await self._observe_duration(self._batch_prefix(keys), "put_values", started)
+
+        written: Counter[str] = Counter()
+        for key, value in entries:
+            written[self._key_prefix(key)] += len(value)
+        await self._record_bytes(written, "written")
+
+    async def invalidate_many(self, keys: Sequence[str]) -> int:
+        """Invalidate many keys, recording the latency."""
+        started = time.perf_counter()
+        try:
+            return await self._inner.invalidate_many(keys)
+        finally:
+            await self._observe_duration(self._batch_prefix(keys), "invalidate_many", started)
+
+    async def invalidate_tag(self, tag: str) -> tuple[str, ...]:
+        """Invalidate a tag, recording the latency under the tag's prefix."""
+        started = time.perf_counter()
+        try:
+            return await self._inner.invalidate_tag(tag)
+        finally:
+            await self._observe_duration(self._key_prefix(tag), "invalidate_tag", started)
+
+    def _batch_prefix(self, keys: Sequence[str]) -> str:
+        """Label for a batch: the shared prefix, or "mixed" if keys differ."""
+        prefixes = {self._key_prefix(key) for key in keys}
+        return prefixes.pop() if len(prefixes) == 1 else _MIXED_PREFIX
+
+    async def _record_lookups(self, lookups: tuple[_Lookup, ...]) -> None:
+        """Record hits, misses by reason, bytes read, and hot keys for lookups.
+
+        Counts are aggregated per label set first, so a batch costs one
+        collector call per distinct (prefix, outcome) rather than per key.
+        """
+        hits: Counter[str] = Counter()
+        misses: Counter[tuple[str, str]] = Counter()
+        read: Counter[str] = Counter()
+        for key, result, size in lookups:
+            prefix = self._key_prefix(key)
+            if self._hot_keys is not None:
+                self._hot_keys.record(key)
+            match result:
+                case CacheHit():
+                    hits[prefix] += 1
+                    read[prefix] += size
+                case CacheMiss(key=_, reason=reason):
+                    misses[(prefix, reason)] += 1
+
+        for prefix, count in hits.items():
+            await self._metrics_collector.increment_counter(
+                metric_name="effectful_cache_hits_total",
+                labels={"prefix": prefix},
+                value=float(count),
+            )
+        for (prefix, miss_reason), count in misses.items():
+            await self._metrics_collector.increment_counter(
+                metric_name="effectful_cache_misses_total",
+                labels={"prefix": prefix, "reason": miss_reason},
+                value=float(count),
+            )
+        await self._record_bytes(read, "read")
+
+    async def _record_bytes(
+        self, sizes: Counter[str], direction: Literal["read", "written"]
+    ) -> None:
+        """Record payload bytes per prefix (zero totals are skipped)."""
+        for prefix, size in sizes.items():
+            if size == 0:
+                continue
+            await self._metrics_collector.increment_counter(
+                metric_name="effectful_cache_bytes_total",
+                labels={"prefix": prefix, "direction": direction},
+                value=float(size),
+            )
+
+    async def _observe_duration(
+        self, prefix: str, operation: CacheOperation, started: float
+    ) -> None:
+        """Record the latency of one wrapped call started at perf_counter() == started."""
+        await self._metrics_collector.observe_histogram(
+            metric_name="effectful_cache_operation_duration_seconds",
+            labels={"prefix": prefix, "operation": operation},
+            value=time.perf_counter() - started,
+        )
+
+
+def _payload_size(result: CacheLookupResult[bytes]) -> int:
+    """Size of a hit's value in bytes (0 for misses)."""
+    match result:
+        case CacheHit(value=value, ttl_remaining=_):
+            return len(value)
+        case CacheMiss():
+            return 0
@@ -0,0 +1,205 @@
+"""Message payload codecs and per-topic codec selection.
+
+This module provides MessageCodec implementations that MessagingInterpreter
+applies to PublishValue effects and consumed envelopes, so programs exchange
+structured values instead of serializing payloads by hand.
+
+Implementations:
+    - JsonMessageCodec: Compact JSON ("application/json")
+    - MsgpackMessageCodec: MessagePack ("application/msgpack"), more compact
+      than JSON for numbers and nested data; requires the msgpack library
+    - SchemaTaggedCodec: Prefixes another codec's payload with a schema ID
+    - TopicCodecRegistry: Codec per topic, and decoders by content type
+
+A SchemaTaggedCodec payload uses the Confluent wire format, so schema-registry
+aware consumers can read it:
+
+    byte 0    MAGIC (0x00)
+    byte 1-4  schema ID (unsigned, big-endian)
+    byte 5+   body encoded by the inner codec
+
+Example:
+    >>> json_codec = JsonMessageCodec()
+    >>> codecs = TopicCodecRegistry(
+    ...     {"user-events": MsgpackMessageCodec(), "audit": SchemaTaggedCodec(7, json_codec)},
+    ...     default=json_codec,
+    ... )
+    >>> interpreter = MessagingInterpreter(producer=producer, consumer=consumer, codecs=codecs)
+"""
+
+import importlib.util
+import json
+import struct
+from collections.abc import Mapping, Sequence
+
+from effectful.domain.message_envelope import MessageValue
+from effectful.infrastructure.messaging import MessageCodec, MessageCodecRegistry
+
+MAGIC = 0x00
+
+_SCHEMA_HEADER = struct.Struct("!BI")
+
+MSGPACK_AVAILABLE = importlib.util.find_spec("msgpack") is not None
+
+
+class UnsupportedMessageFormat(ValueError):
+    """Payload was not written by the codec asked to decode it.
+
+    Raised for a missing or wrong header, or a schema ID other than the
+    codec's, so the interpreter can mark the envelope's value as not decoded.
+    """
+
+
+class JsonMessageCodec(MessageCodec):
+    """Compact JSON codec (no whitespace, UTF-8).
+
+    Implements MessageCodec protocol.
+    """
+
+    @property
+    def content_type(self) -> str:
+        """MIME type of encoded payloads."""
+        return "application/json"
+
+    def encode(self, value: MessageValue) -> bytes:
+        """Encode value as compact UTF-8 JSON."""
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def decode(self, payload: bytes) -> MessageValue:
+        """Decode a JSON payload.
+
+        Raises:
+            ValueError: If payload is not valid JSON
+        """
+        value: MessageValue = json.loads(payload)
+        return value
+
+
+class MsgpackMessageCodec(MessageCodec):
+    """MessagePack codec.
+
+    Implements MessageCodec protocol.
+    """
+
+    def __init__(self) -> None:
+        """Initialize codec.
+
+        Raises:
+            ImportError: If the msgpack library is not installed
+        """
+        if not MSGPACK_AVAILABLE:
+            raise ImportError(
+                "MessagePack encoding requires the msgpack library. "
+                "Install with: pip install msgpack"
+            )
+
+    @property
+    def content_type(self) -> str:
+        """MIME type of encoded payloads."""
+        return "application/msgpack"
+
+    def encode(self, value: MessageValue) -> bytes:
+        """Encode value as MessagePack."""
+        import msgpack
+
+        return msgpack.packb(value, use_bin_type=True)
+
+    def decode(self, payload: bytes) -> MessageValue:
+        """Decode a MessagePack payload.
+
+        Raises:
+            ValueError: If payload is not valid MessagePack
+        """
+        import msgpack
+
+        return msgpack.unpackb(payload, raw=False)
+
+
+class SchemaTaggedCodec(MessageCodec):
+    """Codec tagging payloads of another codec with a schema ID.
+
+    Implements MessageCodec protocol. Decoding checks the tag, so a consumer
+    never parses a payload written for a different schema version; register
+    one SchemaTaggedCodec per schema ID a consumer should still read.
+
+    Attributes:
+        _schema_id: Schema ID written to and expected in the header
+        _inner: Codec for the payload body
+        _header: Encoded header (magic byte and schema ID)
+    """
+
+    def __init__(self, schema_id: int, inner: MessageCodec) -> None:
+        """Initialize codec.
+
+        Args:
+            schema_id: Schema ID (0 to 2**32 - 1)
+            inner: Codec for the payload body
+
+        Raises:
+            ValueError: If schema_id is out of range
+        """
+        if not 0 <= schema_id < 2**32:
+            raise ValueError(f"schema_id must be in [0, 2**32), got {schema_id}")
+
+        self._schema_id = schema_id
+        self._inner = inner
+        self._header = _SCHEMA_HEADER.pack(MAGIC, schema_id)
+
+    @property
+    def content_type(self) -> str:
+        """Inner content type with the schema ID as a parameter."""
+        return f"{self._inner.content_type}; schema-id={self._schema_id}"
+
+    def encode(self, value: MessageValue) -> bytes:
+        """Encode value with the inner codec behind the schema header."""
+        return self._header + self._inner.encode(value)
+
+    def decode(self, payload: bytes) -> MessageValue:
+        """Check the schema header and decode the body with the inner codec.
+
+        Raises:
+            UnsupportedMessageFormat: If the header is missing or names another schema
+        """
+        if payload[: _SCHEMA_HEADER.size] != self._header:
+            raise UnsupportedMessageFormat(f"Payload is not tagged with schema {self._schema_id}")
+        return self._inner.decode(payload[_SCHEMA_HEADER.size :])
+
+
+class TopicCodecRegistry(MessageCodecRegistry):
+    """Codec per topic with an optional default.
+
+    Implements MessageCodecRegistry protocol. Every configured codec (and
+    each of decoders, for formats still read but no longer written) is also
+    looked up by its content type when decoding.
+
+    Attributes:
+        _by_topic: Codec for values published to each topic
+        _default: Codec for topics without their own (None: such topics have no codec)
+        _by_content_type: Decoders by content type
+    """
+
+    def __init__(
+        self,
+        by_topic: Mapping[str, MessageCodec],
+        default: MessageCodec | None = None,
+        decoders: Sequence[MessageCodec] = (),
+    ) -> None:
+        """Initialize registry.
+
+        Args:
+            by_topic: Codec for values published to each topic
+            default: Codec for other topics
+            decoders: Additional codecs consumed payloads may be encoded with
+        """
+        self._by_topic = dict(by_topic)
+        self._default = default
+        codecs = [*decoders, *by_topic.values(), *([default] if default is not None else [])]
+        self._by_content_type = {codec.content_type: codec for codec in codecs}
+
+    def for_topic(self, topic: str) -> MessageCodec | None:
+        """Codec values published to topic are encoded with, or None."""
+        return self._by_topic.get(topic, self._default)
+
+    def for_content_type(self, content_type: str) -> MessageCodec | None:
+        """Codec that decodes payloads of content_type, or None."""
+        return self._by_content_type.get(content_type)
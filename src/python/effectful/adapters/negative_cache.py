@@ -0,0 +1,117 @@
+"""In-process negative cache for lookups that found nothing.
+
+This module provides InMemoryNegativeCache, a NegativeLookupCache that keeps
+not-found results in a size-bounded, TTL-aware LRU in process memory.
+
+Entries are per process: a record created through another instance stays
+"missing" here until the entry expires, so keep ttl_seconds short (seconds,
+not minutes). Writes through this process call forget immediately.
+
+Example:
+    >>> misses: InMemoryNegativeCache[UserNotFound] = InMemoryNegativeCache(ttl_seconds=10.0)
+    >>> interpreter = DatabaseInterpreter(
+    ...     user_repo=user_repo, message_repo=message_repo, negative_cache=misses
+    ... )
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from effectful.domain.optional_value import Absent, OptionalValue, Provided
+from effectful.infrastructure.cache import NegativeLookupCache
+
+
+@dataclass(frozen=True)
+class _MissEntry[T]:
+    """A remembered miss.
+
+    Attributes:
+        miss: Not-found result to return
+        expires_at: Monotonic time after which the entry is dropped
+    """
+
+    miss: T
+    expires_at: float
+
+
+class InMemoryNegativeCache[T](NegativeLookupCache[T]):
+    """Negative cache held in process memory.
+
+    Implements NegativeLookupCache protocol.
+
+    Attributes:
+        _ttl_seconds: How long a miss is remembered
+        _max_entries: Maximum remembered misses before LRU eviction
+        _clock: Monotonic clock (injectable for tests)
+        _entries: Remembered misses in least-recently-used order
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 10.0,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize negative cache.
+
+        Args:
+            ttl_seconds: How long a miss is remembered (> 0)
+            max_entries: Maximum remembered misses (> 0)
+            clock: Monotonic clock in seconds
+
+        Raises:
+            ValueError: If ttl_seconds or max_entries is not positive
+        """
+        if ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be > 0, got {ttl_seconds}")
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be > 0, got {max_entries}")
+
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, _MissEntry[T]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of remembered misses (including not yet evicted expired ones)."""
+        return len(self._entries)
+
+    async def get_miss(self, key: str) -> OptionalValue[T]:
+        """Get the remembered miss for key.
+
+        Args:
+            key: Lookup key
+
+        Returns:
+            Provided miss if remembered and not expired, Absent otherwise
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return Absent(reason="not_cached")
+        if self._clock() >= entry.expires_at:
+            del self._entries[key]
+            return Absent(reason="expired")
+        self._entries.move_to_end(key)
+        return Provided(value=entry.miss)
+
+    async def put_miss(self, key: str, miss: T) -> None:
+        """Remember miss for key for ttl_seconds, evicting the oldest entries.
+
+        Args:
+            key: Lookup key
+            miss: Not-found result to return for key
+        """
+        self._entries[key] = _MissEntry(miss=miss, expires_at=self._clock() + self._ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def forget(self, key: str) -> None:
+        """Drop the remembered miss for key.
+
+        Args:
+            key: Lookup key
+        """
+        self._entries.pop(key, None)
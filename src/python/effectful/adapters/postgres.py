@@ -1,11 +1,14 @@
 """PostgreSQL implementations of repository protocols.
 
-This module provides asyncpg-based implementations for user and message repositories.
+This module provides asyncpg-based implementations for user and message repositories,
+plus a transaction manager that binds both repositories to one transaction on a
+connection acquired from a pool.
 These are production-ready adapters that connect to real PostgreSQL databases.
 
 For testing, use pytest mocks instead of these real implementations.
 """
 
+import asyncio
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
@@ -13,18 +16,50 @@ import asyncpg
 
 from effectful.domain.message import ChatMessage
 from effectful.domain.optional_value import OptionalValue, from_optional_value
-from effectful.domain.user import User, UserFound, UserLookupResult, UserNotFound
+from effectful.domain.user import (
+    User,
+    UserEmailExists,
+    UserFound,
+    UserLookupResult,
+    UserNotFound,
+    UserUpdateResult,
+    UserUpsertResult,
+    UserVersionConflict,
+)
 from effectful.infrastructure.repositories import (
+    BulkChatMessageRepository,
     ChatMessageRepository,
+    TransactionManager,
+    UnitOfWork,
     UserRepository,
 )
 
 
+# Adds the users.version column read by every user query (UpsertUser,
+# UpdateUserIf and optimistic updates). Existing rows start at version 1;
+# re-running it is a no-op.
+USERS_VERSION_MIGRATION = (
+    "ALTER TABLE users ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1"
+)
+
+
+async def migrate_users_version(connection: asyncpg.Connection) -> None:
+    """Add the users.version column to a schema created before it existed.
+
+    Run once per database before deploying code that uses
+    PostgresUserRepository; user reads fail on a users table without it.
+
+    Args:
+        connection: Active asyncpg connection with ALTER TABLE privilege
+    """
+    await connection.execute(USERS_VERSION_MIGRATION)
+
+
 def _extract_user_from_row(row: asyncpg.Record) -> User:
     """Extract and validate User from asyncpg row with type checking.
 
     Args:
-        row: asyncpg Record containing id, email, name columns
+        row: asyncpg Record containing id, email, name, version columns
 
     Returns:
         Validated User instance
@@ -35,6 +70,7 @@ def _extract_user_from_row(row: asyncpg.Record) -> User:
     row_id = row["id"]
     row_email = row["email"]
     row_name = row["name"]
+    row_version = row["version"]
 
     if not isinstance(row_id, UUID):
         raise RuntimeError(f"Invalid row id type: {type(row_id)}")
@@ -42,8 +78,10 @@ def _extract_user_from_row(row: asyncpg.Record) -> User:
         raise RuntimeError(f"Invalid row email type: {type(row_email)}")
     if not isinstance(row_name, str):
         raise RuntimeError(f"Invalid row name type: {type(row_name)}")
+    if not isinstance(row_version, int):
+        raise RuntimeError(f"Invalid row version type: {type(row_version)}")
 
-    return User(id=row_id, email=row_email, name=row_name)
+    return User(id=row_id, email=row_email, name=row_name, version=row_version)
 
 
 def _extract_chat_message_from_row(row: asyncpg.Record) -> ChatMessage:
@@ -83,7 +121,8 @@ def _extract_chat_message_from_row(row: asyncpg.Record) -> ChatMessage:
 class PostgresUserRepository(UserRepository):
     """asyncpg-based user repository.
 
-    Implements UserRepository protocol using PostgreSQL via asyncpg.
+    Implements UserRepository protocol using PostgreSQL via asyncpg. The
+    users table needs the version column (see migrate_users_version).
 
     Attributes:
         _conn: asyncpg connection to PostgreSQL database
@@ -107,7 +146,9 @@ class PostgresUserRepository(UserRepository):
             UserFound if user exists with source="database"
             UserNotFound with reason="does_not_exist" if not found
         """
-        row = await self._conn.fetchrow("SELECT id, email, name FROM users WHERE id = $1", user_id)
+        row = await self._conn.fetchrow(
+            "SELECT id, email, name, version FROM users WHERE id = $1", user_id
+        )
 
         if row is None:
             return UserNotFound(user_id=user_id, reason="does_not_exist")
@@ -123,7 +164,9 @@ class PostgresUserRepository(UserRepository):
         Returns:
             UserFound if user exists, UserNotFound otherwise
         """
-        row = await self._conn.fetchrow("SELECT id, email, name FROM users WHERE email = $1", email)
+        row = await self._conn.fetchrow(
+            "SELECT id, email, name, version FROM users WHERE email = $1", email
+        )
 
         if row is None:
             # Use uuid4() as placeholder since we don't have a user_id
@@ -146,7 +189,7 @@ class PostgresUserRepository(UserRepository):
         resolved_offset = from_optional_value(offset)
 
         query_parts = (
-            "SELECT id, email, name FROM users ORDER BY name",
+            "SELECT id, email, name, version FROM users ORDER BY name",
             " LIMIT $1" if resolved_limit is not None else "",
             f" OFFSET ${2 if resolved_limit is not None else 1}"
             if resolved_offset is not None
@@ -159,12 +202,13 @@ class PostgresUserRepository(UserRepository):
 
         # Pure list comprehension with type validation
         return [
-            User(id=row["id"], email=row["email"], name=row["name"])
+            User(id=row["id"], email=row["email"], name=row["name"], version=row["version"])
             for row in rows
             if (
                 isinstance(row["id"], UUID)
                 and isinstance(row["email"], str)
                 and isinstance(row["name"], str)
+                and isinstance(row["version"], int)
             )
         ]
 
@@ -184,7 +228,7 @@ class PostgresUserRepository(UserRepository):
             """
             INSERT INTO users (id, email, name, password_hash)
             VALUES ($1, $2, $3, $4)
-            RETURNING id, email, name
+            RETURNING id, email, name, version
             """,
             user_id,
             email,
@@ -227,9 +271,9 @@ class PostgresUserRepository(UserRepository):
         updates = ", ".join(f"{field} = ${i + 1}" for i, (field, _) in enumerate(fields))
         params: tuple[str | UUID, ...] = tuple(value for _, value in fields) + (user_id,)
         query = f"""
-            UPDATE users SET {updates}
+            UPDATE users SET {updates}, version = version + 1
             WHERE id = ${len(fields) + 1}
-            RETURNING id, email, name
+            RETURNING id, email, name, version
         """
 
         row = await self._conn.fetchrow(query, *params)
@@ -247,11 +291,122 @@ class PostgresUserRepository(UserRepository):
         """
         await self._conn.execute("DELETE FROM users WHERE id = $1", user_id)
 
+    async def upsert_user(self, email: str, name: str, password_hash: str) -> UserUpsertResult:
+        """Create user unless a user with this email exists, in one statement.
+
+        ON CONFLICT DO NOTHING leaves an existing row untouched; the same
+        statement returns it so the caller learns who holds the email without
+        a second round-trip.
+
+        Args:
+            email: User email address (conflict key)
+            name: User name
+            password_hash: Bcrypt password hash
+
+        Returns:
+            The created User, or UserEmailExists with the existing user
+
+        Raises:
+            RuntimeError: If the conflicting user vanished before it could be read
+        """
+        row = await self._conn.fetchrow(
+            """
+            WITH inserted AS (
+                INSERT INTO users (id, email, name, password_hash)
+                VALUES ($1, $2, $3, $4)
+                ON CONFLICT (email) DO NOTHING
+                RETURNING id, email, name, version
+            )
+            SELECT id, email, name, version, TRUE AS created FROM inserted
+            UNION ALL
+            SELECT id, email, name, version, FALSE AS created FROM users
+            WHERE email = $2 AND NOT EXISTS (SELECT 1 FROM inserted)
+            """,
+            uuid4(),
+            email,
+            name,
+            password_hash,
+        )
+
+        if row is None:
+            # The conflicting row was committed after this statement's snapshot
+            match await self.get_by_email(email):
+                case UserFound(user=current):
+                    return UserEmailExists(email=email, current=current)
+                case UserNotFound():
+                    raise RuntimeError(f"User with email {email} conflicted but is gone")
+
+        user = _extract_user_from_row(row)
+        if row["created"]:
+            return user
+        return UserEmailExists(email=email, current=user)
+
+    async def update_user_if(
+        self,
+        user_id: UUID,
+        expected_version: int,
+        email: OptionalValue[str],
+        name: OptionalValue[str],
+    ) -> UserUpdateResult:
+        """Update user fields in PostgreSQL only if the version is unchanged.
+
+        The conditional UPDATE and the lookup that explains a miss run as one
+        statement: when the version predicate fails, the current row is returned
+        with applied = FALSE, so conflicts and missing users are told apart
+        without a second round-trip. A successful update always bumps version.
+
+        Args:
+            user_id: UUID of user to update
+            expected_version: Version the caller read
+            email: New email (Absent to keep current)
+            name: New name (Absent to keep current)
+
+        Returns:
+            UserFound with updated user, UserNotFound if not found,
+            UserVersionConflict with the current user if the version changed
+        """
+        resolved_email = from_optional_value(email)
+        resolved_name = from_optional_value(name)
+        fields = tuple(
+            (field, value)
+            for field, value in (("email", resolved_email), ("name", resolved_name))
+            if value is not None
+        )
 
-class PostgresChatMessageRepository(ChatMessageRepository):
+        updates = "".join(f"{field} = ${i + 1}, " for i, (field, _) in enumerate(fields))
+        id_param = len(fields) + 1
+        params: tuple[str | UUID | int, ...] = tuple(value for _, value in fields) + (
+            user_id,
+            expected_version,
+        )
+        query = f"""
+            WITH updated AS (
+                UPDATE users SET {updates}version = version + 1
+                WHERE id = ${id_param} AND version = ${id_param + 1}
+                RETURNING id, email, name, version
+            )
+            SELECT id, email, name, version, TRUE AS applied FROM updated
+            UNION ALL
+            SELECT id, email, name, version, FALSE AS applied FROM users
+            WHERE id = ${id_param} AND NOT EXISTS (SELECT 1 FROM updated)
+        """
+
+        row = await self._conn.fetchrow(query, *params)
+
+        if row is None:
+            return UserNotFound(user_id=user_id, reason="does_not_exist")
+
+        user = _extract_user_from_row(row)
+        if row["applied"]:
+            return UserFound(user=user, source="database")
+        return UserVersionConflict(user_id=user_id, expected_version=expected_version, current=user)
+
+
+class PostgresChatMessageRepository(BulkChatMessageRepository):
     """asyncpg-based chat message repository.
 
-    Implements ChatMessageRepository protocol using PostgreSQL via asyncpg.
+    Implements ChatMessageRepository and BulkChatMessageRepository protocols
+    using PostgreSQL via asyncpg.
 
     Attributes:
         _conn: asyncpg connection to PostgreSQL database
@@ -292,6 +447,42 @@ class PostgresChatMessageRepository(ChatMessageRepository):
 
         return _extract_chat_message_from_row(row)
 
+    async def save_messages(self, messages: list[tuple[UUID, str, datetime]]) -> list[ChatMessage]:
+        """Save several chat messages with one multi-row INSERT.
+
+        The rows are passed as parallel arrays and expanded with unnest, so the
+        whole batch costs one statement and one commit regardless of its size.
+
+        Args:
+            messages: (user_id, text, created_at) triples to insert
+
+        Returns:
+            Saved ChatMessages in the same order as the input
+        """
+        if not messages:
+            return []
+
+        message_ids = [uuid4() for _ in messages]
+        rows = await self._conn.fetch(
+            """
+            INSERT INTO chat_messages (id, user_id, text, created_at)
+            SELECT * FROM unnest($1::uuid[], $2::uuid[], $3::text[], $4::timestamptz[])
+            RETURNING id, user_id, text, created_at
+            """,
+            message_ids,
+            [user_id for user_id, _, _ in messages],
+            [text for _, text, _ in messages],
+            [created_at for _, _, created_at in messages],
+        )
+
+        # RETURNING order is not guaranteed for INSERT ... SELECT - realign by id
+        saved = {message.id: message for message in map(_extract_chat_message_from_row, rows)}
+        if len(saved) != len(message_ids):
+            raise RuntimeError(
+                f"INSERT RETURNING returned {len(saved)} rows for {len(message_ids)} messages"
+            )
+        return [saved[message_id] for message_id in message_ids]
+
     async def list_messages_for_user(self, user_id: UUID) -> list[ChatMessage]:
         """List all messages for a given user from PostgreSQL.
 
@@ -327,3 +518,133 @@ class PostgresChatMessageRepository(ChatMessageRepository):
                 and isinstance(row["created_at"], datetime)
             )
         ]
+
+
+class PostgresUnitOfWork(UnitOfWork):
+    """Repositories bound to one open asyncpg transaction.
+
+    Attributes:
+        _conn: Connection the transaction runs on
+        _transaction: Started asyncpg transaction (or savepoint)
+        _pool: Pool to return the connection to when the transaction ends
+            (None for savepoints, whose connection belongs to the outer transaction)
+        _user_repo: User repository sharing the transaction's connection
+        _message_repo: Message repository sharing the transaction's connection
+    """
+
+    def __init__(
+        self,
+        connection: asyncpg.Connection,
+        transaction: "asyncpg.Transaction",
+        pool: "asyncpg.Pool | None" = None,
+    ) -> None:
+        """Initialize unit of work with a started transaction.
+
+        Args:
+            connection: Connection the transaction was started on
+            transaction: Started asyncpg transaction
+            pool: Pool the connection was acquired from, released on commit/rollback
+        """
+        self._conn = connection
+        self._transaction = transaction
+        self._pool = pool
+        self._user_repo = PostgresUserRepository(connection)
+        self._message_repo = PostgresChatMessageRepository(connection)
+
+    @property
+    def user_repo(self) -> UserRepository:
+        """User repository bound to the open transaction."""
+        return self._user_repo
+
+    @property
+    def message_repo(self) -> ChatMessageRepository:
+        """Chat message repository bound to the open transaction."""
+        return self._message_repo
+
+    async def begin(self) -> UnitOfWork:
+        """Start a savepoint inside this transaction.
+
+        Returns:
+            PostgresUnitOfWork on the same connection; committing it releases
+            the savepoint, rolling it back undoes only its writes.
+        """
+        savepoint = self._conn.transaction()
+        await savepoint.start()
+        return PostgresUnitOfWork(self._conn, savepoint)
+
+    async def commit(self) -> None:
+        """Commit the transaction (releases the savepoint when nested)."""
+        try:
+            await self._transaction.commit()
+        finally:
+            await self._release()
+
+    async def rollback(self) -> None:
+        """Roll back the transaction (to the savepoint when nested)."""
+        try:
+            await self._transaction.rollback()
+        finally:
+            await self._release()
+
+    async def _release(self) -> None:
+        """Return the connection to its pool once the outer transaction ends."""
+        if self._pool is not None:
+            await self._pool.release(self._conn)
+
+
+class PostgresTransactionManager(TransactionManager):
+    """asyncpg-based transaction manager.
+
+    Implements TransactionManager protocol on a connection pool. Each begin()
+    acquires a dedicated connection, so concurrent Transaction effects are
+    independent transactions, and autocommit repositories (which must use
+    other connections) never join an open transaction by accident. One COMMIT
+    (and one WAL flush) covers all writes of a Transaction effect instead of
+    one per autocommit statement.
+
+    Unless migrate_schema is False, the first begin() runs
+    USERS_VERSION_MIGRATION, so user reads work against a database created
+    before the users.version column existed.
+
+    Attributes:
+        _pool: asyncpg pool that transaction connections are acquired from
+        _migrated: Whether the schema migration has run (or is disabled)
+        _migrating: Serializes the one-time schema migration
+    """
+
+    def __init__(self, pool: asyncpg.Pool, migrate_schema: bool = True) -> None:
+        """Initialize transaction manager with a connection pool.
+
+        Args:
+            pool: asyncpg pool; each transaction holds one connection until it ends
+            migrate_schema: Add the users.version column on first use (disable
+                when the role lacks ALTER TABLE and migrations run separately)
+        """
+        self._pool = pool
+        self._migrated = not migrate_schema
+        self._migrating = asyncio.Lock()
+
+    async def begin(self) -> UnitOfWork:
+        """Start a transaction on a connection acquired from the pool.
+
+        Returns:
+            PostgresUnitOfWork bound to the started transaction. The connection
+            goes back to the pool on commit or rollback.
+        """
+        connection = await self._pool.acquire()
+        try:
+            if not self._migrated:
+                await self._migrate(connection)
+            transaction = connection.transaction()
+            await transaction.start()
+        except BaseException:
+            await self._pool.release(connection)
+            raise
+        return PostgresUnitOfWork(connection, transaction, self._pool)
+
+    async def _migrate(self, connection: asyncpg.Connection) -> None:
+        """Run the users.version migration once per manager."""
+        async with self._migrating:
+            if not self._migrated:
+                await migrate_users_version(connection)
+                self._migrated = True
@@ -6,6 +6,7 @@ using the Apache Pulsar Python client library.
 Implementations:
     - PulsarMessageProducer: Publishes messages to Pulsar topics
     - PulsarMessageConsumer: Consumes messages from Pulsar subscriptions
+    - PulsarProducerConfig: Batching and compression settings for producers
 
 Dependencies:
     Requires pulsar-client library:
@@ -14,10 +15,32 @@ Dependencies:
 Type Safety:
     All implementations follow protocol contracts strictly. Domain failures return
     ADTs (PublishSuccess/PublishFailure), not exceptions.
+
+Concurrency:
+    PulsarMessageProducer.publish awaits send_async receipts instead of calling
+    the blocking send, so publishing never stalls the event loop. The client's
+    other blocking calls (create_producer, subscribe, receive, batch_receive,
+    acknowledge) run on a thread executor, by default a dedicated
+    ThreadPoolExecutor per producer/consumer instance.
+
+Lifecycle:
+    Producers (per topic) and consumers (per subscription) are cached in an
+    LRU bounded by count and idle time, so services using many short-lived
+    topics do not keep a broker handle open for each one forever. Call
+    close() on shutdown to close every cached handle.
 """
 
+import asyncio
+import itertools
 import os
+import time
+from collections import Counter, OrderedDict, deque
+from collections.abc import Buffer, Callable, Iterator, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import Literal, Protocol
 
 try:
     import pulsar
@@ -30,6 +53,7 @@ from effectful.domain.message_envelope import (
     AcknowledgeFailure,
     AcknowledgeResult,
     AcknowledgeSuccess,
+    ConsumeBatchResult,
     ConsumeFailure,
     ConsumeResult,
     ConsumeTimeout,
@@ -42,22 +66,342 @@ from effectful.domain.message_envelope import (
     PublishSuccess,
 )
 from effectful.infrastructure.messaging import MessageConsumer, MessageProducer
+from effectful.infrastructure.metrics import MetricsCollector
+
+# PublishFailure.reason values
+type _PublishFailureReason = Literal[
+    "broker_unreachable",
+    "bookkeeper_not_ready",
+    "auth_failed",
+    "connection_closed",
+    "timeout",
+    "quota_exceeded",
+    "topic_not_found",
+    "message_too_large",
+    "producer_blocked",
+]
+
+# send_async result codes mapped to publish failure reasons. Other codes are
+# reported as connection_closed (a generic broker-side failure worth retrying)
+# rather than as a topic error that never happened.
+_SEND_FAILURE_REASONS: dict[pulsar.Result, _PublishFailureReason] = {
+    pulsar.Result.Timeout: "timeout",
+    pulsar.Result.ProducerQueueIsFull: "quota_exceeded",
+    pulsar.Result.ProducerBlockedQuotaExceededError: "producer_blocked",
+    pulsar.Result.ProducerBlockedQuotaExceededException: "producer_blocked",
+    pulsar.Result.MessageTooBig: "message_too_large",
+    pulsar.Result.AlreadyClosed: "connection_closed",
+    pulsar.Result.ConnectError: "connection_closed",
+    pulsar.Result.NotConnected: "connection_closed",
+    pulsar.Result.AuthenticationError: "auth_failed",
+    pulsar.Result.AuthorizationError: "auth_failed",
+    pulsar.Result.TopicNotFound: "topic_not_found",
+}
+
+
+# Threads in the executor created when none is passed to a producer/consumer
+_DEFAULT_EXECUTOR_THREADS = 8
+
+
+def _owned_executor(kind: Literal["producer", "consumer"]) -> ThreadPoolExecutor:
+    """Executor for a producer/consumer that was not given one (shut down by close())."""
+    return ThreadPoolExecutor(
+        max_workers=_DEFAULT_EXECUTOR_THREADS, thread_name_prefix=f"pulsar-{kind}"
+    )
+
+
+# Producer compression codecs by name
+type PulsarCompression = Literal["none", "lz4", "zlib", "zstd", "snappy"]
+
+_COMPRESSION_TYPES: dict[PulsarCompression, pulsar.CompressionType] = {
+    "none": pulsar.CompressionType.NONE,
+    "lz4": pulsar.CompressionType.LZ4,
+    "zlib": pulsar.CompressionType.ZLib,
+    "zstd": pulsar.CompressionType.ZSTD,
+    "snappy": pulsar.CompressionType.SNAPPY,
+}
+
+
+@dataclass(frozen=True)
+class PulsarProducerConfig:
+    """Batching and compression settings for producers created per topic.
+
+    A batch is flushed when it holds batching_max_messages messages or
+    batching_max_bytes bytes, or when its oldest message has waited
+    batching_max_delay_ms. Compression applies to the whole batch, so it pays
+    off most with batching enabled.
+
+    Attributes:
+        batching_enabled: Group messages sent close together into one broker entry
+        batching_max_messages: Messages per batch before it is flushed
+        batching_max_bytes: Bytes per batch before it is flushed
+        batching_max_delay_ms: Longest time a message waits for its batch to fill
+        compression: Compression codec ("none", "lz4", "zlib", "zstd", "snappy")
+        max_pending_messages: Client queue size for sends awaiting a receipt
+            (keep the producer's max_in_flight at or below it)
+    """
+
+    batching_enabled: bool = True
+    batching_max_messages: int = 1000
+    batching_max_bytes: int = 128 * 1024
+    batching_max_delay_ms: int = 10
+    compression: PulsarCompression = "lz4"
+    max_pending_messages: int = 1000
+
+
+def _receive_failure(subscription: str, error: Exception) -> ConsumeFailure:
+    """Classify an exception raised while receiving from an existing consumer."""
+    error_msg = str(error).lower()
+    error_type = type(error).__name__.lower()
+    if "closed" in error_msg or "consumerclosed" in error_type:
+        return ConsumeFailure(subscription=subscription, reason="consumer_closed")
+    if "connect" in error_msg:
+        return ConsumeFailure(subscription=subscription, reason="connection_closed")
+    return ConsumeFailure(subscription=subscription, reason="subscription_not_found")
+
+
+@dataclass(frozen=True)
+class _Unacked:
+    """A delivered message awaiting ack/nack and the subscription it came from."""
+
+    subscription: str
+    message: pulsar.Message
+    sequence: int
+
+
+def _as_bytes(payload: Buffer) -> bytes:
+    """Return payload as bytes, copying only buffers that are not bytes already."""
+    return payload if isinstance(payload, bytes) else bytes(payload)
+
+
+@contextmanager
+def _in_use(counts: Counter[str], key: str) -> Iterator[None]:
+    """Count key as in use for the duration of the block."""
+    counts[key] += 1
+    try:
+        yield
+    finally:
+        counts[key] -= 1
+        if counts[key] <= 0:
+            del counts[key]
+
+
+def _resolve_receipt[T](receipt: asyncio.Future[T], value: T) -> None:
+    """Complete a send receipt unless its awaiting publish was cancelled."""
+    if not receipt.done():
+        receipt.set_result(value)
+
+
+class _Closeable(Protocol):
+    """Client handle released with a blocking close()."""
+
+    def close(self) -> None:
+        ...
+
+
+# Why a cached handle was closed (used as a metrics label)
+type _EvictionReason = Literal["idle", "capacity", "policy"]
+
+
+class _HandleCache[H: _Closeable]:
+    """Producers or consumers by topic/subscription, bounded in count and idle time.
+
+    Handles are kept in least-recently-used order. Handles unused for
+    idle_timeout_seconds, and the least recently used ones beyond max_handles,
+    are closed on the executor. A handle for which busy(key) is true (sends or
+    unacknowledged messages outstanding) is never evicted, so the cache can
+    briefly hold more than max_handles handles.
+
+    Metrics recorded when metrics_collector is set (all in FRAMEWORK_METRICS):
+    - effectful_pulsar_handles_created_total: Counter with label (kind)
+    - effectful_pulsar_handles_evicted_total: Counter with labels (kind, reason)
+    - effectful_pulsar_open_handles: Gauge with label (kind)
+
+    Attributes:
+        _kind: "producer" or "consumer" (metrics label)
+        _max_handles: Cached handles before the least recently used idle one is closed
+        _idle_timeout_seconds: Unused time after which a handle is closed (None: never)
+        _busy: Whether the handle for a key must stay open
+        _executor: Returns the executor the blocking close() calls run on
+        _metrics_collector: Optional collector with FRAMEWORK_METRICS registered
+        _clock: Monotonic clock (injectable for tests)
+        _handles: Cached handles in least-recently-used order
+        _last_used: Clock time each cached handle was last used
+    """
+
+    def __init__(
+        self,
+        kind: Literal["producer", "consumer"],
+        max_handles: int,
+        idle_timeout_seconds: float | None,
+        busy: Callable[[str], bool],
+        executor: Callable[[], Executor],
+        metrics_collector: MetricsCollector | None,
+        clock: Callable[[], float],
+    ) -> None:
+        if max_handles < 1:
+            raise ValueError(f"max_{kind}s must be >= 1, got {max_handles}")
+        if idle_timeout_seconds is not None and idle_timeout_seconds <= 0:
+            raise ValueError(f"idle_timeout_seconds must be > 0, got {idle_timeout_seconds}")
+
+        self._kind = kind
+        self._max_handles = max_handles
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._busy = busy
+        self._executor = executor
+        self._metrics_collector = metrics_collector
+        self._clock = clock
+        self._handles: OrderedDict[str, H] = OrderedDict()
+        self._last_used: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        """Number of cached handles."""
+        return len(self._handles)
+
+    def get(self, key: str) -> H | None:
+        """Return the cached handle for key (marking it used), or None."""
+        handle = self._handles.get(key)
+        if handle is not None:
+            self._touch(key)
+        return handle
+
+    async def add(self, key: str, handle: H) -> None:
+        """Cache a newly created handle, closing idle ones beyond max_handles."""
+        self._handles[key] = handle
+        self._touch(key)
+        await self._record_created()
+
+        excess = len(self._handles) - self._max_handles
+        victims = [
+            candidate
+            for candidate in self._handles
+            if candidate != key and not self._busy(candidate)
+        ][: max(excess, 0)]
+        await self._close([self._pop(victim) for victim in victims], reason="capacity")
+
+    async def evict_idle(self) -> None:
+        """Close handles unused for idle_timeout_seconds; busy handles count as used."""
+        if self._idle_timeout_seconds is None:
+            return
+
+        now = self._clock()
+        expired: list[H] = []
+        while self._handles:
+            key = next(iter(self._handles))
+            if now - self._last_used[key] < self._idle_timeout_seconds:
+                break
+            if self._busy(key):
+                self._touch(key)
+            else:
+                expired.append(self._pop(key))
+        await self._close(expired, reason="idle")
+
+    async def remove(self, key: str, reason: _EvictionReason) -> None:
+        """Close and forget the handle for key, if cached."""
+        if key in self._handles:
+            await self._close([self._pop(key)], reason=reason)
+
+    async def close_all(self) -> None:
+        """Close every cached handle."""
+        handles = list(self._handles.values())
+        self._handles.clear()
+        self._last_used.clear()
+        await self._close(handles, reason=None)
+
+    def _touch(self, key: str) -> None:
+        self._handles.move_to_end(key)
+        self._last_used[key] = self._clock()
+
+    def _pop(self, key: str) -> H:
+        del self._last_used[key]
+        return self._handles.pop(key)
+
+    async def _close(self, handles: list[H], reason: _EvictionReason | None) -> None:
+        """Close handles on the executor, recording evictions when reason is set."""
+        if not handles:
+            return
+
+        loop = asyncio.get_running_loop()
+        for handle in handles:
+            try:
+                await loop.run_in_executor(self._executor(), handle.close)
+            except Exception:
+                # The broker releases the handle when its connection goes away
+                pass
+            if reason is not None and self._metrics_collector is not None:
+                await self._metrics_collector.increment_counter(
+                    metric_name="effectful_pulsar_handles_evicted_total",
+                    labels={"kind": self._kind, "reason": reason},
+                    value=1.0,
+                )
+        await self._record_open()
+
+    async def _record_created(self) -> None:
+        """Count a created handle and update the open-handles gauge."""
+        if self._metrics_collector is None:
+            return
+
+        await self._metrics_collector.increment_counter(
+            metric_name="effectful_pulsar_handles_created_total",
+            labels={"kind": self._kind},
+            value=1.0,
+        )
+        await self._record_open()
+
+    async def _record_open(self) -> None:
+        """Set the open-handles gauge (fire-and-forget)."""
+        if self._metrics_collector is None:
+            return
+
+        await self._metrics_collector.record_gauge(
+            metric_name="effectful_pulsar_open_handles",
+            labels={"kind": self._kind},
+            value=float(len(self._handles)),
+        )
 
 
 class PulsarMessageProducer(MessageProducer):
     """Pulsar-based message producer.
 
     This implementation uses the Pulsar Python client to publish messages to topics.
-    Producers are created lazily per topic and cached for reuse.
+    Producers are created lazily per topic and cached for reuse: at most
+    max_producers are kept open, and one unused for idle_timeout_seconds is
+    closed (a producer with sends awaiting a receipt is never closed).
+
+    Messages are sent with the client's send_async, whose completion callback
+    (invoked on a Pulsar I/O thread) resolves an asyncio future, so publish
+    never blocks the event loop on a broker round-trip and many publishes can
+    be in flight at once. At most max_in_flight sends are outstanding per
+    producer instance; further publishes wait for a slot instead of
+    overflowing the client's pending-message queue.
+
+    Without a producer_config, producers use the client defaults. Pass a
+    PulsarProducerConfig to tune batching and compression for throughput.
+
+    Producers are created on the executor (create_producer blocks until the
+    broker answers), one topic at a time.
+
+    Metrics recorded when metrics_collector is set (all in FRAMEWORK_METRICS):
+    - effectful_pulsar_publish_duration_seconds: Histogram with labels (topic, result)
+    - effectful_pulsar_publishes_in_flight: Gauge with label (topic)
+    - effectful_pulsar_handles_created_total / _evicted_total and
+      effectful_pulsar_open_handles with kind="producer"
 
     Attributes:
         _client: Pulsar client instance
-        _producers: Cache of topic -> producer mappings
+        _producers: Bounded cache of topic -> producer mappings
+        _sending: Sends in progress per topic (their producers stay open)
+        _producer_config: Batching/compression settings (None for client defaults)
+        _in_flight: Limits concurrently outstanding sends
+        _metrics_collector: Optional collector with FRAMEWORK_METRICS registered
+        _executor: Runs blocking client calls off the event loop
+        _owns_executor: Whether _executor was created here (and is shut down by close())
+        _creating: Serializes producer creation so each topic gets one producer
 
     Example:
         >>> import pulsar
         >>> client = pulsar.Client("pulsar://localhost:6650")
-        >>> producer = PulsarMessageProducer(client)
+        >>> producer = PulsarMessageProducer(client, max_in_flight=500)
         >>>
         >>> result = await producer.publish(
         ...     topic="user-events",
@@ -70,26 +414,67 @@ class PulsarMessageProducer(MessageProducer):
         ...         print(f"Published: {msg_id}")
     """
 
-    def __init__(self, client: pulsar.Client) -> None:
+    def __init__(
+        self,
+        client: pulsar.Client,
+        max_in_flight: int = 1000,
+        metrics_collector: MetricsCollector | None = None,
+        producer_config: PulsarProducerConfig | None = None,
+        executor: Executor | None = None,
+        max_producers: int = 1000,
+        idle_timeout_seconds: float | None = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         """Initialize producer with Pulsar client.
 
         Args:
             client: Connected Pulsar client instance
+            producer_config: Batching/compression settings (None for client defaults)
+            max_in_flight: Maximum number of sends awaiting a broker receipt (>= 1)
+            metrics_collector: Optional collector with FRAMEWORK_METRICS registered
+            executor: Executor for blocking client calls (None: a dedicated
+                ThreadPoolExecutor with 8 threads)
+            max_producers: Maximum number of cached producers (>= 1)
+            idle_timeout_seconds: Close producers unused this long (> 0, None: never)
+            clock: Monotonic clock in seconds
+
+        Raises:
+            ValueError: If max_in_flight < 1, max_producers < 1 or
+                idle_timeout_seconds <= 0
         """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be >= 1, got {max_in_flight}")
+
         self._client = client
-        self._producers: dict[str, pulsar.Producer] = {}
+        self._sending: Counter[str] = Counter()
+        self._producer_config = producer_config
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._metrics_collector = metrics_collector
+        self._executor = executor or _owned_executor("producer")
+        self._owns_executor = executor is None
+        self._creating = asyncio.Lock()
+        self._producers: _HandleCache[pulsar.Producer] = _HandleCache(
+            kind="producer",
+            max_handles=max_producers,
+            idle_timeout_seconds=idle_timeout_seconds,
+            busy=lambda topic: self._sending[topic] > 0,
+            executor=lambda: self._executor,
+            metrics_collector=metrics_collector,
+            clock=clock,
+        )
 
     async def publish(
         self,
         topic: str,
-        payload: bytes,
+        payload: Buffer,
         properties: dict[str, str] | None = None,
     ) -> PublishResult:
         """Publish message to Pulsar topic.
 
         Args:
             topic: Topic name to publish to
-            payload: Message payload as bytes
+            payload: Message payload; the client only accepts bytes, so other
+                buffers are copied once into bytes when sent
             properties: Optional message properties
 
         Returns:
@@ -100,14 +485,84 @@ class PulsarMessageProducer(MessageProducer):
             Producers are cached per topic for performance. First publish to a topic
             creates the producer; subsequent publishes reuse it.
         """
+        async with self._in_flight:
+            with _in_use(self._sending, topic):
+                await self._record_in_flight(topic, 1.0)
+                started = time.perf_counter()
+                try:
+                    result = await self._send(topic, payload, properties)
+                finally:
+                    await self._record_in_flight(topic, -1.0)
+            await self._record_publish(topic, result, time.perf_counter() - started)
+            return result
+
+    async def publish_many(
+        self,
+        topic: str,
+        payloads: Sequence[Buffer],
+        properties: dict[str, str] | None = None,
+    ) -> tuple[PublishResult, ...]:
+        """Publish many messages to one topic, awaiting all receipts together.
+
+        Every payload is handed to send_async (in order, subject to the
+        in-flight limit) before any receipt is awaited, so with batching
+        enabled the client packs them into few broker messages.
+
+        Args:
+            topic: Topic name to publish to
+            payloads: Message payloads, sent in order
+            properties: Optional properties attached to every message
+
+        Returns:
+            One PublishSuccess or PublishFailure per payload, in the same order.
+        """
+        return tuple(
+            await asyncio.gather(
+                *(self.publish(topic, payload, properties) for payload in payloads)
+            )
+        )
+
+    def _create_producer(self, topic: str) -> pulsar.Producer:
+        """Create a producer for topic using the configured settings."""
+        send_timeout_millis = int(os.environ["PULSAR_SEND_TIMEOUT_MS"])
+        config = self._producer_config
+        if config is None:
+            return self._client.create_producer(topic, send_timeout_millis=send_timeout_millis)
+        return self._client.create_producer(
+            topic,
+            send_timeout_millis=send_timeout_millis,
+            compression_type=_COMPRESSION_TYPES[config.compression],
+            max_pending_messages=config.max_pending_messages,
+            batching_enabled=config.batching_enabled,
+            batching_max_messages=config.batching_max_messages,
+            batching_max_allowed_size_in_bytes=config.batching_max_bytes,
+            batching_max_publish_delay_ms=config.batching_max_delay_ms,
+        )
+
+    async def _producer_for(self, topic: str) -> pulsar.Producer:
+        """Get the cached producer for topic, creating it on the executor on first use."""
+        async with self._creating:
+            producer = self._producers.get(topic)
+            if producer is None:
+                loop = asyncio.get_running_loop()
+                producer = await loop.run_in_executor(self._executor, self._create_producer, topic)
+                await self._producers.add(topic, producer)
+            return producer
+
+    async def _send(
+        self,
+        topic: str,
+        payload: Buffer,
+        properties: dict[str, str] | None,
+    ) -> PublishResult:
+        """Send one message with send_async and await the broker receipt."""
         try:
             # Get or create producer for topic
-            if topic not in self._producers:
+            await self._producers.evict_idle()
+            producer = self._producers.get(topic)
+            if producer is None:
                 try:
-                    self._producers[topic] = self._client.create_producer(
-                        topic,
-                        send_timeout_millis=int(os.environ["PULSAR_SEND_TIMEOUT_MS"]),
-                    )
+                    producer = await self._producer_for(topic)
                 except (TimeoutError, pulsar.Timeout):
                     # Timeout during producer creation indicates BookKeeper not ready
                     return PublishFailure(topic=topic, reason="bookkeeper_not_ready")
@@ -121,11 +576,30 @@ class PulsarMessageProducer(MessageProducer):
                         return PublishFailure(topic=topic, reason="broker_unreachable")
                     if "auth" in error_msg:
                         return PublishFailure(topic=topic, reason="auth_failed")
-                    return PublishFailure(topic=topic, reason="topic_not_found")
+                    if "topic" in error_msg and "not found" in error_msg:
+                        return PublishFailure(topic=topic, reason="topic_not_found")
+                    # Unknown errors are reported as retryable, not as a missing topic
+                    return PublishFailure(topic=topic, reason="connection_closed")
+
+            loop = asyncio.get_running_loop()
+            receipt: asyncio.Future[tuple[pulsar.Result, pulsar.MessageId]] = loop.create_future()
+
+            def on_sent(send_result: pulsar.Result, msg_id: pulsar.MessageId) -> None:
+                # Runs on a Pulsar I/O thread - an exception here would abort the process
+                try:
+                    loop.call_soon_threadsafe(_resolve_receipt, receipt, (send_result, msg_id))
+                except RuntimeError:
+                    # Event loop already closed - nobody is waiting for the receipt
+                    pass
 
-            producer = self._producers[topic]
-            msg_id = producer.send(payload, properties=properties or {})
+            producer.send_async(_as_bytes(payload), on_sent, properties=properties or {})
+            send_result, msg_id = await receipt
 
+            if send_result != pulsar.Result.Ok:
+                return PublishFailure(
+                    topic=topic,
+                    reason=_SEND_FAILURE_REASONS.get(send_result, "connection_closed"),
+                )
             return PublishSuccess(
                 message_id=str(msg_id),
                 topic=topic,
@@ -151,49 +625,118 @@ class PulsarMessageProducer(MessageProducer):
                 return PublishFailure(topic=topic, reason="connection_closed")
             if "auth" in error_msg:
                 return PublishFailure(topic=topic, reason="auth_failed")
-            # Default to topic_not_found for unknown errors
-            return PublishFailure(topic=topic, reason="topic_not_found")
+            if "topic" in error_msg and "not found" in error_msg:
+                return PublishFailure(topic=topic, reason="topic_not_found")
+            # Unknown errors are reported as retryable (like unmapped result
+            # codes), so transient failures are not mistaken for a missing topic
+            return PublishFailure(topic=topic, reason="connection_closed")
+
+    async def _record_in_flight(self, topic: str, delta: float) -> None:
+        """Adjust the in-flight gauge (fire-and-forget - failures are ignored)."""
+        if self._metrics_collector is None:
+            return
+
+        if delta > 0:
+            await self._metrics_collector.increment_gauge(
+                metric_name="effectful_pulsar_publishes_in_flight",
+                labels={"topic": topic},
+                value=delta,
+            )
+        else:
+            await self._metrics_collector.decrement_gauge(
+                metric_name="effectful_pulsar_publishes_in_flight",
+                labels={"topic": topic},
+                value=-delta,
+            )
 
-    def close_producers(self) -> None:
-        """Close all cached producers and clear the cache.
+    async def _record_publish(self, topic: str, result: PublishResult, seconds: float) -> None:
+        """Record publish latency labelled by outcome (ok or the failure reason)."""
+        if self._metrics_collector is None:
+            return
 
-        TESTING ONLY. Used to reset state between test cases.
+        match result:
+            case PublishSuccess():
+                outcome = "ok"
+            case PublishFailure(reason=reason):
+                outcome = reason
+        await self._metrics_collector.observe_histogram(
+            metric_name="effectful_pulsar_publish_duration_seconds",
+            labels={"topic": topic, "result": outcome},
+            value=seconds,
+        )
+
+    async def close(self) -> None:
+        """Close all cached producers, waiting for their pending sends.
+
+        An executor created by this producer is shut down without waiting
+        for its threads. Later publishes create producers (and a new
+        executor) again, so this also resets state between test cases.
 
         Example:
             >>> producer = PulsarMessageProducer(client)
             >>> await producer.publish("topic-1", b"data")
-            >>> producer.close_producers()  # Cleanup between tests
+            >>> await producer.close()  # On shutdown
         """
-
-        # Close each producer using functional pattern
-        def safe_close(producer: pulsar.Producer) -> bool:
-            try:
-                producer.close()
-                return True
-            except Exception:
-                # Ignore errors during cleanup - test isolation is more important
-                return True
-
-        tuple(safe_close(p) for p in self._producers.values())
-
-        # Clear the cache
-        self._producers = {}
+        await self._producers.close_all()
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+            self._executor = _owned_executor("producer")
 
 
 class PulsarMessageConsumer(MessageConsumer):
     """Pulsar-based message consumer.
 
     This implementation uses the Pulsar Python client to consume messages from
-    subscriptions. Consumers are created lazily per subscription and cached.
+    subscriptions. Consumers are created lazily per subscription and cached:
+    at most max_consumers are kept open, and one unused for
+    idle_timeout_seconds is closed. A consumer with a receive in progress,
+    unacknowledged messages or a backlog is never closed.
 
-    Note:
-        This implementation stores message references in memory for ack/nack operations.
-        In production, consider using Pulsar's built-in acknowledgment tracking.
+    Pulsar fixes a consumer's batch receive policy when it subscribes, so a
+    subscription remembers the max_messages and max_wait_ms its consumer was
+    created with. A receive_batch call with other values (or on a consumer
+    created by receive, which gets the client defaults) resubscribes with
+    its own values when the consumer is otherwise unused: no other receive
+    in progress, no unacknowledged messages and no backlog. Otherwise the
+    batch uses the existing policy, still waiting at most max_wait_ms and
+    returning at most max_messages messages. When a batch returns more messages than requested, the surplus is
+    kept in a per-subscription backlog and served first by the next receive
+    or receive_batch call, so no message is dropped.
+
+    Returned messages are tracked by ID until acknowledged or nacked, together
+    with their subscription, so ack/nack finds the owning consumer in O(1). At
+    most max_unacked messages are tracked at once: when the limit is reached,
+    receive and receive_batch wait (within their timeout) for an ack or nack
+    to free a slot and otherwise return ConsumeTimeout or an empty batch.
+
+    Blocking client calls (subscribe, receive, batch_receive, acknowledge,
+    acknowledge_cumulative) run on the executor, so a receive waiting for its
+    timeout holds an executor thread, not the event loop. Size the executor
+    for the number of receives expected to wait at once; further calls queue
+    for a thread. Messages arriving for a receive cancelled while waiting are
+    kept in the subscription backlog for the next receive.
+
+    Metrics recorded when metrics_collector is set (all in FRAMEWORK_METRICS):
+    - effectful_pulsar_unacked_messages: Gauge with label (subscription)
+    - effectful_pulsar_handles_created_total / _evicted_total and
+      effectful_pulsar_open_handles with kind="consumer"
 
     Attributes:
         _client: Pulsar client instance
-        _consumers: Cache of subscription -> consumer mappings
-        _messages: Cache of message_id -> message for ack/nack
+        _consumers: Bounded cache of subscription -> consumer mappings
+        _receiving: Receives in progress per subscription
+        _unacked: Delivered messages awaiting ack/nack by message ID
+        _unacked_counts: Number of tracked messages per subscription
+        _max_unacked: Largest number of tracked messages
+        _slot_freed: Set whenever a tracked message is released
+        _deliveries: Source of receive-order sequence numbers
+        _backlog: Received but not yet returned messages per subscription
+        _batch_limits: (max_messages, max_wait_ms) each cached consumer's
+            batch receive policy was created with
+        _metrics_collector: Optional collector with FRAMEWORK_METRICS registered
+        _executor: Runs blocking client calls off the event loop
+        _owns_executor: Whether _executor was created here (and is shut down by close())
+        _subscribing: Serializes subscribing so each subscription gets one consumer
 
     Example:
         >>> import pulsar
@@ -206,15 +749,57 @@ class PulsarMessageConsumer(MessageConsumer):
         ...     await consumer.acknowledge(envelope.message_id)
     """
 
-    def __init__(self, client: pulsar.Client) -> None:
+    def __init__(
+        self,
+        client: pulsar.Client,
+        max_unacked: int = 10_000,
+        metrics_collector: MetricsCollector | None = None,
+        executor: Executor | None = None,
+        max_consumers: int = 1000,
+        idle_timeout_seconds: float | None = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         """Initialize consumer with Pulsar client.
 
         Args:
             client: Connected Pulsar client instance
+            max_unacked: Maximum number of delivered messages awaiting ack/nack (>= 1)
+            metrics_collector: Optional collector with FRAMEWORK_METRICS registered
+            executor: Executor for blocking client calls (None: a dedicated
+                ThreadPoolExecutor with 8 threads)
+            max_consumers: Maximum number of cached consumers (>= 1)
+            idle_timeout_seconds: Close consumers unused this long (> 0, None: never)
+            clock: Monotonic clock in seconds
+
+        Raises:
+            ValueError: If max_unacked < 1, max_consumers < 1 or
+                idle_timeout_seconds <= 0
         """
+        if max_unacked < 1:
+            raise ValueError(f"max_unacked must be >= 1, got {max_unacked}")
+
         self._client = client
-        self._consumers: dict[str, pulsar.Consumer] = {}
-        self._messages: dict[str, pulsar.Message] = {}
+        self._receiving: Counter[str] = Counter()
+        self._unacked: dict[str, _Unacked] = {}
+        self._unacked_counts: Counter[str] = Counter()
+        self._max_unacked = max_unacked
+        self._slot_freed = asyncio.Event()
+        self._deliveries = itertools.count()
+        self._backlog: dict[str, deque[pulsar.Message]] = {}
+        self._batch_limits: dict[str, tuple[int, int]] = {}
+        self._metrics_collector = metrics_collector
+        self._executor = executor or _owned_executor("consumer")
+        self._owns_executor = executor is None
+        self._subscribing = asyncio.Lock()
+        self._consumers: _HandleCache[pulsar.Consumer] = _HandleCache(
+            kind="consumer",
+            max_handles=max_consumers,
+            idle_timeout_seconds=idle_timeout_seconds,
+            busy=self._is_busy,
+            executor=lambda: self._executor,
+            metrics_collector=metrics_collector,
+            clock=clock,
+        )
 
     async def receive(self, subscription: str, timeout_ms: int) -> ConsumeResult:
         """Receive message from Pulsar subscription.
@@ -226,63 +811,244 @@ class PulsarMessageConsumer(MessageConsumer):
         Returns:
             MessageEnvelope if message received before timeout.
             ConsumeFailure if connection or subscription error occurred.
-            None if timeout occurred (no message available).
+            ConsumeTimeout if no message arrived, or max_unacked messages were
+            still awaiting ack/nack when the timeout expired.
 
         Note:
             Subscription format: "topic/subscription-name"
             First part before "/" is topic, full string is subscription name.
         """
-        # Get or create consumer for subscription
-        if subscription not in self._consumers:
-            # Extract topic from subscription name (assumes format: topic/sub-name)
-            topic = subscription.split("/")[0] if "/" in subscription else subscription
-            # Extract subscription name from format: topic/sub-name
-            sub_name = subscription.split("/")[1] if "/" in subscription else subscription
+        with _in_use(self._receiving, subscription):
+            await self._consumers.evict_idle()
+            remaining_ms = await self._wait_for_slot(timeout_ms)
+            if remaining_ms < 0:
+                return ConsumeTimeout(subscription=subscription, timeout_ms=timeout_ms)
+
+            backlog = self._backlog.get(subscription)
+            if backlog:
+                envelope = self._track(subscription, backlog.popleft())
+                await self._record_unacked(subscription)
+                return envelope
+
+            consumer = await self._consumer_for(subscription, batch_limits=None)
+            if isinstance(consumer, ConsumeFailure):
+                return consumer
+
             try:
-                self._consumers[subscription] = self._client.subscribe(
-                    topic=topic,
-                    subscription_name=sub_name,
-                    initial_position=pulsar.InitialPosition.Earliest,
+                [msg] = await self._receive_on_executor(
+                    subscription, lambda: [consumer.receive(timeout_millis=remaining_ms)]
                 )
+            except (TimeoutError, pulsar.Timeout):
+                return ConsumeTimeout(subscription=subscription, timeout_ms=timeout_ms)
             except Exception as e:
-                error_msg = str(e).lower()
-                if "connect" in error_msg or "unreachable" in error_msg:
-                    return ConsumeFailure(subscription=subscription, reason="broker_unreachable")
-                if "auth" in error_msg:
-                    return ConsumeFailure(subscription=subscription, reason="auth_failed")
-                if "not found" in error_msg or "does not exist" in error_msg:
-                    return ConsumeFailure(
-                        subscription=subscription, reason="subscription_not_found"
+                return _receive_failure(subscription, e)
+
+            envelope = self._track(subscription, msg)
+            await self._record_unacked(subscription)
+            return envelope
+
+    async def receive_batch(
+        self, subscription: str, max_messages: int, max_wait_ms: int
+    ) -> ConsumeBatchResult:
+        """Receive up to max_messages messages with one batch_receive call.
+
+        Args:
+            subscription: Subscription name to consume from ("topic/subscription-name")
+            max_messages: Largest number of messages to return
+            max_wait_ms: Longest time to wait for the batch to fill in milliseconds
+
+        Returns:
+            Tuple of MessageEnvelopes (empty if nothing arrived in time).
+            ConsumeFailure if connection or subscription error occurred.
+
+        Note:
+            Messages already in the backlog are returned without waiting. At
+            most as many messages as there are free tracking slots are
+            returned; with none free, the call waits up to max_wait_ms for one
+            and then gives the batch only the rest of max_wait_ms. Messages
+            arriving after that are kept in the backlog for the next call.
+        """
+        with _in_use(self._receiving, subscription):
+            await self._consumers.evict_idle()
+            remaining_ms = await self._wait_for_slot(max_wait_ms)
+            if remaining_ms < 0:
+                return ()
+
+            backlog = self._backlog.setdefault(subscription, deque())
+            if not backlog:
+                consumer = await self._consumer_for(
+                    subscription, batch_limits=(max_messages, max_wait_ms)
+                )
+                if isinstance(consumer, ConsumeFailure):
+                    return consumer
+                # batch_receive waits as long as the consumer's policy says,
+                # which can exceed what is left after waiting for a slot
+                timeout = None if remaining_ms == max_wait_ms else remaining_ms / 1000
+                try:
+                    backlog.extend(
+                        await asyncio.wait_for(
+                            self._receive_on_executor(subscription, consumer.batch_receive),
+                            timeout=timeout,
+                        )
                     )
-                return ConsumeFailure(subscription=subscription, reason="subscription_not_found")
+                except (TimeoutError, pulsar.Timeout):
+                    return ()
+                except Exception as e:
+                    return _receive_failure(subscription, e)
+
+            count = min(max_messages, len(backlog), self._max_unacked - len(self._unacked))
+            envelopes = tuple(self._track(subscription, backlog.popleft()) for _ in range(count))
+            if not backlog:
+                del self._backlog[subscription]
+            await self._record_unacked(subscription)
+            return envelopes
 
-        consumer = self._consumers[subscription]
+    async def _receive_on_executor(
+        self, subscription: str, receive: Callable[[], list[pulsar.Message]]
+    ) -> list[pulsar.Message]:
+        """Run a blocking receive on the executor.
 
+        If the caller is cancelled while the receive is still waiting, the
+        messages it returns later go to the subscription backlog instead of
+        being dropped unacknowledged.
+        """
+        loop = asyncio.get_running_loop()
+        receiving = loop.run_in_executor(self._executor, receive)
         try:
-            msg = consumer.receive(timeout_millis=timeout_ms)
-
-            # Store message for later ack/nack
-            msg_id = str(msg.message_id())
-            self._messages[msg_id] = msg
-
-            return MessageEnvelope(
-                message_id=msg_id,
-                payload=msg.data(),
-                properties=msg.properties(),
-                publish_time=datetime.fromtimestamp(msg.publish_timestamp() / 1000, UTC),
-                topic=msg.topic_name(),
+            return await asyncio.shield(receiving)
+        except asyncio.CancelledError:
+            receiving.add_done_callback(lambda done: self._keep_for_later(subscription, done))
+            raise
+
+    def _keep_for_later(
+        self, subscription: str, receiving: asyncio.Future[list[pulsar.Message]]
+    ) -> None:
+        """Add the messages of an abandoned receive to the subscription backlog."""
+        if receiving.cancelled() or receiving.exception() is not None:
+            return
+        self._backlog.setdefault(subscription, deque()).extend(receiving.result())
+
+    async def _consumer_for(
+        self,
+        subscription: str,
+        batch_limits: tuple[int, int] | None,
+    ) -> pulsar.Consumer | ConsumeFailure:
+        """Get the cached consumer for subscription, subscribing on first use.
+
+        With batch_limits (max_messages, max_wait_ms) differing from those of
+        an otherwise unused cached consumer, that consumer is closed and the
+        subscription resubscribed with the new batch receive policy.
+        """
+        consumer = self._consumers.get(subscription)
+        if consumer is not None and not self._needs_resubscribe(subscription, batch_limits):
+            return consumer
+
+        async with self._subscribing:
+            if self._needs_resubscribe(subscription, batch_limits):
+                await self._consumers.remove(subscription, reason="policy")
+            return self._consumers.get(subscription) or await self._subscribe(
+                subscription, batch_limits
             )
-        except (TimeoutError, pulsar.Timeout):
-            return ConsumeTimeout(subscription=subscription, timeout_ms=timeout_ms)
+
+    def _needs_resubscribe(self, subscription: str, batch_limits: tuple[int, int] | None) -> bool:
+        """Whether the cached consumer should be replaced to apply batch_limits."""
+        return (
+            batch_limits is not None
+            and self._batch_limits.get(subscription) != batch_limits
+            and self._receiving[subscription] == 1
+            and self._unacked_counts[subscription] == 0
+            and not self._backlog.get(subscription)
+        )
+
+    async def _subscribe(
+        self,
+        subscription: str,
+        batch_limits: tuple[int, int] | None,
+    ) -> pulsar.Consumer | ConsumeFailure:
+        """Subscribe on the executor and cache the consumer."""
+        loop = asyncio.get_running_loop()
+        # Extract topic from subscription name (assumes format: topic/sub-name)
+        topic = subscription.split("/")[0] if "/" in subscription else subscription
+        # Extract subscription name from format: topic/sub-name
+        sub_name = subscription.split("/")[1] if "/" in subscription else subscription
+        try:
+            if batch_limits is None:
+                consumer = await loop.run_in_executor(
+                    self._executor,
+                    lambda: self._client.subscribe(
+                        topic=topic,
+                        subscription_name=sub_name,
+                        initial_position=pulsar.InitialPosition.Earliest,
+                    ),
+                )
+            else:
+                max_messages, max_wait_ms = batch_limits
+                policy = pulsar.ConsumerBatchReceivePolicy(max_messages, -1, max_wait_ms)
+                consumer = await loop.run_in_executor(
+                    self._executor,
+                    lambda: self._client.subscribe(
+                        topic=topic,
+                        subscription_name=sub_name,
+                        initial_position=pulsar.InitialPosition.Earliest,
+                        batch_receive_policy=policy,
+                    ),
+                )
         except Exception as e:
             error_msg = str(e).lower()
-            error_type = type(e).__name__.lower()
-            if "closed" in error_msg or "consumerclosed" in error_type:
-                return ConsumeFailure(subscription=subscription, reason="consumer_closed")
-            if "connect" in error_msg:
-                return ConsumeFailure(subscription=subscription, reason="connection_closed")
+            if "connect" in error_msg or "unreachable" in error_msg:
+                return ConsumeFailure(subscription=subscription, reason="broker_unreachable")
+            if "auth" in error_msg:
+                return ConsumeFailure(subscription=subscription, reason="auth_failed")
+            if "not found" in error_msg or "does not exist" in error_msg:
+                return ConsumeFailure(subscription=subscription, reason="subscription_not_found")
             return ConsumeFailure(subscription=subscription, reason="subscription_not_found")
 
+        if batch_limits is None:
+            self._batch_limits.pop(subscription, None)
+        else:
+            self._batch_limits[subscription] = batch_limits
+        await self._consumers.add(subscription, consumer)
+        return consumer
+
+    async def _wait_for_slot(self, timeout_ms: int) -> int:
+        """Wait until fewer than max_unacked messages are tracked.
+
+        Returns:
+            timeout_ms minus the time spent waiting, or -1 if no slot was
+            freed in time.
+        """
+        if len(self._unacked) < self._max_unacked:
+            return timeout_ms
+
+        deadline = time.monotonic() + timeout_ms / 1000
+        while len(self._unacked) >= self._max_unacked:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return -1
+            self._slot_freed.clear()
+            try:
+                await asyncio.wait_for(self._slot_freed.wait(), timeout=remaining)
+            except TimeoutError:
+                return -1
+        return max(0, int((deadline - time.monotonic()) * 1000))
+
+    def _track(self, subscription: str, msg: pulsar.Message) -> MessageEnvelope:
+        """Remember msg for later ack/nack and convert it to an envelope."""
+        msg_id = str(msg.message_id())
+        if msg_id not in self._unacked:
+            self._unacked_counts[subscription] += 1
+        self._unacked[msg_id] = _Unacked(
+            subscription=subscription, message=msg, sequence=next(self._deliveries)
+        )
+
+        return MessageEnvelope(
+            message_id=msg_id,
+            payload=msg.data(),
+            properties=msg.properties(),
+            publish_time=datetime.fromtimestamp(msg.publish_timestamp() / 1000, UTC),
+            topic=msg.topic_name(),
+        )
+
     async def acknowledge(self, message_id: str) -> AcknowledgeResult:
         """Acknowledge message processing.
 
@@ -293,26 +1059,99 @@ class PulsarMessageConsumer(MessageConsumer):
             AcknowledgeSuccess if acknowledged successfully.
             AcknowledgeFailure with reason if acknowledgment failed.
         """
-        msg = self._messages.get(message_id)
-        if msg is None:
+        unacked = self._unacked.get(message_id)
+        if unacked is None:
             return AcknowledgeFailure(message_id=message_id, reason="message_not_found")
 
-        # Try each consumer to find the one that owns this message
-        ack_errors: list[str] = []
-        for _subscription, consumer in self._consumers.items():
-            try:
-                consumer.acknowledge(msg)
-                # Remove from cache after successful ack
-                self._messages = {k: v for k, v in self._messages.items() if k != message_id}
-                return AcknowledgeSuccess(message_id=message_id)
-            except Exception as e:
-                error_msg = str(e).lower()
-                if "closed" in error_msg:
-                    return AcknowledgeFailure(message_id=message_id, reason="connection_closed")
-                ack_errors.append(str(e))
-                continue
+        consumer = self._consumers.get(unacked.subscription)
+        if consumer is None:
+            return AcknowledgeFailure(message_id=message_id, reason="consumer_not_found")
 
-        return AcknowledgeFailure(message_id=message_id, reason="consumer_not_found")
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, consumer.acknowledge, unacked.message
+            )
+        except Exception as e:
+            if "closed" in str(e).lower():
+                return AcknowledgeFailure(message_id=message_id, reason="connection_closed")
+            return AcknowledgeFailure(message_id=message_id, reason="consumer_not_found")
+
+        self._release(message_id)
+        await self._record_unacked(unacked.subscription)
+        return AcknowledgeSuccess(message_id=message_id)
+
+    async def acknowledge_batch(
+        self, message_ids: Sequence[str], cumulative: bool = False
+    ) -> tuple[AcknowledgeResult, ...]:
+        """Acknowledge many messages.
+
+        Args:
+            message_ids: Pulsar message IDs to acknowledge, in receive order
+            cumulative: Acknowledge only the last ID with acknowledge_cumulative,
+                covering every earlier message of its subscription
+
+        Returns:
+            One AcknowledgeSuccess or AcknowledgeFailure per ID, in the same order.
+            With cumulative=True every ID shares the outcome of the last one,
+            except IDs of other subscriptions, which fail with message_not_found
+            because the cumulative ack does not cover them.
+        """
+        if not cumulative:
+            return tuple([await self.acknowledge(message_id) for message_id in message_ids])
+        if not message_ids:
+            return ()
+
+        unacked = self._unacked.get(message_ids[-1])
+        if unacked is None:
+            return tuple(
+                AcknowledgeFailure(message_id=message_id, reason="message_not_found")
+                for message_id in message_ids
+            )
+
+        consumer = self._consumers.get(unacked.subscription)
+        if consumer is None:
+            return tuple(
+                AcknowledgeFailure(message_id=message_id, reason="consumer_not_found")
+                for message_id in message_ids
+            )
+
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, consumer.acknowledge_cumulative, unacked.message
+            )
+        except Exception as e:
+            reason: Literal["connection_closed", "consumer_not_found"] = (
+                "connection_closed" if "closed" in str(e).lower() else "consumer_not_found"
+            )
+            return tuple(
+                AcknowledgeFailure(message_id=message_id, reason=reason)
+                for message_id in message_ids
+            )
+
+        # The broker acked everything up to the last message, including
+        # messages of this subscription that were received but not listed
+        covered = [
+            message_id
+            for message_id, tracked in self._unacked.items()
+            if tracked.subscription == unacked.subscription and tracked.sequence <= unacked.sequence
+        ]
+        elsewhere = {
+            message_id
+            for message_id in message_ids
+            if (tracked := self._unacked.get(message_id)) is not None
+            and tracked.subscription != unacked.subscription
+        }
+        for message_id in covered:
+            self._release(message_id)
+        await self._record_unacked(unacked.subscription)
+        return tuple(
+            (
+                AcknowledgeFailure(message_id=message_id, reason="message_not_found")
+                if message_id in elsewhere
+                else AcknowledgeSuccess(message_id=message_id)
+            )
+            for message_id in message_ids
+        )
 
     async def negative_acknowledge(self, message_id: str, delay_ms: int = 0) -> NackResult:
         """Negative acknowledge message for redelivery.
@@ -329,47 +1168,74 @@ class PulsarMessageConsumer(MessageConsumer):
             The delay_ms parameter may not be supported by all Pulsar broker versions.
             If unsupported, message will be redelivered immediately.
         """
-        msg = self._messages.get(message_id)
-        if msg is None:
+        unacked = self._unacked.get(message_id)
+        if unacked is None:
             return NackFailure(message_id=message_id, reason="message_not_found")
 
-        # Try each consumer to find the one that owns this message
-        for _subscription, consumer in self._consumers.items():
-            try:
-                consumer.negative_acknowledge(msg)
-                # Remove from cache after successful nack
-                self._messages = {k: v for k, v in self._messages.items() if k != message_id}
-                return NackSuccess(message_id=message_id)
-            except Exception as e:
-                error_msg = str(e).lower()
-                if "closed" in error_msg:
-                    return NackFailure(message_id=message_id, reason="connection_closed")
-                continue
+        consumer = self._consumers.get(unacked.subscription)
+        if consumer is None:
+            return NackFailure(message_id=message_id, reason="consumer_not_found")
 
-        return NackFailure(message_id=message_id, reason="consumer_not_found")
+        try:
+            # Only schedules redelivery in the client - does not block
+            consumer.negative_acknowledge(unacked.message)
+        except Exception as e:
+            if "closed" in str(e).lower():
+                return NackFailure(message_id=message_id, reason="connection_closed")
+            return NackFailure(message_id=message_id, reason="consumer_not_found")
+
+        self._release(message_id)
+        await self._record_unacked(unacked.subscription)
+        return NackSuccess(message_id=message_id)
+
+    def _release(self, message_id: str) -> None:
+        """Stop tracking an acked or nacked message and wake a waiting receive."""
+        unacked = self._unacked.pop(message_id, None)
+        if unacked is None:
+            return
+        self._unacked_counts[unacked.subscription] -= 1
+        if self._unacked_counts[unacked.subscription] <= 0:
+            del self._unacked_counts[unacked.subscription]
+        self._slot_freed.set()
+
+    async def _record_unacked(self, subscription: str) -> None:
+        """Set the unacked-messages gauge for subscription (fire-and-forget)."""
+        if self._metrics_collector is None:
+            return
+
+        await self._metrics_collector.record_gauge(
+            metric_name="effectful_pulsar_unacked_messages",
+            labels={"subscription": subscription},
+            value=float(self._unacked_counts[subscription]),
+        )
 
-    def close_consumers(self) -> None:
-        """Close all cached consumers and clear message cache.
+    def _is_busy(self, subscription: str) -> bool:
+        """Whether the subscription's consumer is needed for a receive, ack or nack."""
+        return (
+            self._receiving[subscription] > 0
+            or self._unacked_counts[subscription] > 0
+            or bool(self._backlog.get(subscription))
+        )
 
-        TESTING ONLY. Used to reset state between test cases.
+    async def close(self) -> None:
+        """Close all cached consumers and forget delivered messages.
+
+        Unacknowledged messages are redelivered by the broker. An executor
+        created by this consumer is shut down without waiting for receives
+        still blocked on its threads. Later receives subscribe (and create a
+        new executor) again, so this also resets state between test cases.
 
         Example:
             >>> consumer = PulsarMessageConsumer(client)
             >>> await consumer.receive("topic/sub", timeout_ms=1000)
-            >>> consumer.close_consumers()  # Cleanup between tests
+            >>> await consumer.close()  # On shutdown
         """
-
-        # Close each consumer using functional pattern
-        def safe_close(consumer: pulsar.Consumer) -> bool:
-            try:
-                consumer.close()
-                return True
-            except Exception:
-                # Ignore errors during cleanup - test isolation is more important
-                return True
-
-        tuple(safe_close(c) for c in self._consumers.values())
-
-        # Clear both caches
-        self._consumers = {}
-        self._messages = {}  # Critical: prevents message reference leaks
+        await self._consumers.close_all()
+        self._unacked = {}  # Critical: prevents message reference leaks
+        self._unacked_counts = Counter()
+        self._backlog = {}
+        self._batch_limits = {}
+        self._slot_freed.set()
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+            self._executor = _owned_executor("consumer")
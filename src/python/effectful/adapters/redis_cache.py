@@ -7,54 +7,106 @@ For testing, use pytest mocks instead of this real implementation.
 """
 
 import json
-from uuid import UUID
+from collections.abc import Sequence
+from uuid import UUID, uuid4
 
 from redis.asyncio import Redis
 
+from effectful.adapters.cache_codecs import CacheCodec, UnsupportedCacheFormat
 from effectful.domain.cache_result import CacheHit, CacheLookupResult, CacheMiss
 from effectful.domain.optional_value import Absent, OptionalValue, Provided
 from effectful.domain.profile import ProfileData
-from effectful.infrastructure.cache import ProfileCache
+from effectful.infrastructure.cache import CacheLock, ProfileCache
+
+# Tag index sets live at "tag:<tag>"; each holds the keys stored with that tag
+_TAG_PREFIX = "tag:"
+
+# UNLINK every member of a tag set (in chunks that fit Lua's unpack limit),
+# then drop the set; returns the members. Member keys are not declared in
+# KEYS, so on Redis Cluster all keys sharing a tag must hash to one slot.
+_INVALIDATE_TAG_SCRIPT = """
+local members = redis.call("smembers", KEYS[1])
+for i = 1, #members, 1000 do
+    redis.call("unlink", unpack(members, i, math.min(i + 999, #members)))
+end
+redis.call("del", KEYS[1])
+return members
+"""
+
+# Delete the lock only if it still holds our token (never another holder's lock)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def _ttl_seconds(ttl_ms: int) -> int:
+    """Convert a PTTL reply to whole seconds, rounded up.
+
+    PTTL returns -1 (no expiration) or -2 (missing) as negatives; both map to 0.
+    """
+    return max(0, -(-int(ttl_ms) // 1000))
 
 
 class RedisProfileCache(ProfileCache):
     """Redis-based profile cache.
 
     Implements ProfileCache protocol using Redis via redis-py async client.
-    Stores ProfileData as JSON with TTL support.
+    Stores ProfileData as JSON with TTL support, or in the compact binary
+    format when a CacheCodec is configured. Each lookup is a single
+    round-trip: GET and PTTL are pipelined, or PTTL is skipped entirely when
+    include_ttl is False.
+
+    Tagged puts add each key to a "tag:<tag>" set in the same MULTI/EXEC as
+    the write. A tag set expires no earlier than its longest-lived member
+    (EXPIRE NX/GT, Redis 7+), so indexes of tags that are never invalidated
+    do not accumulate.
 
     Attributes:
         _redis: Redis async client connection
+        _include_ttl: Whether hits carry the remaining TTL
+        _codec: Codec for stored payloads (None keeps plain JSON and raw bytes)
     """
 
-    def __init__(self, redis_client: Redis) -> None:
+    def __init__(
+        self, redis_client: Redis, include_ttl: bool = True, codec: CacheCodec | None = None
+    ) -> None:
         """Initialize cache with Redis connection.
 
         Args:
             redis_client: Active Redis async client
+            include_ttl: Read the remaining TTL alongside each hit. When False,
+                hits are served by a single GET and report ttl_remaining=0.
+            codec: Optional codec; it reads both legacy and binary payloads,
+                so entries it cannot decode are reported as misses
         """
         self._redis = redis_client
+        self._include_ttl = include_ttl
+        self._codec = codec
 
-    async def _get_ttl_or_expired(self, key: str) -> OptionalValue[int]:
-        """Get TTL from Redis, returning explicit ADT for absence.
+    async def _get_with_ttl(self, key: str) -> tuple[bytes | str | None, int]:
+        """Read a value and its remaining TTL in one round-trip.
+
+        GET and PTTL are pipelined inside MULTI/EXEC, so both replies describe
+        the same key state and a hit can no longer expire between the two reads.
 
         Args:
-            key: Cache key to check TTL for
+            key: Cache key to read
 
         Returns:
-            Provided TTL in seconds (0 if no expiration),
-            Absent when key expired or missing
+            Tuple of raw value (None when missing) and TTL in seconds, rounded
+            up (0 if no expiration or include_ttl is disabled)
         """
-        ttl = await self._redis.ttl(key)
-        # Redis returns int but mypy doesn't know, so ensure it's int
-        ttl_int = int(ttl)
-        if ttl_int == -1:
-            # No expiration set
-            return Provided(0)
-        elif ttl_int == -2:
-            # Key doesn't exist (expired/deleted)
-            return Absent(reason="expired_or_missing")
-        return Provided(ttl_int)
+        if not self._include_ttl:
+            return await self._redis.get(key), 0
+
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.get(key)
+        pipe.pttl(key)
+        data, ttl_ms = await pipe.execute()
+        return data, _ttl_seconds(ttl_ms)
 
     async def get_profile(self, user_id: UUID) -> CacheLookupResult[ProfileData]:
         """Get cached profile from Redis.
@@ -64,42 +116,52 @@ class RedisProfileCache(ProfileCache):
 
         Returns:
             CacheHit with ProfileData and TTL if found
-            CacheMiss with key and reason if not found or expired
+            CacheMiss with key and reason if not found
         """
         key = f"profile:{user_id}"
-        data = await self._redis.get(key)
+        data, ttl_seconds = await self._get_with_ttl(key)
 
         if data is None:
             return CacheMiss(key=key, reason="not_found")
 
+        if self._codec is not None:
+            try:
+                return CacheHit(value=self._codec.decode_profile(data), ttl_remaining=ttl_seconds)
+            except UnsupportedCacheFormat:
+                # Written by a newer codec - treat as a miss so it gets rewritten
+                return CacheMiss(key=key, reason="not_found")
+
         # Parse JSON to ProfileData
         profile_dict = json.loads(data)
         profile = ProfileData(id=profile_dict["id"], name=profile_dict["name"])
+        return CacheHit(value=profile, ttl_remaining=ttl_seconds)
 
-        # Get remaining TTL
-        ttl = await self._get_ttl_or_expired(key)
-        match ttl:
-            case Provided(value=ttl_value):
-                return CacheHit(value=profile, ttl_remaining=ttl_value)
-            case Absent():
-                # Key doesn't exist (race condition between get and ttl)
-                return CacheMiss(key=key, reason="expired")
-
-    async def put_profile(self, user_id: UUID, data: ProfileData, ttl_seconds: int) -> None:
+    async def put_profile(
+        self, user_id: UUID, data: ProfileData, ttl_seconds: int, tags: Sequence[str] = ()
+    ) -> None:
         """Store profile in Redis with TTL.
 
         Args:
             user_id: UUID of the user
             data: ProfileData to cache
             ttl_seconds: Time-to-live in seconds
+            tags: Tags to index the entry under
         """
         key = f"profile:{user_id}"
 
-        # Serialize ProfileData to JSON
-        profile_json = json.dumps({"id": data.id, "name": data.name})
+        payload: bytes | str
+        if self._codec is not None:
+            payload = self._codec.encode_profile(data)
+        else:
+            # Serialize ProfileData to JSON
+            payload = json.dumps({"id": data.id, "name": data.name})
+
+        if tags:
+            await self._put_tagged([(key, payload)], ttl_seconds, tags)
+            return
 
         # Store with TTL
-        await self._redis.setex(key, ttl_seconds, profile_json)
+        await self._redis.setex(key, ttl_seconds, payload)
 
     async def get_value(self, key: str) -> CacheLookupResult[bytes]:
         """Get cached value by key from Redis.
@@ -108,34 +170,26 @@ class RedisProfileCache(ProfileCache):
             key: Cache key to retrieve
 
         Returns:
-            CacheHit with bytes if found, CacheMiss if not found/expired
+            CacheHit with bytes if found, CacheMiss if not found
         """
-        data = await self._redis.get(key)
-
-        if data is None:
-            return CacheMiss(key=key, reason="not_found")
-
-        # Ensure we return bytes
-        if isinstance(data, str):
-            data = data.encode("utf-8")
+        data, ttl_seconds = await self._get_with_ttl(key)
+        return self._value_lookup_result(key, data, ttl_seconds)
 
-        # Get remaining TTL
-        ttl = await self._get_ttl_or_expired(key)
-        match ttl:
-            case Provided(value=ttl_value):
-                return CacheHit(value=data, ttl_remaining=ttl_value)
-            case Absent():
-                return CacheMiss(key=key, reason="expired")
-
-    async def put_value(self, key: str, value: bytes, ttl_seconds: int) -> None:
+    async def put_value(
+        self, key: str, value: bytes, ttl_seconds: int, tags: Sequence[str] = ()
+    ) -> None:
         """Store value in Redis with TTL.
 
         Args:
             key: Cache key
             value: Value to cache (bytes)
             ttl_seconds: Time-to-live in seconds
+            tags: Tags to index the entry under
         """
-        await self._redis.setex(key, ttl_seconds, value)
+        if tags:
+            await self._put_tagged([(key, self._encode_value(value))], ttl_seconds, tags)
+            return
+        await self._redis.setex(key, ttl_seconds, self._encode_value(value))
 
     async def invalidate(self, key: str) -> bool:
         """Invalidate cache entry by key in Redis.
@@ -150,3 +204,189 @@ class RedisProfileCache(ProfileCache):
         # Redis delete returns int, but we need explicit bool conversion
         deleted_count = int(result) if isinstance(result, int) else 0
         return deleted_count > 0
+
+    async def get_values(self, keys: Sequence[str]) -> tuple[CacheLookupResult[bytes], ...]:
+        """Get many cached values from Redis with one MGET.
+
+        With include_ttl, MGET and one PTTL per key are pipelined inside
+        MULTI/EXEC so the whole lookup is still a single round-trip.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            One CacheHit or CacheMiss per key, in the same order as keys
+        """
+        if not keys:
+            return ()
+
+        if self._include_ttl:
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.mget(keys)
+            for key in keys:
+                pipe.pttl(key)
+            values, *ttls_ms = await pipe.execute()
+            ttls = [_ttl_seconds(ttl_ms) for ttl_ms in ttls_ms]
+        else:
+            values = await self._redis.mget(keys)
+            ttls = [0] * len(keys)
+
+        return tuple(
+            self._value_lookup_result(key, data, ttl)
+            for key, data, ttl in zip(keys, values, ttls, strict=True)
+        )
+
+    async def put_values(
+        self, entries: Sequence[tuple[str, bytes]], ttl_seconds: int, tags: Sequence[str] = ()
+    ) -> None:
+        """Store many values in Redis with one pipelined batch of SETEX.
+
+        Args:
+            entries: (key, value) pairs to cache
+            ttl_seconds: Time-to-live in seconds for every entry
+            tags: Tags to index every entry under
+        """
+        if not entries:
+            return
+
+        encoded = [(key, self._encode_value(value)) for key, value in entries]
+        if tags:
+            await self._put_tagged(encoded, ttl_seconds, tags)
+            return
+
+        pipe = self._redis.pipeline(transaction=False)
+        for key, payload in encoded:
+            pipe.setex(key, ttl_seconds, payload)
+        await pipe.execute()
+
+    async def _put_tagged(
+        self, entries: Sequence[tuple[str, bytes | str]], ttl_seconds: int, tags: Sequence[str]
+    ) -> None:
+        """SETEX entries and add their keys to each tag set in one MULTI/EXEC.
+
+        Writing value and index atomically means an InvalidateTag can never
+        run between them and miss a freshly written key.
+        """
+        keys = [key for key, _ in entries]
+        pipe = self._redis.pipeline(transaction=True)
+        for key, payload in entries:
+            pipe.setex(key, ttl_seconds, payload)
+        for tag in tags:
+            tag_key = f"{_TAG_PREFIX}{tag}"
+            pipe.sadd(tag_key, *keys)
+            # NX gives a new set a TTL; GT only ever extends an existing one
+            pipe.expire(tag_key, ttl_seconds, nx=True)
+            pipe.expire(tag_key, ttl_seconds, gt=True)
+        await pipe.execute()
+
+    def _encode_value(self, value: bytes) -> bytes:
+        """Encode a byte value for storage (unchanged without a codec)."""
+        return value if self._codec is None else self._codec.encode_value(value)
+
+    def _value_lookup_result(
+        self, key: str, data: bytes | str | None, ttl_seconds: int
+    ) -> CacheLookupResult[bytes]:
+        """Build the lookup result for a raw GET/MGET reply."""
+        if data is None:
+            return CacheMiss(key=key, reason="not_found")
+
+        if self._codec is not None:
+            try:
+                return CacheHit(value=self._codec.decode_value(data), ttl_remaining=ttl_seconds)
+            except UnsupportedCacheFormat:
+                return CacheMiss(key=key, reason="not_found")
+
+        # Ensure we return bytes
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return CacheHit(value=data, ttl_remaining=ttl_seconds)
+
+    async def invalidate_many(self, keys: Sequence[str]) -> int:
+        """Invalidate many cache entries in Redis with one UNLINK.
+
+        UNLINK reclaims memory in a background thread, so large values do not
+        block the Redis event loop the way DEL would.
+
+        Args:
+            keys: Cache keys to invalidate
+
+        Returns:
+            Number of keys that were found and deleted
+        """
+        if not keys:
+            return 0
+
+        result = await self._redis.unlink(*keys)
+        return int(result) if isinstance(result, int) else 0
+
+    async def invalidate_tag(self, tag: str) -> tuple[str, ...]:
+        """Invalidate every key indexed under tag with one Lua script.
+
+        The script UNLINKs the members of the tag set and deletes the set
+        atomically, so the cost is O(members) and a concurrent tagged put
+        lands either before (and is invalidated) or after (and survives).
+
+        Args:
+            tag: Tag passed to earlier put calls
+
+        Returns:
+            Keys that were indexed under tag and have been invalidated
+        """
+        members = await self._redis.eval(_INVALIDATE_TAG_SCRIPT, 1, f"{_TAG_PREFIX}{tag}")
+        if not isinstance(members, list):
+            return ()
+        return tuple(
+            member.decode("utf-8") if isinstance(member, bytes) else str(member)
+            for member in members
+        )
+
+
+class RedisCacheLock(CacheLock):
+    """Redis-based lock for cross-instance cache recomputation.
+
+    Implements CacheLock protocol with SET NX PX and a compare-and-delete Lua
+    script, so an expired holder can never release a lock taken by another.
+
+    Attributes:
+        _redis: Redis async client connection
+        _prefix: Key prefix separating locks from cached values
+    """
+
+    def __init__(self, redis_client: Redis, prefix: str = "lock:") -> None:
+        """Initialize lock with Redis connection.
+
+        Args:
+            redis_client: Active Redis async client
+            prefix: Prepended to the cache key to form the lock key
+        """
+        self._redis = redis_client
+        self._prefix = prefix
+
+    async def acquire(self, key: str, ttl_ms: int) -> OptionalValue[str]:
+        """Try to take the lock for key without blocking.
+
+        Args:
+            key: Cache key being recomputed
+            ttl_ms: Lock lifetime in milliseconds
+
+        Returns:
+            Provided token if acquired, Absent if another holder has the lock
+        """
+        token = uuid4().hex
+        acquired = await self._redis.set(f"{self._prefix}{key}", token, nx=True, px=ttl_ms)
+        if acquired:
+            return Provided(token)
+        return Absent(reason="lock_held")
+
+    async def release(self, key: str, token: str) -> bool:
+        """Release the lock if it is still held with token.
+
+        Args:
+            key: Cache key the lock was taken for
+            token: Token returned by acquire
+
+        Returns:
+            True if the lock was released, False if it had expired or changed hands
+        """
+        result = await self._redis.eval(_RELEASE_LOCK_SCRIPT, 1, f"{self._prefix}{key}", token)
+        return bool(result)
@@ -17,6 +17,8 @@ Type Safety:
 
 from __future__ import annotations
 
+import io
+from collections.abc import Buffer
 from datetime import UTC, datetime
 
 import boto3
@@ -27,6 +29,46 @@ from effectful.domain.s3_object import ObjectNotFound, PutFailure, PutResult, Pu
 from effectful.infrastructure.storage import ObjectStorage
 
 
+class _BufferReader(io.RawIOBase):
+    """Seekable file object reading from a buffer in place.
+
+    boto3 accepts bytes, bytearray or a file object as the request body, so
+    other buffers (memoryview slices of a larger payload) are wrapped in this
+    reader instead of being copied into bytes.
+    """
+
+    def __init__(self, content: Buffer) -> None:
+        super().__init__()
+        self._view = memoryview(content).cast("B")
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Buffer) -> int:
+        target = memoryview(buffer).cast("B")
+        chunk = self._view[self._position : self._position + len(target)]
+        target[: len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        match whence:
+            case io.SEEK_SET:
+                self._position = offset
+            case io.SEEK_CUR:
+                self._position += offset
+            case _:
+                self._position = len(self._view) + offset
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+
 class S3ObjectStorage(ObjectStorage):
     """AWS S3-based object storage.
 
@@ -131,7 +173,7 @@ class S3ObjectStorage(ObjectStorage):
         self,
         bucket: str,
         key: str,
-        content: bytes,
+        content: Buffer,
         metadata: OptionalValue[dict[str, str]],
         content_type: OptionalValue[str],
     ) -> PutResult:
@@ -140,7 +182,8 @@ class S3ObjectStorage(ObjectStorage):
         Args:
             bucket: Bucket name to store the object
             key: Object key (path) within the bucket
-            content: Object content as bytes
+            content: Object content; buffers other than bytes/bytearray (such as
+                memoryview slices) are streamed from without being copied
             metadata: Optional metadata key-value pairs
             content_type: Optional MIME type
 
@@ -153,6 +196,11 @@ class S3ObjectStorage(ObjectStorage):
             Infrastructure failures (network errors) raise exceptions.
         """
         try:
+            body = (
+                content
+                if isinstance(content, bytes | bytearray)
+                else io.BufferedReader(_BufferReader(content))
+            )
             metadata_value = from_optional_value(metadata)
             content_type_value = from_optional_value(content_type)
 
@@ -160,7 +208,7 @@ class S3ObjectStorage(ObjectStorage):
                 response = self._s3_client.put_object(
                     Bucket=bucket,
                     Key=key,
-                    Body=content,
+                    Body=body,
                     Metadata=metadata_value,
                     ContentType=content_type_value,
                 )
@@ -168,21 +216,21 @@ class S3ObjectStorage(ObjectStorage):
                 response = self._s3_client.put_object(
                     Bucket=bucket,
                     Key=key,
-                    Body=content,
+                    Body=body,
                     Metadata=metadata_value,
                 )
             elif content_type_value is not None:
                 response = self._s3_client.put_object(
                     Bucket=bucket,
                     Key=key,
-                    Body=content,
+                    Body=body,
                     ContentType=content_type_value,
                 )
             else:
                 response = self._s3_client.put_object(
                     Bucket=bucket,
                     Key=key,
-                    Body=content,
+                    Body=body,
                 )
 
             # Extract version ID if versioning enabled
@@ -0,0 +1,461 @@
+"""Two-tier profile cache: in-process L1 in front of a shared cache.
+
+This module provides TieredProfileCache, a ProfileCache decorator that serves
+hot keys from a size-bounded, TTL-aware LRU held in process memory (L1) and
+falls back to a shared cache such as RedisProfileCache (L2).
+
+Writes and invalidations go to L2 first and are then announced on a Redis
+pub/sub channel, so every other instance drops its L1 copy of the key. L1
+entries also expire after at most l1_ttl_seconds, which bounds staleness if an
+invalidation message is ever lost.
+
+Example:
+    >>> cache = TieredProfileCache(
+    ...     RedisProfileCache(redis_client),
+    ...     redis_client=redis_client,
+    ...     max_entries=10_000,
+    ...     l1_ttl_seconds=5.0,
+    ...     metrics_collector=prometheus_collector,  # FRAMEWORK_METRICS registered
+    ... )
+    >>> await cache.start()  # Subscribe to invalidations
+    >>> interpreter = CacheInterpreter(cache=cache)
+    >>> ...
+    >>> await cache.close()
+"""
+
+import asyncio
+import math
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Literal
+from uuid import UUID, uuid4
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from effectful.domain.cache_result import CacheHit, CacheLookupResult, CacheMiss
+from effectful.domain.profile import ProfileData
+from effectful.infrastructure.cache import ProfileCache
+from effectful.infrastructure.metrics import MetricsCollector
+
+# Cache tier a lookup was answered by (used as a metrics label)
+type CacheTier = Literal["l1", "l2"]
+
+DEFAULT_INVALIDATION_CHANNEL = "effectful:cache:invalidate"
+
+
+@dataclass(frozen=True)
+class _L1Entry:
+    """A value held in process memory.
+
+    Attributes:
+        value: Cached profile or raw bytes
+        expires_at: Monotonic time after which the entry is dropped from L1
+        l2_expires_at: Monotonic time the L2 entry expires (None if it never does)
+    """
+
+    value: ProfileData | bytes
+    expires_at: float
+    l2_expires_at: float | None
+
+
+class TieredProfileCache(ProfileCache):
+    """Profile cache with an in-process LRU in front of a shared cache.
+
+    Implements ProfileCache protocol. Lookups check L1 first and fill it from
+    L2 hits; writes go through to L2 and replace the local L1 entry.
+
+    When redis_client is provided, L1 is only used while the invalidation
+    subscription is live (between start() and close()); if the subscription
+    fails, L1 is cleared and every lookup goes to L2. Without redis_client
+    there is no cross-instance invalidation, which suits single-instance
+    deployments.
+
+    Attributes:
+        _remote: Shared L2 cache
+        _redis: Redis client used for invalidation pub/sub (None disables it)
+        _channel: Pub/sub channel carrying invalidated keys
+        _max_entries: Maximum number of L1 entries before LRU eviction
+        _l1_ttl_seconds: Longest time a value is served from L1
+        _metrics_collector: Optional collector for per-tier metrics (FRAMEWORK_METRICS)
+        _clock: Monotonic clock (injectable for tests)
+        _instance_id: Identifies this instance's own invalidation messages
+        _entries: L1 entries in least- to most-recently-used order
+        _generation: Bumped on every eviction; orders evictions against L1 fills
+        _filling: Number of L2 reads in flight per key whose result may fill L1
+        _evicted_at: Generation of the latest eviction per key with a fill in
+            flight (only those fills are discarded, and only for that key)
+        _pubsub: Active invalidation subscription
+        _listener: Task consuming invalidation messages
+    """
+
+    def __init__(
+        self,
+        remote: ProfileCache,
+        redis_client: Redis | None = None,
+        max_entries: int = 10_000,
+        l1_ttl_seconds: float = 5.0,
+        channel: str = DEFAULT_INVALIDATION_CHANNEL,
+        metrics_collector: MetricsCollector | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize tiered cache.
+
+        Args:
+            remote: Shared L2 cache (typically RedisProfileCache)
+            redis_client: Redis client for invalidation pub/sub (None for single instance)
+            max_entries: Maximum number of L1 entries (>= 1)
+            l1_ttl_seconds: Longest time a value is served from L1 (> 0)
+            channel: Pub/sub channel shared by all instances
+            metrics_collector: Optional collector with FRAMEWORK_METRICS registered
+            clock: Monotonic clock returning seconds
+
+        Raises:
+            ValueError: If max_entries < 1 or l1_ttl_seconds <= 0
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        if l1_ttl_seconds <= 0:
+            raise ValueError(f"l1_ttl_seconds must be > 0, got {l1_ttl_seconds}")
+
+        self._remote = remote
+        self._redis = redis_client
+        self._channel = channel
+        self._max_entries = max_entries
+        self._l1_ttl_seconds = l1_ttl_seconds
+        self._metrics_collector = metrics_collector
+        self._clock = clock
+        self._instance_id = uuid4().hex
+        self._entries: OrderedDict[str, _L1Entry] = OrderedDict()
+        self._generation = 0
+        self._filling: Counter[str] = Counter()
+        self._evicted_at: dict[str, int] = {}
+        self._pubsub: PubSub | None = None
+        self._listener: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of L1 entries (including not yet purged expired ones)."""
+        return len(self._entries)
+
+    async def start(self) -> None:
+        """Subscribe to cross-instance invalidations and enable L1.
+
+        No-op without redis_client or when already started.
+        """
+        if self._redis is None or self._listener is not None:
+            return
+
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self._channel)
+        self._pubsub = pubsub
+        self._listener = asyncio.ensure_future(self._listen(pubsub))
+
+    async def close(self) -> None:
+        """Stop listening for invalidations and drop all L1 entries."""
+        listener, self._listener = self._listener, None
+        pubsub, self._pubsub = self._pubsub, None
+        if listener is not None:
+            listener.cancel()
+            await asyncio.gather(listener, return_exceptions=True)
+        if pubsub is not None:
+            await pubsub.reset()
+        self._entries.clear()
+
+    async def get_profile(self, user_id: UUID) -> CacheLookupResult[ProfileData]:
+        """Get cached profile, checking L1 before L2.
+
+        Args:
+            user_id: UUID of the user
+
+        Returns:
+            CacheHit with ProfileData if cached in either tier, CacheMiss otherwise
+        """
+        key = f"profile:{user_id}"
+        match self._l1_get(key):
+            case CacheHit(value=ProfileData() as profile, ttl_remaining=ttl_remaining):
+                await self._record_lookup("l1", "hit")
+                return CacheHit(value=profile, ttl_remaining=ttl_remaining)
+
+        await self._record_lookup("l1", "miss")
+        with self._filling_l1((key,)) as generation:
+            result = await self._remote.get_profile(user_id)
+            if isinstance(result, CacheHit):
+                self._l1_put(key, result.value, result.ttl_remaining, generation)
+        await self._record_lookup("l2", "hit" if isinstance(result, CacheHit) else "miss")
+        return result
+
+    async def put_profile(
+        self, user_id: UUID, data: ProfileData, ttl_seconds: int, tags: Sequence[str] = ()
+    ) -> None:
+        """Store profile in L2, refresh the local L1 copy, and invalidate peers.
+
+        Args:
+            user_id: UUID of the user
+            data: ProfileData to cache
+            ttl_seconds: Time-to-live in seconds
+            tags: Tags to index the entry under (kept by L2)
+        """
+        key = f"profile:{user_id}"
+        await self._remote.put_profile(user_id, data, ttl_seconds, tags)
+        self._evict(key)
+        self._l1_put(key, data, ttl_seconds, self._generation)
+        await self._publish_invalidation((key,))
+
+    async def get_value(self, key: str) -> CacheLookupResult[bytes]:
+        """Get cached value by key, checking L1 before L2.
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            CacheHit with bytes if cached in either tier, CacheMiss otherwise
+        """
+        match self._l1_get(key):
+            case CacheHit(value=bytes() as value, ttl_remaining=ttl_remaining):
+                await self._record_lookup("l1", "hit")
+                return CacheHit(value=value, ttl_remaining=ttl_remaining)
+
+        await self._record_lookup("l1", "miss")
+        with self._filling_l1((key,)) as generation:
+            result = await self._remote.get_value(key)
+            if isinstance(result, CacheHit):
+                self._l1_put(key, result.value, result.ttl_remaining, generation)
+        await self._record_lookup("l2", "hit" if isinstance(result, CacheHit) else "miss")
+        return result
+
+    async def put_value(
+        self, key: str, value: bytes, ttl_seconds: int, tags: Sequence[str] = ()
+    ) -> None:
+        """Store value in L2, refresh the local L1 copy, and invalidate peers.
+
+        Args:
+            key: Cache key
+            value: Value to cache (bytes)
+            ttl_seconds: Time-to-live in seconds
+            tags: Tags to index the entry under (kept by L2)
+        """
+        await self._remote.put_value(key, value, ttl_seconds, tags)
+        self._evict(key)
+        self._l1_put(key, value, ttl_seconds, self._generation)
+        await self._publish_invalidation((key,))
+
+    async def invalidate(self, key: str) -> bool:
+        """Invalidate key in L2, locally, and on every other instance.
+
+        Args:
+            key: Cache key to invalidate
+
+        Returns:
+            True if key was found and deleted in L2, False if not found
+        """
+        deleted = await self._remote.invalidate(key)
+        self._evict(key)
+        await self._publish_invalidation((key,))
+        return deleted
+
+    async def get_values(self, keys: Sequence[str]) -> tuple[CacheLookupResult[bytes], ...]:
+        """Get many cached values, fetching only L1 misses from L2 in one batch.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            One CacheHit or CacheMiss per key, in the same order as keys
+        """
+        local: dict[str, CacheHit[bytes]] = {}
+        for key in keys:
+            match self._l1_get(key):
+                case CacheHit(value=bytes() as value, ttl_remaining=ttl_remaining):
+                    local[key] = CacheHit(value=value, ttl_remaining=ttl_remaining)
+
+        missing = [key for key in dict.fromkeys(keys) if key not in local]
+        await self._record_lookup("l1", "hit", len(local))
+        await self._record_lookup("l1", "miss", len(missing))
+
+        fetched: dict[str, CacheLookupResult[bytes]] = {}
+        if missing:
+            with self._filling_l1(missing) as generation:
+                fetched = dict(zip(missing, await self._remote.get_values(missing), strict=True))
+                hits = {key: hit for key, hit in fetched.items() if isinstance(hit, CacheHit)}
+                for key, hit in hits.items():
+                    self._l1_put(key, hit.value, hit.ttl_remaining, generation)
+            await self._record_lookup("l2", "hit", len(hits))
+            await self._record_lookup("l2", "miss", len(fetched) - len(hits))
+
+        return tuple(local[key] if key in local else fetched[key] for key in keys)
+
+    async def put_values(
+        self, entries: Sequence[tuple[str, bytes]], ttl_seconds: int, tags: Sequence[str] = ()
+    ) -> None:
+        """Store many values in L2, refresh local L1 copies, and invalidate peers.
+
+        Args:
+            entries: (key, value) pairs to cache
+            ttl_seconds: Time-to-live in seconds for every entry
+            tags: Tags to index every entry under (kept by L2)
+        """
+        await self._remote.put_values(entries, ttl_seconds, tags)
+        for key, value in entries:
+            self._evict(key)
+            self._l1_put(key, value, ttl_seconds, self._generation)
+        await self._publish_invalidation([key for key, _ in entries])
+
+    async def invalidate_many(self, keys: Sequence[str]) -> int:
+        """Invalidate many keys in L2, locally, and on every other instance.
+
+        Args:
+            keys: Cache keys to invalidate
+
+        Returns:
+            Number of keys that were found and deleted in L2
+        """
+        deleted = await self._remote.invalidate_many(keys)
+        for key in keys:
+            self._evict(key)
+        await self._publish_invalidation(keys)
+        return deleted
+
+    async def invalidate_tag(self, tag: str) -> tuple[str, ...]:
+        """Invalidate a tag in L2, then drop its keys locally and on every other instance.
+
+        Args:
+            tag: Tag passed to earlier put calls
+
+        Returns:
+            Keys that were indexed under tag and have been invalidated
+        """
+        keys = await self._remote.invalidate_tag(tag)
+        for key in keys:
+            self._evict(key)
+        await self._publish_invalidation(keys)
+        return keys
+
+    def _l1_enabled(self) -> bool:
+        """L1 is safe to use when peers cannot change L2 behind our back."""
+        return self._redis is None or self._listener is not None
+
+    def _l1_get(self, key: str) -> CacheLookupResult[ProfileData | bytes]:
+        """Look up a live L1 entry and mark it most recently used."""
+        entry = self._entries.get(key)
+        if entry is None or not self._l1_enabled():
+            return CacheMiss(key=key, reason="not_found")
+
+        now = self._clock()
+        if entry.expires_at <= now:
+            del self._entries[key]
+            return CacheMiss(key=key, reason="expired")
+
+        self._entries.move_to_end(key)
+        ttl_remaining = 0 if entry.l2_expires_at is None else math.ceil(entry.l2_expires_at - now)
+        return CacheHit(value=entry.value, ttl_remaining=ttl_remaining)
+
+    def _l1_put(
+        self, key: str, value: ProfileData | bytes, ttl_seconds: int, generation: int
+    ) -> None:
+        """Store an entry in L1 unless an invalidation raced with its L2 read.
+
+        Args:
+            key: Cache key
+            value: Value read from or written to L2
+            ttl_seconds: Remaining L2 TTL (0 when the L2 entry never expires)
+            generation: Eviction generation observed before the L2 access
+        """
+        if self._evicted_at.get(key, -1) > generation or not self._l1_enabled():
+            return
+
+        now = self._clock()
+        l1_ttl = (
+            self._l1_ttl_seconds if ttl_seconds <= 0 else min(self._l1_ttl_seconds, ttl_seconds)
+        )
+        self._entries[key] = _L1Entry(
+            value=value,
+            expires_at=now + l1_ttl,
+            l2_expires_at=None if ttl_seconds <= 0 else now + ttl_seconds,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _evict(self, key: str) -> None:
+        """Drop key from L1 and discard any L1 fill of key that raced with this change."""
+        self._generation += 1
+        self._entries.pop(key, None)
+        if key in self._filling:
+            self._evicted_at[key] = self._generation
+
+    @contextmanager
+    def _filling_l1(self, keys: Sequence[str]) -> Iterator[int]:
+        """Track L2 reads of keys that may fill L1; yields the current generation.
+
+        Evictions of these keys while the reads are in flight are remembered
+        until the last read of each key finishes, so _l1_put can reject a value
+        read before the eviction. Other keys' fills are unaffected.
+        """
+        self._filling.update(keys)
+        try:
+            yield self._generation
+        finally:
+            self._filling.subtract(keys)
+            for key in keys:
+                if self._filling[key] <= 0:
+                    self._filling.pop(key, None)
+                    self._evicted_at.pop(key, None)
+
+    async def _publish_invalidation(self, keys: Sequence[str]) -> None:
+        """Announce changed keys to other instances in one message."""
+        if self._redis is None or not keys:
+            return
+        await self._redis.publish(self._channel, f"{self._instance_id} " + "\n".join(keys))
+
+    async def _listen(self, pubsub: PubSub) -> None:
+        """Evict keys invalidated by other instances until cancelled.
+
+        If the subscription fails, L1 is cleared and disabled so lookups fall
+        back to L2 rather than serving entries that may have gone stale.
+        """
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                data = message["data"]
+                text = data.decode("utf-8") if isinstance(data, bytes) else str(data)
+                sender, _, joined_keys = text.partition(" ")
+                if sender != self._instance_id:
+                    keys = joined_keys.split("\n")
+                    for key in keys:
+                        self._evict(key)
+                    await self._record_invalidation(len(keys))
+        except (RedisError, OSError):
+            pass
+        finally:
+            if self._listener is asyncio.current_task():
+                self._listener = None
+            self._entries.clear()
+
+    async def _record_lookup(
+        self, tier: CacheTier, result: Literal["hit", "miss"], count: int = 1
+    ) -> None:
+        """Record per-tier lookups (fire-and-forget - failures are ignored)."""
+        if self._metrics_collector is None or count == 0:
+            return
+
+        await self._metrics_collector.increment_counter(
+            metric_name="effectful_cache_tier_lookups_total",
+            labels={"tier": tier, "result": result},
+            value=float(count),
+        )
+
+    async def _record_invalidation(self, count: int) -> None:
+        """Record L1 evictions requested by another instance."""
+        if self._metrics_collector is None:
+            return
+
+        await self._metrics_collector.increment_counter(
+            metric_name="effectful_cache_remote_invalidations_total",
+            labels={"channel": self._channel},
+            value=float(count),
+        )
@@ -18,9 +18,11 @@ from effectful.domain.cache_result import CacheHit, CacheLookupResult, CacheMiss
 from effectful.domain.errors import DomainError, InvalidMessageError, UserNotFoundError
 from effectful.domain.message import ChatMessage
 from effectful.domain.message_envelope import (
+    ConsumeBatchResult,
     ConsumeResult,
     ConsumeTimeout,
     MessageEnvelope,
+    MessageValue,
     PublishFailure,
     PublishResult,
     PublishSuccess,
@@ -53,7 +55,16 @@ from effectful.domain.token_result import (
     TokenValid,
     TokenValidationResult,
 )
-from effectful.domain.user import User, UserFound, UserLookupResult, UserNotFound
+from effectful.domain.user import (
+    User,
+    UserEmailExists,
+    UserFound,
+    UserLookupResult,
+    UserNotFound,
+    UserUpdateResult,
+    UserUpsertResult,
+    UserVersionConflict,
+)
 
 __all__ = [
     # User ADTs
@@ -61,6 +72,10 @@ __all__ = [
     "UserFound",
     "UserNotFound",
     "UserLookupResult",
+    "UserVersionConflict",
+    "UserUpdateResult",
+    "UserEmailExists",
+    "UserUpsertResult",
     # Message
     "ChatMessage",
     # Profile ADTs
@@ -76,6 +91,8 @@ __all__ = [
     "MessageEnvelope",
     "ConsumeTimeout",
     "ConsumeResult",
+    "ConsumeBatchResult",
+    "MessageValue",
     "PublishSuccess",
     "PublishFailure",
     "PublishResult",
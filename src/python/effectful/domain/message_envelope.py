@@ -11,6 +11,7 @@ Domain Models:
     - NackSuccess/NackFailure: Negative-ack operation results
 
 Type Aliases:
+    - MessageValue: Structured payload encoded by a message codec
     - PublishResult: ADT for publish outcomes
     - ConsumeResult: ADT for consume outcomes
     - AcknowledgeResult: ADT for ack outcomes
@@ -25,6 +26,14 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Literal
 
+from effectful.domain.optional_value import Absent, OptionalValue
+
+# Structured payload a message codec encodes (JSON data model)
+type MessageValue = (None | bool | int | float | str | list[MessageValue] | dict[str, MessageValue])
+
+# Message property naming the codec a payload was encoded with
+CONTENT_TYPE_PROPERTY = "content-type"
+
 
 @dataclass(frozen=True)
 class MessageEnvelope:
@@ -39,6 +48,8 @@ class MessageEnvelope:
         properties: Message properties (metadata key-value pairs)
         publish_time: Timestamp when message was published
         topic: Topic name where message was published
+        value: Payload decoded by the interpreter's codecs (Provided), or Absent
+            with reason "not_decoded", "no_codec" or "decode_failed"
 
     Example:
         >>> envelope = MessageEnvelope(
@@ -56,6 +67,21 @@ class MessageEnvelope:
     properties: dict[str, str]
     publish_time: datetime
     topic: str
+    value: OptionalValue[MessageValue] = Absent(reason="not_decoded")
+
+    @property
+    def content_type(self) -> str | None:
+        """Content type of payload set by the publishing codec, if any."""
+        return self.properties.get(CONTENT_TYPE_PROPERTY)
+
+    @property
+    def payload_view(self) -> memoryview:
+        """Read-only view of payload for slicing without copying.
+
+        Slices of the view can be passed on as PublishMessage payloads or
+        PutObject content, so large messages are not copied by the handler.
+        """
+        return memoryview(self.payload)
 
 
 @dataclass(frozen=True)
@@ -189,6 +215,9 @@ class ConsumeFailure:
 # ADT: Union of consume results (no Optional!)
 type ConsumeResult = MessageEnvelope | ConsumeTimeout | ConsumeFailure
 
+# ADT: Batch consume results - received envelopes (empty on timeout) or a failure
+type ConsumeBatchResult = tuple[MessageEnvelope, ...] | ConsumeFailure
+
 
 @dataclass(frozen=True)
 class AcknowledgeSuccess:
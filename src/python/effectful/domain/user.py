@@ -1,6 +1,7 @@
 """User domain model.
 
-This module defines the User entity and UserLookupResult ADT.
+This module defines the User entity, UserLookupResult ADT, and
+UserUpdateResult ADT for conditional (optimistic-concurrency) updates.
 All domain models are immutable and use ADTs to eliminate Optional types.
 """
 
@@ -19,11 +20,13 @@ class User:
         id: Unique identifier for the user
         name: User's display name
         email: User's email address
+        version: Optimistic-concurrency version, incremented on every update
     """
 
     id: UUID
     name: str
     email: str
+    version: int = 1
 
 
 # UserLookupResult ADT - replaces Optional[User]
@@ -57,3 +60,42 @@ class UserNotFound:
 
 # ADT: Union of user lookup results (no Optional!) using PEP 695 type statement
 type UserLookupResult = UserFound | UserNotFound
+
+
+@dataclass(frozen=True)
+class UserVersionConflict:
+    """Conditional update rejected because the user changed since it was read.
+
+    Attributes:
+        user_id: The user ID that was updated
+        expected_version: Version the caller based its update on
+        current: The user as currently stored (with its current version)
+    """
+
+    user_id: UUID
+    expected_version: int
+    current: User
+
+
+# ADT: Result of a conditional update (UpdateUserIf)
+type UserUpdateResult = UserFound | UserNotFound | UserVersionConflict
+
+
+@dataclass(frozen=True)
+class UserEmailExists:
+    """Create-if-absent rejected because a user with the email already exists.
+
+    The existing user is left untouched (name and credentials are never
+    overwritten).
+
+    Attributes:
+        email: The email that is already taken
+        current: The user as currently stored
+    """
+
+    email: str
+    current: User
+
+
+# ADT: Result of a create-if-absent (UpsertUser)
+type UserUpsertResult = User | UserEmailExists
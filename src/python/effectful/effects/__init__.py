@@ -4,7 +4,8 @@ This package provides immutable effect types for describing program behavior:
 - WebSocket effects: SendText, ReceiveText, Close (with typed CloseReason)
 - Database effects: GetUserById, SaveChatMessage, ListMessagesForUser
 - Cache effects: GetCachedProfile, PutCachedProfile
-- Messaging effects: PublishMessage, ConsumeMessage, AcknowledgeMessage, NegativeAcknowledge
+- Messaging effects: PublishMessage, PublishMessages, PublishValue, ConsumeMessage,
+  ConsumeBatch, AcknowledgeMessage, AcknowledgeBatch, NegativeAcknowledge
 - Storage effects: GetObject, PutObject, DeleteObject, ListObjects
 - Auth effects: ValidateToken, GenerateToken, RefreshToken, RevokeToken
 - System effects: GetCurrentTime, GenerateUUID
@@ -29,11 +30,15 @@ from effectful.effects.database import (
     SaveChatMessage,
 )
 from effectful.effects.messaging import (
+    AcknowledgeBatch,
     AcknowledgeMessage,
+    ConsumeBatch,
     ConsumeMessage,
     MessagingEffect,
     NegativeAcknowledge,
     PublishMessage,
+    PublishMessages,
+    PublishValue,
 )
 from effectful.effects.runtime import (
     CloseDatabasePool,
@@ -95,8 +100,12 @@ __all__ = [
     "CacheEffect",
     # Messaging
     "PublishMessage",
+    "PublishMessages",
+    "PublishValue",
     "ConsumeMessage",
+    "ConsumeBatch",
     "AcknowledgeMessage",
+    "AcknowledgeBatch",
     "NegativeAcknowledge",
     "MessagingEffect",
     # Storage
@@ -6,15 +6,25 @@ This module defines effects for cache operations:
 - InvalidateCache: Invalidate cache entry by key
 - GetCachedValue: Get cached value by key (generic)
 - PutCachedValue: Put value in cache
+- GetCachedValues: Get many cached values in one round-trip
+- PutCachedValues: Put many values in cache in one round-trip
+- InvalidateMany: Invalidate many cache entries in one round-trip
+- InvalidateTag: Invalidate every entry stored with a tag
+- GetOrCompute: Cache-aside lookup that runs a sub-program once per miss
 
 All effects are immutable (frozen dataclasses).
 """
 
+from collections.abc import Generator
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from effectful.domain.profile import ProfileData
 
+if TYPE_CHECKING:
+    from effectful.programs.program_types import AllEffects, EffectResult
+
 
 @dataclass(frozen=True)
 class GetCachedProfile:
@@ -35,11 +45,13 @@ class PutCachedProfile:
         user_id: UUID of the user
         profile_data: The profile data to cache
         ttl_seconds: Time-to-live in seconds (default: 300)
+        tags: Tags to index the entry under for InvalidateTag
     """
 
     user_id: UUID
     profile_data: ProfileData
     ttl_seconds: int = 300
+    tags: tuple[str, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -83,11 +95,104 @@ class PutCachedValue:
         key: Cache key
         value: Value to cache (bytes)
         ttl_seconds: Time-to-live in seconds
+        tags: Tags to index the entry under for InvalidateTag
     """
 
     key: str
     value: bytes
     ttl_seconds: int
+    tags: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class GetCachedValues:
+    """Effect: Get many cached values by key in one round-trip.
+
+    Returns a tuple of CacheLookupResult aligned with keys:
+    - CacheHit(value=bytes) for each key that exists
+    - CacheMiss(key=key) for each key that does not
+
+    Attributes:
+        keys: Cache keys to retrieve
+    """
+
+    keys: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class PutCachedValues:
+    """Effect: Put many values in cache with a shared TTL in one round-trip.
+
+    Attributes:
+        entries: (key, value) pairs to cache
+        ttl_seconds: Time-to-live in seconds for every entry
+        tags: Tags to index every entry under for InvalidateTag
+    """
+
+    entries: tuple[tuple[str, bytes], ...]
+    ttl_seconds: int
+    tags: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class InvalidateMany:
+    """Effect: Invalidate many cache entries in one round-trip.
+
+    Returns the number of keys that existed and were removed.
+
+    Attributes:
+        keys: Cache keys to invalidate
+    """
+
+    keys: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class InvalidateTag:
+    """Effect: Invalidate every cache entry stored with tag.
+
+    Entries are tagged by the tags field of the put effects, e.g. a
+    "user:<id>" tag on everything cached for one user. Returns the number
+    of keys that were indexed under the tag and removed.
+
+    Attributes:
+        tag: Tag whose entries to invalidate
+    """
+
+    tag: str
+
+
+@dataclass(frozen=True)
+class GetOrCompute:
+    """Effect: Return the cached value for key, computing and caching it on a miss.
+
+    On a miss the sub-program runs with the full interpreter and its bytes
+    result is stored with ttl_seconds. Concurrent misses for the same key are
+    coalesced: one caller runs its sub-program and every other caller receives
+    that result without running its own. A non-bytes result (e.g. UserNotFound)
+    is shared with concurrent callers but not cached.
+
+    Attributes:
+        key: Cache key to read and populate
+        program: Sub-program computing the value on a miss; its return value
+            becomes the result of this effect
+        ttl_seconds: Time-to-live in seconds for the computed value
+        tags: Tags to index the computed entry under for InvalidateTag
+
+    Example:
+        >>> def load_profile(user_id: UUID) -> Generator[AllEffects, EffectResult, EffectResult]:
+        ...     user = yield GetUserById(user_id=user_id)
+        ...     if not isinstance(user, User):
+        ...         return user
+        ...     return json.dumps({"id": str(user.id), "name": user.name}).encode()
+        >>>
+        >>> data = yield GetOrCompute(key=f"profile-json:{user_id}", program=load_profile(user_id))
+    """
+
+    key: str
+    program: "Generator[AllEffects, EffectResult, EffectResult]"
+    ttl_seconds: int = 300
+    tags: tuple[str, ...] = ()
 
 
 # ADT: Union of all cache effects using PEP 695 type statement
@@ -98,4 +203,9 @@ type CacheEffect = (
     | DeleteCachedProfile
     | GetCachedValue
     | PutCachedValue
+    | GetCachedValues
+    | PutCachedValues
+    | InvalidateMany
+    | InvalidateTag
+    | GetOrCompute
 )
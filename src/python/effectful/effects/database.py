@@ -8,16 +8,23 @@ This module defines effects for database operations:
 - CreateUser: Create new user
 - UpdateUser: Update user fields
 - DeleteUser: Delete user
+- UpsertUser: Create user unless the email is taken, in one round-trip
+- UpdateUserIf: Update user only if its version is unchanged
+- Transaction: Run a database sub-program atomically
 
 All effects are immutable (frozen dataclasses).
 """
 
+from collections.abc import Generator
 from dataclasses import dataclass
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 from uuid import UUID
 
 from effectful.domain.optional_value import Absent, OptionalValue, Provided, to_optional_value
 
+if TYPE_CHECKING:
+    from effectful.programs.program_types import EffectResult
+
 T_co = TypeVar("T_co")
 
 
@@ -146,6 +153,84 @@ class DeleteUser:
     user_id: UUID
 
 
+@dataclass(frozen=True)
+class Transaction:
+    """Effect: Run a database sub-program atomically in one transaction.
+
+    Every database effect yielded by the sub-program runs on the same
+    connection inside a single transaction. The transaction commits when the
+    sub-program returns and rolls back on the first failed effect.
+
+    Attributes:
+        program: Sub-program yielding database effects only; its return value
+            becomes the result of this effect
+
+    Example:
+        >>> def register(email: str, name: str) -> Generator[DatabaseEffect, EffectResult, User]:
+        ...     user = yield CreateUser(email=email, name=name, password_hash=hashed)
+        ...     assert isinstance(user, User)
+        ...     yield SaveChatMessage(user_id=user.id, text="Welcome!")
+        ...     return user
+        >>>
+        >>> user = yield Transaction(program=register("a@example.com", "Alice"))
+    """
+
+    program: "Generator[DatabaseEffect, EffectResult, EffectResult]"
+
+
+@dataclass(frozen=True)
+class UpsertUser:
+    """Effect: Create user unless a user with the same email exists.
+
+    Replaces the GetUserByEmail/CreateUser read-then-write sequence with a
+    single atomic statement, so concurrent registrations cannot race. An
+    existing user is never modified: the effect returns the created User, or
+    UserEmailExists carrying the existing user.
+
+    Attributes:
+        email: User email address (conflict key)
+        name: User name (used only when the user is created)
+        password_hash: Bcrypt password hash (used only when the user is created)
+    """
+
+    email: str
+    name: str
+    password_hash: str
+
+
+@dataclass(frozen=True, init=False)
+class UpdateUserIf:
+    """Effect: Update user fields only if the stored version matches.
+
+    Optimistic concurrency: callers pass the version they read, and the update
+    is applied only if nobody has modified the user since. Returns the updated
+    User, UserNotFound, or UserVersionConflict carrying the current user.
+
+    Attributes:
+        user_id: UUID of user to update
+        expected_version: Version the caller read (User.version)
+        email: New email (None to keep current)
+        name: New name (None to keep current)
+    """
+
+    user_id: UUID
+    expected_version: int
+    email: OptionalValue[str]
+    name: OptionalValue[str]
+
+    def __init__(
+        self,
+        user_id: UUID,
+        expected_version: int,
+        email: str | OptionalValue[str] | None = None,
+        name: str | OptionalValue[str] | None = None,
+    ) -> None:
+        object.__setattr__(self, "user_id", user_id)
+        object.__setattr__(self, "expected_version", expected_version)
+        object.__setattr__(self, "email", _normalize_optional_value(email))
+        object.__setattr__(self, "name", _normalize_optional_value(name))
+
+
 # ADT: Union of all database effects using PEP 695 type statement
 type DatabaseEffect = (
     GetUserById
@@ -156,4 +241,7 @@ type DatabaseEffect = (
     | CreateUser
     | UpdateUser
     | DeleteUser
+    | UpsertUser
+    | UpdateUserIf
+    | Transaction
 )
@@ -2,8 +2,12 @@
 
 This module defines effects for message queue operations with Pulsar:
 - PublishMessage: Send message to topic
+- PublishMessages: Send many messages to one topic in a single dispatch
+- PublishValue: Send a structured value encoded with the topic's codec
 - ConsumeMessage: Receive message from subscription
+- ConsumeBatch: Receive up to N messages from subscription in one call
 - AcknowledgeMessage: Acknowledge message processing
+- AcknowledgeBatch: Acknowledge many messages, optionally cumulatively
 - NegativeAcknowledge: Negative acknowledge for redelivery
 
 All effects are immutable (frozen dataclasses) and describe *what* should happen,
@@ -28,8 +32,10 @@ Type Safety:
     `type: ignore` allowed. Pattern match on effect types for exhaustive handling.
 """
 
+from collections.abc import Buffer, Sequence
 from dataclasses import dataclass
 
+from effectful.domain.message_envelope import MessageValue
 from effectful.domain.optional_value import (
     Absent,
     OptionalValue,
@@ -55,7 +61,9 @@ class PublishMessage:
 
     Attributes:
         topic: Topic name to publish to (e.g., "persistent://tenant/namespace/topic")
-        payload: Message payload as bytes
+        payload: Message payload; any buffer (bytes, bytearray, memoryview) is
+            passed to the producer as is, so a slice of a received envelope's
+            payload_view is published without copying it first
         properties: Optional message properties (metadata key-value pairs)
 
     Returns:
@@ -73,13 +81,13 @@ class PublishMessage:
     """
 
     topic: str
-    payload: bytes
+    payload: Buffer
     properties: OptionalValue[dict[str, str]]
 
     def __init__(
         self,
         topic: str,
-        payload: bytes,
+        payload: Buffer,
         properties: dict[str, str] | OptionalValue[dict[str, str]] | None = None,
     ) -> None:
         object.__setattr__(self, "topic", topic)
@@ -87,6 +95,88 @@ class PublishMessage:
         object.__setattr__(self, "properties", _normalize_optional_properties(properties))
 
 
+@dataclass(frozen=True, init=False)
+class PublishMessages:
+    """Effect: Publish many messages to one Pulsar topic.
+
+    All payloads are handed to the producer without waiting for each broker
+    receipt in turn, so a batching producer can pack them into few broker
+    messages. Payloads are sent in order and share the same properties.
+
+    Attributes:
+        topic: Topic name to publish to
+        payloads: Message payloads (any buffers), in send order
+        properties: Optional properties attached to every message
+
+    Returns:
+        When yielded in a program, returns tuple[PublishResult, ...] aligned with
+        payloads (PublishSuccess or PublishFailure per message).
+
+    Example:
+        >>> def fan_out(events: list[bytes]) -> Generator[AllEffects, EffectResult, int]:
+        ...     results = yield PublishMessages(topic="user-events", payloads=events)
+        ...     assert isinstance(results, tuple)
+        ...     return sum(isinstance(r, PublishSuccess) for r in results)
+    """
+
+    topic: str
+    payloads: tuple[Buffer, ...]
+    properties: OptionalValue[dict[str, str]]
+
+    def __init__(
+        self,
+        topic: str,
+        payloads: Sequence[Buffer],
+        properties: dict[str, str] | OptionalValue[dict[str, str]] | None = None,
+    ) -> None:
+        object.__setattr__(self, "topic", topic)
+        object.__setattr__(self, "payloads", tuple(payloads))
+        object.__setattr__(self, "properties", _normalize_optional_properties(properties))
+
+
+@dataclass(frozen=True, init=False)
+class PublishValue:
+    """Effect: Publish a structured value encoded with the topic's codec.
+
+    The interpreter encodes value with the codec its codec registry selects
+    for topic and records the codec's content type in the "content-type"
+    message property. Consumed envelopes carrying that property are decoded
+    into MessageEnvelope.value by an interpreter with the same codec.
+
+    Attributes:
+        topic: Topic name to publish to
+        value: JSON-compatible value to encode
+        properties: Optional message properties (metadata key-value pairs)
+
+    Returns:
+        When yielded in a program, returns message ID (str) on success, or
+        PublishFailure; Err(MessagingError) if no codec is configured for topic
+        or value cannot be encoded.
+
+    Example:
+        >>> def publish_login(user_id: str) -> Generator[AllEffects, EffectResult, str]:
+        ...     message_id = yield PublishValue(
+        ...         topic="user-events", value={"event": "login", "user_id": user_id}
+        ...     )
+        ...     assert isinstance(message_id, str)
+        ...     return message_id
+    """
+
+    topic: str
+    value: MessageValue
+    properties: OptionalValue[dict[str, str]]
+
+    def __init__(
+        self,
+        topic: str,
+        value: MessageValue,
+        properties: dict[str, str] | OptionalValue[dict[str, str]] | None = None,
+    ) -> None:
+        object.__setattr__(self, "topic", topic)
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "properties", _normalize_optional_properties(properties))
+
+
 @dataclass(frozen=True)
 class ConsumeMessage:
     """Effect: Consume message from Pulsar subscription.
@@ -134,6 +224,41 @@ class ConsumeMessage:
     timeout_ms: int = 5000
 
 
+@dataclass(frozen=True)
+class ConsumeBatch:
+    """Effect: Consume up to max_messages messages from a Pulsar subscription.
+
+    The interpreter waits until max_messages messages are available or
+    max_wait_ms has passed, whichever comes first, and returns what arrived.
+
+    Attributes:
+        subscription: Subscription name to consume from ("topic/subscription-name")
+        max_messages: Largest number of messages to return
+        max_wait_ms: Longest time to wait for the batch to fill in milliseconds
+
+    Returns:
+        When yielded in a program, returns tuple[MessageEnvelope, ...] (empty if
+        nothing arrived in time) or ConsumeFailure on connection/subscription errors.
+
+    Example:
+        >>> def drain() -> Generator[AllEffects, EffectResult, int]:
+        ...     batch = yield ConsumeBatch(subscription="events/worker", max_messages=100)
+        ...     match batch:
+        ...         case tuple() as envelopes if envelopes:
+        ...             # Process envelopes...
+        ...             yield AcknowledgeBatch(
+        ...                 message_ids=tuple(e.message_id for e in envelopes),
+        ...             )
+        ...             return len(envelopes)
+        ...         case _:
+        ...             return 0
+    """
+
+    subscription: str
+    max_messages: int = 100
+    max_wait_ms: int = 100
+
+
 @dataclass(frozen=True)
 class AcknowledgeMessage:
     """Effect: Acknowledge message processing.
@@ -163,6 +288,33 @@ class AcknowledgeMessage:
     message_id: str
 
 
+@dataclass(frozen=True, init=False)
+class AcknowledgeBatch:
+    """Effect: Acknowledge many messages in one dispatch.
+
+    With cumulative=True, only the last message ID is acknowledged, using
+    Pulsar's cumulative acknowledgement, which also covers every earlier
+    message of that subscription. All IDs must then come from the same
+    subscription, in receive order (e.g. one ConsumeBatch result), and the
+    subscription must not be Shared or Key_Shared.
+
+    Attributes:
+        message_ids: Pulsar message IDs to acknowledge, in receive order
+        cumulative: Acknowledge everything up to the last ID with one call
+
+    Returns:
+        When yielded in a program, returns tuple[AcknowledgeResult, ...] aligned
+        with message_ids.
+    """
+
+    message_ids: tuple[str, ...]
+    cumulative: bool
+
+    def __init__(self, message_ids: Sequence[str], cumulative: bool = False) -> None:
+        object.__setattr__(self, "message_ids", tuple(message_ids))
+        object.__setattr__(self, "cumulative", cumulative)
+
+
 @dataclass(frozen=True)
 class NegativeAcknowledge:
     """Effect: Negative acknowledge message for redelivery.
@@ -199,4 +351,13 @@ class NegativeAcknowledge:
 
 
 # Type alias: Union of all messaging effects (PEP 695)
-type MessagingEffect = (PublishMessage | ConsumeMessage | AcknowledgeMessage | NegativeAcknowledge)
+type MessagingEffect = (
+    PublishMessage
+    | PublishMessages
+    | PublishValue
+    | ConsumeMessage
+    | ConsumeBatch
+    | AcknowledgeMessage
+    | AcknowledgeBatch
+    | NegativeAcknowledge
+)
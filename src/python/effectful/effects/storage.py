@@ -34,6 +34,7 @@ Example:
     ...     return s3_object.key
 """
 
+from collections.abc import Buffer
 from dataclasses import dataclass
 from typing import TypeVar
 
@@ -94,7 +95,8 @@ class PutObject:
     Attributes:
         bucket: Bucket name to store the object
         key: Object key (path) within the bucket
-        content: Object content as bytes
+        content: Object content; any buffer (bytes, bytearray, memoryview) is
+            uploaded without an intermediate copy
         metadata: Optional metadata key-value pairs
         content_type: Optional MIME type (e.g., "text/plain", "application/json")
 
@@ -120,7 +122,7 @@ class PutObject:
 
     bucket: str
     key: str
-    content: bytes
+    content: Buffer
     metadata: OptionalValue[dict[str, str]]
     content_type: OptionalValue[str]
 
@@ -128,7 +130,7 @@ class PutObject:
         self,
         bucket: str,
         key: str,
-        content: bytes,
+        content: Buffer,
         metadata: dict[str, str] | OptionalValue[dict[str, str]] | None = None,
         content_type: str | OptionalValue[str] | None = None,
     ) -> None:
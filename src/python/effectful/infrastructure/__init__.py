@@ -8,7 +8,10 @@ Available protocols:
 - **WebSocketConnection** - Real-time communication protocol
 - **UserRepository** - User data access protocol
 - **ChatMessageRepository** - Message persistence protocol
+- **TransactionManager** / **UnitOfWork** - Transactional repository access protocol
 - **ProfileCache** - Profile caching protocol
+- **CacheLock** - Distributed lock for cache recomputation
+- **NegativeLookupCache** - Short-lived memory of not-found lookups
 - **MessageProducer** - Message publishing protocol (Pulsar, Kafka, etc.)
 - **MessageConsumer** - Message consumption protocol (Pulsar, Kafka, etc.)
 - **ObjectStorage** - Object storage protocol (S3, MinIO, etc.)
@@ -33,11 +36,13 @@ See Also:
 """
 
 from effectful.infrastructure.auth import AuthService
-from effectful.infrastructure.cache import ProfileCache
+from effectful.infrastructure.cache import CacheLock, NegativeLookupCache, ProfileCache
 from effectful.infrastructure.messaging import MessageConsumer, MessageProducer
 from effectful.infrastructure.metrics import MetricsCollector
 from effectful.infrastructure.repositories import (
     ChatMessageRepository,
+    TransactionManager,
+    UnitOfWork,
     UserRepository,
 )
 from effectful.infrastructure.storage import ObjectStorage
@@ -47,7 +52,11 @@ __all__ = [
     "WebSocketConnection",
     "UserRepository",
     "ChatMessageRepository",
+    "TransactionManager",
+    "UnitOfWork",
     "ProfileCache",
+    "CacheLock",
+    "NegativeLookupCache",
     "MessageProducer",
     "MessageConsumer",
     "ObjectStorage",
@@ -5,10 +5,12 @@ Concrete implementations (adapters) like Redis are provided elsewhere.
 Uses ADTs instead of Optional for type safety.
 """
 
+from collections.abc import Sequence
 from typing import Protocol
 from uuid import UUID
 
 from effectful.domain.cache_result import CacheLookupResult
+from effectful.domain.optional_value import OptionalValue
 from effectful.domain.profile import ProfileData
 
 
@@ -27,13 +29,16 @@ class ProfileCache(Protocol):
         """
         ...
 
-    async def put_profile(self, user_id: UUID, data: ProfileData, ttl_seconds: int) -> None:
+    async def put_profile(
+        self, user_id: UUID, data: ProfileData, ttl_seconds: int, tags: Sequence[str] = ()
+    ) -> None:
         """Store profile in cache with TTL.
 
         Args:
             user_id: UUID of the user
             data: ProfileData to cache
             ttl_seconds: Time-to-live in seconds
+            tags: Tags to index the entry under, written atomically with the value
         """
         ...
 
@@ -48,13 +53,16 @@ class ProfileCache(Protocol):
         """
         ...
 
-    async def put_value(self, key: str, value: bytes, ttl_seconds: int) -> None:
+    async def put_value(
+        self, key: str, value: bytes, ttl_seconds: int, tags: Sequence[str] = ()
+    ) -> None:
         """Store value in cache with TTL.
 
         Args:
             key: Cache key
             value: Value to cache (bytes)
             ttl_seconds: Time-to-live in seconds
+            tags: Tags to index the entry under, written atomically with the value
         """
         ...
 
@@ -68,3 +76,119 @@ class ProfileCache(Protocol):
             True if key was found and deleted, False if not found
         """
         ...
+
+    async def get_values(self, keys: Sequence[str]) -> tuple[CacheLookupResult[bytes], ...]:
+        """Get many cached values in one round-trip.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            One CacheHit or CacheMiss per key, in the same order as keys
+        """
+        ...
+
+    async def put_values(
+        self, entries: Sequence[tuple[str, bytes]], ttl_seconds: int, tags: Sequence[str] = ()
+    ) -> None:
+        """Store many values with a shared TTL in one round-trip.
+
+        Args:
+            entries: (key, value) pairs to cache
+            ttl_seconds: Time-to-live in seconds for every entry
+            tags: Tags to index every entry under, written atomically with the values
+        """
+        ...
+
+    async def invalidate_many(self, keys: Sequence[str]) -> int:
+        """Invalidate many cache entries in one round-trip.
+
+        Args:
+            keys: Cache keys to invalidate
+
+        Returns:
+            Number of keys that were found and deleted
+        """
+        ...
+
+    async def invalidate_tag(self, tag: str) -> tuple[str, ...]:
+        """Invalidate every entry indexed under tag, and the tag index itself.
+
+        Costs O(members of the tag), never a scan of the keyspace.
+
+        Args:
+            tag: Tag passed to earlier put calls
+
+        Returns:
+            Keys that were indexed under tag and have been invalidated
+        """
+        ...
+
+
+class CacheLock(Protocol):
+    """Protocol for short-lived distributed locks guarding cache recomputation.
+
+    Used by GetOrCompute so that only one instance recomputes a missing key
+    while the others wait for the value to appear in the shared cache.
+    """
+
+    async def acquire(self, key: str, ttl_ms: int) -> OptionalValue[str]:
+        """Try to take the lock for key without blocking.
+
+        Args:
+            key: Cache key being recomputed
+            ttl_ms: Lock lifetime in milliseconds (bounds a crashed holder)
+
+        Returns:
+            Provided token if acquired, Absent if another holder has the lock
+        """
+        ...
+
+    async def release(self, key: str, token: str) -> bool:
+        """Release the lock if it is still held with token.
+
+        Args:
+            key: Cache key the lock was taken for
+            token: Token returned by acquire
+
+        Returns:
+            True if the lock was released, False if it had expired or changed hands
+        """
+        ...
+
+
+class NegativeLookupCache[T](Protocol):
+    """Protocol for briefly remembering lookups that found nothing.
+
+    Lets interpreters answer repeated lookups of nonexistent records (bots,
+    stale tokens, enumeration) without a database round-trip. Entries must
+    expire after a short TTL; writes that create the record call forget.
+    """
+
+    async def get_miss(self, key: str) -> OptionalValue[T]:
+        """Get the remembered miss for key.
+
+        Args:
+            key: Lookup key (e.g. a user ID)
+
+        Returns:
+            Provided miss if remembered and not expired, Absent otherwise
+        """
+        ...
+
+    async def put_miss(self, key: str, miss: T) -> None:
+        """Remember that looking up key found nothing.
+
+        Args:
+            key: Lookup key
+            miss: Not-found result to return for key until it expires
+        """
+        ...
+
+    async def forget(self, key: str) -> None:
+        """Drop the remembered miss for key (the record now exists).
+
+        Args:
+            key: Lookup key
+        """
+        ...
@@ -7,6 +7,8 @@ the protocol.
 Protocols:
     - MessageProducer: Message publishing operations
     - MessageConsumer: Message consumption and acknowledgment operations
+    - MessageCodec: Encoding of structured values to payload bytes and back
+    - MessageCodecRegistry: Codec selection per topic and content type
 
 Implementation Notes:
     Real implementations use Pulsar client library (pulsar-client).
@@ -17,11 +19,14 @@ Type Safety:
     exceptions for domain-level failures.
 """
 
+from collections.abc import Buffer, Sequence
 from typing import Protocol
 
 from effectful.domain.message_envelope import (
     AcknowledgeResult,
+    ConsumeBatchResult,
     ConsumeResult,
+    MessageValue,
     NackResult,
     PublishResult,
 )
@@ -56,14 +61,14 @@ class MessageProducer(Protocol):
     async def publish(
         self,
         topic: str,
-        payload: bytes,
+        payload: Buffer,
         properties: dict[str, str] | None = None,
     ) -> PublishResult:
         """Publish message to topic.
 
         Args:
             topic: Topic name to publish to
-            payload: Message payload as bytes
+            payload: Message payload (bytes, bytearray, memoryview, ...)
             properties: Optional message properties
 
         Returns:
@@ -77,6 +82,27 @@ class MessageProducer(Protocol):
         """
         ...
 
+    async def publish_many(
+        self,
+        topic: str,
+        payloads: Sequence[Buffer],
+        properties: dict[str, str] | None = None,
+    ) -> tuple[PublishResult, ...]:
+        """Publish many messages to one topic without awaiting each receipt in turn.
+
+        Args:
+            topic: Topic name to publish to
+            payloads: Message payloads, sent in order
+            properties: Optional properties attached to every message
+
+        Returns:
+            One PublishSuccess or PublishFailure per payload, in the same order.
+
+        Note:
+            Same failure semantics as publish, reported per message.
+        """
+        ...
+
 
 class MessageConsumer(Protocol):
     """Protocol for message consumption operations.
@@ -125,6 +151,22 @@ class MessageConsumer(Protocol):
         """
         ...
 
+    async def receive_batch(
+        self, subscription: str, max_messages: int, max_wait_ms: int
+    ) -> ConsumeBatchResult:
+        """Receive up to max_messages messages in one call.
+
+        Args:
+            subscription: Subscription name to consume from
+            max_messages: Largest number of messages to return
+            max_wait_ms: Longest time to wait for the batch to fill in milliseconds
+
+        Returns:
+            Tuple of MessageEnvelopes (empty if nothing arrived in time).
+            ConsumeFailure if connection or subscription error occurred.
+        """
+        ...
+
     async def acknowledge(self, message_id: str) -> AcknowledgeResult:
         """Acknowledge message processing.
 
@@ -141,6 +183,22 @@ class MessageConsumer(Protocol):
         """
         ...
 
+    async def acknowledge_batch(
+        self, message_ids: Sequence[str], cumulative: bool = False
+    ) -> tuple[AcknowledgeResult, ...]:
+        """Acknowledge many messages.
+
+        Args:
+            message_ids: Message IDs to acknowledge, in receive order
+            cumulative: Acknowledge only the last ID cumulatively, covering every
+                earlier message of its subscription
+
+        Returns:
+            One AcknowledgeSuccess or AcknowledgeFailure per ID, in the same order.
+            With cumulative=True every ID shares the outcome of the last one.
+        """
+        ...
+
     async def negative_acknowledge(self, message_id: str, delay_ms: int = 0) -> NackResult:
         """Negative acknowledge message for redelivery.
 
@@ -157,3 +215,44 @@ class MessageConsumer(Protocol):
             Failures are explicit ADTs for exhaustive pattern matching.
         """
         ...
+
+
+class MessageCodec(Protocol):
+    """Protocol for message payload codecs.
+
+    The interpreter stores content_type in the "content-type" message property
+    when publishing, so consumers can pick the matching codec.
+    """
+
+    @property
+    def content_type(self) -> str:
+        """MIME type identifying this codec's payloads (e.g. "application/json")."""
+        ...
+
+    def encode(self, value: MessageValue) -> bytes:
+        """Encode value as a message payload.
+
+        Raises:
+            ValueError/TypeError: If value cannot be encoded
+        """
+        ...
+
+    def decode(self, payload: bytes) -> MessageValue:
+        """Decode a payload written by encode.
+
+        Raises:
+            ValueError: If payload is not in this codec's format
+        """
+        ...
+
+
+class MessageCodecRegistry(Protocol):
+    """Protocol for choosing message codecs."""
+
+    def for_topic(self, topic: str) -> MessageCodec | None:
+        """Codec values published to topic are encoded with, or None."""
+        ...
+
+    def for_content_type(self, content_type: str) -> MessageCodec | None:
+        """Codec that decodes payloads of content_type, or None."""
+        ...
@@ -5,12 +5,13 @@ Concrete implementations (adapters) are provided elsewhere.
 Uses ADTs instead of Optional for type safety.
 """
 
+from datetime import datetime
 from typing import Protocol
 from uuid import UUID
 
 from effectful.domain.message import ChatMessage
 from effectful.domain.optional_value import OptionalValue
-from effectful.domain.user import User, UserLookupResult
+from effectful.domain.user import User, UserLookupResult, UserUpdateResult, UserUpsertResult
 
 
 class UserRepository(Protocol):
@@ -87,6 +88,43 @@ class UserRepository(Protocol):
         """
         ...
 
+    async def upsert_user(self, email: str, name: str, password_hash: str) -> UserUpsertResult:
+        """Create user unless a user with this email exists, in one statement.
+
+        An existing user is never modified, so a registration cannot overwrite
+        another account's name or credentials.
+
+        Args:
+            email: User email address (conflict key)
+            name: User name
+            password_hash: Bcrypt password hash
+
+        Returns:
+            The created User, or UserEmailExists with the existing user
+        """
+        ...
+
+    async def update_user_if(
+        self,
+        user_id: UUID,
+        expected_version: int,
+        email: OptionalValue[str],
+        name: OptionalValue[str],
+    ) -> UserUpdateResult:
+        """Update user fields only if the stored version equals expected_version.
+
+        Args:
+            user_id: UUID of user to update
+            expected_version: Version the caller read
+            email: New email (Absent to keep current)
+            name: New name (Absent to keep current)
+
+        Returns:
+            UserFound with updated user, UserNotFound if not found,
+            UserVersionConflict with the current user if the version changed
+        """
+        ...
+
 
 class ChatMessageRepository(Protocol):
     """Protocol for chat message repository operations."""
@@ -113,3 +151,67 @@ class ChatMessageRepository(Protocol):
             List of ChatMessages (may be empty)
         """
         ...
+
+
+class BulkChatMessageRepository(ChatMessageRepository, Protocol):
+    """Protocol for chat message repositories that can insert many rows at once."""
+
+    async def save_messages(self, messages: list[tuple[UUID, str, datetime]]) -> list[ChatMessage]:
+        """Save several chat messages in a single statement.
+
+        Args:
+            messages: (user_id, text, created_at) triples to insert
+
+        Returns:
+            Saved ChatMessages in the same order as the input
+        """
+        ...
+
+
+class UnitOfWork(Protocol):
+    """Protocol for repositories bound to one open database transaction.
+
+    All repository calls made through a unit of work share a single connection
+    and become visible to other sessions only after commit.
+    """
+
+    @property
+    def user_repo(self) -> UserRepository:
+        """User repository bound to the open transaction."""
+        ...
+
+    @property
+    def message_repo(self) -> ChatMessageRepository:
+        """Chat message repository bound to the open transaction."""
+        ...
+
+    async def begin(self) -> "UnitOfWork":
+        """Start a nested transaction (savepoint) inside this one.
+
+        Returns:
+            UnitOfWork on the same connection whose writes can be rolled back
+            without ending the outer transaction.
+        """
+        ...
+
+    async def commit(self) -> None:
+        """Commit all writes made through this unit of work."""
+        ...
+
+    async def rollback(self) -> None:
+        """Discard all writes made through this unit of work."""
+        ...
+
+
+class TransactionManager(Protocol):
+    """Protocol for opening database transactions."""
+
+    async def begin(self) -> UnitOfWork:
+        """Start a new transaction.
+
+        Returns:
+            UnitOfWork whose repositories run inside the new transaction.
+            Every call starts an independent transaction; nest through
+            UnitOfWork.begin() instead.
+        """
+        ...
@@ -46,6 +46,7 @@ Example:
     >>> adapter: ObjectStorage = MyStorageAdapter()
 """
 
+from collections.abc import Buffer
 from typing import Protocol
 
 from effectful.domain.optional_value import OptionalValue
@@ -94,7 +95,7 @@ class ObjectStorage(Protocol):
         self,
         bucket: str,
         key: str,
-        content: bytes,
+        content: Buffer,
         metadata: OptionalValue[dict[str, str]],
         content_type: OptionalValue[str],
     ) -> PutResult:
@@ -103,7 +104,7 @@ class ObjectStorage(Protocol):
         Args:
             bucket: Bucket name to store the object
             key: Object key (path) within the bucket
-            content: Object content as bytes
+            content: Object content (bytes, bytearray, memoryview, ...)
             metadata: Optional metadata key-value pairs
             content_type: Optional MIME type (e.g., "text/plain")
 
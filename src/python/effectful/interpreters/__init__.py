@@ -5,6 +5,7 @@ This module provides interpreters that handle effect execution:
 - **WebSocketInterpreter** - Handles WebSocket effects (SendText, ReceiveText, Close)
 - **DatabaseInterpreter** - Handles database effects (GetUserById, SaveChatMessage)
 - **CacheInterpreter** - Handles cache effects (GetCachedProfile, PutCachedProfile)
+- **ReadThroughCacheInterpreter** - Caches database reads (GetUserById, ListUsers)
 - **MessagingInterpreter** - Handles messaging effects (PublishMessage, ConsumeMessage)
 - **StorageInterpreter** - Handles storage effects (GetObject, PutObject, DeleteObject, ListObjects)
 - **AuthInterpreter** - Handles auth effects (ValidateToken, GenerateToken, RefreshToken, RevokeToken)
@@ -55,6 +56,7 @@ from effectful.interpreters.composite import (
 )
 from effectful.interpreters.database import DatabaseInterpreter
 from effectful.interpreters.messaging import MessagingInterpreter
+from effectful.interpreters.read_through import CachedRead, ReadThroughCacheInterpreter
 from effectful.interpreters.runtime import RuntimeInterpreter
 from effectful.interpreters.storage import StorageInterpreter
 from effectful.interpreters.system import SystemInterpreter
@@ -64,6 +66,8 @@ __all__ = [
     "WebSocketInterpreter",
     "DatabaseInterpreter",
     "CacheInterpreter",
+    "ReadThroughCacheInterpreter",
+    "CachedRead",
     "MessagingInterpreter",
     "StorageInterpreter",
     "AuthInterpreter",
@@ -3,23 +3,36 @@
 This module implements the interpreter for Cache effects.
 """
 
-from dataclasses import dataclass
+import asyncio
+import math
+import random
+import struct
+import time
+from collections.abc import Callable, Generator
+from dataclasses import dataclass, field
 from uuid import UUID
 
 from effectful.algebraic.effect_return import EffectReturn
 from effectful.algebraic.result import Err, Ok, Result
-from effectful.domain.cache_result import CacheHit, CacheMiss
+from effectful.domain.cache_result import CacheHit, CacheLookupResult, CacheMiss
+from effectful.domain.optional_value import Absent, Provided
 from effectful.domain.profile import ProfileData
 from effectful.effects.base import Effect
 from effectful.effects.cache import (
     DeleteCachedProfile,
     GetCachedProfile,
     GetCachedValue,
+    GetCachedValues,
+    GetOrCompute,
     InvalidateCache,
+    InvalidateMany,
+    InvalidateTag,
     PutCachedProfile,
     PutCachedValue,
+    PutCachedValues,
 )
-from effectful.infrastructure.cache import ProfileCache
+from effectful.infrastructure.cache import CacheLock, ProfileCache
+from effectful.interpreters.base import EffectInterpreter
 from effectful.interpreters.errors import (
     CacheError,
     InterpreterError,
@@ -29,18 +42,56 @@ from effectful.interpreters.retry_logic import (
     CACHE_RETRY_PATTERNS,
     is_retryable_error,
 )
-from effectful.programs.program_types import EffectResult
+from effectful.programs.program_types import AllEffects, EffectResult
+from effectful.programs.runners import run_ws_program
+
+type _ComputeOutcome = Result[EffectReturn[EffectResult], InterpreterError]
+
+# Companion key holding a GetOrCompute key's last recompute duration
+_DELTA_KEY_SUFFIX = ":xfetch-delta"
+
+# Recompute duration in seconds, stored under the companion key
+_DELTA = struct.Struct("!d")
 
 
 @dataclass(frozen=True)
 class CacheInterpreter:
     """Interpreter for Cache effects.
 
+    GetOrCompute sub-programs may yield any effect, so CompositeInterpreter
+    routes GetOrCompute to get_or_compute with itself as the sub-program
+    interpreter. Interpreted directly, the sub-program may only yield cache
+    effects.
+
+    GetOrCompute hits may be recomputed before they expire (XFetch): a hit
+    with ttl_remaining seconds left is treated as a miss when
+    early_expiration_beta * delta * -ln(U) >= ttl_remaining, where delta is
+    the last observed sub-program duration for the key and U is uniform in
+    (0, 1]. Refreshes of hot keys are spread out ahead of the TTL boundary
+    instead of all callers missing at once. delta is cached next to the value
+    (under key + ":xfetch-delta", same TTL and tags, read in the same batch),
+    so every instance sharing the cache sees it, including after a restart.
+
     Attributes:
         cache: Profile cache implementation
+        lock: Optional distributed lock so one instance recomputes a missing key
+        lock_ttl_ms: Lock lifetime, and how long other instances wait for the value
+        lock_poll_interval_ms: How often waiting instances re-read the cache
+        early_expiration_beta: XFetch aggressiveness; 0 disables early
+            recomputation, values above 1 refresh earlier
+        rng: Uniform [0, 1) source for early expiration (injectable for tests)
+        _in_flight: Computations in progress in this process, by cache key
     """
 
     cache: ProfileCache
+    lock: CacheLock | None = None
+    lock_ttl_ms: int = 5000
+    lock_poll_interval_ms: float = 50.0
+    early_expiration_beta: float = 1.0
+    rng: Callable[[], float] = field(default=random.random, repr=False, compare=False)
+    _in_flight: dict[str, asyncio.Future[_ComputeOutcome]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     async def interpret(
         self, effect: Effect
@@ -57,16 +108,28 @@ class CacheInterpreter:
         match effect:
             case GetCachedProfile(user_id=user_id):
                 return await self._handle_get_profile(user_id, effect)
-            case PutCachedProfile(user_id=user_id, profile_data=profile_data, ttl_seconds=ttl):
-                return await self._handle_put_profile(user_id, profile_data, ttl, effect)
+            case PutCachedProfile(
+                user_id=user_id, profile_data=profile_data, ttl_seconds=ttl, tags=tags
+            ):
+                return await self._handle_put_profile(user_id, profile_data, ttl, tags, effect)
             case GetCachedValue(key=key):
                 return await self._handle_get_value(key, effect)
-            case PutCachedValue(key=key, value=value, ttl_seconds=ttl):
-                return await self._handle_put_value(key, value, ttl, effect)
+            case PutCachedValue(key=key, value=value, ttl_seconds=ttl, tags=tags):
+                return await self._handle_put_value(key, value, ttl, tags, effect)
             case InvalidateCache(key=key):
                 return await self._handle_invalidate(key, effect)
             case DeleteCachedProfile(user_id=user_id):
                 return await self._handle_invalidate(str(user_id), effect, "DeleteCachedProfile")
+            case GetCachedValues(keys=keys):
+                return await self._handle_get_values(keys, effect)
+            case PutCachedValues(entries=entries, ttl_seconds=ttl, tags=tags):
+                return await self._handle_put_values(entries, ttl, tags, effect)
+            case InvalidateMany(keys=keys):
+                return await self._handle_invalidate_many(keys, effect)
+            case InvalidateTag(tag=tag):
+                return await self._handle_invalidate_tag(tag, effect)
+            case GetOrCompute():
+                return await self.get_or_compute(effect, self)
             case _:
                 return Err(
                     UnhandledEffectError(
@@ -103,11 +166,16 @@ class CacheInterpreter:
             )
 
     async def _handle_put_profile(
-        self, user_id: UUID, profile_data: ProfileData, ttl_seconds: int, effect: Effect
+        self,
+        user_id: UUID,
+        profile_data: ProfileData,
+        ttl_seconds: int,
+        tags: tuple[str, ...],
+        effect: Effect,
     ) -> Result[EffectReturn[EffectResult], InterpreterError]:
         """Handle PutCachedProfile effect."""
         try:
-            await self.cache.put_profile(user_id, profile_data, ttl_seconds)
+            await self.cache.put_profile(user_id, profile_data, ttl_seconds, tags)
             return Ok(EffectReturn(value=None, effect_name="PutCachedProfile"))
         except Exception as e:
             return Err(
@@ -142,11 +210,11 @@ class CacheInterpreter:
             )
 
     async def _handle_put_value(
-        self, key: str, value: bytes, ttl_seconds: int, effect: Effect
+        self, key: str, value: bytes, ttl_seconds: int, tags: tuple[str, ...], effect: Effect
     ) -> Result[EffectReturn[EffectResult], InterpreterError]:
         """Handle PutCachedValue effect."""
         try:
-            await self.cache.put_value(key, value, ttl_seconds)
+            await self.cache.put_value(key, value, ttl_seconds, tags)
             return Ok(EffectReturn(value=True, effect_name="PutCachedValue"))
         except Exception as e:
             return Err(
@@ -173,6 +241,281 @@ class CacheInterpreter:
                 )
             )
 
+    async def _handle_get_values(
+        self, keys: tuple[str, ...], effect: Effect
+    ) -> Result[EffectReturn[EffectResult], InterpreterError]:
+        """Handle GetCachedValues effect.
+
+        Returns CacheHit/CacheMiss tuple aligned with the requested keys.
+        """
+        try:
+            lookup_results = await self.cache.get_values(keys)
+            return Ok(EffectReturn(value=lookup_results, effect_name="GetCachedValues"))
+        except Exception as e:
+            return Err(
+                CacheError(
+                    effect=effect,
+                    cache_error=str(e),
+                    is_retryable=self._is_retryable_error(e),
+                )
+            )
+
+    async def _handle_put_values(
+        self,
+        entries: tuple[tuple[str, bytes], ...],
+        ttl_seconds: int,
+        tags: tuple[str, ...],
+        effect: Effect,
+    ) -> Result[EffectReturn[EffectResult], InterpreterError]:
+        """Handle PutCachedValues effect."""
+        try:
+            await self.cache.put_values(entries, ttl_seconds, tags)
+            return Ok(EffectReturn(value=True, effect_name="PutCachedValues"))
+        except Exception as e:
+            return Err(
+                CacheError(
+                    effect=effect,
+                    cache_error=str(e),
+                    is_retryable=self._is_retryable_error(e),
+                )
+            )
+
+    async def _handle_invalidate_many(
+        self, keys: tuple[str, ...], effect: Effect
+    ) -> Result[EffectReturn[EffectResult], InterpreterError]:
+        """Handle InvalidateMany effect."""
+        try:
+            deleted_count = await self.cache.invalidate_many(keys)
+            return Ok(EffectReturn(value=deleted_count, effect_name="InvalidateMany"))
+        except Exception as e:
+            return Err(
+                CacheError(
+                    effect=effect,
+                    cache_error=str(e),
+                    is_retryable=self._is_retryable_error(e),
+                )
+            )
+
+    async def _handle_invalidate_tag(
+        self, tag: str, effect: Effect
+    ) -> Result[EffectReturn[EffectResult], InterpreterError]:
+        """Handle InvalidateTag effect.
+
+        Returns the number of keys that were indexed under the tag.
+        """
+        try:
+            invalidated_keys = await self.cache.invalidate_tag(tag)
+            return Ok(EffectReturn(value=len(invalidated_keys), effect_name="InvalidateTag"))
+        except Exception as e:
+            return Err(
+                CacheError(
+                    effect=effect,
+                    cache_error=str(e),
+                    is_retryable=self._is_retryable_error(e),
+                )
+            )
+
+    async def get_or_compute(
+        self, effect: GetOrCompute, interpreter: EffectInterpreter
+    ) -> Result[EffectReturn[EffectResult], InterpreterError]:
+        """Handle GetOrCompute effect with single-flight miss coalescing.
+
+        A hit returns the cached bytes, unless early expiration selects this
+        caller to refresh it and no refresh is already running; a failed early
+        refresh still returns the cached bytes. On a miss the
+        first caller for a key runs its sub-program with interpreter and stores
+        a bytes result; callers arriving meanwhile share that outcome (value or
+        error) and never run their own sub-program. If the running caller is
+        cancelled, the next waiter takes over.
+
+        Args:
+            effect: The GetOrCompute effect
+            interpreter: Interpreter for the sub-program's effects
+
+        Returns:
+            Ok(EffectReturn(value)) with cached or computed value
+            Err(InterpreterError) if the lookup, sub-program, or store failed
+        """
+        try:
+            lookup_result, delta = await self._lookup_with_delta(effect.key)
+        except Exception as e:
+            return Err(
+                CacheError(
+                    effect=effect,
+                    cache_error=str(e),
+                    is_retryable=self._is_retryable_error(e),
+                )
+            )
+        current: CacheHit[bytes] | None = None
+        match lookup_result:
+            case CacheHit(value=value, ttl_remaining=ttl_remaining):
+                if effect.key in self._in_flight or not self._should_recompute_early(
+                    delta, ttl_remaining
+                ):
+                    effect.program.close()
+                    return Ok(EffectReturn(value=value, effect_name="GetOrCompute"))
+                current = lookup_result
+
+        # Acceptable while loop: a waiter retries only if the running caller was cancelled
+        while (in_flight := self._in_flight.get(effect.key)) is not None:
+            try:
+                outcome = await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if in_flight.cancelled():
+                    continue
+                raise
+            effect.program.close()
+            return outcome
+
+        future: asyncio.Future[_ComputeOutcome] = asyncio.get_running_loop().create_future()
+        self._in_flight[effect.key] = future
+        try:
+            outcome = await self._compute_with_lock(effect, interpreter, current)
+            match outcome:
+                case Err() if current is not None:
+                    # The hit being refreshed early is still valid - keep serving it
+                    outcome = Ok(EffectReturn(value=current.value, effect_name="GetOrCompute"))
+                case _:
+                    pass
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Waiters re-raise it; mark retrieved in case there are none
+                future.exception()
+            raise
+        else:
+            future.set_result(outcome)
+            return outcome
+        finally:
+            del self._in_flight[effect.key]
+
+    async def _lookup_with_delta(self, key: str) -> tuple[CacheLookupResult[bytes], float | None]:
+        """Read key and, when early expiration is enabled, its recompute duration.
+
+        Both come from one get_values call. The duration is None when it was
+        never stored (or is unreadable).
+        """
+        if self.early_expiration_beta <= 0:
+            return await self.cache.get_value(key), None
+
+        lookup_result, delta_result = await self.cache.get_values((key, key + _DELTA_KEY_SUFFIX))
+        match delta_result:
+            case CacheHit(value=encoded) if len(encoded) == _DELTA.size:
+                (delta,) = _DELTA.unpack(encoded)
+                return lookup_result, float(delta)
+            case _:
+                return lookup_result, None
+
+    def _should_recompute_early(self, delta: float | None, ttl_remaining: int) -> bool:
+        """XFetch check: whether to refresh a hit with ttl_remaining seconds left.
+
+        Never fires for entries without a known expiry or before any instance
+        has recorded how long the key takes to recompute.
+        """
+        if delta is None or ttl_remaining <= 0 or self.early_expiration_beta <= 0:
+            return False
+        # 1 - rng() is in (0, 1], so the log is always defined
+        gap = delta * self.early_expiration_beta * -math.log(1.0 - self.rng())
+        return gap >= ttl_remaining
+
+    async def _compute_with_lock(
+        self,
+        effect: GetOrCompute,
+        interpreter: EffectInterpreter,
+        current: CacheHit[bytes] | None = None,
+    ) -> Result[EffectReturn[EffectResult], InterpreterError]:
+        """Compute under the distributed lock, or wait for another instance's value.
+
+        current is the still-valid hit being refreshed early; if another
+        instance holds the lock it is returned instead of waiting.
+        """
+        if self.lock is None:
+            return await self._compute(effect, interpreter)
+
+        try:
+            acquired = await self.lock.acquire(effect.key, self.lock_ttl_ms)
+        except Exception:
+            # Lock backend unavailable - fall back to in-process coalescing only
+            return await self._compute(effect, interpreter)
+
+        match acquired:
+            case Provided(value=token):
+                try:
+                    return await self._compute(effect, interpreter)
+                finally:
+                    try:
+                        await self.lock.release(effect.key, token)
+                    except Exception:
+                        # The lock expires after lock_ttl_ms anyway
+                        pass
+            case Absent() if current is not None:
+                effect.program.close()
+                return Ok(EffectReturn(value=current.value, effect_name="GetOrCompute"))
+            case Absent():
+                match await self._await_other_instance(effect.key):
+                    case CacheHit(value=value, ttl_remaining=_):
+                        effect.program.close()
+                        return Ok(EffectReturn(value=value, effect_name="GetOrCompute"))
+                    case CacheMiss():
+                        # Holder crashed or was too slow - compute it ourselves
+                        return await self._compute(effect, interpreter)
+
+    async def _await_other_instance(self, key: str) -> CacheHit[bytes] | CacheMiss:
+        """Poll the cache until another instance stores key or its lock would expire."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.lock_ttl_ms / 1000
+        # Acceptable while loop: bounded polling until the lock deadline
+        while loop.time() < deadline:
+            await asyncio.sleep(self.lock_poll_interval_ms / 1000)
+            try:
+                lookup_result = await self.cache.get_value(key)
+            except Exception:
+                break
+            if isinstance(lookup_result, CacheHit):
+                return lookup_result
+        return CacheMiss(key=key, reason="not_found")
+
+    async def _compute(
+        self, effect: GetOrCompute, interpreter: EffectInterpreter
+    ) -> Result[EffectReturn[EffectResult], InterpreterError]:
+        """Run the sub-program and cache its result when it is bytes."""
+        program: Generator[AllEffects, EffectResult, EffectResult] = effect.program
+        started = time.perf_counter()
+        outcome = await run_ws_program(program, interpreter)
+        delta = time.perf_counter() - started
+        match outcome:  # pragma: no branch
+            case Ok(bytes() as value):
+                try:
+                    await self._store_with_delta(effect, value, delta)
+                except Exception as e:
+                    return Err(
+                        CacheError(
+                            effect=effect,
+                            cache_error=str(e),
+                            is_retryable=self._is_retryable_error(e),
+                        )
+                    )
+                return Ok(EffectReturn(value=value, effect_name="GetOrCompute"))
+            case Ok(value):
+                # Not cacheable (e.g. UserNotFound) - returned to this flight only
+                return Ok(EffectReturn(value=value, effect_name="GetOrCompute"))
+            case Err(error):
+                return Err(error)
+
+    async def _store_with_delta(self, effect: GetOrCompute, value: bytes, delta: float) -> None:
+        """Cache a computed value and, when early expiration is enabled, its duration."""
+        if self.early_expiration_beta <= 0:
+            await self.cache.put_value(effect.key, value, effect.ttl_seconds, effect.tags)
+            return
+
+        await self.cache.put_values(
+            ((effect.key, value), (effect.key + _DELTA_KEY_SUFFIX, _DELTA.pack(delta))),
+            effect.ttl_seconds,
+            effect.tags,
+        )
+
     def _is_retryable_error(self, error: Exception) -> bool:
         """Determine if a cache error is retryable.
 
@@ -8,13 +8,20 @@ from dataclasses import dataclass
 
 from effectful.algebraic.effect_return import EffectReturn
 from effectful.algebraic.result import Err, Result
+from effectful.domain.user import UserNotFound
 from effectful.effects.base import Effect
+from effectful.effects.cache import GetOrCompute
 from effectful.infrastructure.auth import AuthService
-from effectful.infrastructure.cache import ProfileCache
-from effectful.infrastructure.messaging import MessageConsumer, MessageProducer
+from effectful.infrastructure.cache import CacheLock, NegativeLookupCache, ProfileCache
+from effectful.infrastructure.messaging import (
+    MessageCodecRegistry,
+    MessageConsumer,
+    MessageProducer,
+)
 from effectful.infrastructure.metrics import MetricsCollector
 from effectful.infrastructure.repositories import (
     ChatMessageRepository,
+    TransactionManager,
     UserRepository,
 )
 from effectful.infrastructure.storage import ObjectStorage
@@ -25,6 +32,7 @@ from effectful.interpreters.database import DatabaseInterpreter
 from effectful.interpreters.errors import InterpreterError, UnhandledEffectError
 from effectful.interpreters.messaging import MessagingInterpreter
 from effectful.interpreters.metrics import MetricsInterpreter
+from effectful.interpreters.read_through import ReadThroughCacheInterpreter
 from effectful.interpreters.storage import StorageInterpreter
 from effectful.interpreters.system import SystemInterpreter
 from effectful.interpreters.websocket import WebSocketInterpreter
@@ -39,7 +47,7 @@ class CompositeInterpreter:
 
     Attributes:
         websocket: WebSocket effect interpreter
-        database: Database effect interpreter
+        database: Database effect interpreter (optionally behind read-through caching)
         cache: Cache effect interpreter
         messaging: Messaging effect interpreter (optional)
         storage: Storage effect interpreter (optional)
@@ -49,7 +57,7 @@ class CompositeInterpreter:
     """
 
     websocket: WebSocketInterpreter
-    database: DatabaseInterpreter
+    database: DatabaseInterpreter | ReadThroughCacheInterpreter
     cache: CacheInterpreter
     system: SystemInterpreter
     messaging: MessagingInterpreter | None = None
@@ -69,6 +77,10 @@ class CompositeInterpreter:
             Ok(EffectReturn(value)) if any interpreter handled it
             Err(UnhandledEffectError) if no interpreter could handle it
         """
+        # GetOrCompute sub-programs may yield any effect, so they run through us
+        if isinstance(effect, GetOrCompute):
+            return await self.cache.get_or_compute(effect, self)
+
         # Try WebSocket interpreter first
         ws_result = await self.websocket.interpret(effect)
         match ws_result:
@@ -164,9 +176,14 @@ def create_composite_interpreter(
     cache: ProfileCache,
     message_producer: MessageProducer | None = None,
     message_consumer: MessageConsumer | None = None,
+    message_codecs: MessageCodecRegistry | None = None,
     object_storage: ObjectStorage | None = None,
     auth_service: AuthService | None = None,
     metrics_collector: MetricsCollector | None = None,
+    transaction_manager: TransactionManager | None = None,
+    cache_lock: CacheLock | None = None,
+    negative_cache: NegativeLookupCache[UserNotFound] | None = None,
+    read_through_cache: bool = False,
 ) -> CompositeInterpreter:
     """Factory function to create a configured composite interpreter.
 
@@ -177,16 +194,23 @@ def create_composite_interpreter(
         cache: Profile cache implementation
         message_producer: Optional message producer for Pulsar (if messaging needed)
         message_consumer: Optional message consumer for Pulsar (if messaging needed)
+        message_codecs: Optional codecs for PublishValue and decoding consumed payloads
         object_storage: Optional object storage for S3 (if storage needed)
         auth_service: Optional auth service for JWT authentication (if auth needed)
         metrics_collector: Optional metrics collector for Prometheus/in-memory (if metrics needed)
+        transaction_manager: Optional transaction manager (if Transaction effects needed)
+        cache_lock: Optional distributed lock so GetOrCompute recomputes once across instances
+        negative_cache: Optional short-lived cache of UserNotFound lookups
+        read_through_cache: Serve GetUserById/ListUsers through cache with default settings
 
     Returns:
         Configured CompositeInterpreter with all dependencies injected
     """
     # Create optional messaging interpreter if both producer and consumer provided
     messaging_interpreter = (
-        MessagingInterpreter(producer=message_producer, consumer=message_consumer)
+        MessagingInterpreter(
+            producer=message_producer, consumer=message_consumer, codecs=message_codecs
+        )
         if (message_producer is not None and message_consumer is not None)
         else None
     )
@@ -206,10 +230,23 @@ def create_composite_interpreter(
         MetricsInterpreter(collector=metrics_collector) if metrics_collector is not None else None
     )
 
+    database_interpreter = DatabaseInterpreter(
+        user_repo=user_repo,
+        message_repo=message_repo,
+        transaction_manager=transaction_manager,
+        negative_cache=negative_cache,
+    )
+
     return CompositeInterpreter(
         websocket=WebSocketInterpreter(connection=websocket_connection),
-        database=DatabaseInterpreter(user_repo=user_repo, message_repo=message_repo),
-        cache=CacheInterpreter(cache=cache),
+        database=(
+            ReadThroughCacheInterpreter(
+                inner=database_interpreter, cache=cache, metrics_collector=metrics_collector
+            )
+            if read_through_cache
+            else database_interpreter
+        ),
+        cache=CacheInterpreter(cache=cache, lock=cache_lock),
         system=SystemInterpreter(),
         messaging=messaging_interpreter,
         storage=storage_interpreter,
@@ -3,26 +3,40 @@
 This module implements the interpreter for Database effects.
 """
 
+import contextlib
+from collections.abc import Generator
 from dataclasses import dataclass
 from uuid import UUID
 
 from effectful.algebraic.effect_return import EffectReturn
 from effectful.algebraic.result import Err, Ok, Result
-from effectful.domain.optional_value import OptionalValue
-from effectful.domain.user import UserFound, UserNotFound
+from effectful.domain.optional_value import Absent, OptionalValue, Provided
+from effectful.domain.user import (
+    User,
+    UserEmailExists,
+    UserFound,
+    UserNotFound,
+    UserVersionConflict,
+)
 from effectful.effects.base import Effect
 from effectful.effects.database import (
     CreateUser,
+    DatabaseEffect,
     DeleteUser,
     GetChatMessages,
     GetUserById,
     ListMessagesForUser,
     ListUsers,
     SaveChatMessage,
+    Transaction,
     UpdateUser,
+    UpdateUserIf,
+    UpsertUser,
 )
+from effectful.infrastructure.cache import NegativeLookupCache
 from effectful.infrastructure.repositories import (
     ChatMessageRepository,
+    TransactionManager,
     UserRepository,
 )
 from effectful.interpreters.errors import (
@@ -35,19 +49,34 @@ from effectful.interpreters.retry_logic import (
     is_retryable_error,
 )
 from effectful.programs.program_types import EffectResult
+from effectful.programs.runners import run_ws_program
 
 
 @dataclass(frozen=True)
 class DatabaseInterpreter:
     """Interpreter for Database effects.
 
+    With negative_cache set, GetUserById remembers UserNotFound results so
+    repeated lookups of nonexistent users skip the repository until the entry
+    expires. CreateUser and UpsertUser forget the created user's entry; inside
+    a Transaction this happens only after a successful commit, so a concurrent
+    lookup cannot re-remember the miss before the row is visible. Negative
+    cache failures never fail an effect; the repository is used.
+
     Attributes:
         user_repo: User repository implementation
         message_repo: Chat message repository implementation
+        transaction_manager: Transaction manager for Transaction effects (optional)
+        negative_cache: Short-lived cache of UserNotFound results (optional)
+        deferred_forgets: User IDs whose remembered misses are forgotten once
+            the enclosing transaction commits (None outside a transaction)
     """
 
     user_repo: UserRepository
     message_repo: ChatMessageRepository
+    transaction_manager: TransactionManager | None = None
+    negative_cache: NegativeLookupCache[UserNotFound] | None = None
+    deferred_forgets: list[UUID] | None = None
 
     async def interpret(
         self, effect: Effect
@@ -78,6 +107,16 @@ class DatabaseInterpreter:
                 return await self._handle_update_user(user_id, email, name, effect)
             case DeleteUser(user_id=user_id):
                 return await self._handle_delete_user(user_id, effect)
+            case UpsertUser(email=email, name=name, password_hash=password_hash):
+                return await self._handle_upsert_user(email, name, password_hash, effect)
+            case UpdateUserIf(
+                user_id=user_id, expected_version=expected_version, email=email, name=name
+            ):
+                return await self._handle_update_user_if(
+                    user_id, expected_version, email, name, effect
+                )
+            case Transaction(program=program):
+                return await self._handle_transaction(program, effect)
             case _:
                 return Err(
                     UnhandledEffectError(
@@ -94,6 +133,12 @@ class DatabaseInterpreter:
         Returns the User if found, UserNotFound ADT if not found.
         ADT types provide explicit semantics instead of None.
         """
+        match await self._remembered_miss(user_id):
+            case Provided(value=not_found):
+                return Ok(EffectReturn(value=not_found, effect_name="GetUserById"))
+            case Absent():
+                pass
+
         try:
             lookup_result = await self.user_repo.get_by_id(user_id)
             # Pattern match on UserLookupResult ADT and return appropriate type
@@ -103,6 +148,7 @@ class DatabaseInterpreter:
                     return Ok(EffectReturn(value=user, effect_name="GetUserById"))
                 case UserNotFound() as not_found:
                     # User not found - return the ADT type directly
+                    await self._remember_miss(not_found)
                     return Ok(EffectReturn(value=not_found, effect_name="GetUserById"))
         except Exception as e:
             return Err(
@@ -167,6 +213,7 @@ class DatabaseInterpreter:
         """Handle CreateUser effect."""
         try:
             user = await self.user_repo.create_user(email, name, password_hash)
+            await self._forget_miss(user.id)
             return Ok(EffectReturn(value=user, effect_name="CreateUser"))
         except Exception as e:
             return Err(
@@ -204,6 +251,65 @@ class DatabaseInterpreter:
                 )
             )
 
+    async def _handle_upsert_user(
+        self, email: str, name: str, password_hash: str, effect: Effect
+    ) -> Result[EffectReturn[EffectResult], InterpreterError]:
+        """Handle UpsertUser effect.
+
+        Returns the created User, or the UserEmailExists ADT. A taken email is
+        an expected outcome, not an interpreter error.
+        """
+        try:
+            upsert_result = await self.user_repo.upsert_user(email, name, password_hash)
+            match upsert_result:
+                case User() as user:
+                    await self._forget_miss(user.id)
+                case UserEmailExists():
+                    pass
+            return Ok(EffectReturn(value=upsert_result, effect_name="UpsertUser"))
+        except Exception as e:
+            return Err(
+                DatabaseError(
+                    effect=effect,
+                    db_error=str(e),
+                    is_retryable=self._is_retryable_error(e),
+                )
+            )
+
+    async def _handle_update_user_if(
+        self,
+        user_id: UUID,
+        expected_version: int,
+        email: OptionalValue[str],
+        name: OptionalValue[str],
+        effect: Effect,
+    ) -> Result[EffectReturn[EffectResult], InterpreterError]:
+        """Handle UpdateUserIf effect.
+
+        Returns the updated User, or the UserNotFound / UserVersionConflict ADT.
+        A version conflict is an expected outcome, not an interpreter error.
+        """
+        try:
+            update_result = await self.user_repo.update_user_if(
+                user_id,
+                expected_version,
+                email,
+                name,
+            )
+            match update_result:  # pragma: no branch
+                case UserFound(user=user, source=_):
+                    return Ok(EffectReturn(value=user, effect_name="UpdateUserIf"))
+                case UserNotFound() | UserVersionConflict() as rejected:
+                    return Ok(EffectReturn(value=rejected, effect_name="UpdateUserIf"))
+        except Exception as e:
+            return Err(
+                DatabaseError(
+                    effect=effect,
+                    db_error=str(e),
+                    is_retryable=self._is_retryable_error(e),
+                )
+            )
+
     async def _handle_delete_user(
         self, user_id: UUID, effect: Effect
     ) -> Result[EffectReturn[EffectResult], InterpreterError]:
@@ -220,6 +326,113 @@ class DatabaseInterpreter:
                 )
             )
 
+    async def _handle_transaction(
+        self,
+        program: Generator[DatabaseEffect, EffectResult, EffectResult],
+        effect: Effect,
+    ) -> Result[EffectReturn[EffectResult], InterpreterError]:
+        """Handle Transaction effect.
+
+        Runs the sub-program against repositories bound to one transaction.
+        Commits when the sub-program returns; rolls back on the first failed
+        effect and returns that effect's error unchanged. Negative cache
+        entries of users created inside are forgotten only after the commit
+        (by the enclosing transaction when nested) and kept on rollback.
+        """
+        if self.transaction_manager is None:
+            return Err(
+                DatabaseError(
+                    effect=effect,
+                    db_error="Transaction effect requires a transaction_manager",
+                    is_retryable=False,
+                )
+            )
+
+        try:
+            unit_of_work = await self.transaction_manager.begin()
+        except Exception as e:
+            return Err(
+                DatabaseError(
+                    effect=effect,
+                    db_error=str(e),
+                    is_retryable=self._is_retryable_error(e),
+                )
+            )
+
+        # Nested Transaction effects become savepoints of this unit of work
+        created: list[UUID] = []
+        scoped = DatabaseInterpreter(
+            user_repo=unit_of_work.user_repo,
+            message_repo=unit_of_work.message_repo,
+            transaction_manager=unit_of_work,
+            negative_cache=self.negative_cache,
+            deferred_forgets=created,
+        )
+
+        try:
+            outcome = await run_ws_program(program, scoped)
+        except BaseException:
+            # Sub-program raised - never leave the transaction open, but keep
+            # its exception as the one propagated
+            with contextlib.suppress(Exception):
+                await unit_of_work.rollback()
+            raise
+
+        match outcome:  # pragma: no branch
+            case Ok(value):
+                try:
+                    await unit_of_work.commit()
+                except Exception as e:
+                    return Err(
+                        DatabaseError(
+                            effect=effect,
+                            db_error=str(e),
+                            is_retryable=self._is_retryable_error(e),
+                        )
+                    )
+                for user_id in created:
+                    await self._forget_miss(user_id)
+                return Ok(EffectReturn(value=value, effect_name="Transaction"))
+            case Err(error):
+                try:
+                    await unit_of_work.rollback()
+                except Exception:
+                    # The failed effect is the root cause - report it, not the rollback
+                    pass
+                return Err(error)
+
+    async def _remembered_miss(self, user_id: UUID) -> OptionalValue[UserNotFound]:
+        """Look up a remembered UserNotFound for user_id in the negative cache."""
+        if self.negative_cache is None:
+            return Absent(reason="negative_cache_disabled")
+        try:
+            return await self.negative_cache.get_miss(_negative_cache_key(user_id))
+        except Exception:
+            return Absent(reason="negative_cache_unavailable")
+
+    async def _remember_miss(self, not_found: UserNotFound) -> None:
+        """Store a UserNotFound result in the negative cache."""
+        if self.negative_cache is None:
+            return
+        try:
+            await self.negative_cache.put_miss(_negative_cache_key(not_found.user_id), not_found)
+        except Exception:
+            # Best effort - the next lookup simply goes to the repository
+            pass
+
+    async def _forget_miss(self, user_id: UUID) -> None:
+        """Drop any remembered miss for a user that now exists (or will on commit)."""
+        if self.negative_cache is None:
+            return
+        if self.deferred_forgets is not None:
+            self.deferred_forgets.append(user_id)
+            return
+        try:
+            await self.negative_cache.forget(_negative_cache_key(user_id))
+        except Exception:
+            # Entries expire after their short TTL anyway
+            pass
+
     def _is_retryable_error(self, error: Exception) -> bool:
         """Determine if a database error is retryable.
 
@@ -230,3 +443,8 @@ class DatabaseInterpreter:
             True if error might succeed on retry, False otherwise
         """
         return is_retryable_error(error, DATABASE_RETRY_PATTERNS)
+
+
+def _negative_cache_key(user_id: UUID) -> str:
+    """Negative cache key for a user ID lookup."""
+    return f"user:{user_id}"
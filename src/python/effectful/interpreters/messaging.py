@@ -1,7 +1,8 @@
 """Messaging interpreter implementation for Pulsar effects.
 
 This module implements the interpreter for messaging effects (PublishMessage,
-ConsumeMessage, AcknowledgeMessage, NegativeAcknowledge).
+PublishMessages, PublishValue, ConsumeMessage, ConsumeBatch, AcknowledgeMessage,
+AcknowledgeBatch, NegativeAcknowledge).
 
 Components:
     - MessagingError: Error type for messaging failures
@@ -9,36 +10,49 @@ Components:
 
 The interpreter delegates to MessageProducer and MessageConsumer protocol
 implementations, converting protocol results to Result[EffectReturn, InterpreterError].
+With a MessageCodecRegistry it encodes PublishValue values and decodes consumed
+payloads into MessageEnvelope.value, so programs do not serialize by hand.
 
 Type Safety:
     All pattern matching is exhaustive. All return types use Result for explicit
     error handling.
 """
 
-from dataclasses import dataclass
+from collections.abc import Buffer
+from dataclasses import dataclass, replace
 
 from effectful.algebraic.effect_return import EffectReturn
 from effectful.algebraic.result import Err, Ok, Result
 from effectful.domain.message_envelope import (
+    CONTENT_TYPE_PROPERTY,
     AcknowledgeFailure,
     AcknowledgeSuccess,
     ConsumeFailure,
     ConsumeTimeout,
     MessageEnvelope,
+    MessageValue,
     NackFailure,
     NackSuccess,
     PublishFailure,
     PublishSuccess,
 )
-from effectful.domain.optional_value import OptionalValue, from_optional_value
+from effectful.domain.optional_value import Absent, OptionalValue, Provided, from_optional_value
 from effectful.effects.base import Effect
 from effectful.effects.messaging import (
+    AcknowledgeBatch,
     AcknowledgeMessage,
+    ConsumeBatch,
     ConsumeMessage,
     NegativeAcknowledge,
     PublishMessage,
+    PublishMessages,
+    PublishValue,
+)
+from effectful.infrastructure.messaging import (
+    MessageCodecRegistry,
+    MessageConsumer,
+    MessageProducer,
 )
-from effectful.infrastructure.messaging import MessageConsumer, MessageProducer
 from effectful.interpreters.errors import (
     InterpreterError,
     MessagingError,
@@ -55,13 +69,21 @@ from effectful.programs.program_types import EffectResult
 class MessagingInterpreter:
     """Interpreter for messaging effects.
 
-    This interpreter handles PublishMessage, ConsumeMessage, AcknowledgeMessage,
-    and NegativeAcknowledge effects by delegating to MessageProducer and
+    This interpreter handles PublishMessage, PublishMessages, PublishValue,
+    ConsumeMessage, ConsumeBatch, AcknowledgeMessage, AcknowledgeBatch, and
+    NegativeAcknowledge effects by delegating to MessageProducer and
     MessageConsumer implementations.
 
+    With codecs, PublishValue is encoded by the topic's codec, whose content
+    type is sent in the "content-type" property, and every consumed envelope
+    gets a value: decoded with the codec for its content type (or its topic's
+    codec when it has none), or Absent("no_codec") / Absent("decode_failed").
+    Undecodable messages are still returned, so programs can ack or nack them.
+
     Attributes:
         producer: Message producer implementation
         consumer: Message consumer implementation
+        codecs: Optional codec selection for PublishValue and consumed payloads
 
     Example:
         >>> from effectful.testing.fakes import (
@@ -84,6 +106,7 @@ class MessagingInterpreter:
 
     producer: MessageProducer
     consumer: MessageConsumer
+    codecs: MessageCodecRegistry | None = None
 
     async def interpret(
         self, effect: Effect
@@ -105,10 +128,18 @@ class MessagingInterpreter:
         match effect:
             case PublishMessage(topic=topic, payload=payload, properties=props):
                 return await self._handle_publish(topic, payload, props, effect)
+            case PublishMessages(topic=topic, payloads=payloads, properties=props):
+                return await self._handle_publish_many(topic, payloads, props, effect)
+            case PublishValue(topic=topic, value=value, properties=props):
+                return await self._handle_publish_value(topic, value, props, effect)
             case ConsumeMessage(subscription=sub, timeout_ms=timeout):
                 return await self._handle_consume(sub, timeout, effect)
+            case ConsumeBatch(subscription=sub, max_messages=max_messages, max_wait_ms=wait):
+                return await self._handle_consume_batch(sub, max_messages, wait, effect)
             case AcknowledgeMessage(message_id=msg_id):
                 return await self._handle_ack(msg_id, effect)
+            case AcknowledgeBatch(message_ids=msg_ids, cumulative=cumulative):
+                return await self._handle_ack_batch(msg_ids, cumulative, effect)
             case NegativeAcknowledge(message_id=msg_id, delay_ms=delay):
                 return await self._handle_nack(msg_id, delay, effect)
             case _:
@@ -122,11 +153,12 @@ class MessagingInterpreter:
     async def _handle_publish(
         self,
         topic: str,
-        payload: bytes,
+        payload: Buffer,
         properties: OptionalValue[dict[str, str]],
         effect: Effect,
+        effect_name: str = "PublishMessage",
     ) -> Result[EffectReturn[EffectResult], InterpreterError]:
-        """Handle PublishMessage effect.
+        """Handle PublishMessage effect (and PublishValue once encoded).
 
         Returns:
             Ok with message_id (str) on successful publish.
@@ -144,12 +176,12 @@ class MessagingInterpreter:
             match publish_result:  # pragma: no branch
                 case PublishSuccess(message_id=msg_id, topic=_):
                     # Success - return message ID
-                    return Ok(EffectReturn(value=msg_id, effect_name="PublishMessage"))
+                    return Ok(EffectReturn(value=msg_id, effect_name=effect_name))
                 case PublishFailure(topic=t, reason=r):
                     # Domain failure (timeout, quota, topic not found)
                     # Return as Ok with ADT - programs handle via pattern matching
                     failure = PublishFailure(topic=t, reason=r)
-                    return Ok(EffectReturn(value=failure, effect_name="PublishMessage"))
+                    return Ok(EffectReturn(value=failure, effect_name=effect_name))
         except Exception as e:
             # Infrastructure failure (connection error, etc.)
             return Err(
@@ -160,6 +192,91 @@ class MessagingInterpreter:
                 )
             )
 
+    async def _handle_publish_many(
+        self,
+        topic: str,
+        payloads: tuple[Buffer, ...],
+        properties: OptionalValue[dict[str, str]],
+        effect: Effect,
+    ) -> Result[EffectReturn[EffectResult], InterpreterError]:
+        """Handle PublishMessages effect.
+
+        Returns:
+            Ok with tuple[PublishResult, ...] aligned with payloads (per-message
+            failures are domain results, not errors).
+            Err(MessagingError) on infrastructure failure.
+        """
+        try:
+            results = await self.producer.publish_many(
+                topic,
+                payloads,
+                properties=from_optional_value(properties),
+            )
+            return Ok(EffectReturn(value=results, effect_name="PublishMessages"))
+        except Exception as e:
+            return Err(
+                MessagingError(
+                    effect=effect,
+                    messaging_error=str(e),
+                    is_retryable=self._is_retryable_error(e),
+                )
+            )
+
+    async def _handle_publish_value(
+        self,
+        topic: str,
+        value: MessageValue,
+        properties: OptionalValue[dict[str, str]],
+        effect: Effect,
+    ) -> Result[EffectReturn[EffectResult], InterpreterError]:
+        """Handle PublishValue effect.
+
+        Returns:
+            Same as PublishMessage.
+            Err(MessagingError) (not retryable) if topic has no codec or value
+            cannot be encoded.
+        """
+        codec = self.codecs.for_topic(topic) if self.codecs is not None else None
+        if codec is None:
+            return Err(
+                MessagingError(
+                    effect=effect,
+                    messaging_error=f"No message codec configured for topic {topic}",
+                    is_retryable=False,
+                )
+            )
+
+        try:
+            payload = codec.encode(value)
+        except (TypeError, ValueError) as e:
+            return Err(MessagingError(effect=effect, messaging_error=str(e), is_retryable=False))
+
+        tagged = {
+            **(from_optional_value(properties) or {}),
+            CONTENT_TYPE_PROPERTY: codec.content_type,
+        }
+        return await self._handle_publish(
+            topic, payload, Provided(value=tagged), effect, effect_name="PublishValue"
+        )
+
+    def _decode(self, envelope: MessageEnvelope) -> MessageEnvelope:
+        """Set envelope.value from its payload when codecs are configured."""
+        if self.codecs is None:
+            return envelope
+
+        content_type = envelope.content_type
+        codec = (
+            self.codecs.for_content_type(content_type)
+            if content_type is not None
+            else self.codecs.for_topic(envelope.topic)
+        )
+        if codec is None:
+            return replace(envelope, value=Absent(reason="no_codec"))
+        try:
+            return replace(envelope, value=Provided(value=codec.decode(envelope.payload)))
+        except (TypeError, ValueError):
+            return replace(envelope, value=Absent(reason="decode_failed"))
+
     async def _handle_consume(
         self, subscription: str, timeout_ms: int, effect: Effect
     ) -> Result[EffectReturn[EffectResult], InterpreterError]:
@@ -176,7 +293,9 @@ class MessagingInterpreter:
             # Pattern match on ConsumeResult ADT
             match result:  # pragma: no branch
                 case MessageEnvelope() as envelope:
-                    return Ok(EffectReturn(value=envelope, effect_name="ConsumeMessage"))
+                    return Ok(
+                        EffectReturn(value=self._decode(envelope), effect_name="ConsumeMessage")
+                    )
                 case ConsumeTimeout() as timeout:
                     return Ok(EffectReturn(value=timeout, effect_name="ConsumeMessage"))
                 case ConsumeFailure() as failure:
@@ -190,6 +309,33 @@ class MessagingInterpreter:
                 )
             )
 
+    async def _handle_consume_batch(
+        self, subscription: str, max_messages: int, max_wait_ms: int, effect: Effect
+    ) -> Result[EffectReturn[EffectResult], InterpreterError]:
+        """Handle ConsumeBatch effect.
+
+        Returns:
+            Ok with tuple[MessageEnvelope, ...] (empty when nothing arrived in time).
+            Ok with ConsumeFailure ADT on connection/subscription errors.
+            Err(MessagingError) on infrastructure failure.
+        """
+        try:
+            result = await self.consumer.receive_batch(subscription, max_messages, max_wait_ms)
+            match result:
+                case tuple() as envelopes:
+                    decoded = tuple(self._decode(envelope) for envelope in envelopes)
+                    return Ok(EffectReturn(value=decoded, effect_name="ConsumeBatch"))
+                case ConsumeFailure() as failure:
+                    return Ok(EffectReturn(value=failure, effect_name="ConsumeBatch"))
+        except Exception as e:
+            return Err(
+                MessagingError(
+                    effect=effect,
+                    messaging_error=str(e),
+                    is_retryable=self._is_retryable_error(e),
+                )
+            )
+
     async def _handle_ack(
         self, message_id: str, effect: Effect
     ) -> Result[EffectReturn[EffectResult], InterpreterError]:
@@ -216,6 +362,27 @@ class MessagingInterpreter:
                 )
             )
 
+    async def _handle_ack_batch(
+        self, message_ids: tuple[str, ...], cumulative: bool, effect: Effect
+    ) -> Result[EffectReturn[EffectResult], InterpreterError]:
+        """Handle AcknowledgeBatch effect.
+
+        Returns:
+            Ok with tuple[AcknowledgeResult, ...] aligned with message_ids.
+            Err(MessagingError) on infrastructure failure.
+        """
+        try:
+            results = await self.consumer.acknowledge_batch(message_ids, cumulative=cumulative)
+            return Ok(EffectReturn(value=results, effect_name="AcknowledgeBatch"))
+        except Exception as e:
+            return Err(
+                MessagingError(
+                    effect=effect,
+                    messaging_error=str(e),
+                    is_retryable=self._is_retryable_error(e),
+                )
+            )
+
     async def _handle_nack(
         self, message_id: str, delay_ms: int, effect: Effect
     ) -> Result[EffectReturn[EffectResult], InterpreterError]:
@@ -0,0 +1,330 @@
+"""Read-through caching interpreter for database effects.
+
+This module provides ReadThroughCacheInterpreter, a decorator around a
+database interpreter that answers GetUserById and ListUsers from a
+ProfileCache when it can and invalidates them after user writes, so
+programs get cache-aside behaviour without yielding any cache effects.
+
+Each cached read effect type is configured by a CachedRead (key function,
+TTL, and codec). Cached user lists are stored under USER_LIST_TAG so one
+InvalidateTag-style call drops every page after a write.
+
+Writes made inside a Transaction sub-program run against the transaction's
+own repositories, so the sub-program is wrapped to record the users it writes;
+their entries are invalidated once the transaction has committed.
+
+Example:
+    >>> database = ReadThroughCacheInterpreter(
+    ...     inner=DatabaseInterpreter(user_repo=user_repo, message_repo=message_repo),
+    ...     cache=redis_cache,
+    ...     user_by_id=CachedRead(
+    ...         key=USER_BY_ID.key, encode=USER_BY_ID.encode, decode=USER_BY_ID.decode,
+    ...         ttl_seconds=600,
+    ...     ),
+    ...     metrics_collector=prometheus_collector,  # FRAMEWORK_METRICS registered
+    ... )
+"""
+
+import json
+from collections.abc import Callable, Generator
+from dataclasses import dataclass
+from typing import Literal
+from uuid import UUID
+
+from effectful.algebraic.effect_return import EffectReturn
+from effectful.algebraic.result import Ok, Result
+from effectful.domain.cache_result import CacheHit, CacheMiss
+from effectful.domain.optional_value import (
+    Absent,
+    OptionalValue,
+    Provided,
+    from_optional_value,
+)
+from effectful.domain.user import User
+from effectful.effects.base import Effect
+from effectful.effects.database import (
+    CreateUser,
+    DatabaseEffect,
+    DeleteUser,
+    GetUserById,
+    ListUsers,
+    Transaction,
+    UpdateUser,
+    UpdateUserIf,
+    UpsertUser,
+)
+from effectful.infrastructure.cache import ProfileCache
+from effectful.infrastructure.metrics import MetricsCollector
+from effectful.interpreters.base import EffectInterpreter
+from effectful.interpreters.errors import InterpreterError
+from effectful.programs.program_types import EffectResult
+
+# Tag every cached ListUsers page is stored under
+USER_LIST_TAG = "db:users"
+
+# Outcome of a read-through lookup (used as a metrics label)
+type ReadThroughOutcome = Literal["hit", "miss", "error"]
+
+
+@dataclass(frozen=True)
+class CachedRead[E]:
+    """Read-through settings for one read effect type.
+
+    Attributes:
+        key: Cache key for an effect
+        encode: Serialize a result; Absent means the result is not cached
+            (e.g. UserNotFound)
+        decode: Deserialize a cached result; raising treats the entry as a miss
+        ttl_seconds: Time-to-live of cached results
+        tags: Tags the cached results are stored under
+    """
+
+    key: Callable[[E], str]
+    encode: Callable[[EffectResult], OptionalValue[bytes]]
+    decode: Callable[[bytes], EffectResult]
+    ttl_seconds: int = 300
+    tags: tuple[str, ...] = ()
+
+
+def _user_to_dict(user: User) -> dict[str, str | int]:
+    """JSON-ready form of a User."""
+    return {"id": str(user.id), "name": user.name, "email": user.email, "version": user.version}
+
+
+def _user_from_dict(data: dict[str, str | int]) -> User:
+    """Rebuild a User from its JSON form."""
+    return User(
+        id=UUID(str(data["id"])),
+        name=str(data["name"]),
+        email=str(data["email"]),
+        version=int(data["version"]),
+    )
+
+
+def _encode_user(result: EffectResult) -> OptionalValue[bytes]:
+    """Encode a found User; UserNotFound and other results are not cached."""
+    match result:
+        case User() as user:
+            return Provided(value=json.dumps(_user_to_dict(user)).encode("utf-8"))
+        case _:
+            return Absent(reason="not_cacheable")
+
+
+def _decode_user(data: bytes) -> EffectResult:
+    """Decode a cached User."""
+    decoded: dict[str, str | int] = json.loads(data)
+    return _user_from_dict(decoded)
+
+
+def _encode_users(result: EffectResult) -> OptionalValue[bytes]:
+    """Encode a list of Users."""
+    match result:
+        case list() as items:
+            users = [item for item in items if isinstance(item, User)]
+            if len(users) != len(items):
+                return Absent(reason="not_cacheable")
+            return Provided(value=json.dumps([_user_to_dict(u) for u in users]).encode("utf-8"))
+        case _:
+            return Absent(reason="not_cacheable")
+
+
+def _decode_users(data: bytes) -> EffectResult:
+    """Decode a cached list of Users."""
+    decoded: list[dict[str, str | int]] = json.loads(data)
+    return [_user_from_dict(item) for item in decoded]
+
+
+def _user_list_key(effect: ListUsers) -> str:
+    """Cache key for one ListUsers page."""
+    return f"db:users:{from_optional_value(effect.limit)}:{from_optional_value(effect.offset)}"
+
+
+def _track_user_writes(
+    program: Generator[DatabaseEffect, EffectResult, EffectResult], written: set[UUID]
+) -> Generator[DatabaseEffect, EffectResult, EffectResult]:
+    """Run a Transaction sub-program unchanged, adding the IDs of users it writes.
+
+    Nested Transaction sub-programs are tracked too, since they commit with
+    the outer transaction.
+    """
+    value: EffectResult = None
+    # Acceptable while loop: relays effects until the sub-program returns
+    while True:
+        try:
+            effect = program.send(value)
+        except StopIteration as stop:
+            returned: EffectResult = stop.value
+            return returned
+        match effect:
+            case Transaction(program=nested):
+                effect = Transaction(program=_track_user_writes(nested, written))
+            case (
+                UpdateUser(user_id=user_id)
+                | UpdateUserIf(user_id=user_id)
+                | DeleteUser(user_id=user_id)
+            ):
+                written.add(user_id)
+            case _:
+                pass
+        value = yield effect
+        match (effect, value):
+            case (CreateUser() | UpsertUser(), User() as user):
+                written.add(user.id)
+            case _:
+                pass
+
+
+# Default settings: users by ID for 5 minutes, list pages for 1 minute
+USER_BY_ID: CachedRead[GetUserById] = CachedRead(
+    key=lambda effect: f"db:user:{effect.user_id}",
+    encode=_encode_user,
+    decode=_decode_user,
+)
+USER_LIST: CachedRead[ListUsers] = CachedRead(
+    key=_user_list_key,
+    encode=_encode_users,
+    decode=_decode_users,
+    ttl_seconds=60,
+    tags=(USER_LIST_TAG,),
+)
+
+
+@dataclass(frozen=True)
+class ReadThroughCacheInterpreter:
+    """Interpreter decorator adding read-through caching to database effects.
+
+    Cached reads are served from the cache on a hit; on a miss the inner
+    interpreter runs and a cacheable result is stored. After a successful
+    CreateUser, UpsertUser, UpdateUser, UpdateUserIf or DeleteUser the
+    affected user entry and every cached user list are invalidated; for those
+    writes inside a Transaction, after it commits. All other effects
+    (including unhandled ones) are passed to inner unchanged.
+
+    Cache failures never fail an effect: reads fall back to inner and failed
+    stores or invalidations are dropped (entries still expire by TTL).
+
+    Attributes:
+        inner: Wrapped interpreter, typically DatabaseInterpreter
+        cache: Cache for read results
+        user_by_id: Settings for GetUserById (None disables caching it)
+        user_list: Settings for ListUsers (None disables caching it)
+        metrics_collector: Optional collector for hit/miss counts
+    """
+
+    inner: EffectInterpreter
+    cache: ProfileCache
+    user_by_id: CachedRead[GetUserById] | None = USER_BY_ID
+    user_list: CachedRead[ListUsers] | None = USER_LIST
+    metrics_collector: MetricsCollector | None = None
+
+    async def interpret(
+        self, effect: Effect
+    ) -> Result[EffectReturn[EffectResult], InterpreterError]:
+        """Interpret an effect, answering cached reads from the cache.
+
+        Args:
+            effect: The effect to interpret
+
+        Returns:
+            Ok(EffectReturn(value)) from the cache or inner interpreter
+            Err(InterpreterError) from the inner interpreter
+        """
+        match effect:
+            case GetUserById() if self.user_by_id is not None:
+                return await self._read_through(
+                    effect, "GetUserById", self.user_by_id.key(effect), self.user_by_id
+                )
+            case ListUsers() if self.user_list is not None:
+                return await self._read_through(
+                    effect, "ListUsers", self.user_list.key(effect), self.user_list
+                )
+            case CreateUser() | UpsertUser():
+                result = await self.inner.interpret(effect)
+                match result:
+                    case Ok(EffectReturn(value=User() as user, effect_name=_)):
+                        await self._invalidate_user(user.id)
+                return result
+            case (
+                UpdateUser(user_id=user_id)
+                | UpdateUserIf(user_id=user_id)
+                | DeleteUser(user_id=user_id)
+            ):
+                result = await self.inner.interpret(effect)
+                if isinstance(result, Ok):
+                    await self._invalidate_user(user_id)
+                return result
+            case Transaction(program=program):
+                written: set[UUID] = set()
+                result = await self.inner.interpret(
+                    Transaction(program=_track_user_writes(program, written))
+                )
+                if isinstance(result, Ok):
+                    for user_id in written:
+                        await self._invalidate_user(user_id)
+                return result
+            case _:
+                return await self.inner.interpret(effect)
+
+    async def _read_through[
+        E
+    ](self, effect: Effect, effect_name: str, key: str, policy: CachedRead[E]) -> Result[
+        EffectReturn[EffectResult], InterpreterError
+    ]:
+        """Serve effect from the cache, or run it and cache a cacheable result."""
+        match await self._cached(key, policy):
+            case Provided(value=value):
+                await self._record_lookup(effect_name, "hit")
+                return Ok(EffectReturn(value=value, effect_name=effect_name))
+            case Absent(reason=reason):
+                await self._record_lookup(effect_name, "error" if reason == "error" else "miss")
+
+        result = await self.inner.interpret(effect)
+        match result:
+            case Ok(EffectReturn(value=value, effect_name=_)):
+                match policy.encode(value):
+                    case Provided(value=payload):
+                        try:
+                            await self.cache.put_value(
+                                key, payload, policy.ttl_seconds, policy.tags
+                            )
+                        except Exception:
+                            # Best effort - the next read simply misses again
+                            pass
+                    case Absent():
+                        pass
+        return result
+
+    async def _cached[E](self, key: str, policy: CachedRead[E]) -> OptionalValue[EffectResult]:
+        """Read and decode key; lookup or decode failures are Absent("error")."""
+        try:
+            lookup_result = await self.cache.get_value(key)
+            match lookup_result:
+                case CacheHit(value=data, ttl_remaining=_):
+                    return Provided(value=policy.decode(data))
+                case CacheMiss(key=_, reason=reason):
+                    return Absent(reason=reason)
+        except Exception:
+            return Absent(reason="error")
+
+    async def _invalidate_user(self, user_id: UUID) -> None:
+        """Drop the cached user and every cached user list after a write."""
+        try:
+            if self.user_by_id is not None:
+                await self.cache.invalidate(self.user_by_id.key(GetUserById(user_id=user_id)))
+            if self.user_list is not None:
+                for tag in self.user_list.tags:
+                    await self.cache.invalidate_tag(tag)
+        except Exception:
+            # The write succeeded - stale entries still expire by TTL
+            pass
+
+    async def _record_lookup(self, effect_name: str, outcome: ReadThroughOutcome) -> None:
+        """Record a read-through lookup outcome."""
+        if self.metrics_collector is None:
+            return
+
+        await self.metrics_collector.increment_counter(
+            metric_name="effectful_read_through_lookups_total",
+            labels={"effect_type": effect_name, "result": outcome},
+            value=1.0,
+        )
@@ -15,6 +15,7 @@ Type Safety:
     error handling.
 """
 
+from collections.abc import Buffer
 from dataclasses import dataclass
 from typing import Literal
 
@@ -136,7 +137,7 @@ class StorageInterpreter:
         self,
         bucket: str,
         key: str,
-        content: bytes,
+        content: Buffer,
         metadata: OptionalValue[dict[str, str]],
         content_type: OptionalValue[str],
         effect: Effect,
@@ -8,6 +8,15 @@ When InstrumentedInterpreter is enabled, it automatically tracks:
 - Effect error rates
 - Effect concurrency
 - Program execution counts and durations
+- Chat message group-commit batch sizes and latencies
+- Per-statement SQL latency, row counts, and pool acquire wait
+- Tiered cache hits/misses per tier and cross-instance invalidations
+- Read-through cache hits/misses per database effect type
+- Cache hits, misses by reason, bytes, and latency per key prefix
+- Pulsar publish latency and in-flight sends per topic
+- Pulsar delivered-but-unacknowledged messages per subscription
+- Pulsar producer/consumer handles created, evicted, and open
+- MessageWorker throughput, processing time, lag, and in-flight messages
 
 For application-specific business metrics, create your own registry.
 
@@ -44,6 +53,66 @@ FRAMEWORK_METRICS = MetricsRegistry(
             help_text="Total program executions by name and result",
             label_names=("program_name", "result"),
         ),
+        CounterDefinition(
+            name="effectful_chat_message_batches_total",
+            help_text="Chat message batch flushes by trigger and result",
+            label_names=("trigger", "result"),
+        ),
+        CounterDefinition(
+            name="effectful_db_queries_total",
+            help_text="SQL statements executed by fingerprint, operation, and result",
+            label_names=("fingerprint", "operation", "result"),
+        ),
+        CounterDefinition(
+            name="effectful_db_slow_queries_total",
+            help_text="SQL statements slower than the slow-query threshold",
+            label_names=("fingerprint",),
+        ),
+        CounterDefinition(
+            name="effectful_cache_tier_lookups_total",
+            help_text="Tiered cache lookups by tier (l1, l2) and result (hit, miss)",
+            label_names=("tier", "result"),
+        ),
+        CounterDefinition(
+            name="effectful_cache_remote_invalidations_total",
+            help_text="L1 cache evictions requested by other instances via pub/sub",
+            label_names=("channel",),
+        ),
+        CounterDefinition(
+            name="effectful_read_through_lookups_total",
+            help_text="Read-through cache lookups by effect type and result (hit, miss, error)",
+            label_names=("effect_type", "result"),
+        ),
+        CounterDefinition(
+            name="effectful_cache_hits_total",
+            help_text="Cache lookups answered from the cache by key prefix",
+            label_names=("prefix",),
+        ),
+        CounterDefinition(
+            name="effectful_cache_misses_total",
+            help_text="Cache lookups not answered from the cache by key prefix and reason",
+            label_names=("prefix", "reason"),
+        ),
+        CounterDefinition(
+            name="effectful_cache_bytes_total",
+            help_text="Cached value bytes by key prefix and direction (read, written)",
+            label_names=("prefix", "direction"),
+        ),
+        CounterDefinition(
+            name="effectful_pulsar_handles_created_total",
+            help_text="Pulsar producers or consumers created by kind",
+            label_names=("kind",),
+        ),
+        CounterDefinition(
+            name="effectful_pulsar_handles_evicted_total",
+            help_text="Cached Pulsar producers or consumers closed by kind and reason",
+            label_names=("kind", "reason"),
+        ),
+        CounterDefinition(
+            name="effectful_worker_messages_total",
+            help_text="Messages settled by MessageWorker by subscription and result",
+            label_names=("subscription", "result"),
+        ),
     ),
     gauges=(
         GaugeDefinition(
@@ -51,6 +120,26 @@ FRAMEWORK_METRICS = MetricsRegistry(
             help_text="Currently executing effects",
             label_names=("effect_type",),
         ),
+        GaugeDefinition(
+            name="effectful_pulsar_publishes_in_flight",
+            help_text="Pulsar sends awaiting a broker receipt by topic",
+            label_names=("topic",),
+        ),
+        GaugeDefinition(
+            name="effectful_pulsar_unacked_messages",
+            help_text="Pulsar messages delivered but not yet acked or nacked by subscription",
+            label_names=("subscription",),
+        ),
+        GaugeDefinition(
+            name="effectful_pulsar_open_handles",
+            help_text="Cached Pulsar producers or consumers by kind",
+            label_names=("kind",),
+        ),
+        GaugeDefinition(
+            name="effectful_worker_messages_in_flight",
+            help_text="Messages being processed by MessageWorker by subscription",
+            label_names=("subscription",),
+        ),
     ),
     histograms=(
         HistogramDefinition(
@@ -65,6 +154,66 @@ FRAMEWORK_METRICS = MetricsRegistry(
             label_names=("program_name",),
             buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
         ),
+        HistogramDefinition(
+            name="effectful_chat_message_batch_size",
+            help_text="Rows written per chat message batch flush",
+            label_names=("trigger",),
+            buckets=(1.0, 2.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0),
+        ),
+        HistogramDefinition(
+            name="effectful_chat_message_batch_wait_seconds",
+            help_text="Time the oldest message of a batch waited before its flush started",
+            label_names=("trigger",),
+            buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+        ),
+        HistogramDefinition(
+            name="effectful_chat_message_batch_flush_seconds",
+            help_text="Chat message batch write duration distribution",
+            label_names=("result",),
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+        ),
+        HistogramDefinition(
+            name="effectful_db_query_duration_seconds",
+            help_text="SQL statement duration distribution by fingerprint",
+            label_names=("fingerprint", "operation"),
+            buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+        ),
+        HistogramDefinition(
+            name="effectful_db_query_rows",
+            help_text="Rows returned or affected per SQL statement",
+            label_names=("fingerprint",),
+            buckets=(1.0, 5.0, 10.0, 50.0, 100.0, 500.0, 1000.0, 5000.0, 10000.0),
+        ),
+        HistogramDefinition(
+            name="effectful_db_pool_acquire_wait_seconds",
+            help_text="Time spent waiting for a pooled connection before a statement",
+            label_names=("operation",),
+            buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0),
+        ),
+        HistogramDefinition(
+            name="effectful_cache_operation_duration_seconds",
+            help_text="Cache operation duration distribution by key prefix",
+            label_names=("prefix", "operation"),
+            buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5),
+        ),
+        HistogramDefinition(
+            name="effectful_pulsar_publish_duration_seconds",
+            help_text="Pulsar publish latency until broker receipt by topic and result",
+            label_names=("topic", "result"),
+            buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+        ),
+        HistogramDefinition(
+            name="effectful_worker_processing_seconds",
+            help_text="MessageWorker program duration per message by subscription and result",
+            label_names=("subscription", "result"),
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 30.0),
+        ),
+        HistogramDefinition(
+            name="effectful_worker_message_lag_seconds",
+            help_text="Time from publish until MessageWorker starts processing by subscription",
+            label_names=("subscription",),
+            buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0),
+        ),
     ),
     summaries=(),
 )
@@ -0,0 +1,235 @@
+"""Per-statement SQL instrumentation for database adapters.
+
+InstrumentedInterpreter measures whole effects, but one effect may run several
+statements. This module provides the statement-level layer that database pool
+and connection wrappers call after each query:
+
+- fingerprint_sql: normalizes SQL so literals and placeholders share one label
+- redact_parameters: describes bound parameters without exposing their values
+- rows_from_status: reads the affected-row count from an execute() status tag
+- QueryInstrumentation: records latency, rows, acquire wait, and slow-query samples
+
+Metrics recorded (all in FRAMEWORK_METRICS):
+- effectful_db_queries_total: Counter with labels (fingerprint, operation, result)
+- effectful_db_query_duration_seconds: Histogram with labels (fingerprint, operation)
+- effectful_db_query_rows: Histogram with label (fingerprint)
+- effectful_db_pool_acquire_wait_seconds: Histogram with label (operation)
+- effectful_db_slow_queries_total: Counter with label (fingerprint)
+
+Example:
+    >>> instrumentation = QueryInstrumentation(
+    ...     metrics_collector=prometheus_collector,  # FRAMEWORK_METRICS registered
+    ...     slow_query_threshold_seconds=0.1,
+    ... )
+    >>> await instrumentation.record_query(
+    ...     operation="fetch",
+    ...     query="SELECT * FROM users WHERE id = $1",
+    ...     args=(user_id,),
+    ...     duration_seconds=0.004,
+    ...     rows=1,
+    ...     acquire_wait_seconds=0.0002,
+    ...     succeeded=True,
+    ... )
+    >>> instrumentation.slow_queries()
+    ()
+"""
+
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Literal
+
+from effectful.infrastructure.metrics import MetricsCollector
+
+# asyncpg query methods that can be instrumented
+type QueryOperation = Literal["execute", "fetch", "fetchrow", "fetchval"]
+
+# Fingerprints become metric labels, so keep them bounded
+_MAX_FINGERPRINT_LENGTH = 200
+
+_COMMENT_PATTERN = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER_PATTERN = re.compile(r"\$\d+")
+_NUMBER_PATTERN = re.compile(r"\b\d+(?:\.\d+)?\b")
+_VALUE_LIST_PATTERN = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def fingerprint_sql(query: str) -> str:
+    """Normalize SQL text into a low-cardinality fingerprint.
+
+    Comments are dropped, string/numeric literals and $N placeholders become ?,
+    value lists collapse to (?), whitespace is collapsed, and the result is
+    lowercased and truncated.
+
+    Args:
+        query: SQL statement as sent to the driver
+
+    Returns:
+        Fingerprint suitable for use as a metric label
+
+    Example:
+        >>> fingerprint_sql("SELECT * FROM users\\n WHERE id IN ($1, $2) LIMIT 10")
+        'select * from users where id in (?) limit ?'
+    """
+    without_comments = _COMMENT_PATTERN.sub(" ", query)
+    without_strings = _STRING_LITERAL_PATTERN.sub("?", without_comments)
+    without_placeholders = _PLACEHOLDER_PATTERN.sub("?", without_strings)
+    without_numbers = _NUMBER_PATTERN.sub("?", without_placeholders)
+    collapsed_lists = _VALUE_LIST_PATTERN.sub("(?)", without_numbers)
+    normalized = _WHITESPACE_PATTERN.sub(" ", collapsed_lists).strip().lower()
+    return normalized[:_MAX_FINGERPRINT_LENGTH]
+
+
+def redact_parameters(args: tuple[object, ...]) -> tuple[str, ...]:
+    """Describe bound parameters by type only, never by value.
+
+    Args:
+        args: Positional parameters bound to the statement
+
+    Returns:
+        One description per parameter, e.g. ("<UUID>", "<str>", "NULL")
+    """
+    return tuple("NULL" if arg is None else f"<{type(arg).__name__}>" for arg in args)
+
+
+def rows_from_status(status: str) -> int | None:
+    """Extract the affected-row count from a PostgreSQL command status tag.
+
+    Args:
+        status: Status string returned by execute(), e.g. "UPDATE 3" or "INSERT 0 1"
+
+    Returns:
+        Row count, or None if the tag carries no count (e.g. "CREATE TABLE")
+    """
+    last_token = status.rsplit(" ", 1)[-1]
+    return int(last_token) if last_token.isdigit() else None
+
+
+@dataclass(frozen=True)
+class SlowQuerySample:
+    """A statement that exceeded the slow-query threshold.
+
+    Attributes:
+        fingerprint: Normalized SQL (see fingerprint_sql)
+        operation: Driver method that ran the statement
+        duration_seconds: Statement execution time
+        rows: Rows returned or affected (None if the statement failed)
+        parameters: Redacted parameter descriptions (see redact_parameters)
+        recorded_at: Unix timestamp when the sample was taken
+    """
+
+    fingerprint: str
+    operation: QueryOperation
+    duration_seconds: float
+    rows: int | None
+    parameters: tuple[str, ...]
+    recorded_at: float
+
+
+class QueryInstrumentation:
+    """Records per-statement metrics and keeps recent slow-query samples.
+
+    Shared by every wrapper that executes SQL on behalf of one application.
+    Metrics recording is fire-and-forget: collector results are ignored.
+
+    Attributes:
+        _metrics_collector: Collector with FRAMEWORK_METRICS registered
+        _slow_query_threshold_seconds: Duration at or above which a sample is kept
+        _slow_samples: Most recent slow-query samples (bounded)
+    """
+
+    def __init__(
+        self,
+        metrics_collector: MetricsCollector,
+        slow_query_threshold_seconds: float = 0.1,
+        max_slow_samples: int = 100,
+    ) -> None:
+        """Initialize query instrumentation.
+
+        Args:
+            metrics_collector: Collector with FRAMEWORK_METRICS registered
+            slow_query_threshold_seconds: Keep samples for statements at least this slow
+            max_slow_samples: Number of recent slow-query samples to retain (>= 1)
+
+        Raises:
+            ValueError: If max_slow_samples < 1
+        """
+        if max_slow_samples < 1:
+            raise ValueError(f"max_slow_samples must be >= 1, got {max_slow_samples}")
+
+        self._metrics_collector = metrics_collector
+        self._slow_query_threshold_seconds = slow_query_threshold_seconds
+        self._slow_samples: deque[SlowQuerySample] = deque(maxlen=max_slow_samples)
+
+    def slow_queries(self) -> tuple[SlowQuerySample, ...]:
+        """Return retained slow-query samples, oldest first."""
+        return tuple(self._slow_samples)
+
+    async def record_query(
+        self,
+        operation: QueryOperation,
+        query: str,
+        args: tuple[object, ...],
+        duration_seconds: float,
+        rows: int | None,
+        acquire_wait_seconds: float | None,
+        succeeded: bool,
+    ) -> None:
+        """Record metrics for one executed statement.
+
+        Args:
+            operation: Driver method that ran the statement
+            query: SQL text (fingerprinted before use as a label)
+            args: Bound parameters (only redacted descriptions are kept)
+            duration_seconds: Statement execution time, excluding acquire wait
+            rows: Rows returned or affected (None if unknown or failed)
+            acquire_wait_seconds: Time waiting for a pooled connection (None if not pooled)
+            succeeded: Whether the statement completed without raising
+        """
+        fingerprint = fingerprint_sql(query)
+
+        await self._metrics_collector.increment_counter(
+            metric_name="effectful_db_queries_total",
+            labels={
+                "fingerprint": fingerprint,
+                "operation": operation,
+                "result": "ok" if succeeded else "error",
+            },
+            value=1.0,
+        )
+        await self._metrics_collector.observe_histogram(
+            metric_name="effectful_db_query_duration_seconds",
+            labels={"fingerprint": fingerprint, "operation": operation},
+            value=duration_seconds,
+        )
+        if rows is not None:
+            await self._metrics_collector.observe_histogram(
+                metric_name="effectful_db_query_rows",
+                labels={"fingerprint": fingerprint},
+                value=float(rows),
+            )
+        if acquire_wait_seconds is not None:
+            await self._metrics_collector.observe_histogram(
+                metric_name="effectful_db_pool_acquire_wait_seconds",
+                labels={"operation": operation},
+                value=acquire_wait_seconds,
+            )
+
+        if duration_seconds >= self._slow_query_threshold_seconds:
+            self._slow_samples.append(
+                SlowQuerySample(
+                    fingerprint=fingerprint,
+                    operation=operation,
+                    duration_seconds=duration_seconds,
+                    rows=rows,
+                    parameters=redact_parameters(args),
+                    recorded_at=time.time(),
+                )
+            )
+            await self._metrics_collector.increment_counter(
+                metric_name="effectful_db_slow_queries_total",
+                labels={"fingerprint": fingerprint},
+                value=1.0,
+            )
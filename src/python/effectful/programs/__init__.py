@@ -6,6 +6,7 @@ This module provides the core program runner and type definitions:
 - **WSProgram** - Type alias for programs returning None
 - **AllEffects** - Union of all effect types
 - **EffectResult** - Union of all effect result types
+- **MessageWorker** - Run a program per message from a subscription
 
 Example:
     >>> from effectful.programs import run_ws_program
@@ -45,12 +46,15 @@ See Also:
     - effectful.interpreters - Effect interpreters
 """
 
+from effectful.programs.message_worker import MessageHandler, MessageWorker
 from effectful.programs.program_types import AllEffects, EffectResult, WSProgram
 from effectful.programs.runners import run_ws_program, run_ws_program_with_metrics
 
 __all__ = [
     "run_ws_program",
     "run_ws_program_with_metrics",
+    "MessageHandler",
+    "MessageWorker",
     "AllEffects",
     "EffectResult",
     "WSProgram",
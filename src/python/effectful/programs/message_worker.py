@@ -0,0 +1,365 @@
+"""Concurrent message-processing worker.
+
+This module provides MessageWorker, a consumer runtime that pulls batches of
+messages from one subscription and runs a program per message with bounded
+concurrency, so applications do not have to hand-write a ConsumeMessage ->
+work -> AcknowledgeMessage loop that handles one message at a time.
+
+Each message is settled from its program's outcome:
+- Ok(value): the message is acknowledged
+- Err(error) with error.is_retryable: the message is nacked with retry_delay_ms
+- Err(error) otherwise: the message is nacked with retry_delay_ms, or
+  acknowledged (dropped) when ack_permanent_failures is set
+- An exception raised by the program: the message is nacked with retry_delay_ms
+
+With an ordering_key, messages sharing a key are processed one after another in
+receive order while different keys run concurrently (key-shared partitioning
+within this worker). Later messages with a busy key wait in a per-key queue
+and take no processing slot, so a slow or stuck key never starves other keys.
+A message that would be nacked for retry is instead retried in place every
+retry_delay_ms, holding back later messages with its key until it succeeds or
+fails permanently. Once the worker is stopped it is nacked, and so is every
+later message with its key that is still waiting, so none of them is processed
+ahead of it.
+
+Example:
+    >>> def handle_signup(envelope: MessageEnvelope) -> Generator[AllEffects, EffectResult, None]:
+    ...     event = json.loads(envelope.payload)
+    ...     yield SaveChatMessage(user_id=UUID(event["user_id"]), text="Welcome!")
+    >>>
+    >>> worker = MessageWorker(
+    ...     consumer=PulsarMessageConsumer(client),
+    ...     interpreter=interpreter,
+    ...     subscription="user-events/signup-worker",
+    ...     handler=handle_signup,
+    ...     concurrency=32,
+    ...     ordering_key=lambda envelope: envelope.properties.get("user_id", ""),
+    ...     metrics_collector=prometheus_collector,  # FRAMEWORK_METRICS registered
+    ... )
+    >>> runner = asyncio.create_task(worker.run())
+    >>> ...
+    >>> worker.stop()
+    >>> await runner  # Waits for in-flight messages to settle
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable, Coroutine, Generator
+from datetime import UTC, datetime
+from typing import Literal
+
+from effectful.algebraic.result import Err, Ok
+from effectful.domain.message_envelope import ConsumeFailure, MessageEnvelope
+from effectful.infrastructure.messaging import MessageConsumer
+from effectful.infrastructure.metrics import MetricsCollector
+from effectful.interpreters.base import EffectInterpreter
+from effectful.interpreters.errors import (
+    AuthError,
+    CacheError,
+    DatabaseError,
+    MessagingError,
+    ObservabilityError,
+    StorageError,
+)
+from effectful.programs.program_types import AllEffects, EffectResult
+from effectful.programs.runners import run_ws_program
+
+# Program run for one message; its return value is ignored
+type MessageHandler = Callable[[MessageEnvelope], Generator[AllEffects, EffectResult, object]]
+
+# How a message was settled (used as a metrics label)
+type MessageOutcome = Literal["ok", "retry", "failed", "error"]
+
+
+class MessageWorker:
+    """Runs a program per message from one subscription with bounded concurrency.
+
+    The worker receives with receive_batch, never asking for more messages
+    than it has free processing slots, so at most concurrency programs run
+    at once. Only messages queued behind a busy ordering key wait inside the
+    worker; the consumer's own unacked-message limit bounds how many.
+
+    Metrics recorded when metrics_collector is set (all in FRAMEWORK_METRICS):
+    - effectful_worker_messages_total: Counter with labels (subscription, result)
+    - effectful_worker_processing_seconds: Histogram with labels (subscription, result)
+    - effectful_worker_message_lag_seconds: Histogram with label (subscription),
+      time from publish to the start of processing
+    - effectful_worker_messages_in_flight: Gauge with label (subscription)
+
+    Attributes:
+        _consumer: Consumer the subscription is read from
+        _interpreter: Interpreter the per-message programs run with
+        _subscription: Subscription name ("topic/subscription-name")
+        _handler: Builds the program for one message
+        _concurrency: Largest number of programs running at once
+        _batch_size: Largest number of messages requested per receive_batch
+        _max_wait_ms: Longest wait for a batch to fill
+        _retry_delay_ms: Redelivery delay for nacked messages
+        _ordering_key: Optional key whose messages are processed in order
+        _ack_permanent_failures: Acknowledge messages failing with a non-retryable error
+        _metrics_collector: Optional collector with FRAMEWORK_METRICS registered
+        _in_flight: Tasks processing (or nacking) received messages
+        _key_queues: Messages waiting per ordering key whose predecessor is
+            being processed (a key is present while it is busy)
+        _stopped: Whether stop() has been called
+    """
+
+    def __init__(
+        self,
+        consumer: MessageConsumer,
+        interpreter: EffectInterpreter,
+        subscription: str,
+        handler: MessageHandler,
+        concurrency: int = 16,
+        batch_size: int = 100,
+        max_wait_ms: int = 100,
+        retry_delay_ms: int = 1000,
+        ordering_key: Callable[[MessageEnvelope], str] | None = None,
+        ack_permanent_failures: bool = False,
+        metrics_collector: MetricsCollector | None = None,
+    ) -> None:
+        """Initialize worker.
+
+        Args:
+            consumer: Consumer the subscription is read from
+            interpreter: Interpreter the per-message programs run with
+            subscription: Subscription name ("topic/subscription-name")
+            handler: Builds the program for one message
+            concurrency: Maximum number of programs running at once (>= 1)
+            batch_size: Maximum number of messages per receive_batch (>= 1)
+            max_wait_ms: Longest wait for a batch to fill in milliseconds
+            retry_delay_ms: Redelivery delay for nacked messages in milliseconds
+            ordering_key: Process messages with equal keys sequentially (None: no ordering)
+            ack_permanent_failures: Acknowledge (drop) messages whose program fails
+                with a non-retryable error instead of nacking them
+            metrics_collector: Optional collector with FRAMEWORK_METRICS registered
+
+        Raises:
+            ValueError: If concurrency < 1 or batch_size < 1
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+
+        self._consumer = consumer
+        self._interpreter = interpreter
+        self._subscription = subscription
+        self._handler = handler
+        self._concurrency = concurrency
+        self._batch_size = batch_size
+        self._max_wait_ms = max_wait_ms
+        self._retry_delay_ms = retry_delay_ms
+        self._ordering_key = ordering_key
+        self._ack_permanent_failures = ack_permanent_failures
+        self._metrics_collector = metrics_collector
+        self._in_flight: set[asyncio.Task[bool]] = set()
+        self._key_queues: dict[str, deque[MessageEnvelope]] = {}
+        self._stopped = False
+
+    async def run(self) -> None:
+        """Receive and process messages until stop() is called.
+
+        Returns once stopped and every message already received is settled.
+        Receive failures are retried after max_wait_ms.
+        """
+        while not self._stopped:
+            match await self.poll():
+                case None:
+                    await asyncio.sleep(self._max_wait_ms / 1000)
+                case _:
+                    # Yield even when the consumer returned without suspending
+                    await asyncio.sleep(0)
+        await self.drain()
+
+    def stop(self) -> None:
+        """Stop receiving; run() returns after in-flight messages settle."""
+        self._stopped = True
+
+    async def poll(self) -> int | None:
+        """Receive one batch and start processing its messages.
+
+        Waits for a free processing slot first when all are busy.
+
+        Returns:
+            Number of messages started or queued behind their key, or None
+            if the receive failed.
+        """
+        while len(self._in_flight) >= self._concurrency:
+            await asyncio.wait(self._in_flight, return_when=asyncio.FIRST_COMPLETED)
+
+        batch = await self._consumer.receive_batch(
+            self._subscription,
+            min(self._batch_size, self._concurrency - len(self._in_flight)),
+            self._max_wait_ms,
+        )
+        match batch:
+            case ConsumeFailure():
+                return None
+            case envelopes:
+                for envelope in envelopes:
+                    self._start(envelope)
+                return len(envelopes)
+
+    async def drain(self) -> None:
+        """Wait until every received message is settled."""
+        while self._in_flight:
+            await asyncio.wait(self._in_flight)
+
+    def _start(self, envelope: MessageEnvelope) -> None:
+        """Process envelope now, or queue it behind the busy key it belongs to."""
+        key = self._ordering_key(envelope) if self._ordering_key is not None else None
+        if key is None:
+            self._launch(self._process(envelope))
+            return
+
+        waiting = self._key_queues.get(key)
+        if waiting is not None:
+            waiting.append(envelope)
+            return
+
+        self._key_queues[key] = deque()
+        task = self._launch(self._process(envelope))
+        task.add_done_callback(lambda done: self._advance(key, done))
+
+    def _launch(self, work: Coroutine[object, object, bool]) -> asyncio.Task[bool]:
+        """Run work as an in-flight task."""
+        task = asyncio.create_task(work)
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+        return task
+
+    def _advance(self, key: str, done: asyncio.Task[bool]) -> None:
+        """Start the next message with key once its predecessor has settled.
+
+        When the predecessor was left for redelivery, the waiting messages are
+        nacked unprocessed so none of them overtakes it.
+        """
+        waiting = self._key_queues[key]
+        if done.cancelled() or done.exception() is not None or not done.result():
+            del self._key_queues[key]
+            if waiting:
+                self._launch(self._reject(tuple(waiting)))
+            return
+        if not waiting:
+            del self._key_queues[key]
+            return
+
+        task = self._launch(self._process(waiting.popleft()))
+        task.add_done_callback(lambda next_done: self._advance(key, next_done))
+
+    async def _reject(self, envelopes: tuple[MessageEnvelope, ...]) -> bool:
+        """Nack envelopes without processing them."""
+        for envelope in envelopes:
+            await self._settle(envelope, acknowledge=False)
+        return False
+
+    async def _process(self, envelope: MessageEnvelope) -> bool:
+        """Run the handler program for envelope and settle the message.
+
+        Returns:
+            False if the message was left for redelivery, so later messages
+            with its key must not be processed before it; True otherwise.
+        """
+        await self._record_in_flight(1.0)
+        await self._record_lag(envelope)
+        try:
+            outcome = await self._attempt(envelope)
+            # Acceptable while loop: retrying in place keeps later messages with
+            # this key behind the message until it succeeds or fails permanently
+            while (
+                outcome in ("retry", "error")
+                and self._ordering_key is not None
+                and not self._stopped
+            ):
+                await asyncio.sleep(self._retry_delay_ms / 1000)
+                outcome = await self._attempt(envelope)
+
+            await self._settle(
+                envelope,
+                acknowledge=outcome == "ok"
+                or (outcome == "failed" and self._ack_permanent_failures),
+            )
+            return outcome in ("ok", "failed")
+        finally:
+            await self._record_in_flight(-1.0)
+
+    async def _attempt(self, envelope: MessageEnvelope) -> MessageOutcome:
+        """Run the handler program for envelope once and classify its outcome."""
+        started = time.perf_counter()
+        try:
+            result = await run_ws_program(self._handler(envelope), self._interpreter)
+        except Exception:
+            outcome: MessageOutcome = "error"
+        else:
+            match result:
+                case Ok(_):
+                    outcome = "ok"
+                case Err(
+                    DatabaseError(is_retryable=True)
+                    | CacheError(is_retryable=True)
+                    | MessagingError(is_retryable=True)
+                    | StorageError(is_retryable=True)
+                    | AuthError(is_retryable=True)
+                    | ObservabilityError(is_retryable=True)
+                ):
+                    outcome = "retry"
+                case Err(_):
+                    outcome = "failed"
+
+        await self._record_processed(outcome, time.perf_counter() - started)
+        return outcome
+
+    async def _settle(self, envelope: MessageEnvelope, acknowledge: bool) -> None:
+        """Acknowledge envelope, or nack it for redelivery after retry_delay_ms."""
+        try:
+            if acknowledge:
+                await self._consumer.acknowledge(envelope.message_id)
+            else:
+                await self._consumer.negative_acknowledge(
+                    envelope.message_id, delay_ms=self._retry_delay_ms
+                )
+        except Exception:
+            # Unsettled messages are redelivered by the broker
+            pass
+
+    async def _record_in_flight(self, delta: float) -> None:
+        """Adjust the in-flight gauge (fire-and-forget - failures are ignored)."""
+        if self._metrics_collector is None:
+            return
+
+        labels = {"subscription": self._subscription}
+        if delta > 0:
+            await self._metrics_collector.increment_gauge(
+                metric_name="effectful_worker_messages_in_flight", labels=labels, value=delta
+            )
+        else:
+            await self._metrics_collector.decrement_gauge(
+                metric_name="effectful_worker_messages_in_flight", labels=labels, value=-delta
+            )
+
+    async def _record_lag(self, envelope: MessageEnvelope) -> None:
+        """Record how long the message waited between publish and processing."""
+        if self._metrics_collector is None:
+            return
+
+        lag = (datetime.now(UTC) - envelope.publish_time).total_seconds()
+        await self._metrics_collector.observe_histogram(
+            metric_name="effectful_worker_message_lag_seconds",
+            labels={"subscription": self._subscription},
+            value=max(lag, 0.0),
+        )
+
+    async def _record_processed(self, outcome: MessageOutcome, seconds: float) -> None:
+        """Count a settled message and record its processing time."""
+        if self._metrics_collector is None:
+            return
+
+        labels = {"subscription": self._subscription, "result": outcome}
+        await self._metrics_collector.increment_counter(
+            metric_name="effectful_worker_messages_total", labels=labels, value=1.0
+        )
+        await self._metrics_collector.observe_histogram(
+            metric_name="effectful_worker_processing_seconds", labels=labels, value=seconds
+        )
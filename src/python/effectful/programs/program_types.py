@@ -10,7 +10,7 @@ from collections.abc import Generator
 from datetime import datetime
 from uuid import UUID
 
-from effectful.domain.cache_result import CacheMiss
+from effectful.domain.cache_result import CacheLookupResult, CacheMiss
 from effectful.domain.message import ChatMessage
 from effectful.domain.message_envelope import (
     AcknowledgeResult,
@@ -30,7 +30,7 @@ from effectful.domain.metrics_result import (
 from effectful.domain.profile import ProfileData
 from effectful.domain.s3_object import ObjectNotFound, PutSuccess, S3Object
 from effectful.domain.token_result import TokenRefreshResult, TokenValidationResult
-from effectful.domain.user import User, UserNotFound
+from effectful.domain.user import User, UserEmailExists, UserNotFound, UserVersionConflict
 from effectful.effects.auth import AuthEffect
 from effectful.effects.cache import CacheEffect
 from effectful.effects.database import DatabaseEffect
@@ -60,24 +60,31 @@ type AllEffects = (
 type EffectResult = (
     None  # Most effects return None (SendText, Close, PutCachedProfile, DeleteObject, RevokeToken)
     | str  # ReceiveText, PublishMessage, GenerateToken, HashPassword return str
-    | bool  # ValidatePassword, InvalidateCache, PutCachedValue return bool
+    | bool  # ValidatePassword, InvalidateCache, PutCachedValue(s) return bool
+    | int  # InvalidateMany and InvalidateTag return the number of deleted keys
     | bytes  # GetCachedValue returns bytes on cache hit
     | UUID  # CreateUser, GenerateUUID return UUID
     | datetime  # GetCurrentTime returns datetime
     # User ADTs
     | User  # GetUserById, GetUserByEmail returns User on success
     | UserNotFound  # GetUserById, GetUserByEmail returns UserNotFound when not found
+    | UserVersionConflict  # UpdateUserIf returns UserVersionConflict on a stale version
+    | UserEmailExists  # UpsertUser returns UserEmailExists when the email is taken
     # Message types
     | ChatMessage  # SaveChatMessage returns ChatMessage
     # Cache ADTs
     | ProfileData  # GetCachedProfile returns ProfileData on cache hit
     | CacheMiss  # GetCachedProfile returns CacheMiss on cache miss
+    | tuple[CacheLookupResult[bytes], ...]  # GetCachedValues returns results aligned with keys
     # Messaging ADTs
     | MessageEnvelope  # ConsumeMessage returns MessageEnvelope on success
     | ConsumeTimeout  # ConsumeMessage returns ConsumeTimeout on timeout
     | ConsumeFailure  # ConsumeMessage returns ConsumeFailure on connection/subscription errors
+    | tuple[MessageEnvelope, ...]  # ConsumeBatch returns the received envelopes
     | PublishResult  # PublishMessage returns PublishResult ADT (PublishSuccess | PublishFailure)
+    | tuple[PublishResult, ...]  # PublishMessages returns results aligned with payloads
     | AcknowledgeResult  # AcknowledgeMessage returns AcknowledgeResult ADT (AcknowledgeSuccess | AcknowledgeFailure)
+    | tuple[AcknowledgeResult, ...]  # AcknowledgeBatch returns results aligned with message IDs
     | NackResult  # NegativeAcknowledge returns NackResult ADT (NackSuccess | NackFailure)
     # Storage types
     | S3Object  # GetObject returns S3Object on success
@@ -4,44 +4,67 @@ Minimal stubs for the asyncpg library to satisfy mypy strict mode.
 Only includes types actually used by effectful.
 """
 
+from collections.abc import Awaitable
 from typing import Protocol
 from datetime import datetime
 from uuid import UUID
 
+type _Arg = UUID | str | datetime | int | None | list[UUID] | list[str] | list[datetime]
+
 class Record(Protocol):
     """Protocol for asyncpg Record (row result)."""
 
     def __getitem__(self, key: str) -> UUID | str | datetime | int | None: ...
 
+class Transaction(Protocol):
+    """Protocol for asyncpg Transaction."""
+
+    async def start(self) -> None: ...
+    async def commit(self) -> None: ...
+    async def rollback(self) -> None: ...
+
 class Connection(Protocol):
     """Protocol for asyncpg Connection."""
 
     async def execute(
         self,
         query: str,
-        *args: UUID | str | datetime | int | None,
+        *args: _Arg,
         timeout: float | None = None,
     ) -> str: ...
     async def fetch(
         self,
         query: str,
-        *args: UUID | str | datetime | int | None,
+        *args: _Arg,
         timeout: float | None = None,
     ) -> list[Record]: ...
     async def fetchrow(
         self,
         query: str,
-        *args: UUID | str | datetime | int | None,
+        *args: _Arg,
         timeout: float | None = None,
     ) -> Record | None: ...
     async def fetchval(
         self,
         query: str,
-        *args: UUID | str | datetime | int | None,
+        *args: _Arg,
         timeout: float | None = None,
     ) -> UUID | str | datetime | int | None: ...
+    def transaction(
+        self,
+        *,
+        isolation: str | None = None,
+        readonly: bool = False,
+        deferrable: bool = False,
+    ) -> Transaction: ...
     async def close(self) -> None: ...
 
+class Pool(Protocol):
+    """Protocol for asyncpg connection Pool."""
+
+    def acquire(self, *, timeout: float | None = None) -> Awaitable[Connection]: ...
+    async def release(self, connection: Connection, *, timeout: float | None = None) -> None: ...
+
 async def connect(
     dsn: str | None = None,
     *,
@@ -4,7 +4,7 @@ Minimal stubs for the boto3 library to satisfy mypy strict mode.
 Only includes types actually used by effectful.
 """
 
-from typing import Protocol
+from typing import IO, Protocol
 from datetime import datetime
 from botocore.exceptions import ClientError as ClientError
 
@@ -39,7 +39,7 @@ class S3Client(Protocol):
         *,
         Bucket: str,
         Key: str,
-        Body: bytes,
+        Body: bytes | bytearray | IO[bytes],
         Metadata: dict[str, str] | None = None,
         ContentType: str | None = None,
     ) -> S3PutObjectResponse: ...
@@ -0,0 +1,10 @@
+"""Type stubs for msgpack.
+
+Minimal stubs for the msgpack library to satisfy mypy strict mode.
+Only includes types actually used by effectful.
+"""
+
+type _Packable = None | bool | int | float | str | list[_Packable] | dict[str, _Packable]
+
+def packb(o: _Packable, *, use_bin_type: bool = True) -> bytes: ...
+def unpackb(packed: bytes, *, raw: bool = False) -> _Packable: ...
@@ -4,12 +4,41 @@ Minimal stubs for the Apache Pulsar Python client to satisfy mypy strict mode.
 Only includes types actually used by effectful.
 """
 
+from collections.abc import Callable
+
 class InitialPosition:
     """Pulsar subscription initial position enum."""
 
     Earliest: InitialPosition
     Latest: InitialPosition
 
+class Result:
+    """Pulsar operation result code enum."""
+
+    Ok: Result
+    Timeout: Result
+    ProducerQueueIsFull: Result
+    ProducerBlockedQuotaExceededError: Result
+    ProducerBlockedQuotaExceededException: Result
+    MessageTooBig: Result
+    AlreadyClosed: Result
+    ConnectError: Result
+    NotConnected: Result
+    AuthenticationError: Result
+    AuthorizationError: Result
+    TopicNotFound: Result
+    TopicTerminated: Result
+    UnknownError: Result
+
+class CompressionType:
+    """Pulsar producer compression codec enum."""
+
+    NONE: CompressionType
+    LZ4: CompressionType
+    ZLib: CompressionType
+    ZSTD: CompressionType
+    SNAPPY: CompressionType
+
 class MessageId:
     """Pulsar message identifier."""
 
@@ -38,13 +67,32 @@ class Producer:
         disable_replication: bool = False,
         event_timestamp: int | None = None,
     ) -> MessageId: ...
+    def send_async(
+        self,
+        content: bytes,
+        callback: Callable[[Result, MessageId], None],
+        *,
+        properties: dict[str, str] | None = None,
+        partition_key: str | None = None,
+        sequence_id: int | None = None,
+        replication_clusters: list[str] | None = None,
+        disable_replication: bool = False,
+        event_timestamp: int | None = None,
+    ) -> None: ...
     def close(self) -> None: ...
 
+class ConsumerBatchReceivePolicy:
+    """Limits for one batch_receive call (negative values mean no limit)."""
+
+    def __init__(self, max_num_message: int, max_num_bytes: int, timeout_ms: int) -> None: ...
+
 class Consumer:
     """Pulsar consumer for receiving messages from a subscription."""
 
     def receive(self, timeout_millis: int | None = None) -> Message: ...
+    def batch_receive(self) -> list[Message]: ...
     def acknowledge(self, message: Message) -> None: ...
+    def acknowledge_cumulative(self, message: Message) -> None: ...
     def negative_acknowledge(self, message: Message) -> None: ...
     def close(self) -> None: ...
 
@@ -72,7 +120,7 @@ class Client:
         producer_name: str | None = None,
         initial_sequence_id: int | None = None,
         send_timeout_millis: int = 30000,
-        compression_type: int = 0,
+        compression_type: CompressionType = ...,
         max_pending_messages: int = 1000,
         block_if_queue_full: bool = True,
         batching_enabled: bool = True,
@@ -96,6 +144,7 @@ class Client:
         properties: dict[str, str] | None = None,
         pattern_auto_discovery_period: int = 60,
         initial_position: InitialPosition = ...,
+        batch_receive_policy: ConsumerBatchReceivePolicy | None = None,
     ) -> Consumer: ...
     def close(self) -> None: ...
 
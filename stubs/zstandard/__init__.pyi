@@ -0,0 +1,17 @@
+"""Type stubs for zstandard.
+
+Minimal stubs for the python-zstandard library to satisfy mypy strict mode.
+Only includes types actually used by effectful.
+"""
+
+class ZstdCompressor:
+    """Zstandard compressor."""
+
+    def __init__(self, level: int = 3) -> None: ...
+    def compress(self, data: bytes) -> bytes: ...
+
+class ZstdDecompressor:
+    """Zstandard decompressor."""
+
+    def __init__(self) -> None: ...
+    def decompress(self, data: bytes, max_output_size: int = 0) -> bytes: ...
@@ -11,7 +11,11 @@ from collections.abc import AsyncGenerator
 import asyncpg
 import pytest_asyncio
 
-from effectful.adapters.postgres import PostgresChatMessageRepository, PostgresUserRepository
+from effectful.adapters.postgres import (
+    PostgresChatMessageRepository,
+    PostgresUserRepository,
+    migrate_users_version,
+)
 from tests.fixtures.config import (
     POSTGRES_DB,
     POSTGRES_HOST,
@@ -45,7 +49,8 @@ async def postgres_connection() -> AsyncGenerator[asyncpg.Connection, None]:
             id UUID PRIMARY KEY,
             email VARCHAR(255) NOT NULL UNIQUE,
             name VARCHAR(255) NOT NULL,
-            password_hash VARCHAR(255)
+            password_hash VARCHAR(255),
+            version INTEGER NOT NULL DEFAULT 1
         )
     """
     )
@@ -55,6 +60,7 @@ async def postgres_connection() -> AsyncGenerator[asyncpg.Connection, None]:
         ALTER TABLE users ADD COLUMN IF NOT EXISTS password_hash VARCHAR(255)
     """
     )
+    await migrate_users_version(conn)
     await conn.execute(
         """
         CREATE TABLE IF NOT EXISTS chat_messages (
@@ -80,8 +80,8 @@ async def clean_pulsar(
         Tests must use unique topic names (UUID) to avoid broker-level conflicts
     """
     # PRE-CLEANUP: Clean up BEFORE test runs (matches other clean_* fixtures)
-    pulsar_producer.close_producers()
-    pulsar_consumer.close_consumers()
+    await pulsar_producer.close()
+    await pulsar_consumer.close()
 
     # Give broker time to process close operations
     # Pulsar broker needs ~100ms to finalize producer/consumer cleanup
@@ -91,8 +91,8 @@ async def clean_pulsar(
 
     # POST-CLEANUP: Critical for preventing resource leaks on test failure
     try:
-        pulsar_producer.close_producers()
-        pulsar_consumer.close_consumers()
+        await pulsar_producer.close()
+        await pulsar_consumer.close()
         await asyncio.sleep(0.2)  # Allow cleanup to propagate
     except Exception:
         # Ignore cleanup errors - test isolation is more important than cleanup failure
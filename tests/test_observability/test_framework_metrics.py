@@ -8,9 +8,37 @@ def test_framework_metrics_definitions_present() -> None:
     assert {c.name for c in FRAMEWORK_METRICS.counters} == {
         "effectful_effects_total",
         "effectful_programs_total",
+        "effectful_chat_message_batches_total",
+        "effectful_db_queries_total",
+        "effectful_db_slow_queries_total",
+        "effectful_cache_tier_lookups_total",
+        "effectful_cache_remote_invalidations_total",
+        "effectful_read_through_lookups_total",
+        "effectful_cache_hits_total",
+        "effectful_cache_misses_total",
+        "effectful_cache_bytes_total",
+        "effectful_pulsar_handles_created_total",
+        "effectful_pulsar_handles_evicted_total",
+        "effectful_worker_messages_total",
+    }
+    assert {g.name for g in FRAMEWORK_METRICS.gauges} == {
+        "effectful_effects_in_progress",
+        "effectful_pulsar_publishes_in_flight",
+        "effectful_pulsar_unacked_messages",
+        "effectful_pulsar_open_handles",
+        "effectful_worker_messages_in_flight",
     }
-    assert {g.name for g in FRAMEWORK_METRICS.gauges} == {"effectful_effects_in_progress"}
     assert {h.name for h in FRAMEWORK_METRICS.histograms} == {
         "effectful_effect_duration_seconds",
         "effectful_program_duration_seconds",
+        "effectful_chat_message_batch_size",
+        "effectful_chat_message_batch_wait_seconds",
+        "effectful_chat_message_batch_flush_seconds",
+        "effectful_db_query_duration_seconds",
+        "effectful_db_query_rows",
+        "effectful_db_pool_acquire_wait_seconds",
+        "effectful_cache_operation_duration_seconds",
+        "effectful_pulsar_publish_duration_seconds",
+        "effectful_worker_processing_seconds",
+        "effectful_worker_message_lag_seconds",
     }
@@ -0,0 +1,113 @@
+"""Tests for per-statement SQL instrumentation."""
+
+from uuid import uuid4
+
+import pytest
+
+from effectful.adapters.in_memory_metrics import InMemoryMetricsCollector
+from effectful.domain.metrics_result import QuerySuccess
+from effectful.observability.framework_metrics import FRAMEWORK_METRICS
+from effectful.observability.query_instrumentation import (
+    QueryInstrumentation,
+    fingerprint_sql,
+    redact_parameters,
+    rows_from_status,
+)
+
+
+def test_fingerprint_normalizes_literals_placeholders_and_whitespace() -> None:
+    """Statements differing only in values share one fingerprint."""
+    first = fingerprint_sql("SELECT *\n  FROM users WHERE id = $1 AND name = 'alice' LIMIT 10")
+    second = fingerprint_sql("select * from users where id = $2 and name = 'bob' limit 50")
+
+    assert first == second == "select * from users where id = ? and name = ? limit ?"
+
+
+def test_fingerprint_collapses_value_lists_and_drops_comments() -> None:
+    """IN lists of any length and SQL comments do not change the fingerprint."""
+    assert fingerprint_sql("SELECT 1 FROM t WHERE id IN ($1, $2, $3) -- hot path") == (
+        "select ? from t where id in (?)"
+    )
+
+
+def test_redact_parameters_hides_values() -> None:
+    """Only parameter types are kept."""
+    assert redact_parameters((uuid4(), "secret@example.com", None, 42)) == (
+        "<UUID>",
+        "<str>",
+        "NULL",
+        "<int>",
+    )
+
+
+def test_rows_from_status() -> None:
+    """Affected-row counts are read from command status tags."""
+    assert rows_from_status("UPDATE 3") == 3
+    assert rows_from_status("INSERT 0 1") == 1
+    assert rows_from_status("CREATE TABLE") is None
+
+
+@pytest.mark.asyncio
+async def test_record_query_emits_framework_metrics_and_slow_sample() -> None:
+    """A slow statement is counted, timed, and sampled with redacted parameters."""
+    collector = InMemoryMetricsCollector()
+    await collector.register_metrics(FRAMEWORK_METRICS)
+    instrumentation = QueryInstrumentation(collector, slow_query_threshold_seconds=0.05)
+    query = "SELECT id FROM patients WHERE email = $1"
+
+    await instrumentation.record_query(
+        operation="fetch",
+        query=query,
+        args=("patient@example.com",),
+        duration_seconds=0.2,
+        rows=4,
+        acquire_wait_seconds=0.001,
+        succeeded=True,
+    )
+
+    fingerprint = fingerprint_sql(query)
+    queries = await collector.query_metrics(
+        "effectful_db_queries_total",
+        {"fingerprint": fingerprint, "operation": "fetch", "result": "ok"},
+    )
+    slow = await collector.query_metrics(
+        "effectful_db_slow_queries_total", {"fingerprint": fingerprint}
+    )
+    acquire = await collector.query_metrics(
+        "effectful_db_pool_acquire_wait_seconds", {"operation": "fetch"}
+    )
+    assert isinstance(queries, QuerySuccess)
+    assert isinstance(slow, QuerySuccess)
+    assert isinstance(acquire, QuerySuccess)
+    assert list(queries.metrics.values()) == [1.0]
+    assert list(slow.metrics.values()) == [1.0]
+    assert list(acquire.metrics.values()) == [1.0]
+
+    (sample,) = instrumentation.slow_queries()
+    assert sample.fingerprint == fingerprint
+    assert sample.rows == 4
+    assert sample.parameters == ("<str>",)
+
+
+@pytest.mark.asyncio
+async def test_fast_query_not_sampled_and_samples_bounded() -> None:
+    """Fast statements are not sampled; only the newest slow samples are kept."""
+    collector = InMemoryMetricsCollector()
+    await collector.register_metrics(FRAMEWORK_METRICS)
+    instrumentation = QueryInstrumentation(
+        collector, slow_query_threshold_seconds=0.1, max_slow_samples=2
+    )
+
+    await instrumentation.record_query("execute", "SELECT 1", (), 0.001, None, None, True)
+    assert instrumentation.slow_queries() == ()
+
+    for duration in (0.2, 0.3, 0.4):
+        await instrumentation.record_query("execute", "SELECT 1", (), duration, None, None, False)
+
+    assert [sample.duration_seconds for sample in instrumentation.slow_queries()] == [0.3, 0.4]
+
+
+def test_rejects_invalid_sample_bound() -> None:
+    """max_slow_samples must be positive."""
+    with pytest.raises(ValueError, match="max_slow_samples"):
+        QueryInstrumentation(InMemoryMetricsCollector(), max_slow_samples=0)
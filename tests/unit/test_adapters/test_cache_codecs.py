@@ -0,0 +1,145 @@
+"""Unit tests for cache codecs.
+
+Tests CacheCodec round-trips, legacy fallbacks, compression, and version checks.
+"""
+
+import json
+from uuid import uuid4
+
+import pytest
+from pytest_mock import MockerFixture
+from redis.asyncio import Redis
+
+from effectful.adapters.cache_codecs import (
+    FORMAT_VERSION,
+    MAGIC,
+    ZSTD_AVAILABLE,
+    CacheCodec,
+    UnsupportedCacheFormat,
+)
+from effectful.adapters.redis_cache import RedisProfileCache
+from effectful.domain.cache_result import CacheHit, CacheMiss
+from effectful.domain.profile import ProfileData
+
+
+class TestCacheCodec:
+    """Tests for CacheCodec."""
+
+    def test_profile_with_uuid_id_round_trips_smaller_than_json(self) -> None:
+        """UUID ids are packed into 16 bytes, well below the JSON size."""
+        codec = CacheCodec()
+        profile = ProfileData(id=str(uuid4()), name="Alice Smith")
+
+        encoded = codec.encode_profile(profile)
+
+        assert encoded[:2] == bytes([MAGIC, FORMAT_VERSION])
+        assert codec.decode_profile(encoded) == profile
+        assert len(encoded) < len(json.dumps({"id": profile.id, "name": profile.name})) / 2
+
+    def test_profile_with_arbitrary_id_round_trips(self) -> None:
+        """Non-UUID ids (and non-canonical UUID spellings) are kept verbatim."""
+        codec = CacheCodec()
+        for profile_id in ("custom-id-123", str(uuid4()).upper(), ""):
+            profile = ProfileData(id=profile_id, name="Zoë")
+            assert codec.decode_profile(codec.encode_profile(profile)) == profile
+
+    def test_legacy_payloads_are_still_readable(self) -> None:
+        """JSON profiles and raw values written before the codec decode unchanged."""
+        codec = CacheCodec()
+
+        assert codec.decode_profile('{"id": "1", "name": "Bob"}') == ProfileData(id="1", name="Bob")
+        assert codec.decode_profile(b'{"id": "1", "name": "Bob"}') == ProfileData(
+            id="1", name="Bob"
+        )
+        assert codec.decode_value(b"raw-bytes") == b"raw-bytes"
+
+    def test_legacy_writes_until_binary_enabled(self) -> None:
+        """With binary_writes=False the codec writes the legacy formats."""
+        codec = CacheCodec(binary_writes=False)
+        profile = ProfileData(id="1", name="Bob")
+
+        assert json.loads(codec.encode_profile(profile)) == {"id": "1", "name": "Bob"}
+        assert codec.encode_value(b"raw") == b"raw"
+
+    def test_values_starting_with_magic_round_trip(self) -> None:
+        """Values whose first byte is MAGIC decode unchanged in both write modes."""
+        values = [
+            "안녕하세요".encode(),
+            bytes([MAGIC, FORMAT_VERSION, 0]) + b"hello",
+            bytes([MAGIC]),
+        ]
+        for codec in (CacheCodec(binary_writes=False), CacheCodec(compress_threshold_bytes=0)):
+            for value in values:
+                assert codec.decode_value(codec.encode_value(value)) == value
+
+    def test_legacy_mode_frames_only_values_starting_with_magic(self) -> None:
+        """With binary_writes=False other values stay raw for codec-unaware readers."""
+        codec = CacheCodec(binary_writes=False)
+
+        assert codec.encode_value("hello".encode()) == b"hello"
+        assert codec.encode_value(bytes([MAGIC]) * 2048)[:3] == bytes([MAGIC, FORMAT_VERSION, 0])
+
+    def test_large_values_are_compressed(self) -> None:
+        """Values at or above the threshold are compressed; small ones are not."""
+        codec = CacheCodec(compression="zlib", compress_threshold_bytes=64)
+        large = b"0123456789abcdef" * 1024
+
+        encoded_large = codec.encode_value(large)
+        encoded_small = codec.encode_value(b"tiny")
+
+        assert len(encoded_large) < len(large) / 10
+        assert codec.decode_value(encoded_large) == large
+        assert encoded_small == bytes([MAGIC, FORMAT_VERSION, 0]) + b"tiny"
+
+    def test_unknown_version_is_rejected(self) -> None:
+        """Payloads from a newer format version raise UnsupportedCacheFormat."""
+        codec = CacheCodec()
+
+        with pytest.raises(UnsupportedCacheFormat, match="version"):
+            codec.decode_value(bytes([MAGIC, FORMAT_VERSION + 1, 0]) + b"x")
+
+    @pytest.mark.skipif(ZSTD_AVAILABLE, reason="zstandard is installed")
+    def test_zstd_requires_zstandard(self) -> None:
+        """Explicitly requesting zstd without the library fails fast."""
+        with pytest.raises(ImportError, match="zstandard"):
+            CacheCodec(compression="zstd")
+
+    def test_rejects_negative_threshold(self) -> None:
+        """compress_threshold_bytes must be non-negative."""
+        with pytest.raises(ValueError, match="compress_threshold_bytes"):
+            CacheCodec(compress_threshold_bytes=-1)
+
+
+class TestRedisProfileCacheWithCodec:
+    """Tests for RedisProfileCache configured with a CacheCodec."""
+
+    @pytest.mark.asyncio
+    async def test_put_and_get_profile_use_codec(self, mocker: MockerFixture) -> None:
+        """Profiles are stored in the binary format and decoded on read."""
+        user_id = uuid4()
+        profile = ProfileData(id=str(user_id), name="Alice")
+        codec = CacheCodec()
+        mock_redis = mocker.AsyncMock(spec=Redis)
+        mock_redis.setex = mocker.AsyncMock()
+        cache = RedisProfileCache(mock_redis, include_ttl=False, codec=codec)
+
+        await cache.put_profile(user_id, profile, 300)
+        stored = mock_redis.setex.call_args.args[2]
+        mock_redis.get = mocker.AsyncMock(return_value=stored)
+        result = await cache.get_profile(user_id)
+
+        assert stored == codec.encode_profile(profile)
+        assert result == CacheHit(value=profile, ttl_remaining=0)
+
+    @pytest.mark.asyncio
+    async def test_unreadable_payload_is_a_miss(self, mocker: MockerFixture) -> None:
+        """Entries written by a newer codec version are reported as misses."""
+        mock_redis = mocker.AsyncMock(spec=Redis)
+        mock_redis.get = mocker.AsyncMock(
+            return_value=bytes([MAGIC, FORMAT_VERSION + 1, 0]) + b"future"
+        )
+        cache = RedisProfileCache(mock_redis, include_ttl=False, codec=CacheCodec())
+
+        result = await cache.get_value("k")
+
+        assert result == CacheMiss(key="k", reason="not_found")
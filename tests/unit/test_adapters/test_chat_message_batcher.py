@@ -0,0 +1,214 @@
+"""Unit tests for BatchingChatMessageRepository.
+
+Tests group-commit batching over a mocked BulkChatMessageRepository.
+"""
+
+import asyncio
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+from pytest_mock import MockerFixture
+
+from effectful.adapters.chat_message_batcher import BatchingChatMessageRepository
+from effectful.adapters.in_memory_metrics import InMemoryMetricsCollector
+from effectful.domain.message import ChatMessage
+from effectful.domain.metrics_result import QuerySuccess
+from effectful.infrastructure.repositories import BulkChatMessageRepository
+from effectful.observability.framework_metrics import FRAMEWORK_METRICS
+
+
+async def _echo_batch(messages: list[tuple[UUID, str, datetime]]) -> list[ChatMessage]:
+    """Build saved ChatMessages the way a bulk repository would."""
+    return [
+        ChatMessage(id=uuid4(), user_id=user_id, text=text, created_at=created_at)
+        for user_id, text, created_at in messages
+    ]
+
+
+class TestBatchingChatMessageRepository:
+    """Tests for BatchingChatMessageRepository."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_share_one_batch(self, mocker: MockerFixture) -> None:
+        """Test saves reaching max_batch_size are written by a single call."""
+        # Setup
+        bulk = mocker.AsyncMock(spec=BulkChatMessageRepository)
+        bulk.save_messages.side_effect = _echo_batch
+        repo = BatchingChatMessageRepository(bulk, max_batch_size=3, max_delay_ms=1000.0)
+        user_id = uuid4()
+
+        # Execute
+        results = await asyncio.gather(
+            repo.save_message(user_id, "a"),
+            repo.save_message(user_id, "b"),
+            repo.save_message(user_id, "c"),
+        )
+
+        # Assert - each caller gets its own message, one batch written
+        assert [message.text for message in results] == ["a", "b", "c"]
+        bulk.save_messages.assert_called_once()
+        assert [text for _, text, _ in bulk.save_messages.call_args.args[0]] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_flushed_after_delay(self, mocker: MockerFixture) -> None:
+        """Test a batch below max_batch_size is written once max_delay_ms elapses."""
+        # Setup
+        bulk = mocker.AsyncMock(spec=BulkChatMessageRepository)
+        bulk.save_messages.side_effect = _echo_batch
+        repo = BatchingChatMessageRepository(bulk, max_batch_size=100, max_delay_ms=1.0)
+
+        # Execute
+        result = await asyncio.wait_for(repo.save_message(uuid4(), "Hello"), timeout=1.0)
+
+        # Assert
+        assert result.text == "Hello"
+        bulk.save_messages.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_error_propagates_to_every_caller(self, mocker: MockerFixture) -> None:
+        """Test a failed batch write raises in each waiting save_message call."""
+        # Setup
+        bulk = mocker.AsyncMock(spec=BulkChatMessageRepository)
+        bulk.save_messages.side_effect = ConnectionError("connection lost")
+        repo = BatchingChatMessageRepository(bulk, max_batch_size=2, max_delay_ms=1000.0)
+
+        # Execute
+        results = await asyncio.gather(
+            repo.save_message(uuid4(), "a"),
+            repo.save_message(uuid4(), "b"),
+            return_exceptions=True,
+        )
+
+        # Assert
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_bad_row_fails_only_its_own_caller(self, mocker: MockerFixture) -> None:
+        """Test a failed batch is bisected so the other rows are still saved."""
+
+        # Setup - the database rejects any insert containing the "bad" row
+        async def reject_bad_row(
+            messages: list[tuple[UUID, str, datetime]],
+        ) -> list[ChatMessage]:
+            if any(text == "bad" for _, text, _ in messages):
+                raise ValueError("invalid byte sequence")
+            return await _echo_batch(messages)
+
+        bulk = mocker.AsyncMock(spec=BulkChatMessageRepository)
+        bulk.save_messages.side_effect = reject_bad_row
+        collector = InMemoryMetricsCollector()
+        await collector.register_metrics(FRAMEWORK_METRICS)
+        repo = BatchingChatMessageRepository(
+            bulk, max_batch_size=4, max_delay_ms=1000.0, metrics_collector=collector
+        )
+
+        # Execute
+        results = await asyncio.gather(
+            *(repo.save_message(uuid4(), text) for text in ("a", "bad", "c", "d")),
+            return_exceptions=True,
+        )
+        await repo.close()
+
+        # Assert - [a bad c d] -> [a bad] -> [a], [bad]; then [c d] in one insert
+        assert [getattr(result, "text", None) for result in results] == ["a", None, "c", "d"]
+        assert isinstance(results[1], ValueError)
+        assert bulk.save_messages.await_count == 5
+        batches = await collector.query_metrics(
+            "effectful_chat_message_batches_total", {"trigger": "size", "result": "error"}
+        )
+        assert isinstance(batches, QuerySuccess)
+        assert list(batches.metrics.values()) == [1.0]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_cancels_waiting_callers(self, mocker: MockerFixture) -> None:
+        """Test callers are not left hanging when their batch write is cancelled."""
+        # Setup
+        write_started = asyncio.Event()
+
+        async def blocking_batch(
+            messages: list[tuple[UUID, str, datetime]],
+        ) -> list[ChatMessage]:
+            write_started.set()
+            await asyncio.Event().wait()
+            return []
+
+        bulk = mocker.AsyncMock(spec=BulkChatMessageRepository)
+        bulk.save_messages.side_effect = blocking_batch
+        repo = BatchingChatMessageRepository(bulk, max_batch_size=1, max_delay_ms=1000.0)
+        save = asyncio.ensure_future(repo.save_message(uuid4(), "a"))
+        await write_started.wait()
+
+        # Execute - cancel the in-flight flush
+        for flush in list(repo._flushes):
+            flush.cancel()
+
+        # Assert
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(save, timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_and_rejects_new_saves(self, mocker: MockerFixture) -> None:
+        """Test close() writes queued saves immediately and then refuses new ones."""
+        # Setup
+        bulk = mocker.AsyncMock(spec=BulkChatMessageRepository)
+        bulk.save_messages.side_effect = _echo_batch
+        repo = BatchingChatMessageRepository(bulk, max_batch_size=100, max_delay_ms=60_000.0)
+        pending = asyncio.ensure_future(repo.save_message(uuid4(), "queued"))
+        await asyncio.sleep(0)
+
+        # Execute
+        await repo.close()
+
+        # Assert
+        assert (await pending).text == "queued"
+        with pytest.raises(RuntimeError, match="closed"):
+            await repo.save_message(uuid4(), "late")
+
+    @pytest.mark.asyncio
+    async def test_list_messages_delegates(self, mocker: MockerFixture) -> None:
+        """Test list_messages_for_user reads from the wrapped repository."""
+        bulk = mocker.AsyncMock(spec=BulkChatMessageRepository)
+        bulk.list_messages_for_user.return_value = []
+        repo = BatchingChatMessageRepository(bulk)
+        user_id = uuid4()
+
+        assert await repo.list_messages_for_user(user_id) == []
+        bulk.list_messages_for_user.assert_called_once_with(user_id)
+
+    @pytest.mark.asyncio
+    async def test_batch_metrics_recorded(self, mocker: MockerFixture) -> None:
+        """Test batch count, size, wait, and flush metrics use FRAMEWORK_METRICS."""
+        # Setup
+        collector = InMemoryMetricsCollector()
+        await collector.register_metrics(FRAMEWORK_METRICS)
+        bulk = mocker.AsyncMock(spec=BulkChatMessageRepository)
+        bulk.save_messages.side_effect = _echo_batch
+        repo = BatchingChatMessageRepository(
+            bulk, max_batch_size=2, max_delay_ms=1000.0, metrics_collector=collector
+        )
+
+        # Execute
+        await asyncio.gather(repo.save_message(uuid4(), "a"), repo.save_message(uuid4(), "b"))
+        await repo.close()
+
+        # Assert
+        batches = await collector.query_metrics(
+            "effectful_chat_message_batches_total", {"trigger": "size", "result": "ok"}
+        )
+        sizes = await collector.query_metrics(
+            "effectful_chat_message_batch_size", {"trigger": "size"}
+        )
+        assert isinstance(batches, QuerySuccess)
+        assert isinstance(sizes, QuerySuccess)
+        assert list(batches.metrics.values()) == [1.0]
+        assert list(sizes.metrics.values()) == [1.0]
+
+    def test_rejects_invalid_configuration(self, mocker: MockerFixture) -> None:
+        """Test constructor validates batch size and delay."""
+        bulk = mocker.AsyncMock(spec=BulkChatMessageRepository)
+
+        with pytest.raises(ValueError, match="max_batch_size"):
+            BatchingChatMessageRepository(bulk, max_batch_size=0)
+        with pytest.raises(ValueError, match="max_delay_ms"):
+            BatchingChatMessageRepository(bulk, max_delay_ms=-1.0)
@@ -0,0 +1,185 @@
+"""Unit tests for the in-process message broker.
+
+Tests InMemoryBroker with its producer and consumer, on their own and driven
+through MessagingInterpreter.
+"""
+
+import asyncio
+
+import pytest
+
+from effectful.adapters.in_memory_messaging import (
+    InMemoryBroker,
+    InMemoryMessageConsumer,
+    InMemoryMessageProducer,
+)
+from effectful.adapters.in_memory_repositories import fixed_latency
+from effectful.algebraic.effect_return import EffectReturn
+from effectful.algebraic.result import Ok
+from effectful.domain.message_envelope import (
+    AcknowledgeFailure,
+    AcknowledgeSuccess,
+    ConsumeFailure,
+    ConsumeTimeout,
+    MessageEnvelope,
+    NackSuccess,
+    PublishSuccess,
+)
+from effectful.effects.messaging import ConsumeMessage, PublishMessage
+from effectful.interpreters.messaging import MessagingInterpreter
+
+
+class TestInMemoryBroker:
+    """Tests for InMemoryBroker, InMemoryMessageProducer and InMemoryMessageConsumer."""
+
+    @pytest.mark.asyncio
+    async def test_every_subscription_receives_each_message(self) -> None:
+        """Messages fan out to all subscriptions; earlier messages go to the first one."""
+        broker = InMemoryBroker()
+        producer = InMemoryMessageProducer(broker)
+        early = await producer.publish("events", b"early", {"k": "v"})
+        audit, billing = InMemoryMessageConsumer(broker), InMemoryMessageConsumer(broker)
+
+        first = await audit.receive("events/audit", timeout_ms=0)
+        await billing.receive("events/billing", timeout_ms=0)
+        await producer.publish_many("events", [b"a", b"b"])
+
+        assert isinstance(early, PublishSuccess)
+        assert isinstance(first, MessageEnvelope)
+        assert (first.message_id, first.payload, first.properties) == (
+            early.message_id,
+            b"early",
+            {"k": "v"},
+        )
+        assert (broker.backlog("events/audit"), broker.backlog("events/billing")) == (2, 2)
+
+    @pytest.mark.asyncio
+    async def test_shared_consumers_split_messages(self) -> None:
+        """Consumers of a shared subscription each get different messages."""
+        broker = InMemoryBroker()
+        await InMemoryMessageProducer(broker).publish_many("jobs", [b"1", b"2", b"3"])
+        one, two = InMemoryMessageConsumer(broker), InMemoryMessageConsumer(broker)
+
+        batch = await one.receive_batch("jobs/workers", max_messages=2, max_wait_ms=0)
+        rest = await two.receive_batch("jobs/workers", max_messages=2, max_wait_ms=0)
+
+        assert isinstance(batch, tuple) and isinstance(rest, tuple)
+        assert [e.payload for e in batch] == [b"1", b"2"]
+        assert [e.payload for e in rest] == [b"3"]
+        assert await two.acknowledge(batch[0].message_id) == AcknowledgeFailure(
+            message_id=batch[0].message_id, reason="message_not_found"
+        )
+
+    @pytest.mark.asyncio
+    async def test_exclusive_subscription_admits_one_consumer(self) -> None:
+        """A second consumer is refused until the owner closes; unacked messages return."""
+        broker = InMemoryBroker()
+        await InMemoryMessageProducer(broker).publish("orders", b"o1")
+        owner = InMemoryMessageConsumer(broker, subscription_type="exclusive")
+        other = InMemoryMessageConsumer(broker, subscription_type="exclusive")
+
+        received = await owner.receive("orders/sync", timeout_ms=0)
+        refused = await other.receive("orders/sync", timeout_ms=0)
+        await owner.close()
+        redelivered = await other.receive("orders/sync", timeout_ms=0)
+
+        assert refused == ConsumeFailure(
+            subscription="orders/sync", reason="subscription_not_found"
+        )
+        assert isinstance(received, MessageEnvelope)
+        assert redelivered == received
+        assert await owner.receive("orders/sync", timeout_ms=0) == ConsumeFailure(
+            subscription="orders/sync", reason="consumer_closed"
+        )
+
+    @pytest.mark.asyncio
+    async def test_nack_redelivers_after_delay(self) -> None:
+        """A nacked message is not receivable again until its delay has passed."""
+        broker = InMemoryBroker()
+        await InMemoryMessageProducer(broker).publish("jobs", b"retry-me")
+        consumer = InMemoryMessageConsumer(broker)
+        envelope = await consumer.receive("jobs/workers", timeout_ms=0)
+        assert isinstance(envelope, MessageEnvelope)
+
+        assert await consumer.negative_acknowledge(envelope.message_id, delay_ms=30) == (
+            NackSuccess(message_id=envelope.message_id)
+        )
+        assert await consumer.receive("jobs/workers", timeout_ms=0) == ConsumeTimeout(
+            subscription="jobs/workers", timeout_ms=0
+        )
+        redelivered = await consumer.receive("jobs/workers", timeout_ms=1000)
+
+        assert redelivered == envelope
+
+    @pytest.mark.asyncio
+    async def test_waiting_receive_wakes_on_publish(self) -> None:
+        """receive waits for a message published after it started."""
+        broker = InMemoryBroker()
+        consumer = InMemoryMessageConsumer(broker)
+        await consumer.receive_batch("events/tail", max_messages=1, max_wait_ms=0)
+
+        waiting = asyncio.create_task(consumer.receive("events/tail", timeout_ms=1000))
+        await asyncio.sleep(0)
+        await InMemoryMessageProducer(broker, latency=fixed_latency(0.001)).publish(
+            "events", b"late"
+        )
+        envelope = await waiting
+
+        assert isinstance(envelope, MessageEnvelope)
+        assert envelope.payload == b"late"
+
+    @pytest.mark.asyncio
+    async def test_cumulative_ack_covers_earlier_messages(self) -> None:
+        """Cumulative acknowledgement acks everything received up to the last ID."""
+        broker = InMemoryBroker()
+        await InMemoryMessageProducer(broker).publish_many("jobs", [b"1", b"2", b"3"])
+        consumer = InMemoryMessageConsumer(broker)
+        batch = await consumer.receive_batch("jobs/workers", max_messages=3, max_wait_ms=0)
+        assert isinstance(batch, tuple)
+
+        results = await consumer.acknowledge_batch([batch[1].message_id], cumulative=True)
+
+        assert results == (AcknowledgeSuccess(message_id=batch[1].message_id),)
+        assert isinstance(await consumer.acknowledge(batch[0].message_id), AcknowledgeFailure)
+        assert await consumer.acknowledge(batch[2].message_id) == AcknowledgeSuccess(
+            message_id=batch[2].message_id
+        )
+
+    @pytest.mark.asyncio
+    async def test_buffer_payloads_are_snapshotted_and_viewable(self) -> None:
+        """Published buffers are copied at publish; payload_view slices without copying."""
+        broker = InMemoryBroker()
+        consumer = InMemoryMessageConsumer(broker)
+        await consumer.receive_batch("blobs/sub", max_messages=1, max_wait_ms=0)
+        payload = bytearray(b"header|body")
+
+        await InMemoryMessageProducer(broker).publish("blobs", memoryview(payload))
+        payload[:6] = b"HEADER"
+        envelope = await consumer.receive("blobs/sub", timeout_ms=0)
+
+        assert isinstance(envelope, MessageEnvelope)
+        assert envelope.payload == b"header|body"
+        body = envelope.payload_view[7:]
+        assert body.obj is envelope.payload
+        assert body.tobytes() == b"body"
+
+    @pytest.mark.asyncio
+    async def test_round_trip_through_messaging_interpreter(self) -> None:
+        """Effects published and consumed through MessagingInterpreter use the broker."""
+        broker = InMemoryBroker()
+        consumer = InMemoryMessageConsumer(broker)
+        interpreter = MessagingInterpreter(
+            producer=InMemoryMessageProducer(broker), consumer=consumer
+        )
+
+        published = await interpreter.interpret(PublishMessage(topic="events", payload=b"x"))
+        consumed = await interpreter.interpret(
+            ConsumeMessage(subscription="events/sub", timeout_ms=0)
+        )
+
+        assert isinstance(published, Ok)
+        match consumed:
+            case Ok(EffectReturn(value=MessageEnvelope(payload=payload), effect_name=_)):
+                assert payload == b"x"
+            case _:
+                pytest.fail(f"Unexpected result: {consumed}")
@@ -0,0 +1,223 @@
+"""Unit tests for indexed in-memory repositories.
+
+Tests InMemoryUserRepository and InMemoryChatMessageRepository behave like the
+PostgreSQL adapters and keep their indexes consistent.
+"""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from effectful.adapters.in_memory_repositories import (
+    InMemoryChatMessageRepository,
+    InMemoryUserRepository,
+    MessageCursor,
+    fixed_latency,
+    lognormal_latency,
+)
+from effectful.domain.message import ChatMessage
+from effectful.domain.optional_value import Absent, OptionalValue, Provided
+from effectful.domain.user import (
+    User,
+    UserEmailExists,
+    UserFound,
+    UserNotFound,
+    UserVersionConflict,
+)
+
+
+class TestInMemoryUserRepository:
+    """Tests for InMemoryUserRepository."""
+
+    @pytest.mark.asyncio
+    async def test_create_then_lookup_by_id_and_email(self) -> None:
+        """Created users are found through both hash indexes."""
+        repo = InMemoryUserRepository()
+        user = await repo.create_user("alice@example.com", "Alice", "hash")
+
+        by_id = await repo.get_by_id(user.id)
+        by_email = await repo.get_by_email("alice@example.com")
+
+        assert by_id == UserFound(user=user, source="database")
+        assert by_email == UserFound(user=user, source="database")
+        assert isinstance(await repo.get_by_id(uuid4()), UserNotFound)
+        assert isinstance(await repo.get_by_email("nobody@example.com"), UserNotFound)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_email_rejected(self) -> None:
+        """Email uniqueness is enforced like the database constraint."""
+        repo = InMemoryUserRepository()
+        await repo.create_user("alice@example.com", "Alice", "hash")
+
+        with pytest.raises(ValueError, match="unique constraint"):
+            await repo.create_user("alice@example.com", "Other", "hash")
+
+    @pytest.mark.asyncio
+    async def test_list_users_ordered_by_name_with_pagination(self) -> None:
+        """list_users pages through users sorted by name."""
+        repo = InMemoryUserRepository()
+        for name in ("Carol", "Alice", "Dave", "Bob"):
+            await repo.create_user(f"{name.lower()}@example.com", name, "hash")
+
+        first_page = await repo.list_users(limit=Provided(value=2), offset=Absent())
+        second_page = await repo.list_users(limit=Provided(value=2), offset=Provided(value=2))
+
+        assert [user.name for user in first_page] == ["Alice", "Bob"]
+        assert [user.name for user in second_page] == ["Carol", "Dave"]
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_keep_indexes_consistent(self) -> None:
+        """Renames move users in the sort index; deletes remove every index entry."""
+        repo = InMemoryUserRepository()
+        alice = await repo.create_user("alice@example.com", "Alice", "hash")
+        await repo.create_user("bob@example.com", "Bob", "hash")
+
+        result = await repo.update_user(
+            alice.id, email=Provided(value="zed@example.com"), name=Provided(value="Zed")
+        )
+
+        assert isinstance(result, UserFound)
+        assert isinstance(await repo.get_by_email("alice@example.com"), UserNotFound)
+        assert [user.name for user in await repo.list_users(Absent(), Absent())] == ["Bob", "Zed"]
+
+        await repo.delete_user(alice.id)
+
+        assert len(repo) == 1
+        assert isinstance(await repo.get_by_email("zed@example.com"), UserNotFound)
+        assert [user.name for user in await repo.list_users(Absent(), Absent())] == ["Bob"]
+
+    @pytest.mark.asyncio
+    async def test_name_index_stays_sorted_across_writes(self) -> None:
+        """Every write updates the name index in place, including duplicate names."""
+        repo = InMemoryUserRepository()
+        first = await repo.create_user("a1@example.com", "Ann", "hash")
+        await repo.list_users(Absent(), Absent())
+        second = await repo.create_user("a2@example.com", "Ann", "hash")
+        upserted = await repo.upsert_user("cy@example.com", "Cy", "hash")
+        await repo.update_user(first.id, email=Absent(), name=Provided(value="Bea"))
+        await repo.delete_user(second.id)
+
+        assert isinstance(upserted, User)
+        assert repo._name_index == sorted((user.name, user.id) for user in repo._users.values())
+        assert [user.name for user in await repo.list_users(Absent(), Absent())] == ["Bea", "Cy"]
+
+    @pytest.mark.asyncio
+    async def test_update_missing_user_returns_not_found(self) -> None:
+        """Updating an unknown id returns UserNotFound."""
+        repo = InMemoryUserRepository()
+
+        result = await repo.update_user(uuid4(), email=Absent(), name=Provided(value="X"))
+
+        assert isinstance(result, UserNotFound)
+
+    @pytest.mark.asyncio
+    async def test_upsert_creates_then_reports_taken_email(self) -> None:
+        """Upsert inserts a new user, then never overwrites it for the same email."""
+        repo = InMemoryUserRepository()
+
+        created = await repo.upsert_user("alice@example.com", "Alice", "hash")
+        rejected = await repo.upsert_user("alice@example.com", "Mallory", "hash2")
+
+        assert isinstance(created, User)
+        assert rejected == UserEmailExists(email="alice@example.com", current=created)
+        assert await repo.get_by_email("alice@example.com") == UserFound(
+            user=created, source="database"
+        )
+        assert repo._password_hashes[created.id] == "hash"
+        assert len(repo) == 1
+
+    @pytest.mark.asyncio
+    async def test_update_user_if_checks_version(self) -> None:
+        """Only the first writer holding a given version succeeds."""
+        repo = InMemoryUserRepository()
+        user = await repo.create_user("alice@example.com", "Alice", "hash")
+
+        first = await repo.update_user_if(user.id, user.version, Absent(), Provided(value="A"))
+        second = await repo.update_user_if(user.id, user.version, Absent(), Provided(value="B"))
+
+        assert isinstance(first, UserFound)
+        assert first.user.version == 2
+        assert isinstance(second, UserVersionConflict)
+        assert second.current.name == "A"
+
+
+class TestInMemoryChatMessageRepository:
+    """Tests for InMemoryChatMessageRepository."""
+
+    @pytest.mark.asyncio
+    async def test_messages_indexed_per_user_in_created_order(self) -> None:
+        """Each user's messages are returned sorted by created_at."""
+        repo = InMemoryChatMessageRepository()
+        user_id = uuid4()
+        now = datetime.now(UTC)
+
+        await repo.save_messages(
+            [
+                (user_id, "second", now + timedelta(seconds=1)),
+                (uuid4(), "other user", now),
+                (user_id, "first", now),
+            ]
+        )
+
+        messages = await repo.list_messages_for_user(user_id)
+
+        assert [message.text for message in messages] == ["first", "second"]
+        assert len(repo) == 3
+
+    @pytest.mark.asyncio
+    async def test_keyset_pagination(self) -> None:
+        """list_messages_page resumes strictly after the given position."""
+        repo = InMemoryChatMessageRepository()
+        user_id = uuid4()
+        start = datetime.now(UTC)
+        await repo.save_messages(
+            [(user_id, f"m{i}", start + timedelta(seconds=i)) for i in range(5)]
+        )
+
+        first = await repo.list_messages_page(user_id, after=Absent(), limit=2)
+        second = await repo.list_messages_page(
+            user_id, after=Provided(value=(first[-1].created_at, first[-1].id)), limit=2
+        )
+
+        assert [message.text for message in first] == ["m0", "m1"]
+        assert [message.text for message in second] == ["m2", "m3"]
+
+    @pytest.mark.asyncio
+    async def test_keyset_pagination_with_tied_timestamps(self) -> None:
+        """Messages sharing the page boundary's created_at are not skipped."""
+        repo = InMemoryChatMessageRepository()
+        user_id = uuid4()
+        tied = datetime.now(UTC)
+        await repo.save_messages([(user_id, f"m{i}", tied) for i in range(5)])
+
+        pages: list[list[ChatMessage]] = []
+        after: OptionalValue[MessageCursor] = Absent()
+        while page := await repo.list_messages_page(user_id, after=after, limit=2):
+            pages.append(page)
+            after = Provided(value=(page[-1].created_at, page[-1].id))
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert sorted(message.text for page in pages for message in page) == [
+            f"m{i}" for i in range(5)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_save_message_with_simulated_latency(self) -> None:
+        """A latency sampler is applied without changing results."""
+        repo = InMemoryChatMessageRepository(latency=fixed_latency(0.0))
+        user_id = uuid4()
+
+        saved = await repo.save_message(user_id, "hello")
+
+        assert await repo.list_messages_for_user(user_id) == [saved]
+
+
+def test_lognormal_latency_is_reproducible_with_seed() -> None:
+    """Seeded samplers produce identical latency sequences."""
+    first = lognormal_latency(0.002, 0.5, seed=7)
+    second = lognormal_latency(0.002, 0.5, seed=7)
+
+    assert [first() for _ in range(5)] == [second() for _ in range(5)]
+    with pytest.raises(ValueError, match="median_seconds"):
+        lognormal_latency(0.0, 0.5)
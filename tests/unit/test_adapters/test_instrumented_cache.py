@@ -0,0 +1,182 @@
+"""Unit tests for the instrumented cache decorator.
+
+Tests InstrumentedProfileCache with a mocked inner ProfileCache and an
+in-memory metrics collector, and HotKeySampler on its own.
+"""
+
+from uuid import uuid4
+
+import pytest
+from pytest_mock import MockerFixture
+
+from effectful.adapters.in_memory_metrics import InMemoryMetricsCollector
+from effectful.adapters.instrumented_cache import (
+    HotKey,
+    HotKeySampler,
+    InstrumentedProfileCache,
+    key_prefix,
+)
+from effectful.domain.cache_result import CacheHit, CacheMiss
+from effectful.domain.profile import ProfileData
+from effectful.infrastructure.cache import ProfileCache
+from effectful.observability.framework_metrics import FRAMEWORK_METRICS
+
+
+async def _collector() -> InMemoryMetricsCollector:
+    """Collector with FRAMEWORK_METRICS registered."""
+    collector = InMemoryMetricsCollector()
+    await collector.register_metrics(FRAMEWORK_METRICS)
+    return collector
+
+
+class TestKeyPrefix:
+    """Tests for key_prefix."""
+
+    def test_drops_variable_segment_and_bounds_depth(self) -> None:
+        """The last segment is dropped and at most max_segments are kept."""
+        assert key_prefix(f"profile:{uuid4()}") == "profile"
+        assert key_prefix("db:users:10:20") == "db:users"
+        assert key_prefix("db:users:10:20", max_segments=1) == "db"
+        assert key_prefix("standalone") == "other"
+
+    def test_drops_every_id_like_segment(self) -> None:
+        """IDs anywhere in the key are dropped, so tenants do not become labels."""
+        assert key_prefix(f"tenant:{uuid4()}:profile:{uuid4()}") == "tenant:profile"
+        assert key_prefix("tenant:42:read_through:user:7") == "tenant:read_through"
+        assert key_prefix("session:bob@example.com:data") == "session"
+
+
+class TestHotKeySampler:
+    """Tests for HotKeySampler."""
+
+    def test_top_returns_most_read_keys_first(self) -> None:
+        """Keys are ranked by read count."""
+        sampler = HotKeySampler()
+        for key, reads in (("a", 3), ("b", 5), ("c", 1)):
+            for _ in range(reads):
+                sampler.record(key)
+
+        assert sampler.top(2) == (
+            HotKey(key="b", accesses=5, overestimate=0),
+            HotKey(key="a", accesses=3, overestimate=0),
+        )
+
+    def test_full_table_replaces_least_read_key(self) -> None:
+        """A newcomer evicts the least-read key and inherits its count."""
+        sampler = HotKeySampler(capacity=2)
+        for key in ("hot", "hot", "hot", "cold", "new"):
+            sampler.record(key)
+
+        assert sampler.top(5) == (
+            HotKey(key="hot", accesses=3, overestimate=0),
+            HotKey(key="new", accesses=2, overestimate=1),
+        )
+        sampler.reset()
+        assert sampler.top() == ()
+
+    def test_heavy_hitters_survive_a_long_tail(self) -> None:
+        """With many one-off keys, counts stay consistent and hot keys stay tracked."""
+        sampler = HotKeySampler(capacity=8)
+        records = 0
+        for i in range(5000):
+            for key in ("hot", f"tail-{i}") if i % 2 == 0 else (f"tail-{i}",):
+                sampler.record(key)
+                records += 1
+
+        top = sampler.top(8)
+        assert top[0].key == "hot"
+        assert top[0].accesses - top[0].overestimate <= 2500 <= top[0].accesses
+        # Space-Saving invariant: estimated counts of a full table sum to the reads
+        assert sum(hot_key.accesses for hot_key in top) == records
+
+    def test_sampling_skips_reads(self) -> None:
+        """Reads whose rng draw is at or above sample_rate are not recorded."""
+        draws = iter([0.05, 0.5, 0.09, 0.99])
+        sampler = HotKeySampler(sample_rate=0.1, rng=lambda: next(draws))
+        for _ in range(4):
+            sampler.record("k")
+
+        assert sampler.top() == (HotKey(key="k", accesses=2, overestimate=0),)
+
+    @pytest.mark.parametrize(("capacity", "sample_rate"), [(0, 1.0), (1, 0.0), (1, 1.5)])
+    def test_rejects_invalid_settings(self, capacity: int, sample_rate: float) -> None:
+        """capacity must be positive and sample_rate in (0, 1]."""
+        with pytest.raises(ValueError):
+            HotKeySampler(capacity=capacity, sample_rate=sample_rate)
+
+
+class TestInstrumentedProfileCache:
+    """Tests for InstrumentedProfileCache."""
+
+    @pytest.mark.asyncio
+    async def test_value_lookups_record_hits_misses_and_bytes(self, mocker: MockerFixture) -> None:
+        """Hits, misses by reason, and bytes are counted per key prefix."""
+        inner = mocker.AsyncMock(spec=ProfileCache)
+        inner.get_value.side_effect = [
+            CacheHit(value=b"12345", ttl_remaining=60),
+            CacheMiss(key="report:2", reason="expired"),
+        ]
+        inner.get_values.return_value = (
+            CacheHit(value=b"abc", ttl_remaining=60),
+            CacheMiss(key="report:4", reason="not_found"),
+        )
+        collector = await _collector()
+        sampler = HotKeySampler()
+        cache = InstrumentedProfileCache(inner, collector, hot_keys=sampler)
+
+        first = await cache.get_value("report:1")
+        await cache.get_value("report:2")
+        await cache.get_values(["report:1", "report:4"])
+        await cache.put_value("report:5", b"1234567", 60)
+
+        assert first == CacheHit(value=b"12345", ttl_remaining=60)
+        assert collector.counters["effectful_cache_hits_total"] == {"prefix=report": 2.0}
+        assert collector.counters["effectful_cache_misses_total"] == {
+            "prefix=report,reason=expired": 1.0,
+            "prefix=report,reason=not_found": 1.0,
+        }
+        assert collector.counters["effectful_cache_bytes_total"] == {
+            "direction=read,prefix=report": 8.0,
+            "direction=written,prefix=report": 7.0,
+        }
+        assert sampler.top(1) == (HotKey(key="report:1", accesses=2, overestimate=0),)
+
+    @pytest.mark.asyncio
+    async def test_operations_are_timed_per_prefix(self, mocker: MockerFixture) -> None:
+        """Every call records its latency, batches use a shared or "mixed" prefix."""
+        user_id = uuid4()
+        inner = mocker.AsyncMock(spec=ProfileCache)
+        inner.get_profile.return_value = CacheHit(
+            value=ProfileData(id=str(user_id), name="Alice"), ttl_remaining=60
+        )
+        inner.invalidate_tag.return_value = ("db:users:10:0",)
+        collector = await _collector()
+        cache = InstrumentedProfileCache(inner, collector)
+
+        await cache.get_profile(user_id)
+        await cache.put_values([("a:1", b"x"), ("b:1", b"y")], 60, ("t",))
+        assert await cache.invalidate_tag("db:users") == ("db:users:10:0",)
+
+        inner.put_values.assert_awaited_once_with([("a:1", b"x"), ("b:1", b"y")], 60, ("t",))
+        assert set(collector.histograms["effectful_cache_operation_duration_seconds"]) == {
+            "operation=get_profile,prefix=profile",
+            "operation=put_values,prefix=mixed",
+            "operation=invalidate_tag,prefix=db",
+        }
+        assert collector.counters["effectful_cache_hits_total"] == {"prefix=profile": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_failures_are_timed_and_reraised(self, mocker: MockerFixture) -> None:
+        """Exceptions from the wrapped cache propagate after latency is recorded."""
+        inner = mocker.AsyncMock(spec=ProfileCache)
+        inner.get_value.side_effect = ConnectionError("down")
+        collector = await _collector()
+        cache = InstrumentedProfileCache(inner, collector, key_prefix=lambda _: "all")
+
+        with pytest.raises(ConnectionError):
+            await cache.get_value("k")
+
+        assert list(collector.histograms["effectful_cache_operation_duration_seconds"]) == [
+            "operation=get_value,prefix=all"
+        ]
+        assert "effectful_cache_misses_total" not in collector.counters
@@ -0,0 +1,149 @@
+"""Unit tests for message codecs.
+
+Tests codec round-trips, schema tags, per-topic selection, and codecs applied
+by MessagingInterpreter over the in-memory broker.
+"""
+
+import json
+
+import pytest
+
+from effectful.adapters.in_memory_messaging import (
+    InMemoryBroker,
+    InMemoryMessageConsumer,
+    InMemoryMessageProducer,
+)
+from effectful.adapters.message_codecs import (
+    MAGIC,
+    MSGPACK_AVAILABLE,
+    JsonMessageCodec,
+    MsgpackMessageCodec,
+    SchemaTaggedCodec,
+    TopicCodecRegistry,
+    UnsupportedMessageFormat,
+)
+from effectful.algebraic.effect_return import EffectReturn
+from effectful.algebraic.result import Ok
+from effectful.domain.message_envelope import MessageEnvelope, MessageValue
+from effectful.domain.optional_value import Provided
+from effectful.effects.messaging import ConsumeMessage, PublishValue
+from effectful.interpreters.messaging import MessagingInterpreter
+
+_EVENT: MessageValue = {"user_id": 42, "tags": ["a", "b"], "score": 1.5, "active": True}
+
+
+class TestJsonMessageCodec:
+    """Tests for JsonMessageCodec."""
+
+    def test_round_trips_compactly(self) -> None:
+        """Values round-trip and are written without whitespace."""
+        codec = JsonMessageCodec()
+
+        encoded = codec.encode(_EVENT)
+
+        assert codec.decode(encoded) == _EVENT
+        assert len(encoded) < len(json.dumps(_EVENT))
+        assert codec.content_type == "application/json"
+
+    def test_invalid_payload_raises_value_error(self) -> None:
+        """Non-JSON payloads raise ValueError."""
+        with pytest.raises(ValueError):
+            JsonMessageCodec().decode(b"\xff not json")
+
+
+class TestMsgpackMessageCodec:
+    """Tests for MsgpackMessageCodec."""
+
+    @pytest.mark.skipif(not MSGPACK_AVAILABLE, reason="msgpack is not installed")
+    def test_round_trips_smaller_than_json(self) -> None:
+        """Values round-trip in fewer bytes than compact JSON."""
+        codec = MsgpackMessageCodec()
+
+        encoded = codec.encode(_EVENT)
+
+        assert codec.decode(encoded) == _EVENT
+        assert len(encoded) < len(JsonMessageCodec().encode(_EVENT))
+
+    @pytest.mark.skipif(MSGPACK_AVAILABLE, reason="msgpack is installed")
+    def test_requires_msgpack(self) -> None:
+        """Creating the codec without the library fails fast."""
+        with pytest.raises(ImportError, match="msgpack"):
+            MsgpackMessageCodec()
+
+
+class TestSchemaTaggedCodec:
+    """Tests for SchemaTaggedCodec."""
+
+    def test_round_trips_behind_schema_header(self) -> None:
+        """Payloads start with the magic byte and big-endian schema ID."""
+        codec = SchemaTaggedCodec(7, JsonMessageCodec())
+
+        encoded = codec.encode(_EVENT)
+
+        assert encoded[:5] == bytes([MAGIC, 0, 0, 0, 7])
+        assert codec.decode(encoded) == _EVENT
+        assert codec.content_type == "application/json; schema-id=7"
+
+    def test_other_schema_is_rejected(self) -> None:
+        """Payloads tagged with another schema ID, or untagged, are not decoded."""
+        codec = SchemaTaggedCodec(7, JsonMessageCodec())
+
+        with pytest.raises(UnsupportedMessageFormat, match="schema 7"):
+            codec.decode(SchemaTaggedCodec(8, JsonMessageCodec()).encode(_EVENT))
+        with pytest.raises(UnsupportedMessageFormat):
+            codec.decode(b"{}")
+
+    def test_rejects_out_of_range_schema_id(self) -> None:
+        """Schema IDs must fit in four unsigned bytes."""
+        with pytest.raises(ValueError, match="schema_id"):
+            SchemaTaggedCodec(2**32, JsonMessageCodec())
+
+
+class TestTopicCodecRegistry:
+    """Tests for TopicCodecRegistry."""
+
+    def test_selects_codec_per_topic_with_default(self) -> None:
+        """Topics use their own codec, falling back to the default."""
+        json_codec = JsonMessageCodec()
+        tagged = SchemaTaggedCodec(3, json_codec)
+        registry = TopicCodecRegistry({"audit": tagged}, default=json_codec)
+
+        assert registry.for_topic("audit") is tagged
+        assert registry.for_topic("other") is json_codec
+        assert TopicCodecRegistry({"audit": tagged}).for_topic("other") is None
+
+    def test_looks_up_decoders_by_content_type(self) -> None:
+        """Configured codecs and extra decoders are found by content type."""
+        old = SchemaTaggedCodec(1, JsonMessageCodec())
+        new = SchemaTaggedCodec(2, JsonMessageCodec())
+        registry = TopicCodecRegistry({"audit": new}, decoders=[old])
+
+        assert registry.for_content_type(old.content_type) is old
+        assert registry.for_content_type(new.content_type) is new
+        assert registry.for_content_type("text/plain") is None
+
+
+class TestCodecsThroughInterpreter:
+    """Tests for codecs applied by MessagingInterpreter on the in-memory broker."""
+
+    @pytest.mark.asyncio()
+    async def test_published_value_is_decoded_on_consume(self) -> None:
+        """PublishValue encodes once; ConsumeMessage decodes into the envelope value."""
+        broker = InMemoryBroker()
+        codec = SchemaTaggedCodec(7, JsonMessageCodec())
+        interpreter = MessagingInterpreter(
+            producer=InMemoryMessageProducer(broker),
+            consumer=InMemoryMessageConsumer(broker),
+            codecs=TopicCodecRegistry({"audit": codec}),
+        )
+
+        await interpreter.interpret(PublishValue(topic="audit", value=_EVENT))
+        result = await interpreter.interpret(ConsumeMessage(subscription="audit/sub"))
+
+        match result:
+            case Ok(EffectReturn(value=MessageEnvelope() as envelope)):
+                assert envelope.value == Provided(value=_EVENT)
+                assert envelope.content_type == codec.content_type
+                assert envelope.payload == codec.encode(_EVENT)
+            case _:
+                pytest.fail(f"Expected decoded MessageEnvelope, got {result}")
@@ -0,0 +1,69 @@
+"""Unit tests for the in-process negative cache.
+
+Tests InMemoryNegativeCache expiry, LRU bounds and forgetting, using an
+injected clock.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from effectful.adapters.negative_cache import InMemoryNegativeCache
+from effectful.domain.optional_value import Absent, Provided
+from effectful.domain.user import UserNotFound
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestInMemoryNegativeCache:
+    """Tests for InMemoryNegativeCache."""
+
+    @pytest.mark.asyncio
+    async def test_miss_is_remembered_until_ttl_passes(self) -> None:
+        """A stored miss is returned until ttl_seconds have elapsed."""
+        not_found = UserNotFound(user_id=uuid4(), reason="does_not_exist")
+        clock = _Clock()
+        cache: InMemoryNegativeCache[UserNotFound] = InMemoryNegativeCache(
+            ttl_seconds=10.0, clock=clock
+        )
+
+        await cache.put_miss("k", not_found)
+        clock.now += 9.9
+        remembered = await cache.get_miss("k")
+        clock.now += 0.1
+        expired = await cache.get_miss("k")
+
+        assert remembered == Provided(value=not_found)
+        assert expired == Absent(reason="expired")
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_forget_and_lru_eviction(self) -> None:
+        """forget drops a key, and the least recently used key is evicted first."""
+        cache: InMemoryNegativeCache[str] = InMemoryNegativeCache(max_entries=2)
+
+        await cache.put_miss("a", "miss-a")
+        await cache.put_miss("b", "miss-b")
+        await cache.get_miss("a")  # "a" becomes most recently used
+        await cache.put_miss("c", "miss-c")  # Evicts "b"
+        await cache.forget("a")
+
+        assert await cache.get_miss("a") == Absent(reason="not_cached")
+        assert await cache.get_miss("b") == Absent(reason="not_cached")
+        assert await cache.get_miss("c") == Provided(value="miss-c")
+
+
+def test_rejects_invalid_configuration() -> None:
+    """ttl_seconds and max_entries must be positive."""
+    with pytest.raises(ValueError, match="ttl_seconds"):
+        InMemoryNegativeCache[str](ttl_seconds=0)
+    with pytest.raises(ValueError, match="max_entries"):
+        InMemoryNegativeCache[str](max_entries=0)
@@ -12,11 +12,21 @@ from pytest_mock import MockerFixture
 import asyncpg
 
 from effectful.adapters.postgres import (
+    USERS_VERSION_MIGRATION,
     PostgresChatMessageRepository,
+    PostgresTransactionManager,
     PostgresUserRepository,
+    migrate_users_version,
 )
 from effectful.domain.message import ChatMessage
-from effectful.domain.user import UserFound, UserNotFound
+from effectful.domain.optional_value import Absent, Provided
+from effectful.domain.user import (
+    User,
+    UserEmailExists,
+    UserFound,
+    UserNotFound,
+    UserVersionConflict,
+)
 
 
 class TestPostgresUserRepository:
@@ -32,6 +42,7 @@ class TestPostgresUserRepository:
             "id": user_id,
             "email": "test@example.com",
             "name": "Test User",
+            "version": 1,
         }
         mock_conn.fetchrow.return_value = mock_row
 
@@ -50,7 +61,7 @@ class TestPostgresUserRepository:
         # Verify query
         mock_conn.fetchrow.assert_called_once()
         call_args = mock_conn.fetchrow.call_args
-        assert "SELECT id, email, name FROM users WHERE id = $1" in call_args.args[0]
+        assert "SELECT id, email, name, version FROM users WHERE id = $1" in call_args.args[0]
         assert call_args.args[1] == user_id
 
     @pytest.mark.asyncio
@@ -83,6 +94,7 @@ class TestPostgresUserRepository:
             "id": "not-a-uuid",  # Invalid type
             "email": "test@example.com",
             "name": "Test User",
+            "version": 1,
         }
         mock_conn.fetchrow.return_value = mock_row
 
@@ -102,6 +114,7 @@ class TestPostgresUserRepository:
             "id": user_id,
             "email": 123,  # Invalid type
             "name": "Test User",
+            "version": 1,
         }
         mock_conn.fetchrow.return_value = mock_row
 
@@ -121,6 +134,7 @@ class TestPostgresUserRepository:
             "id": user_id,
             "email": "test@example.com",
             "name": None,  # Invalid type
+            "version": 1,
         }
         mock_conn.fetchrow.return_value = mock_row
 
@@ -130,6 +144,135 @@ class TestPostgresUserRepository:
         with pytest.raises(RuntimeError, match="Invalid row name type"):
             await repo.get_by_id(user_id)
 
+    @pytest.mark.asyncio
+    async def test_upsert_user_uses_on_conflict(self, mocker: MockerFixture) -> None:
+        """Test upsert runs a single INSERT ... ON CONFLICT DO NOTHING statement."""
+        # Setup
+        user_id = uuid4()
+        mock_conn = mocker.AsyncMock(spec=asyncpg.Connection)
+        mock_conn.fetchrow.return_value = {
+            "id": user_id,
+            "email": "test@example.com",
+            "name": "Test",
+            "version": 1,
+            "created": True,
+        }
+        repo = PostgresUserRepository(mock_conn)
+
+        # Execute
+        user = await repo.upsert_user("test@example.com", "Test", "hash")
+
+        # Assert
+        assert user == User(id=user_id, email="test@example.com", name="Test")
+        mock_conn.fetchrow.assert_called_once()
+        query = mock_conn.fetchrow.call_args.args[0]
+        assert "ON CONFLICT (email) DO NOTHING" in query
+        assert "password_hash =" not in query
+
+    @pytest.mark.asyncio
+    async def test_upsert_user_reports_existing_email(self, mocker: MockerFixture) -> None:
+        """Test a taken email returns the stored user instead of overwriting it."""
+        # Setup
+        existing = User(id=uuid4(), email="test@example.com", name="Owner", version=3)
+        mock_conn = mocker.AsyncMock(spec=asyncpg.Connection)
+        mock_conn.fetchrow.return_value = {
+            "id": existing.id,
+            "email": existing.email,
+            "name": existing.name,
+            "version": existing.version,
+            "created": False,
+        }
+        repo = PostgresUserRepository(mock_conn)
+
+        # Execute
+        result = await repo.upsert_user("test@example.com", "Mallory", "hash")
+
+        # Assert
+        assert result == UserEmailExists(email="test@example.com", current=existing)
+
+    @pytest.mark.asyncio
+    async def test_upsert_user_rereads_row_committed_after_snapshot(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test a conflict with a concurrent insert falls back to reading by email."""
+        # Setup
+        existing = User(id=uuid4(), email="test@example.com", name="Owner")
+        mock_conn = mocker.AsyncMock(spec=asyncpg.Connection)
+        mock_conn.fetchrow.side_effect = [
+            None,
+            {"id": existing.id, "email": existing.email, "name": "Owner", "version": 1},
+        ]
+        repo = PostgresUserRepository(mock_conn)
+
+        # Execute
+        result = await repo.upsert_user("test@example.com", "Mallory", "hash")
+
+        # Assert
+        assert result == UserEmailExists(email="test@example.com", current=existing)
+        assert mock_conn.fetchrow.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_update_user_if_applied(self, mocker: MockerFixture) -> None:
+        """Test a matching version returns the updated user from one statement."""
+        # Setup
+        user_id = uuid4()
+        mock_conn = mocker.AsyncMock(spec=asyncpg.Connection)
+        mock_conn.fetchrow.return_value = {
+            "id": user_id,
+            "email": "test@example.com",
+            "name": "New Name",
+            "version": 4,
+            "applied": True,
+        }
+        repo = PostgresUserRepository(mock_conn)
+
+        # Execute
+        result = await repo.update_user_if(user_id, 3, Absent(), Provided(value="New Name"))
+
+        # Assert
+        assert isinstance(result, UserFound)
+        assert result.user.version == 4
+        call_args = mock_conn.fetchrow.call_args
+        assert "WHERE id = $2 AND version = $3" in call_args.args[0]
+        assert call_args.args[1:] == ("New Name", user_id, 3)
+
+    @pytest.mark.asyncio
+    async def test_update_user_if_returns_conflict_with_current_user(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test a stale version returns UserVersionConflict with the current row."""
+        # Setup
+        user_id = uuid4()
+        mock_conn = mocker.AsyncMock(spec=asyncpg.Connection)
+        mock_conn.fetchrow.return_value = {
+            "id": user_id,
+            "email": "test@example.com",
+            "name": "Someone Else's Edit",
+            "version": 5,
+            "applied": False,
+        }
+        repo = PostgresUserRepository(mock_conn)
+
+        # Execute
+        result = await repo.update_user_if(user_id, 3, Absent(), Provided(value="Mine"))
+
+        # Assert
+        assert isinstance(result, UserVersionConflict)
+        assert result.expected_version == 3
+        assert result.current.version == 5
+
+    @pytest.mark.asyncio
+    async def test_update_user_if_returns_not_found(self, mocker: MockerFixture) -> None:
+        """Test a missing user returns UserNotFound."""
+        user_id = uuid4()
+        mock_conn = mocker.AsyncMock(spec=asyncpg.Connection)
+        mock_conn.fetchrow.return_value = None
+        repo = PostgresUserRepository(mock_conn)
+
+        result = await repo.update_user_if(user_id, 1, Absent(), Absent())
+
+        assert result == UserNotFound(user_id=user_id, reason="does_not_exist")
+
 
 class TestPostgresChatMessageRepository:
     """Tests for PostgresChatMessageRepository."""
@@ -301,3 +444,185 @@ class TestPostgresChatMessageRepository:
         assert len(result) == 1
         assert result[0].id == msg_id
         assert result[0].text == "Good message"
+
+    @pytest.mark.asyncio
+    async def test_save_messages_inserts_batch_in_one_statement(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test batch save issues one unnest INSERT and preserves input order."""
+        # Setup
+        user_id = uuid4()
+        created_at = datetime.now(UTC)
+        mock_conn = mocker.AsyncMock(spec=asyncpg.Connection)
+
+        async def fake_fetch(
+            query: str, ids: list[object], *args: object
+        ) -> list[dict[str, object]]:
+            # Return rows in reverse order to exercise realignment
+            return [
+                {"id": message_id, "user_id": user_id, "text": f"m{i}", "created_at": created_at}
+                for i, message_id in reversed(list(enumerate(ids)))
+            ]
+
+        mock_conn.fetch.side_effect = fake_fetch
+        repo = PostgresChatMessageRepository(mock_conn)
+
+        # Execute
+        result = await repo.save_messages(
+            [(user_id, "m0", created_at), (user_id, "m1", created_at), (user_id, "m2", created_at)]
+        )
+
+        # Assert
+        assert [message.text for message in result] == ["m0", "m1", "m2"]
+        mock_conn.fetch.assert_called_once()
+        call_args = mock_conn.fetch.call_args
+        assert "unnest" in call_args.args[0]
+        assert call_args.args[3] == ["m0", "m1", "m2"]
+
+    @pytest.mark.asyncio
+    async def test_save_messages_empty_batch_skips_query(self, mocker: MockerFixture) -> None:
+        """Test empty batch returns [] without touching the connection."""
+        mock_conn = mocker.AsyncMock(spec=asyncpg.Connection)
+        repo = PostgresChatMessageRepository(mock_conn)
+
+        assert await repo.save_messages([]) == []
+        mock_conn.fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_messages_raises_on_missing_rows(self, mocker: MockerFixture) -> None:
+        """Test that fewer RETURNING rows than inputs raises RuntimeError."""
+        mock_conn = mocker.AsyncMock(spec=asyncpg.Connection)
+        mock_conn.fetch.return_value = []
+        repo = PostgresChatMessageRepository(mock_conn)
+
+        with pytest.raises(RuntimeError, match="returned 0 rows for 1 messages"):
+            await repo.save_messages([(uuid4(), "Hello", datetime.now(UTC))])
+
+
+class TestPostgresTransactionManager:
+    """Tests for PostgresTransactionManager."""
+
+    @pytest.mark.asyncio
+    async def test_begin_starts_transaction_on_pooled_connection(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test begin() acquires a connection and binds repositories to its transaction."""
+        # Setup
+        user_id = uuid4()
+        mock_conn = mocker.AsyncMock(spec=asyncpg.Connection)
+        mock_tx = mocker.AsyncMock()
+        mock_conn.transaction = mocker.MagicMock(return_value=mock_tx)
+        mock_conn.fetchrow.return_value = {
+            "id": user_id,
+            "email": "test@example.com",
+            "name": "Test User",
+            "version": 1,
+        }
+        mock_pool = mocker.AsyncMock(spec=asyncpg.Pool)
+        mock_pool.acquire = mocker.AsyncMock(return_value=mock_conn)
+
+        manager = PostgresTransactionManager(mock_pool)
+
+        # Execute
+        unit_of_work = await manager.begin()
+        result = await unit_of_work.user_repo.get_by_id(user_id)
+
+        # Assert - transaction started, repository queries share the connection
+        mock_tx.start.assert_awaited_once()
+        assert isinstance(result, UserFound)
+        mock_conn.fetchrow.assert_called_once()
+        assert isinstance(unit_of_work.message_repo, PostgresChatMessageRepository)
+        mock_pool.release.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_commit_and_rollback_release_connection(self, mocker: MockerFixture) -> None:
+        """Test commit() and rollback() finish the transaction and return its connection."""
+        # Setup
+        first_conn = mocker.AsyncMock(spec=asyncpg.Connection)
+        committed_tx = mocker.AsyncMock()
+        first_conn.transaction = mocker.MagicMock(return_value=committed_tx)
+        second_conn = mocker.AsyncMock(spec=asyncpg.Connection)
+        rolled_back_tx = mocker.AsyncMock()
+        rolled_back_tx.rollback.side_effect = ConnectionError("connection reset")
+        second_conn.transaction = mocker.MagicMock(return_value=rolled_back_tx)
+        mock_pool = mocker.AsyncMock(spec=asyncpg.Pool)
+        mock_pool.acquire = mocker.AsyncMock(side_effect=[first_conn, second_conn])
+
+        manager = PostgresTransactionManager(mock_pool)
+
+        # Execute - concurrent transactions get their own connections
+        first = await manager.begin()
+        second = await manager.begin()
+        await first.commit()
+        with pytest.raises(ConnectionError):
+            await second.rollback()
+
+        # Assert
+        committed_tx.commit.assert_awaited_once()
+        committed_tx.rollback.assert_not_awaited()
+        rolled_back_tx.commit.assert_not_awaited()
+        assert mock_pool.release.await_args_list == [
+            mocker.call(first_conn),
+            mocker.call(second_conn),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_first_begin_migrates_schema_once(self, mocker: MockerFixture) -> None:
+        """Test the users.version migration runs on the first transaction only."""
+        # Setup
+        mock_conn = mocker.AsyncMock(spec=asyncpg.Connection)
+        mock_conn.transaction = mocker.MagicMock(return_value=mocker.AsyncMock())
+        mock_pool = mocker.AsyncMock(spec=asyncpg.Pool)
+        mock_pool.acquire = mocker.AsyncMock(return_value=mock_conn)
+
+        # Execute
+        await PostgresTransactionManager(mock_pool).begin()
+        migrating = PostgresTransactionManager(mock_pool)
+        await migrating.begin()
+        await migrating.begin()
+        await PostgresTransactionManager(mock_pool, migrate_schema=False).begin()
+
+        # Assert - one run per migrating manager
+        assert mock_conn.execute.await_args_list == [
+            mocker.call(USERS_VERSION_MIGRATION),
+            mocker.call(USERS_VERSION_MIGRATION),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_nested_begin_uses_savepoint_on_same_connection(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test a unit of work nests savepoints on its connection without releasing it."""
+        # Setup
+        mock_conn = mocker.AsyncMock(spec=asyncpg.Connection)
+        outer_tx = mocker.AsyncMock()
+        savepoint = mocker.AsyncMock()
+        mock_conn.transaction = mocker.MagicMock(side_effect=[outer_tx, savepoint])
+        mock_pool = mocker.AsyncMock(spec=asyncpg.Pool)
+        mock_pool.acquire = mocker.AsyncMock(return_value=mock_conn)
+
+        manager = PostgresTransactionManager(mock_pool)
+
+        # Execute
+        outer = await manager.begin()
+        nested = await outer.begin()
+        await nested.rollback()
+
+        # Assert - only the outer transaction gives the connection back
+        savepoint.start.assert_awaited_once()
+        savepoint.rollback.assert_awaited_once()
+        mock_pool.release.assert_not_awaited()
+        await outer.commit()
+        mock_pool.release.assert_awaited_once_with(mock_conn)
+        mock_pool.acquire.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_migrate_users_version_adds_column_idempotently(mocker: MockerFixture) -> None:
+    """Test the migration adds users.version with a default so old rows stay readable."""
+    mock_conn = mocker.AsyncMock(spec=asyncpg.Connection)
+
+    await migrate_users_version(mock_conn)
+
+    mock_conn.execute.assert_awaited_once_with(USERS_VERSION_MIGRATION)
+    assert "ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1" in USERS_VERSION_MIGRATION
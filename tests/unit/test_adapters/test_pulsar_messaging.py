@@ -3,15 +3,23 @@
 Tests PulsarMessageProducer and PulsarMessageConsumer using pytest-mock.
 """
 
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from unittest.mock import MagicMock
 
 import pulsar  # Only for InitialPosition constants, not infrastructure
 import pytest
 from pytest_mock import MockerFixture
 
+from effectful.adapters.in_memory_metrics import InMemoryMetricsCollector
 from effectful.adapters.pulsar_messaging import (
     PulsarMessageConsumer,
     PulsarMessageProducer,
+    PulsarProducerConfig,
 )
 from effectful.domain.message_envelope import (
     AcknowledgeFailure,
@@ -23,11 +31,32 @@ from effectful.domain.message_envelope import (
     PublishFailure,
     PublishSuccess,
 )
+from effectful.observability.framework_metrics import FRAMEWORK_METRICS
+
+
+def _ack_immediately(
+    msg_id: object,
+) -> Callable[[bytes, Callable[[pulsar.Result, object], None], dict[str, str] | None], None]:
+    """send_async side effect that reports a broker receipt right away."""
+
+    def send_async(
+        content: bytes,
+        callback: Callable[[pulsar.Result, object], None],
+        properties: dict[str, str] | None = None,
+    ) -> None:
+        callback(pulsar.Result.Ok, msg_id)
+
+    return send_async
 
 
 class TestPulsarMessageProducer:
     """Tests for PulsarMessageProducer."""
 
+    @pytest.fixture(autouse=True)
+    def _send_timeout(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Provide the send timeout the container images set."""
+        monkeypatch.setenv("PULSAR_SEND_TIMEOUT_MS", "5000")
+
     @pytest.mark.asyncio
     async def test_publish_returns_success_with_message_id(self, mocker: MockerFixture) -> None:
         """Test successful publish returns PublishSuccess."""
@@ -40,7 +69,7 @@ class TestPulsarMessageProducer:
         mock_msg_id.__str__ = mocker.MagicMock(return_value="msg-123")
 
         mock_producer = mocker.MagicMock()
-        mock_producer.send.return_value = mock_msg_id
+        mock_producer.send_async.side_effect = _ack_immediately(mock_msg_id)
 
         mock_client = mocker.MagicMock()
         mock_client.create_producer.return_value = mock_producer
@@ -55,9 +84,10 @@ class TestPulsarMessageProducer:
         assert result.topic == topic
         assert "msg-123" in result.message_id
 
-        # Verify calls
+        # Verify calls - the blocking send is never used
         mock_client.create_producer.assert_called_once_with(topic, send_timeout_millis=5000)
-        mock_producer.send.assert_called_once_with(payload, properties=properties)
+        mock_producer.send_async.assert_called_once_with(payload, mocker.ANY, properties=properties)
+        mock_producer.send.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_publish_reuses_producer_for_same_topic(self, mocker: MockerFixture) -> None:
@@ -65,7 +95,7 @@ class TestPulsarMessageProducer:
         # Setup
         mock_msg_id = mocker.MagicMock()
         mock_producer = mocker.MagicMock()
-        mock_producer.send.return_value = mock_msg_id
+        mock_producer.send_async.side_effect = _ack_immediately(mock_msg_id)
 
         mock_client = mocker.MagicMock()
         mock_client.create_producer.return_value = mock_producer
@@ -78,14 +108,14 @@ class TestPulsarMessageProducer:
 
         # Assert - producer created only once
         mock_client.create_producer.assert_called_once()
-        assert mock_producer.send.call_count == 2
+        assert mock_producer.send_async.call_count == 2
 
     @pytest.mark.asyncio
     async def test_publish_returns_failure_for_timeout(self, mocker: MockerFixture) -> None:
         """Test publish timeout returns PublishFailure."""
         # Setup
         mock_producer = mocker.MagicMock()
-        mock_producer.send.side_effect = TimeoutError("Timeout")
+        mock_producer.send_async.side_effect = TimeoutError("Timeout")
 
         mock_client = mocker.MagicMock()
         mock_client.create_producer.return_value = mock_producer
@@ -105,7 +135,7 @@ class TestPulsarMessageProducer:
         """Test publish with full queue returns PublishFailure."""
         # Setup
         mock_producer = mocker.MagicMock()
-        mock_producer.send.side_effect = RuntimeError("Queue full")
+        mock_producer.send_async.side_effect = RuntimeError("Queue full")
 
         mock_client = mocker.MagicMock()
         mock_client.create_producer.return_value = mock_producer
@@ -123,22 +153,192 @@ class TestPulsarMessageProducer:
     async def test_publish_returns_failure_for_other_exceptions(
         self, mocker: MockerFixture
     ) -> None:
-        """Test other exceptions return topic_not_found failure."""
+        """Test unknown exceptions return a retryable connection_closed failure."""
         # Setup
         mock_producer = mocker.MagicMock()
-        mock_producer.send.side_effect = RuntimeError("Unknown error")
+        mock_producer.send_async.side_effect = [
+            RuntimeError("Unknown error"),
+            RuntimeError("Topic not found"),
+        ]
 
         mock_client = mocker.MagicMock()
-        mock_client.create_producer.return_value = mock_producer
+        mock_client.create_producer.side_effect = [
+            RuntimeError("Unexpected internal error"),
+            mock_producer,
+        ]
 
         producer = PulsarMessageProducer(mock_client)
 
         # Execute
-        result = await producer.publish("topic", b"payload", None)
+        results = [await producer.publish("topic", b"payload", None) for _ in range(3)]
 
         # Assert
-        assert isinstance(result, PublishFailure)
-        assert result.reason == "topic_not_found"
+        assert results == [
+            PublishFailure(topic="topic", reason="connection_closed"),
+            PublishFailure(topic="topic", reason="connection_closed"),
+            PublishFailure(topic="topic", reason="topic_not_found"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_publish_maps_failed_receipt_to_reason(self, mocker: MockerFixture) -> None:
+        """A non-Ok result code in the send callback becomes a PublishFailure."""
+        mock_producer = mocker.MagicMock()
+        mock_producer.send_async.side_effect = lambda content, callback, properties: callback(
+            pulsar.Result.MessageTooBig, None
+        )
+        mock_client = mocker.MagicMock()
+        mock_client.create_producer.return_value = mock_producer
+
+        result = await PulsarMessageProducer(mock_client).publish("topic", b"payload")
+
+        assert result == PublishFailure(topic="topic", reason="message_too_large")
+
+    @pytest.mark.asyncio
+    async def test_publish_reports_unmapped_receipt_as_connection_closed(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Result codes without a specific reason are not reported as topic errors."""
+        mock_producer = mocker.MagicMock()
+        mock_producer.send_async.side_effect = lambda content, callback, properties: callback(
+            pulsar.Result.UnknownError, None
+        )
+        mock_client = mocker.MagicMock()
+        mock_client.create_producer.return_value = mock_producer
+
+        result = await PulsarMessageProducer(mock_client).publish("topic", b"payload")
+
+        assert result == PublishFailure(topic="topic", reason="connection_closed")
+
+    @pytest.mark.asyncio
+    async def test_publishes_overlap_up_to_in_flight_limit(self, mocker: MockerFixture) -> None:
+        """Receipts arrive from another thread; only max_in_flight sends are outstanding."""
+        pending: list[Callable[[pulsar.Result, object], None]] = []
+        mock_producer = mocker.MagicMock()
+        mock_producer.send_async.side_effect = lambda content, callback, properties: (
+            pending.append(callback)
+        )
+        mock_client = mocker.MagicMock()
+        mock_client.create_producer.return_value = mock_producer
+        producer = PulsarMessageProducer(mock_client, max_in_flight=2)
+
+        publishes = [
+            asyncio.create_task(producer.publish("topic", f"m{i}".encode())) for i in range(3)
+        ]
+        await asyncio.sleep(0.01)  # Producer creation runs on the executor
+        assert len(pending) == 2
+
+        io_threads = [
+            threading.Thread(target=pending.pop(0), args=(pulsar.Result.Ok, "id")) for _ in range(2)
+        ]
+        for thread in io_threads:
+            thread.start()
+            thread.join()
+        await asyncio.sleep(0.01)
+        assert len(pending) == 1
+
+        pending.pop(0)(pulsar.Result.Ok, "id")
+        results = await asyncio.gather(*publishes)
+
+        assert results == [PublishSuccess(message_id="id", topic="topic")] * 3
+
+    @pytest.mark.asyncio
+    async def test_publish_records_latency_and_in_flight(self, mocker: MockerFixture) -> None:
+        """Latency is labelled by outcome and the in-flight gauge returns to zero."""
+        mock_producer = mocker.MagicMock()
+        mock_producer.send_async.side_effect = _ack_immediately("id")
+        mock_client = mocker.MagicMock()
+        mock_client.create_producer.return_value = mock_producer
+        collector = InMemoryMetricsCollector()
+        await collector.register_metrics(FRAMEWORK_METRICS)
+        producer = PulsarMessageProducer(mock_client, metrics_collector=collector)
+
+        await producer.publish("topic", b"payload")
+
+        assert list(collector.histograms["effectful_pulsar_publish_duration_seconds"]) == [
+            "result=ok,topic=topic"
+        ]
+        assert collector.gauges["effectful_pulsar_publishes_in_flight"] == {"topic=topic": 0.0}
+
+    @pytest.mark.asyncio
+    async def test_publish_many_sends_all_before_awaiting_receipts(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Every payload is handed to send_async in order; results align with payloads."""
+        pending: list[Callable[[pulsar.Result, object], None]] = []
+        mock_producer = mocker.MagicMock()
+        mock_producer.send_async.side_effect = lambda content, callback, properties: (
+            pending.append(callback)
+        )
+        mock_client = mocker.MagicMock()
+        mock_client.create_producer.return_value = mock_producer
+        producer = PulsarMessageProducer(mock_client)
+
+        publishing = asyncio.create_task(
+            producer.publish_many("topic", [b"a", b"b", b"c"], {"k": "v"})
+        )
+        await asyncio.sleep(0.01)
+        assert len(pending) == 3
+        sent = [call.args[0] for call in mock_producer.send_async.call_args_list]
+        for callback, code in zip(
+            pending, (pulsar.Result.Ok, pulsar.Result.ProducerQueueIsFull, pulsar.Result.Ok)
+        ):
+            callback(code, "id")
+        results = await publishing
+
+        assert sent == [b"a", b"b", b"c"]
+        assert results == (
+            PublishSuccess(message_id="id", topic="topic"),
+            PublishFailure(topic="topic", reason="quota_exceeded"),
+            PublishSuccess(message_id="id", topic="topic"),
+        )
+        mock_client.create_producer.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_publish_converts_buffer_payloads_to_bytes(self, mocker: MockerFixture) -> None:
+        """The client only accepts bytes; bytes are passed through, other buffers copied."""
+        mock_producer = mocker.MagicMock()
+        mock_producer.send_async.side_effect = _ack_immediately("id")
+        mock_client = mocker.MagicMock()
+        mock_client.create_producer.return_value = mock_producer
+        producer = PulsarMessageProducer(mock_client)
+        payload = b"header|body"
+
+        await producer.publish_many("topic", [payload, memoryview(payload)[7:]])
+
+        sent = [call.args[0] for call in mock_producer.send_async.call_args_list]
+        assert sent[0] is payload
+        assert type(sent[1]) is bytes and sent[1] == b"body"
+
+    @pytest.mark.asyncio
+    async def test_producer_config_sets_batching_and_compression(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Producers are created with the configured batching and compression settings."""
+        mock_producer = mocker.MagicMock()
+        mock_producer.send_async.side_effect = _ack_immediately("id")
+        mock_client = mocker.MagicMock()
+        mock_client.create_producer.return_value = mock_producer
+        config = PulsarProducerConfig(
+            batching_max_messages=500, batching_max_delay_ms=5, compression="zstd"
+        )
+
+        await PulsarMessageProducer(mock_client, producer_config=config).publish("topic", b"x")
+
+        mock_client.create_producer.assert_called_once_with(
+            "topic",
+            send_timeout_millis=5000,
+            compression_type=pulsar.CompressionType.ZSTD,
+            max_pending_messages=1000,
+            batching_enabled=True,
+            batching_max_messages=500,
+            batching_max_allowed_size_in_bytes=128 * 1024,
+            batching_max_publish_delay_ms=5,
+        )
+
+    def test_rejects_non_positive_in_flight_limit(self, mocker: MockerFixture) -> None:
+        """max_in_flight must be at least 1."""
+        with pytest.raises(ValueError, match="max_in_flight"):
+            PulsarMessageProducer(mocker.MagicMock(), max_in_flight=0)
 
 
 class TestPulsarMessageConsumer:
@@ -365,3 +565,597 @@ class TestPulsarMessageConsumer:
             subscription_name="simple-subscription",
             initial_position=pulsar.InitialPosition.Earliest,
         )
+
+
+def _pulsar_message(mocker: MockerFixture, msg_id: str) -> MagicMock:
+    """Mock Pulsar message with the given ID."""
+    mock_msg: MagicMock = mocker.MagicMock()
+    mock_msg.message_id.return_value.__str__ = mocker.MagicMock(return_value=msg_id)
+    mock_msg.data.return_value = msg_id.encode()
+    mock_msg.properties.return_value = {}
+    mock_msg.publish_timestamp.return_value = 0
+    mock_msg.topic_name.return_value = "events"
+    return mock_msg
+
+
+class TestPulsarMessageConsumerBatches:
+    """Tests for PulsarMessageConsumer batch receive and batch acknowledgement."""
+
+    @pytest.mark.asyncio
+    async def test_receive_batch_uses_batch_policy_and_keeps_surplus(
+        self, mocker: MockerFixture
+    ) -> None:
+        """The first batch sets the receive policy; extra messages are served next."""
+        mock_consumer = mocker.MagicMock()
+        mock_consumer.batch_receive.return_value = [
+            _pulsar_message(mocker, f"m{i}") for i in range(3)
+        ]
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.return_value = mock_consumer
+        policy = mocker.patch("pulsar.ConsumerBatchReceivePolicy")
+        consumer = PulsarMessageConsumer(mock_client)
+
+        first = await consumer.receive_batch("events/worker", max_messages=2, max_wait_ms=50)
+        second = await consumer.receive_batch("events/worker", max_messages=2, max_wait_ms=50)
+
+        assert isinstance(first, tuple) and isinstance(second, tuple)
+        assert [e.message_id for e in first] == ["m0", "m1"]
+        assert [e.message_id for e in second] == ["m2"]
+        policy.assert_called_once_with(2, -1, 50)
+        mock_client.subscribe.assert_called_once_with(
+            topic="events",
+            subscription_name="worker",
+            initial_position=pulsar.InitialPosition.Earliest,
+            batch_receive_policy=policy.return_value,
+        )
+        mock_consumer.batch_receive.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_receive_batch_resubscribes_idle_consumer_with_new_policy(
+        self, mocker: MockerFixture
+    ) -> None:
+        """A consumer created by receive, or with other batch limits, is replaced when unused."""
+        first, second, third = mocker.MagicMock(), mocker.MagicMock(), mocker.MagicMock()
+        first.receive.return_value = _pulsar_message(mocker, "m0")
+        second.batch_receive.return_value = [_pulsar_message(mocker, "m1")]
+        third.batch_receive.return_value = [_pulsar_message(mocker, "m2")]
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.side_effect = [first, second, third]
+        policy = mocker.patch("pulsar.ConsumerBatchReceivePolicy")
+        consumer = PulsarMessageConsumer(mock_client)
+
+        await consumer.receive("events/worker", timeout_ms=100)
+        await consumer.acknowledge("m0")
+        await consumer.receive_batch("events/worker", max_messages=5, max_wait_ms=50)
+        await consumer.receive_batch("events/worker", max_messages=5, max_wait_ms=50)
+        await consumer.acknowledge("m1")
+        await consumer.receive_batch("events/worker", max_messages=10, max_wait_ms=20)
+
+        assert policy.call_args_list == [mocker.call(5, -1, 50), mocker.call(10, -1, 20)]
+        assert mock_client.subscribe.call_count == 3
+        first.close.assert_called_once()
+        second.close.assert_called_once()
+        assert second.batch_receive.call_count == 2
+        third.batch_receive.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_receive_batch_keeps_consumer_with_unacked_messages(
+        self, mocker: MockerFixture
+    ) -> None:
+        """A consumer with messages awaiting ack keeps its policy instead of resubscribing."""
+        mock_consumer = mocker.MagicMock()
+        mock_consumer.receive.return_value = _pulsar_message(mocker, "m0")
+        mock_consumer.batch_receive.return_value = [_pulsar_message(mocker, "m1")]
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.return_value = mock_consumer
+        consumer = PulsarMessageConsumer(mock_client)
+
+        await consumer.receive("events/worker", timeout_ms=100)
+        result = await consumer.receive_batch("events/worker", max_messages=5, max_wait_ms=50)
+
+        assert isinstance(result, tuple)
+        assert [e.message_id for e in result] == ["m1"]
+        mock_client.subscribe.assert_called_once()
+        mock_consumer.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_receive_batch_waits_only_the_rest_of_max_wait_after_slot_wait(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Time spent waiting for a slot is taken off the batch wait; late messages are kept."""
+        release = threading.Event()
+
+        def slow_batch() -> list[pulsar.Message]:
+            release.wait(timeout=1)
+            return [_pulsar_message(mocker, "m1")]
+
+        mock_consumer = mocker.MagicMock()
+        mock_consumer.receive.return_value = _pulsar_message(mocker, "m0")
+        mock_consumer.batch_receive.side_effect = slow_batch
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.return_value = mock_consumer
+        consumer = PulsarMessageConsumer(mock_client, max_unacked=1)
+        await consumer.receive("events/worker", timeout_ms=100)
+
+        waiting = asyncio.create_task(
+            consumer.receive_batch("events/worker", max_messages=5, max_wait_ms=100)
+        )
+        await asyncio.sleep(0.06)
+        await consumer.acknowledge("m0")
+        started = time.monotonic()
+        result = await waiting
+        elapsed = time.monotonic() - started
+        release.set()
+        await asyncio.sleep(0.01)
+
+        assert result == ()
+        assert elapsed < 0.08
+        late = await consumer.receive("events/worker", timeout_ms=10)
+        assert isinstance(late, MessageEnvelope)
+        assert late.message_id == "m1"
+
+    @pytest.mark.asyncio
+    async def test_receive_batch_returns_empty_tuple_when_nothing_arrives(
+        self, mocker: MockerFixture
+    ) -> None:
+        """An empty batch is a normal outcome, not a failure."""
+        mock_consumer = mocker.MagicMock()
+        mock_consumer.batch_receive.return_value = []
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.return_value = mock_consumer
+
+        result = await PulsarMessageConsumer(mock_client).receive_batch("events/worker", 10, 10)
+
+        assert result == ()
+
+    @pytest.mark.asyncio
+    async def test_acknowledge_batch_cumulative_acks_last_message_once(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Cumulative acknowledgement acks only the last ID and reports every ID."""
+        messages = [_pulsar_message(mocker, f"m{i}") for i in range(3)]
+        mock_consumer = mocker.MagicMock()
+        mock_consumer.batch_receive.return_value = messages
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.return_value = mock_consumer
+        consumer = PulsarMessageConsumer(mock_client)
+        await consumer.receive_batch("events/worker", max_messages=3, max_wait_ms=50)
+
+        results = await consumer.acknowledge_batch(["m0", "m1", "m2"], cumulative=True)
+
+        assert results == tuple(AcknowledgeSuccess(message_id=f"m{i}") for i in range(3))
+        mock_consumer.acknowledge_cumulative.assert_called_once_with(messages[2])
+        mock_consumer.acknowledge.assert_not_called()
+        assert await consumer.acknowledge("m0") == AcknowledgeFailure(
+            message_id="m0", reason="message_not_found"
+        )
+
+    @pytest.mark.asyncio
+    async def test_acknowledge_batch_cumulative_releases_earlier_unlisted_messages(
+        self, mocker: MockerFixture
+    ) -> None:
+        """A cumulative ack of the last message stops tracking every earlier one."""
+        mock_consumer = mocker.MagicMock()
+        mock_consumer.batch_receive.return_value = [
+            _pulsar_message(mocker, f"m{i}") for i in range(3)
+        ]
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.return_value = mock_consumer
+        consumer = PulsarMessageConsumer(mock_client)
+        await consumer.receive_batch("events/worker", max_messages=3, max_wait_ms=50)
+
+        results = await consumer.acknowledge_batch(["m2"], cumulative=True)
+
+        assert results == (AcknowledgeSuccess(message_id="m2"),)
+        assert consumer._unacked == {}
+        assert not consumer._is_busy("events/worker")
+
+    @pytest.mark.asyncio
+    async def test_acknowledge_batch_cumulative_fails_ids_of_other_subscriptions(
+        self, mocker: MockerFixture
+    ) -> None:
+        """IDs from another subscription are not covered and stay tracked."""
+        orders, payments = mocker.MagicMock(), mocker.MagicMock()
+        orders.receive.return_value = _pulsar_message(mocker, "o1")
+        payments.receive.return_value = _pulsar_message(mocker, "p1")
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.side_effect = [orders, payments]
+        consumer = PulsarMessageConsumer(mock_client)
+        await consumer.receive("orders/worker", timeout_ms=100)
+        await consumer.receive("payments/worker", timeout_ms=100)
+
+        results = await consumer.acknowledge_batch(["o1", "p1"], cumulative=True)
+
+        assert results == (
+            AcknowledgeFailure(message_id="o1", reason="message_not_found"),
+            AcknowledgeSuccess(message_id="p1"),
+        )
+        payments.acknowledge_cumulative.assert_called_once_with(payments.receive.return_value)
+        orders.acknowledge_cumulative.assert_not_called()
+        assert list(consumer._unacked) == ["o1"]
+
+    @pytest.mark.asyncio
+    async def test_acknowledge_batch_individual_results_align(self, mocker: MockerFixture) -> None:
+        """Non-cumulative acknowledgement reports each ID separately."""
+        mock_consumer = mocker.MagicMock()
+        mock_consumer.batch_receive.return_value = [_pulsar_message(mocker, "m0")]
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.return_value = mock_consumer
+        consumer = PulsarMessageConsumer(mock_client)
+        await consumer.receive_batch("events/worker", max_messages=1, max_wait_ms=50)
+
+        results = await consumer.acknowledge_batch(["m0", "unknown"])
+
+        assert results == (
+            AcknowledgeSuccess(message_id="m0"),
+            AcknowledgeFailure(message_id="unknown", reason="message_not_found"),
+        )
+
+
+class TestPulsarMessageConsumerTracking:
+    """Tests for PulsarMessageConsumer unacked-message tracking."""
+
+    @pytest.mark.asyncio
+    async def test_ack_and_nack_use_owning_consumer(self, mocker: MockerFixture) -> None:
+        """Messages are acked/nacked on the consumer of the subscription they came from."""
+        orders, payments = mocker.MagicMock(), mocker.MagicMock()
+        orders.receive.return_value = _pulsar_message(mocker, "o1")
+        payments.receive.return_value = _pulsar_message(mocker, "p1")
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.side_effect = [orders, payments]
+        consumer = PulsarMessageConsumer(mock_client)
+        await consumer.receive("orders/worker", timeout_ms=100)
+        await consumer.receive("payments/worker", timeout_ms=100)
+
+        assert await consumer.acknowledge("p1") == AcknowledgeSuccess(message_id="p1")
+        assert await consumer.negative_acknowledge("o1") == NackSuccess(message_id="o1")
+        payments.acknowledge.assert_called_once_with(payments.receive.return_value)
+        orders.negative_acknowledge.assert_called_once_with(orders.receive.return_value)
+        orders.acknowledge.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_receive_waits_for_ack_when_limit_reached(self, mocker: MockerFixture) -> None:
+        """With max_unacked messages outstanding, receive waits for an ack to free a slot."""
+        mock_consumer = mocker.MagicMock()
+        mock_consumer.receive.side_effect = [
+            _pulsar_message(mocker, "m0"),
+            _pulsar_message(mocker, "m1"),
+        ]
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.return_value = mock_consumer
+        consumer = PulsarMessageConsumer(mock_client, max_unacked=1)
+        await consumer.receive("events/worker", timeout_ms=100)
+
+        assert await consumer.receive("events/worker", timeout_ms=10) == ConsumeTimeout(
+            subscription="events/worker", timeout_ms=10
+        )
+        assert mock_consumer.receive.call_count == 1
+
+        waiting = asyncio.create_task(consumer.receive("events/worker", timeout_ms=1000))
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+        await consumer.acknowledge("m0")
+        envelope = await waiting
+
+        assert isinstance(envelope, MessageEnvelope)
+        assert envelope.message_id == "m1"
+
+    @pytest.mark.asyncio
+    async def test_receive_batch_is_capped_by_free_slots(self, mocker: MockerFixture) -> None:
+        """A batch returns no more messages than free slots; the rest stay in the backlog."""
+        mock_consumer = mocker.MagicMock()
+        mock_consumer.batch_receive.return_value = [
+            _pulsar_message(mocker, f"m{i}") for i in range(3)
+        ]
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.return_value = mock_consumer
+        consumer = PulsarMessageConsumer(mock_client, max_unacked=2)
+
+        first = await consumer.receive_batch("events/worker", max_messages=3, max_wait_ms=10)
+        blocked = await consumer.receive_batch("events/worker", max_messages=3, max_wait_ms=10)
+        await consumer.acknowledge_batch(["m0", "m1"], cumulative=True)
+        rest = await consumer.receive_batch("events/worker", max_messages=3, max_wait_ms=10)
+
+        assert isinstance(first, tuple) and isinstance(rest, tuple)
+        assert [e.message_id for e in first] == ["m0", "m1"]
+        assert blocked == ()
+        assert [e.message_id for e in rest] == ["m2"]
+        mock_consumer.batch_receive.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unacked_gauge_tracks_outstanding_messages(self, mocker: MockerFixture) -> None:
+        """The unacked gauge follows receives and acks per subscription."""
+        mock_consumer = mocker.MagicMock()
+        mock_consumer.batch_receive.return_value = [
+            _pulsar_message(mocker, f"m{i}") for i in range(3)
+        ]
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.return_value = mock_consumer
+        collector = InMemoryMetricsCollector()
+        await collector.register_metrics(FRAMEWORK_METRICS)
+        consumer = PulsarMessageConsumer(mock_client, metrics_collector=collector)
+
+        await consumer.receive_batch("events/worker", max_messages=3, max_wait_ms=10)
+        assert collector.gauges["effectful_pulsar_unacked_messages"] == {
+            "subscription=events/worker": 3.0
+        }
+        await consumer.acknowledge("m1")
+        await consumer.negative_acknowledge("m0")
+
+        assert collector.gauges["effectful_pulsar_unacked_messages"] == {
+            "subscription=events/worker": 1.0
+        }
+
+    def test_rejects_non_positive_max_unacked(self, mocker: MockerFixture) -> None:
+        """max_unacked must be at least 1."""
+        with pytest.raises(ValueError):
+            PulsarMessageConsumer(mocker.MagicMock(), max_unacked=0)
+
+
+async def _max_loop_lag[T](work: Awaitable[T]) -> tuple[T, float]:
+    """Await work while ticking every 5 ms; return its result and the longest tick gap."""
+    done = asyncio.Event()
+    longest = 0.0
+
+    async def tick() -> None:
+        nonlocal longest
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            longest = max(longest, now - last)
+            last = now
+
+    ticker = asyncio.create_task(tick())
+    try:
+        return await work, longest
+    finally:
+        done.set()
+        await ticker
+
+
+class TestPulsarBlockingCallsOffloaded:
+    """Blocking client calls run on the executor and leave the event loop responsive."""
+
+    @pytest.mark.asyncio
+    async def test_long_receive_does_not_stall_event_loop(self, mocker: MockerFixture) -> None:
+        """A receive blocking for 200 ms runs on the given executor's thread."""
+        receiving_threads: list[str] = []
+
+        def slow_receive(timeout_millis: int) -> MagicMock:
+            receiving_threads.append(threading.current_thread().name)
+            time.sleep(0.2)
+            return _pulsar_message(mocker, "m0")
+
+        mock_consumer = mocker.MagicMock()
+        mock_consumer.receive.side_effect = slow_receive
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.return_value = mock_consumer
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="test-pulsar") as executor:
+            consumer = PulsarMessageConsumer(mock_client, executor=executor)
+
+            envelope, lag = await _max_loop_lag(consumer.receive("events/sub", timeout_ms=1000))
+
+        assert isinstance(envelope, MessageEnvelope)
+        assert lag < 0.1
+        assert receiving_threads[0].startswith("test-pulsar")
+
+    @pytest.mark.asyncio
+    async def test_close_shuts_down_only_owned_executors(self, mocker: MockerFixture) -> None:
+        """close() stops the threads it created and leaves a passed executor running."""
+        with ThreadPoolExecutor(max_workers=1) as shared:
+            producer = PulsarMessageProducer(mocker.MagicMock())
+            consumer = PulsarMessageConsumer(mocker.MagicMock())
+            owned = [producer._executor, consumer._executor]
+            borrowing = PulsarMessageConsumer(mocker.MagicMock(), executor=shared)
+
+            await producer.close()
+            await consumer.close()
+            await borrowing.close()
+
+            for executor in owned:
+                with pytest.raises(RuntimeError):
+                    executor.submit(time.sleep, 0)
+            assert shared.submit(lambda: "ok").result() == "ok"
+            assert producer._executor not in owned and consumer._executor not in owned
+
+    @pytest.mark.asyncio
+    async def test_slow_producer_creation_does_not_stall_event_loop(
+        self, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Concurrent first publishes create one producer without blocking the loop."""
+        monkeypatch.setenv("PULSAR_SEND_TIMEOUT_MS", "5000")
+        mock_producer: MagicMock = mocker.MagicMock()
+        mock_producer.send_async.side_effect = _ack_immediately("id")
+
+        def slow_create_producer(topic: str, send_timeout_millis: int) -> MagicMock:
+            time.sleep(0.2)
+            return mock_producer
+
+        mock_client = mocker.MagicMock()
+        mock_client.create_producer.side_effect = slow_create_producer
+        producer = PulsarMessageProducer(mock_client)
+
+        results, lag = await _max_loop_lag(producer.publish_many("topic", [b"a", b"b"]))
+
+        assert results == (PublishSuccess(message_id="id", topic="topic"),) * 2
+        assert lag < 0.1
+        mock_client.create_producer.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_receives_subscribe_once(self, mocker: MockerFixture) -> None:
+        """Receives racing on a new subscription share one consumer."""
+        mock_consumer: MagicMock = mocker.MagicMock()
+        mock_consumer.receive.side_effect = pulsar.Timeout()
+
+        def slow_subscribe(**kwargs: object) -> MagicMock:
+            time.sleep(0.05)
+            return mock_consumer
+
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.side_effect = slow_subscribe
+        consumer = PulsarMessageConsumer(mock_client)
+
+        await asyncio.gather(*(consumer.receive("events/sub", timeout_ms=0) for _ in range(3)))
+
+        mock_client.subscribe.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_receive_keeps_late_message(self, mocker: MockerFixture) -> None:
+        """A message returned after its receive was cancelled is served next."""
+        message = _pulsar_message(mocker, "m0")
+        release = threading.Event()
+        mock_consumer = mocker.MagicMock()
+
+        def receive_when_released(timeout_millis: int) -> MagicMock:
+            release.wait(timeout=1)
+            return message
+
+        mock_consumer.receive.side_effect = receive_when_released
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.return_value = mock_consumer
+        consumer = PulsarMessageConsumer(mock_client)
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(consumer.receive("events/sub", timeout_ms=1000), timeout=0.05)
+        release.set()
+        await asyncio.sleep(0.05)
+        envelope = await consumer.receive("events/sub", timeout_ms=0)
+
+        assert isinstance(envelope, MessageEnvelope)
+        assert envelope.message_id == "m0"
+        assert mock_consumer.receive.call_count == 1
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _producer_client(mocker: MockerFixture) -> tuple[MagicMock, dict[str, MagicMock]]:
+    """Mock client creating a new acking producer per topic, and those producers by topic."""
+    producers: dict[str, MagicMock] = {}
+
+    def create_producer(topic: str, send_timeout_millis: int) -> MagicMock:
+        producer: MagicMock = mocker.MagicMock()
+        producer.send_async.side_effect = _ack_immediately("id")
+        producers[topic] = producer
+        return producer
+
+    client: MagicMock = mocker.MagicMock()
+    client.create_producer.side_effect = create_producer
+    return client, producers
+
+
+class TestPulsarHandleCache:
+    """Producers and consumers are cached with LRU and idle-time bounds."""
+
+    @pytest.fixture(autouse=True)
+    def _send_timeout(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Provide the send timeout the container images set."""
+        monkeypatch.setenv("PULSAR_SEND_TIMEOUT_MS", "5000")
+
+    @pytest.mark.asyncio
+    async def test_idle_producers_are_closed(self, mocker: MockerFixture) -> None:
+        """A producer unused for idle_timeout_seconds is closed on the next publish."""
+        client, producers = _producer_client(mocker)
+        clock = _Clock()
+        collector = InMemoryMetricsCollector()
+        await collector.register_metrics(FRAMEWORK_METRICS)
+        producer = PulsarMessageProducer(
+            client, idle_timeout_seconds=60.0, clock=clock, metrics_collector=collector
+        )
+
+        await producer.publish("tenant-a", b"x")
+        clock.now = 30.0
+        await producer.publish("tenant-b", b"x")
+        clock.now = 61.0
+        await producer.publish("tenant-b", b"x")
+
+        producers["tenant-a"].close.assert_called_once()
+        producers["tenant-b"].close.assert_not_called()
+        assert collector.counters["effectful_pulsar_handles_created_total"] == {
+            "kind=producer": 2.0
+        }
+        assert collector.counters["effectful_pulsar_handles_evicted_total"] == {
+            "kind=producer,reason=idle": 1.0
+        }
+        assert collector.gauges["effectful_pulsar_open_handles"] == {"kind=producer": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_producer_is_closed_beyond_limit(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Creating a producer beyond max_producers closes the least recently used one."""
+        client, producers = _producer_client(mocker)
+        producer = PulsarMessageProducer(client, max_producers=2)
+
+        for topic in ("a", "b", "a", "c"):
+            await producer.publish(topic, b"x")
+        await producer.publish("b", b"x")
+
+        assert client.create_producer.call_count == 4
+        assert [producers[topic].close.call_count for topic in ("a", "b", "c")] == [1, 0, 0]
+
+    @pytest.mark.asyncio
+    async def test_consumer_with_unacked_messages_stays_open(self, mocker: MockerFixture) -> None:
+        """An idle consumer is only closed once its delivered messages are settled."""
+        mock_consumer: MagicMock = mocker.MagicMock()
+        mock_consumer.receive.return_value = _pulsar_message(mocker, "m0")
+        mock_client = mocker.MagicMock()
+        mock_client.subscribe.side_effect = [mock_consumer, mocker.MagicMock()]
+        clock = _Clock()
+        consumer = PulsarMessageConsumer(mock_client, idle_timeout_seconds=60.0, clock=clock)
+
+        envelope = await consumer.receive("events/a", timeout_ms=0)
+        assert isinstance(envelope, MessageEnvelope)
+        clock.now = 120.0
+        await consumer.receive("events/b", timeout_ms=0)
+        mock_consumer.close.assert_not_called()
+
+        assert await consumer.acknowledge(envelope.message_id) == AcknowledgeSuccess(
+            message_id="m0"
+        )
+        clock.now = 240.0
+        await consumer.receive("events/b", timeout_ms=0)
+
+        mock_consumer.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_close_closes_all_handles_and_allows_reuse(self, mocker: MockerFixture) -> None:
+        """close() closes every cached producer; the next publish creates a new one."""
+        client, producers = _producer_client(mocker)
+        producer = PulsarMessageProducer(client)
+        await producer.publish("a", b"x")
+        first = producers["a"]
+
+        await producer.close()
+        await producer.publish("a", b"x")
+
+        first.close.assert_called_once()
+        assert producers["a"] is not first
+
+    @pytest.mark.parametrize(
+        ("max_handles", "idle_timeout_seconds"), [(0, 60.0), (10, 0.0), (10, -1.0)]
+    )
+    def test_rejects_invalid_bounds(
+        self, mocker: MockerFixture, max_handles: int, idle_timeout_seconds: float
+    ) -> None:
+        """Handle limits must be positive."""
+        with pytest.raises(ValueError):
+            PulsarMessageProducer(
+                mocker.MagicMock(),
+                max_producers=max_handles,
+                idle_timeout_seconds=idle_timeout_seconds,
+            )
+        with pytest.raises(ValueError):
+            PulsarMessageConsumer(
+                mocker.MagicMock(),
+                max_consumers=max_handles,
+                idle_timeout_seconds=idle_timeout_seconds,
+            )
@@ -10,8 +10,9 @@ import pytest
 from pytest_mock import MockerFixture
 from redis.asyncio import Redis
 
-from effectful.adapters.redis_cache import RedisProfileCache
+from effectful.adapters.redis_cache import RedisCacheLock, RedisProfileCache
 from effectful.domain.cache_result import CacheHit, CacheMiss
+from effectful.domain.optional_value import Absent, Provided
 from effectful.domain.profile import ProfileData
 
 
@@ -26,10 +27,10 @@ class TestRedisProfileCache:
         profile_data = {"id": str(user_id), "name": "Test User"}
         cached_json = json.dumps(profile_data)
 
+        pipe = mocker.MagicMock()
+        pipe.execute = mocker.AsyncMock(return_value=[cached_json, 300_000])  # 5 minutes
         mock_redis = mocker.AsyncMock(spec=Redis)
-        mock_redis.setex = mocker.AsyncMock()
-        mock_redis.get = mocker.AsyncMock(return_value=cached_json)
-        mock_redis.ttl = mocker.AsyncMock(return_value=300)  # 5 minutes remaining
+        mock_redis.pipeline = mocker.MagicMock(return_value=pipe)
 
         cache = RedisProfileCache(mock_redis)
 
@@ -43,9 +44,13 @@ class TestRedisProfileCache:
         assert result.value.name == "Test User"
         assert result.ttl_remaining == 300
 
-        # Verify Redis calls
-        mock_redis.get.assert_called_once_with(f"profile:{user_id}")
-        mock_redis.ttl.assert_called_once_with(f"profile:{user_id}")
+        # Verify GET and PTTL share one pipelined round-trip
+        mock_redis.pipeline.assert_called_once_with(transaction=True)
+        pipe.get.assert_called_once_with(f"profile:{user_id}")
+        pipe.pttl.assert_called_once_with(f"profile:{user_id}")
+        pipe.execute.assert_awaited_once()
+        mock_redis.get.assert_not_called()
+        mock_redis.ttl.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_profile_returns_cache_miss_when_not_found(
@@ -54,8 +59,10 @@ class TestRedisProfileCache:
         """Test cache lookup returns CacheMiss when key doesn't exist."""
         # Setup
         user_id = uuid4()
+        pipe = mocker.MagicMock()
+        pipe.execute = mocker.AsyncMock(return_value=[None, -2])
         mock_redis = mocker.AsyncMock(spec=Redis)
-        mock_redis.get = mocker.AsyncMock(return_value=None)
+        mock_redis.pipeline = mocker.MagicMock(return_value=pipe)
 
         cache = RedisProfileCache(mock_redis)
 
@@ -68,16 +75,15 @@ class TestRedisProfileCache:
         assert result.reason == "not_found"
 
     @pytest.mark.asyncio
-    async def test_get_profile_returns_cache_miss_when_expired(self, mocker: MockerFixture) -> None:
-        """Test cache lookup returns CacheMiss when TTL indicates expired."""
+    async def test_get_profile_rounds_partial_seconds_up(self, mocker: MockerFixture) -> None:
+        """Test millisecond TTLs are rounded up so live keys never report 0."""
         # Setup
         user_id = uuid4()
-        profile_data = {"id": str(user_id), "name": "Test User"}
-        cached_json = json.dumps(profile_data)
-
+        cached_json = json.dumps({"id": str(user_id), "name": "Test User"})
+        pipe = mocker.MagicMock()
+        pipe.execute = mocker.AsyncMock(return_value=[cached_json, 1])
         mock_redis = mocker.AsyncMock(spec=Redis)
-        mock_redis.get = mocker.AsyncMock(return_value=cached_json)
-        mock_redis.ttl = mocker.AsyncMock(return_value=-2)  # Key doesn't exist (race condition)
+        mock_redis.pipeline = mocker.MagicMock(return_value=pipe)
 
         cache = RedisProfileCache(mock_redis)
 
@@ -85,9 +91,8 @@ class TestRedisProfileCache:
         result = await cache.get_profile(user_id)
 
         # Assert
-        assert isinstance(result, CacheMiss)
-        assert result.key == f"profile:{user_id}"
-        assert result.reason == "expired"
+        assert isinstance(result, CacheHit)
+        assert result.ttl_remaining == 1
 
     @pytest.mark.asyncio
     async def test_get_profile_handles_no_expiration(self, mocker: MockerFixture) -> None:
@@ -97,9 +102,10 @@ class TestRedisProfileCache:
         profile_data = {"id": str(user_id), "name": "Test User"}
         cached_json = json.dumps(profile_data)
 
+        pipe = mocker.MagicMock()
+        pipe.execute = mocker.AsyncMock(return_value=[cached_json, -1])  # No expiration
         mock_redis = mocker.AsyncMock(spec=Redis)
-        mock_redis.get = mocker.AsyncMock(return_value=cached_json)
-        mock_redis.ttl = mocker.AsyncMock(return_value=-1)  # No expiration
+        mock_redis.pipeline = mocker.MagicMock(return_value=pipe)
 
         cache = RedisProfileCache(mock_redis)
 
@@ -110,6 +116,25 @@ class TestRedisProfileCache:
         assert isinstance(result, CacheHit)
         assert result.ttl_remaining == 0  # Normalized to 0
 
+    @pytest.mark.asyncio
+    async def test_get_value_skips_ttl_when_disabled(self, mocker: MockerFixture) -> None:
+        """Test include_ttl=False serves hits with a plain GET."""
+        # Setup
+        mock_redis = mocker.AsyncMock(spec=Redis)
+        mock_redis.get = mocker.AsyncMock(return_value="cached")
+        mock_redis.pipeline = mocker.MagicMock()
+
+        cache = RedisProfileCache(mock_redis, include_ttl=False)
+
+        # Execute
+        result = await cache.get_value("session:abc")
+
+        # Assert
+        assert result == CacheHit(value=b"cached", ttl_remaining=0)
+        mock_redis.get.assert_awaited_once_with("session:abc")
+        mock_redis.pipeline.assert_not_called()
+        mock_redis.ttl.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_put_profile_stores_with_ttl(self, mocker: MockerFixture) -> None:
         """Test storing profile sets correct key, value, and TTL."""
@@ -157,3 +182,157 @@ class TestRedisProfileCache:
 
         assert stored_data["id"] == "custom-id-123"
         assert stored_data["name"] == "Alice Smith"
+
+    @pytest.mark.asyncio
+    async def test_get_values_returns_aligned_results_in_one_round_trip(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test MGET and per-key PTTL are pipelined and results align with keys."""
+        # Setup
+        pipe = mocker.MagicMock()
+        pipe.execute = mocker.AsyncMock(return_value=[[b"1", None, "3"], 60_000, -2, -1])
+        mock_redis = mocker.AsyncMock(spec=Redis)
+        mock_redis.pipeline = mocker.MagicMock(return_value=pipe)
+
+        cache = RedisProfileCache(mock_redis)
+
+        # Execute
+        results = await cache.get_values(["a", "b", "c"])
+
+        # Assert
+        assert results == (
+            CacheHit(value=b"1", ttl_remaining=60),
+            CacheMiss(key="b", reason="not_found"),
+            CacheHit(value=b"3", ttl_remaining=0),
+        )
+        pipe.mget.assert_called_once_with(["a", "b", "c"])
+        assert [call.args[0] for call in pipe.pttl.call_args_list] == ["a", "b", "c"]
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_put_values_pipelines_setex(self, mocker: MockerFixture) -> None:
+        """Test batch writes issue one SETEX per entry in a single pipeline."""
+        # Setup
+        pipe = mocker.MagicMock()
+        pipe.execute = mocker.AsyncMock(return_value=[True, True])
+        mock_redis = mocker.AsyncMock(spec=Redis)
+        mock_redis.pipeline = mocker.MagicMock(return_value=pipe)
+
+        cache = RedisProfileCache(mock_redis)
+
+        # Execute
+        await cache.put_values([("a", b"1"), ("b", b"2")], 120)
+
+        # Assert
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert [call.args for call in pipe.setex.call_args_list] == [
+            ("a", 120, b"1"),
+            ("b", 120, b"2"),
+        ]
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_many_unlinks_all_keys(self, mocker: MockerFixture) -> None:
+        """Test batch invalidation uses one UNLINK and returns the deleted count."""
+        # Setup
+        mock_redis = mocker.AsyncMock(spec=Redis)
+        mock_redis.unlink = mocker.AsyncMock(return_value=2)
+
+        cache = RedisProfileCache(mock_redis)
+
+        # Execute
+        deleted = await cache.invalidate_many(["a", "b", "c"])
+        nothing = await cache.invalidate_many([])
+
+        # Assert
+        assert (deleted, nothing) == (2, 0)
+        mock_redis.unlink.assert_awaited_once_with("a", "b", "c")
+
+    @pytest.mark.asyncio
+    async def test_tagged_put_indexes_keys_in_same_transaction(self, mocker: MockerFixture) -> None:
+        """Test tagged writes SETEX and SADD to each tag set inside one MULTI/EXEC."""
+        # Setup
+        pipe = mocker.MagicMock()
+        pipe.execute = mocker.AsyncMock(return_value=[])
+        mock_redis = mocker.AsyncMock(spec=Redis)
+        mock_redis.pipeline = mocker.MagicMock(return_value=pipe)
+
+        cache = RedisProfileCache(mock_redis)
+
+        # Execute
+        await cache.put_values([("a", b"1"), ("b", b"2")], 120, tags=("user:1", "tenant:7"))
+
+        # Assert
+        mock_redis.pipeline.assert_called_once_with(transaction=True)
+        assert [call.args for call in pipe.setex.call_args_list] == [
+            ("a", 120, b"1"),
+            ("b", 120, b"2"),
+        ]
+        assert [call.args for call in pipe.sadd.call_args_list] == [
+            ("tag:user:1", "a", "b"),
+            ("tag:tenant:7", "a", "b"),
+        ]
+        assert [call.kwargs for call in pipe.expire.call_args_list] == [
+            {"nx": True},
+            {"gt": True},
+        ] * 2
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tag_runs_script_and_returns_members(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test tag invalidation is one script call returning the removed keys."""
+        # Setup
+        mock_redis = mocker.AsyncMock(spec=Redis)
+        mock_redis.eval = mocker.AsyncMock(return_value=[b"a", b"profile:1"])
+
+        cache = RedisProfileCache(mock_redis)
+
+        # Execute
+        keys = await cache.invalidate_tag("user:1")
+
+        # Assert
+        assert keys == ("a", "profile:1")
+        assert mock_redis.eval.await_args.args[1:] == (1, "tag:user:1")
+
+
+class TestRedisCacheLock:
+    """Tests for RedisCacheLock."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_uses_set_nx_px_and_release_checks_token(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test the lock is taken atomically and released only with its token."""
+        # Setup
+        mock_redis = mocker.AsyncMock(spec=Redis)
+        mock_redis.set = mocker.AsyncMock(return_value=True)
+        mock_redis.eval = mocker.AsyncMock(return_value=1)
+        lock = RedisCacheLock(mock_redis)
+
+        # Execute
+        acquired = await lock.acquire("profile:1", 5000)
+        assert isinstance(acquired, Provided)
+        released = await lock.release("profile:1", acquired.value)
+
+        # Assert
+        assert released is True
+        set_call = mock_redis.set.call_args
+        assert set_call.args == ("lock:profile:1", acquired.value)
+        assert set_call.kwargs == {"nx": True, "px": 5000}
+        assert mock_redis.eval.call_args.args[1:] == (1, "lock:profile:1", acquired.value)
+
+    @pytest.mark.asyncio
+    async def test_acquire_returns_absent_when_held(self, mocker: MockerFixture) -> None:
+        """Test a lock held by another instance is reported as Absent."""
+        # Setup
+        mock_redis = mocker.AsyncMock(spec=Redis)
+        mock_redis.set = mocker.AsyncMock(return_value=None)
+        lock = RedisCacheLock(mock_redis)
+
+        # Execute
+        acquired = await lock.acquire("profile:1", 5000)
+
+        # Assert
+        assert isinstance(acquired, Absent)
@@ -3,6 +3,7 @@
 Tests S3ObjectStorage using pytest-mock with MagicMock for boto3 client.
 """
 
+import io
 from datetime import UTC, datetime
 
 import pytest
@@ -162,6 +163,23 @@ class TestS3ObjectStoragePutObject:
             ContentType=content_type,
         )
 
+    @pytest.mark.asyncio
+    async def test_put_object_streams_memoryview_content(self, mocker: MockerFixture) -> None:
+        """Non-bytes buffers are passed to boto3 as a seekable file object."""
+        mock_client = mocker.MagicMock()
+        mock_client.put_object.return_value = {}
+        storage = S3ObjectStorage(mock_client)
+        payload = b"header|Hello, World!"
+
+        await storage.put_object("bucket", "key", memoryview(payload)[7:], Absent(), Absent())
+
+        body = mock_client.put_object.call_args.kwargs["Body"]
+        assert body.read(5) == b"Hello"
+        assert body.read() == b", World!"
+        assert body.seek(0, io.SEEK_END) == 13
+        body.seek(0)
+        assert body.read() == b"Hello, World!"
+
     @pytest.mark.asyncio
     async def test_put_object_returns_failure_for_quota_exceeded(
         self, mocker: MockerFixture
@@ -0,0 +1,247 @@
+"""Unit tests for the two-tier profile cache.
+
+Tests TieredProfileCache using pytest-mock with AsyncMock for the L2 cache and
+the Redis pub/sub connection, and an injected clock for L1 expiry.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from uuid import uuid4
+
+import pytest
+from pytest_mock import MockerFixture
+from redis.asyncio import Redis
+
+from effectful.adapters.in_memory_metrics import InMemoryMetricsCollector
+from effectful.adapters.tiered_cache import TieredProfileCache
+from effectful.domain.cache_result import CacheHit, CacheMiss
+from effectful.domain.metrics_result import QuerySuccess
+from effectful.domain.profile import ProfileData
+from effectful.infrastructure.cache import ProfileCache
+from effectful.observability.framework_metrics import FRAMEWORK_METRICS
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTieredProfileCache:
+    """Tests for TieredProfileCache."""
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_fills_l1_and_repeat_lookups_skip_l2(self, mocker: MockerFixture) -> None:
+        """A profile read from L2 is served from L1 until its L1 TTL passes."""
+        user_id = uuid4()
+        profile = ProfileData(id=str(user_id), name="Alice")
+        remote = mocker.AsyncMock(spec=ProfileCache)
+        remote.get_profile.return_value = CacheHit(value=profile, ttl_remaining=300)
+        clock = _Clock()
+        cache = TieredProfileCache(remote, l1_ttl_seconds=5.0, clock=clock)
+
+        first = await cache.get_profile(user_id)
+        clock.now += 2.5
+        second = await cache.get_profile(user_id)
+
+        assert first == CacheHit(value=profile, ttl_remaining=300)
+        assert second == CacheHit(value=profile, ttl_remaining=298)
+        remote.get_profile.assert_awaited_once_with(user_id)
+
+        clock.now += 5.0
+        await cache.get_profile(user_id)
+
+        assert remote.get_profile.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_l1_ttl_never_outlives_l2_entry(self, mocker: MockerFixture) -> None:
+        """Entries about to expire in L2 are only kept in L1 for their remaining TTL."""
+        remote = mocker.AsyncMock(spec=ProfileCache)
+        remote.get_value.return_value = CacheHit(value=b"v", ttl_remaining=1)
+        clock = _Clock()
+        cache = TieredProfileCache(remote, l1_ttl_seconds=30.0, clock=clock)
+
+        await cache.get_value("k")
+        clock.now += 1.0
+        await cache.get_value("k")
+
+        assert remote.get_value.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_l1_evicts_least_recently_used(self, mocker: MockerFixture) -> None:
+        """L1 is bounded by max_entries and evicts the least recently used key."""
+        remote = mocker.AsyncMock(spec=ProfileCache)
+        remote.get_value.side_effect = lambda key: CacheHit(value=key.encode(), ttl_remaining=0)
+        cache = TieredProfileCache(remote, max_entries=2)
+
+        await cache.get_value("a")
+        await cache.get_value("b")
+        await cache.get_value("a")  # L1 hit, "a" becomes most recently used
+        await cache.get_value("c")  # Evicts "b"
+        await cache.get_value("b")
+
+        assert len(cache) == 2
+        assert [call.args[0] for call in remote.get_value.await_args_list] == ["a", "b", "c", "b"]
+
+    @pytest.mark.asyncio
+    async def test_get_values_fetches_only_l1_misses(self, mocker: MockerFixture) -> None:
+        """Batch lookups serve L1 hits locally and fetch the rest from L2 in one call."""
+        remote = mocker.AsyncMock(spec=ProfileCache)
+        remote.get_values.return_value = (
+            CacheHit(value=b"2", ttl_remaining=60),
+            CacheMiss(key="c", reason="not_found"),
+        )
+        cache = TieredProfileCache(remote)
+        await cache.put_values([("a", b"1")], 60)
+
+        results = await cache.get_values(["a", "b", "c"])
+
+        assert results == (
+            CacheHit(value=b"1", ttl_remaining=60),
+            CacheHit(value=b"2", ttl_remaining=60),
+            CacheMiss(key="c", reason="not_found"),
+        )
+        remote.get_values.assert_awaited_once_with(["b", "c"])
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_discards_only_racing_fill_of_same_key(
+        self, mocker: MockerFixture
+    ) -> None:
+        """An eviction during in-flight L2 reads keeps only other keys' results in L1."""
+        release = asyncio.Event()
+
+        async def slow_get_value(key: str) -> CacheHit[bytes]:
+            await release.wait()
+            return CacheHit(value=key.encode(), ttl_remaining=60)
+
+        remote = mocker.AsyncMock(spec=ProfileCache)
+        remote.get_value.side_effect = slow_get_value
+        cache = TieredProfileCache(remote)
+
+        reads = [asyncio.create_task(cache.get_value(key)) for key in ("a", "b")]
+        await asyncio.sleep(0)
+        await cache.invalidate("b")
+        release.set()
+        await asyncio.gather(*reads)
+        await cache.get_value("a")
+        await cache.get_value("b")
+
+        assert [call.args[0] for call in remote.get_value.await_args_list] == ["a", "b", "b"]
+        assert not cache._filling and not cache._evicted_at
+
+    @pytest.mark.asyncio
+    async def test_writes_go_through_and_publish_invalidation(self, mocker: MockerFixture) -> None:
+        """put/invalidate update L2, the local L1, and notify other instances."""
+        user_id = uuid4()
+        profile = ProfileData(id=str(user_id), name="Alice")
+        remote = mocker.AsyncMock(spec=ProfileCache)
+        remote.invalidate.return_value = True
+        redis = mocker.AsyncMock(spec=Redis)
+        redis.publish = mocker.AsyncMock(return_value=1)
+        cache = TieredProfileCache(remote, redis_client=redis, channel="invalidate")
+
+        await cache.put_profile(user_id, profile, 300)
+        deleted = await cache.invalidate(f"profile:{user_id}")
+
+        assert deleted is True
+        remote.put_profile.assert_awaited_once_with(user_id, profile, 300, ())
+        remote.invalidate.assert_awaited_once_with(f"profile:{user_id}")
+        assert [call.args[0] for call in redis.publish.await_args_list] == ["invalidate"] * 2
+        assert all(
+            call.args[1].endswith(f" profile:{user_id}") for call in redis.publish.await_args_list
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tag_evicts_and_announces_tagged_keys(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Keys removed by an L2 tag invalidation are dropped from L1 and published."""
+        remote = mocker.AsyncMock(spec=ProfileCache)
+        remote.invalidate_tag.return_value = ("a", "b")
+        remote.get_value.return_value = CacheMiss(key="a", reason="not_found")
+        cache = TieredProfileCache(remote)
+        await cache.put_values([("a", b"1"), ("c", b"3")], 60, tags=("user:1",))
+
+        keys = await cache.invalidate_tag("user:1")
+
+        assert keys == ("a", "b")
+        assert isinstance(await cache.get_value("a"), CacheMiss)
+        assert len(cache) == 1
+        remote.put_values.assert_awaited_once_with([("a", b"1"), ("c", b"3")], 60, ("user:1",))
+
+    @pytest.mark.asyncio
+    async def test_l1_disabled_until_subscribed(self, mocker: MockerFixture) -> None:
+        """With pub/sub configured, L1 is bypassed until start() subscribes."""
+        remote = mocker.AsyncMock(spec=ProfileCache)
+        remote.get_value.return_value = CacheMiss(key="k", reason="not_found")
+        redis = mocker.AsyncMock(spec=Redis)
+        redis.publish = mocker.AsyncMock(return_value=1)
+        cache = TieredProfileCache(remote, redis_client=redis)
+
+        await cache.put_value("k", b"v", 60)
+        result = await cache.get_value("k")
+
+        assert isinstance(result, CacheMiss)
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_remote_invalidation_evicts_l1_entry(self, mocker: MockerFixture) -> None:
+        """Keys announced by other instances are dropped; our own messages are ignored."""
+        messages: asyncio.Queue[dict[str, object]] = asyncio.Queue()
+
+        async def listen() -> AsyncIterator[dict[str, object]]:
+            while True:
+                yield await messages.get()
+
+        pubsub = mocker.AsyncMock()
+        pubsub.listen = listen
+        redis = mocker.AsyncMock(spec=Redis)
+        redis.pubsub = mocker.MagicMock(return_value=pubsub)
+        redis.publish = mocker.AsyncMock(return_value=1)
+        remote = mocker.AsyncMock(spec=ProfileCache)
+        remote.get_value.return_value = CacheHit(value=b"fresh", ttl_remaining=60)
+        collector = InMemoryMetricsCollector()
+        await collector.register_metrics(FRAMEWORK_METRICS)
+        cache = TieredProfileCache(remote, redis_client=redis, metrics_collector=collector)
+        await cache.start()
+
+        await cache.put_value("k", b"v", 60)
+        own_message = redis.publish.await_args.args[1]
+        await messages.put({"type": "message", "data": own_message.encode()})
+        await asyncio.sleep(0)
+        assert await cache.get_value("k") == CacheHit(value=b"v", ttl_remaining=60)
+
+        await messages.put({"type": "message", "data": b"other-instance k"})
+        await asyncio.sleep(0)
+        assert await cache.get_value("k") == CacheHit(value=b"fresh", ttl_remaining=60)
+
+        lookups = await collector.query_metrics(
+            "effectful_cache_tier_lookups_total", {"tier": "l1", "result": "hit"}
+        )
+        invalidations = await collector.query_metrics(
+            "effectful_cache_remote_invalidations_total", {}
+        )
+        assert isinstance(lookups, QuerySuccess)
+        assert isinstance(invalidations, QuerySuccess)
+        assert list(lookups.metrics.values()) == [1.0]
+        assert list(invalidations.metrics.values()) == [1.0]
+
+        await cache.close()
+        pubsub.subscribe.assert_awaited_once()
+        pubsub.reset.assert_awaited_once()
+        assert len(cache) == 0
+
+
+def test_rejects_invalid_configuration(mocker: MockerFixture) -> None:
+    """max_entries and l1_ttl_seconds must be positive."""
+    remote = mocker.AsyncMock(spec=ProfileCache)
+
+    with pytest.raises(ValueError, match="max_entries"):
+        TieredProfileCache(remote, max_entries=0)
+    with pytest.raises(ValueError, match="l1_ttl_seconds"):
+        TieredProfileCache(remote, l1_ttl_seconds=0)
@@ -7,18 +7,25 @@ Tests cover:
 - Type safety with ProfileData
 """
 
+from collections.abc import Generator
 from dataclasses import FrozenInstanceError
 from uuid import uuid4
 
 import pytest
 
 from effectful.domain.profile import ProfileData
+from effectful.programs.program_types import AllEffects, EffectResult
 from effectful.effects.cache import (
     GetCachedProfile,
     GetCachedValue,
+    GetCachedValues,
+    GetOrCompute,
     InvalidateCache,
+    InvalidateMany,
+    InvalidateTag,
     PutCachedProfile,
     PutCachedValue,
+    PutCachedValues,
 )
 
 
@@ -139,3 +146,60 @@ class TestInvalidateCache:
         effect = InvalidateCache(key="test_key")
         with pytest.raises(FrozenInstanceError):
             setattr(effect, "key", "new_key")
+
+
+class TestMultiKeyCacheEffects:
+    """Test GetCachedValues, PutCachedValues, and InvalidateMany effects."""
+
+    def test_multi_key_effects_wrap_keys_and_entries(self) -> None:
+        """Batch effects should wrap their keys, entries, and TTL."""
+        entries = (("a", b"1"), ("b", b"2"))
+
+        assert GetCachedValues(keys=("a", "b")).keys == ("a", "b")
+        assert PutCachedValues(entries=entries, ttl_seconds=60).entries == entries
+        assert InvalidateMany(keys=("a",)).keys == ("a",)
+
+    def test_multi_key_effects_are_immutable(self) -> None:
+        """Batch effects should be frozen (immutable)."""
+        with pytest.raises(FrozenInstanceError):
+            setattr(GetCachedValues(keys=("a",)), "keys", ("b",))
+        with pytest.raises(FrozenInstanceError):
+            setattr(PutCachedValues(entries=(), ttl_seconds=60), "ttl_seconds", 1)
+        with pytest.raises(FrozenInstanceError):
+            setattr(InvalidateMany(keys=("a",)), "keys", ("b",))
+
+
+class TestTagEffects:
+    """Test tagged puts and InvalidateTag effect."""
+
+    def test_put_effects_default_to_no_tags(self) -> None:
+        """Put effects should be untagged unless tags are given."""
+        assert PutCachedValue(key="k", value=b"v", ttl_seconds=60).tags == ()
+        assert PutCachedValues(entries=(), ttl_seconds=60, tags=("user:1",)).tags == ("user:1",)
+
+    def test_invalidate_tag_wraps_tag_and_is_immutable(self) -> None:
+        """InvalidateTag should wrap the tag and be frozen (immutable)."""
+        effect = InvalidateTag(tag="user:1")
+        assert effect.tag == "user:1"
+        with pytest.raises(FrozenInstanceError):
+            setattr(effect, "tag", "user:2")
+
+
+class TestGetOrCompute:
+    """Test GetOrCompute effect."""
+
+    def test_get_or_compute_wraps_key_program_and_default_ttl(self) -> None:
+        """GetOrCompute should wrap key and sub-program with a 300 second default TTL."""
+
+        def compute() -> Generator[AllEffects, EffectResult, EffectResult]:
+            yield GetCachedValue(key="source")
+            return b"value"
+
+        program = compute()
+        effect = GetOrCompute(key="k", program=program)
+
+        assert effect.key == "k"
+        assert effect.program is program
+        assert effect.ttl_seconds == 300
+        with pytest.raises(FrozenInstanceError):
+            setattr(effect, "key", "other")
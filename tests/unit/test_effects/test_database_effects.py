@@ -6,6 +6,7 @@ Tests cover:
 - Type safety with UUIDs
 """
 
+from collections.abc import Generator
 from dataclasses import FrozenInstanceError
 from uuid import UUID, uuid4
 
@@ -18,9 +19,14 @@ from effectful.effects.database import (
     GetUserById,
     ListMessagesForUser,
     ListUsers,
+    DatabaseEffect,
     SaveChatMessage,
+    Transaction,
     UpdateUser,
+    UpdateUserIf,
+    UpsertUser,
 )
+from effectful.programs.program_types import EffectResult
 
 
 class TestGetUserById:
@@ -200,3 +206,65 @@ class TestDeleteUser:
         user_id = uuid4()
         effect = DeleteUser(user_id=user_id)
         assert isinstance(effect.user_id, UUID)
+
+
+class TestUpsertUser:
+    """Test UpsertUser effect."""
+
+    def test_upsert_user_creates_effect(self) -> None:
+        """UpsertUser should wrap email, name, and password_hash."""
+        effect = UpsertUser(email="alice@example.com", name="Alice", password_hash="$2b$12$hash")
+        assert effect.email == "alice@example.com"
+        assert effect.name == "Alice"
+        assert effect.password_hash == "$2b$12$hash"
+
+    def test_upsert_user_is_immutable(self) -> None:
+        """UpsertUser should be frozen (immutable)."""
+        effect = UpsertUser(email="alice@example.com", name="Alice", password_hash="$2b$12$hash")
+        with pytest.raises(FrozenInstanceError):
+            setattr(effect, "name", "Bob")
+
+
+class TestUpdateUserIf:
+    """Test UpdateUserIf effect."""
+
+    def test_update_user_if_creates_effect(self) -> None:
+        """UpdateUserIf should wrap user_id, expected_version, and optional fields."""
+        user_id = uuid4()
+        effect = UpdateUserIf(user_id=user_id, expected_version=3, name="New Name")
+        assert effect.user_id == user_id
+        assert effect.expected_version == 3
+        assert effect.email == Absent()
+        assert effect.name == Provided(value="New Name")
+
+    def test_update_user_if_is_immutable(self) -> None:
+        """UpdateUserIf should be frozen (immutable)."""
+        effect = UpdateUserIf(user_id=uuid4(), expected_version=1)
+        with pytest.raises(FrozenInstanceError):
+            setattr(effect, "expected_version", 2)
+
+
+class TestTransaction:
+    """Test Transaction effect."""
+
+    def test_transaction_wraps_program(self) -> None:
+        """Transaction should wrap the sub-program without starting it."""
+
+        def sub_program() -> Generator[DatabaseEffect, EffectResult, EffectResult]:
+            yield DeleteUser(user_id=uuid4())
+            return None
+
+        program = sub_program()
+        effect = Transaction(program=program)
+        assert effect.program is program
+
+    def test_transaction_is_immutable(self) -> None:
+        """Transaction should be frozen (immutable)."""
+
+        def sub_program() -> Generator[DatabaseEffect, EffectResult, EffectResult]:
+            yield DeleteUser(user_id=uuid4())
+            return None
+
+        effect = Transaction(program=sub_program())
+        with pytest.raises(FrozenInstanceError):
+            setattr(effect, "program", sub_program())
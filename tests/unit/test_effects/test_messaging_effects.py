@@ -10,10 +10,13 @@ import pytest
 
 from effectful.domain.optional_value import Absent, Provided
 from effectful.effects.messaging import (
+    AcknowledgeBatch,
     AcknowledgeMessage,
+    ConsumeBatch,
     ConsumeMessage,
     NegativeAcknowledge,
     PublishMessage,
+    PublishMessages,
 )
 
 
@@ -83,6 +86,25 @@ class TestPublishMessage:
         assert effect_dict[effect2] == "value"
 
 
+class TestPublishMessages:
+    """Tests for PublishMessages effect."""
+
+    def test_publish_messages_normalizes_payloads_and_properties(self) -> None:
+        """Payloads are stored as a tuple and properties as an OptionalValue."""
+        effect = PublishMessages(topic="events", payloads=[b"a", b"b"], properties={"k": "v"})
+
+        assert effect.payloads == (b"a", b"b")
+        assert effect.properties == Provided(value={"k": "v"})
+        assert PublishMessages(topic="events", payloads=()).properties == Absent()
+
+    def test_publish_messages_is_frozen(self) -> None:
+        """PublishMessages should be a frozen dataclass."""
+        effect = PublishMessages(topic="events", payloads=[b"a"])
+
+        with pytest.raises(Exception):  # FrozenInstanceError or AttributeError
+            setattr(effect, "payloads", ())
+
+
 class TestConsumeMessage:
     """Tests for ConsumeMessage effect."""
 
@@ -121,6 +143,24 @@ class TestConsumeMessage:
         assert len(effect_set) == 1
 
 
+class TestBatchEffects:
+    """Tests for ConsumeBatch and AcknowledgeBatch effects."""
+
+    def test_consume_batch_defaults(self) -> None:
+        """ConsumeBatch should default to 100 messages within 100ms."""
+        effect = ConsumeBatch(subscription="events/worker")
+
+        assert (effect.max_messages, effect.max_wait_ms) == (100, 100)
+
+    def test_acknowledge_batch_normalizes_ids_and_is_hashable(self) -> None:
+        """AcknowledgeBatch stores IDs as a tuple and defaults to individual acks."""
+        effect = AcknowledgeBatch(["a", "b"])
+
+        assert effect.message_ids == ("a", "b")
+        assert effect.cumulative is False
+        assert hash(effect) == hash(AcknowledgeBatch(("a", "b")))
+
+
 class TestAcknowledgeMessage:
     """Tests for AcknowledgeMessage effect."""
 
@@ -9,6 +9,9 @@ Tests cover:
 - Immutability
 """
 
+import asyncio
+import struct
+from collections.abc import Generator
 from dataclasses import FrozenInstanceError
 from uuid import uuid4
 
@@ -18,18 +21,38 @@ from pytest_mock import MockerFixture
 from effectful.algebraic.effect_return import EffectReturn
 from effectful.algebraic.result import Err, Ok
 from effectful.domain.cache_result import CacheHit, CacheMiss
+from effectful.domain.optional_value import Absent
 from effectful.domain.profile import ProfileData
+from effectful.domain.user import UserNotFound
 from effectful.effects.cache import (
     GetCachedProfile,
     GetCachedValue,
+    GetCachedValues,
+    GetOrCompute,
     InvalidateCache,
+    InvalidateMany,
+    InvalidateTag,
     PutCachedProfile,
     PutCachedValue,
+    PutCachedValues,
 )
 from effectful.effects.websocket import SendText
-from effectful.infrastructure.cache import ProfileCache
+from effectful.infrastructure.cache import CacheLock, ProfileCache
+from effectful.interpreters.base import EffectInterpreter
 from effectful.interpreters.cache import CacheInterpreter
 from effectful.interpreters.errors import CacheError, UnhandledEffectError
+from effectful.programs.program_types import AllEffects, EffectResult
+
+
+def _compute(result: EffectResult) -> Generator[AllEffects, EffectResult, EffectResult]:
+    """Sub-program that performs one effect and returns result."""
+    yield SendText(text="computing")
+    return result
+
+
+def _half() -> float:
+    """Deterministic draw for early expiration: -ln(1 - 0.5) ~= 0.69."""
+    return 0.5
 
 
 class TestCacheInterpreter:
@@ -136,7 +159,7 @@ class TestCacheInterpreter:
                 pytest.fail(f"Expected Ok, got {result}")
 
         # Verify mock was called correctly
-        mock_cache.put_profile.assert_called_once_with(user_id, profile, 300)
+        mock_cache.put_profile.assert_called_once_with(user_id, profile, 300, ())
 
     @pytest.mark.asyncio()
     async def test_put_cached_profile_with_custom_ttl(self, mocker: MockerFixture) -> None:
@@ -160,7 +183,7 @@ class TestCacheInterpreter:
                 pytest.fail(f"Expected Ok, got {result}")
 
         # Verify mock was called with custom TTL
-        mock_cache.put_profile.assert_called_once_with(user_id, profile, 600)
+        mock_cache.put_profile.assert_called_once_with(user_id, profile, 600, ())
 
     @pytest.mark.asyncio()
     async def test_put_cached_profile_cache_error(self, mocker: MockerFixture) -> None:
@@ -185,7 +208,7 @@ class TestCacheInterpreter:
                 pytest.fail(f"Expected CacheError, got {result}")
 
         # Verify mock was called correctly (default TTL = 300)
-        mock_cache.put_profile.assert_called_once_with(user_id, profile, 300)
+        mock_cache.put_profile.assert_called_once_with(user_id, profile, 300, ())
 
     @pytest.mark.asyncio()
     async def test_unhandled_effect(self, mocker: MockerFixture) -> None:
@@ -325,7 +348,7 @@ class TestCacheInterpreter:
             case _:
                 pytest.fail(f"Expected Ok with True, got {result}")
 
-        mock_cache.put_value.assert_called_once_with(key, value, ttl)
+        mock_cache.put_value.assert_called_once_with(key, value, ttl, ())
 
     @pytest.mark.asyncio()
     async def test_put_cached_value_error(self, mocker: MockerFixture) -> None:
@@ -410,3 +433,351 @@ class TestCacheInterpreter:
                 assert e == effect
             case _:
                 pytest.fail(f"Expected CacheError, got {result}")
+
+    # Tests for multi-key effects
+
+    @pytest.mark.asyncio()
+    async def test_get_cached_values_returns_aligned_results(self, mocker: MockerFixture) -> None:
+        """Interpreter should return one CacheHit/CacheMiss per requested key."""
+        results = (CacheHit(value=b"1", ttl_remaining=60), CacheMiss(key="b", reason="not_found"))
+
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+        mock_cache.get_values.return_value = results
+
+        interpreter = CacheInterpreter(cache=mock_cache)
+
+        effect = GetCachedValues(keys=("a", "b"))
+        result = await interpreter.interpret(effect)
+
+        match result:
+            case Ok(EffectReturn(value=value, effect_name="GetCachedValues")):
+                assert value == results
+            case _:
+                pytest.fail(f"Expected Ok with aligned results, got {result}")
+
+        mock_cache.get_values.assert_called_once_with(("a", "b"))
+
+    @pytest.mark.asyncio()
+    async def test_put_cached_values_and_invalidate_many(self, mocker: MockerFixture) -> None:
+        """Interpreter should batch writes and return the deleted key count."""
+        entries = (("a", b"1"), ("b", b"2"))
+
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+        mock_cache.invalidate_many.return_value = 2
+
+        interpreter = CacheInterpreter(cache=mock_cache)
+
+        put_result = await interpreter.interpret(PutCachedValues(entries=entries, ttl_seconds=60))
+        delete_result = await interpreter.interpret(InvalidateMany(keys=("a", "b", "c")))
+
+        match (put_result, delete_result):
+            case (
+                Ok(EffectReturn(value=True, effect_name="PutCachedValues")),
+                Ok(EffectReturn(value=2, effect_name="InvalidateMany")),
+            ):
+                pass
+            case _:
+                pytest.fail(f"Expected Ok results, got {put_result}, {delete_result}")
+
+        mock_cache.put_values.assert_called_once_with(entries, 60, ())
+        mock_cache.invalidate_many.assert_called_once_with(("a", "b", "c"))
+
+    @pytest.mark.asyncio()
+    async def test_tagged_put_and_invalidate_tag(self, mocker: MockerFixture) -> None:
+        """Interpreter should pass tags to the cache and return the invalidated count."""
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+        mock_cache.invalidate_tag.return_value = ("k", "profile:1")
+
+        interpreter = CacheInterpreter(cache=mock_cache)
+
+        put_result = await interpreter.interpret(
+            PutCachedValue(key="k", value=b"v", ttl_seconds=60, tags=("user:1",))
+        )
+        invalidate_result = await interpreter.interpret(InvalidateTag(tag="user:1"))
+
+        assert put_result == Ok(EffectReturn(value=True, effect_name="PutCachedValue"))
+        assert invalidate_result == Ok(EffectReturn(value=2, effect_name="InvalidateTag"))
+        mock_cache.put_value.assert_called_once_with("k", b"v", 60, ("user:1",))
+        mock_cache.invalidate_tag.assert_called_once_with("user:1")
+
+    @pytest.mark.asyncio()
+    async def test_invalidate_tag_error(self, mocker: MockerFixture) -> None:
+        """Interpreter should return CacheError when tag invalidation fails."""
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+        mock_cache.invalidate_tag.side_effect = Exception("Connection refused")
+
+        interpreter = CacheInterpreter(cache=mock_cache)
+        effect = InvalidateTag(tag="user:1")
+
+        result = await interpreter.interpret(effect)
+
+        match result:
+            case Err(CacheError(effect=e, is_retryable=True)):
+                assert e == effect
+            case _:
+                pytest.fail(f"Expected retryable CacheError, got {result}")
+
+    @pytest.mark.asyncio()
+    async def test_get_cached_values_error(self, mocker: MockerFixture) -> None:
+        """Interpreter should return CacheError when the batch lookup fails."""
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+        mock_cache.get_values.side_effect = Exception("Connection refused")
+
+        interpreter = CacheInterpreter(cache=mock_cache)
+
+        effect = GetCachedValues(keys=("a",))
+        result = await interpreter.interpret(effect)
+
+        match result:
+            case Err(CacheError(effect=e, cache_error="Connection refused", is_retryable=True)):
+                assert e == effect
+            case _:
+                pytest.fail(f"Expected CacheError, got {result}")
+
+
+def _lookup(
+    value: CacheHit[bytes] | CacheMiss, delta_seconds: float | None = None
+) -> tuple[CacheHit[bytes] | CacheMiss, CacheHit[bytes] | CacheMiss]:
+    """get_values result for a GetOrCompute key and its recompute-duration key."""
+    if delta_seconds is None:
+        return value, CacheMiss(key="k:xfetch-delta", reason="not_found")
+    return value, CacheHit(value=struct.pack("!d", delta_seconds), ttl_remaining=60)
+
+
+_MISS = CacheMiss(key="k", reason="not_found")
+
+
+class TestGetOrCompute:
+    """Tests for GetOrCompute single-flight cache-aside."""
+
+    @pytest.mark.asyncio()
+    async def test_hit_returns_cached_value_without_running_program(
+        self, mocker: MockerFixture
+    ) -> None:
+        """A cached value is returned and the sub-program never starts."""
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+        mock_cache.get_values.return_value = _lookup(CacheHit(value=b"cached", ttl_remaining=60))
+        sub_interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        interpreter = CacheInterpreter(cache=mock_cache)
+
+        result = await interpreter.get_or_compute(
+            GetOrCompute(key="k", program=_compute(b"fresh")), sub_interpreter
+        )
+
+        assert result == Ok(EffectReturn(value=b"cached", effect_name="GetOrCompute"))
+        sub_interpreter.interpret.assert_not_called()
+        mock_cache.get_values.assert_awaited_once_with(("k", "k:xfetch-delta"))
+        mock_cache.put_values.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_concurrent_misses_run_program_once(self, mocker: MockerFixture) -> None:
+        """Concurrent misses for one key share a single computation and cache write."""
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+        mock_cache.get_values.return_value = _lookup(_MISS)
+        release = asyncio.Event()
+
+        async def slow_interpret(effect: object) -> Ok[EffectReturn[EffectResult]]:
+            await release.wait()
+            return Ok(EffectReturn(value=None, effect_name="SendText"))
+
+        sub_interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        sub_interpreter.interpret.side_effect = slow_interpret
+        interpreter = CacheInterpreter(cache=mock_cache)
+
+        tasks = [
+            asyncio.ensure_future(
+                interpreter.get_or_compute(
+                    GetOrCompute(key="k", program=_compute(b"value"), ttl_seconds=30),
+                    sub_interpreter,
+                )
+            )
+            for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert all(
+            result == Ok(EffectReturn(value=b"value", effect_name="GetOrCompute"))
+            for result in results
+        )
+        sub_interpreter.interpret.assert_called_once()
+        [(entries, ttl, tags)] = [call.args for call in mock_cache.put_values.await_args_list]
+        assert entries[0] == ("k", b"value") and ttl == 30 and tags == ()
+        assert entries[1][0] == "k:xfetch-delta"
+        assert struct.unpack("!d", entries[1][1])[0] >= 0.0
+
+    @pytest.mark.asyncio()
+    async def test_non_bytes_result_returned_but_not_cached(self, mocker: MockerFixture) -> None:
+        """Results such as UserNotFound are passed through without a cache write."""
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+        mock_cache.get_values.return_value = _lookup(_MISS)
+        sub_interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        sub_interpreter.interpret.return_value = Ok(EffectReturn(value=None, effect_name="X"))
+        interpreter = CacheInterpreter(cache=mock_cache)
+        not_found = UserNotFound(user_id=uuid4(), reason="does_not_exist")
+
+        result = await interpreter.get_or_compute(
+            GetOrCompute(key="k", program=_compute(not_found)), sub_interpreter
+        )
+
+        assert result == Ok(EffectReturn(value=not_found, effect_name="GetOrCompute"))
+        mock_cache.put_values.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_waits_for_value_when_lock_held_elsewhere(self, mocker: MockerFixture) -> None:
+        """When another instance holds the lock, the value it stores is reused."""
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+        mock_cache.get_values.return_value = _lookup(_MISS)
+        mock_cache.get_value.side_effect = [
+            _MISS,
+            CacheHit(value=b"from-peer", ttl_remaining=300),
+        ]
+        mock_lock = mocker.AsyncMock(spec=CacheLock)
+        mock_lock.acquire.return_value = Absent(reason="lock_held")
+        sub_interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        interpreter = CacheInterpreter(cache=mock_cache, lock=mock_lock, lock_poll_interval_ms=1)
+
+        result = await interpreter.get_or_compute(
+            GetOrCompute(key="k", program=_compute(b"mine")), sub_interpreter
+        )
+
+        assert result == Ok(EffectReturn(value=b"from-peer", effect_name="GetOrCompute"))
+        sub_interpreter.interpret.assert_not_called()
+        mock_lock.release.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_sub_program_error_shared_and_flight_cleared(self, mocker: MockerFixture) -> None:
+        """A failing sub-program returns its error and a later call recomputes."""
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+        mock_cache.get_values.return_value = _lookup(_MISS)
+        error = Err(UnhandledEffectError(effect=SendText(text="x"), available_interpreters=[]))
+        sub_interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        sub_interpreter.interpret.side_effect = [
+            error,
+            Ok(EffectReturn(value=None, effect_name="SendText")),
+        ]
+        interpreter = CacheInterpreter(cache=mock_cache)
+
+        first = await interpreter.get_or_compute(
+            GetOrCompute(key="k", program=_compute(b"v")), sub_interpreter
+        )
+        second = await interpreter.get_or_compute(
+            GetOrCompute(key="k", program=_compute(b"v")), sub_interpreter
+        )
+
+        assert first == error
+        assert second == Ok(EffectReturn(value=b"v", effect_name="GetOrCompute"))
+
+
+class TestEarlyExpiration:
+    """Tests for XFetch probabilistic early recomputation in GetOrCompute."""
+
+    @pytest.mark.asyncio()
+    async def test_hit_is_refreshed_when_stored_delta_outweighs_remaining_ttl(
+        self, mocker: MockerFixture
+    ) -> None:
+        """A recompute cost cached by any instance triggers refresh on a fresh one."""
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+        mock_cache.get_values.return_value = _lookup(
+            CacheHit(value=b"first", ttl_remaining=1), delta_seconds=2.0
+        )
+        sub_interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        sub_interpreter.interpret.return_value = Ok(EffectReturn(value=None, effect_name="X"))
+        # This interpreter never computed "k" itself: the delta comes from the cache
+        interpreter = CacheInterpreter(cache=mock_cache, rng=_half)
+
+        result = await interpreter.get_or_compute(
+            GetOrCompute(key="k", program=_compute(b"second"), ttl_seconds=60), sub_interpreter
+        )
+
+        assert result == Ok(EffectReturn(value=b"second", effect_name="GetOrCompute"))
+        [(entries, ttl, tags)] = [call.args for call in mock_cache.put_values.await_args_list]
+        assert entries[0] == ("k", b"second") and ttl == 60 and tags == ()
+
+    @pytest.mark.asyncio()
+    async def test_failed_early_refresh_serves_current_value(self, mocker: MockerFixture) -> None:
+        """An early refresh whose sub-program fails returns the still-valid hit."""
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+        mock_cache.get_values.return_value = _lookup(
+            CacheHit(value=b"first", ttl_remaining=1), delta_seconds=2.0
+        )
+        sub_interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        sub_interpreter.interpret.return_value = Err(
+            CacheError(effect=SendText(text="computing"), cache_error="down", is_retryable=True)
+        )
+        interpreter = CacheInterpreter(cache=mock_cache, rng=_half)
+
+        result = await interpreter.get_or_compute(
+            GetOrCompute(key="k", program=_compute(b"second")), sub_interpreter
+        )
+
+        assert result == Ok(EffectReturn(value=b"first", effect_name="GetOrCompute"))
+        sub_interpreter.interpret.assert_awaited_once()
+        mock_cache.put_values.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_hit_is_served_when_draw_is_below_remaining_ttl(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Entries far from expiry, unknown deltas and beta=0 are served from cache."""
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+        sub_interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        interpreter = CacheInterpreter(cache=mock_cache, rng=_half)
+        disabled = CacheInterpreter(cache=mock_cache, early_expiration_beta=0.0, rng=_half)
+        near_expiry = CacheHit(value=b"cached", ttl_remaining=1)
+
+        for lookup in (
+            _lookup(near_expiry),
+            _lookup(CacheHit(value=b"cached", ttl_remaining=3600), delta_seconds=2.0),
+            _lookup(near_expiry, delta_seconds=0.001),
+        ):
+            mock_cache.get_values.return_value = lookup
+            result = await interpreter.get_or_compute(
+                GetOrCompute(key="k", program=_compute(b"fresh")), sub_interpreter
+            )
+            assert result == Ok(EffectReturn(value=b"cached", effect_name="GetOrCompute"))
+
+        mock_cache.get_value.return_value = near_expiry
+        result = await disabled.get_or_compute(
+            GetOrCompute(key="k", program=_compute(b"fresh")), sub_interpreter
+        )
+        assert result == Ok(EffectReturn(value=b"cached", effect_name="GetOrCompute"))
+        sub_interpreter.interpret.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_disabled_early_expiration_skips_delta_key(self, mocker: MockerFixture) -> None:
+        """With beta=0 the value is read and written alone, without a duration key."""
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+        mock_cache.get_value.return_value = _MISS
+        sub_interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        sub_interpreter.interpret.return_value = Ok(EffectReturn(value=None, effect_name="X"))
+        interpreter = CacheInterpreter(cache=mock_cache, early_expiration_beta=0.0)
+
+        await interpreter.get_or_compute(
+            GetOrCompute(key="k", program=_compute(b"v"), ttl_seconds=30), sub_interpreter
+        )
+
+        mock_cache.put_value.assert_awaited_once_with("k", b"v", 30, ())
+        mock_cache.get_values.assert_not_called()
+        mock_cache.put_values.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_early_refresh_is_not_blocked_by_peer_lock(self, mocker: MockerFixture) -> None:
+        """If another instance is already refreshing, the current value is returned."""
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+        mock_cache.get_values.return_value = _lookup(
+            CacheHit(value=b"first", ttl_remaining=1), delta_seconds=2.0
+        )
+        mock_lock = mocker.AsyncMock(spec=CacheLock)
+        mock_lock.acquire.return_value = Absent(reason="lock_held")
+        sub_interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        interpreter = CacheInterpreter(cache=mock_cache, lock=mock_lock, rng=_half)
+
+        result = await interpreter.get_or_compute(
+            GetOrCompute(key="k", program=_compute(b"second")), sub_interpreter
+        )
+
+        assert result == Ok(EffectReturn(value=b"first", effect_name="GetOrCompute"))
+        mock_cache.get_value.assert_not_called()
+        sub_interpreter.interpret.assert_not_called()
@@ -10,6 +10,7 @@ Tests cover:
 - Immutability
 """
 
+from collections.abc import Generator
 from dataclasses import FrozenInstanceError, dataclass
 from datetime import datetime
 from uuid import uuid4
@@ -19,7 +20,7 @@ from pytest_mock import MockerFixture
 
 from effectful.algebraic.effect_return import EffectReturn
 from effectful.algebraic.result import Err, Ok
-from effectful.domain.cache_result import CacheHit
+from effectful.domain.cache_result import CacheHit, CacheMiss
 from effectful.domain.message import ChatMessage
 from effectful.domain.profile import ProfileData
 from effectful.domain.user import User, UserFound
@@ -28,7 +29,7 @@ from effectful.domain.optional_value import Absent
 from effectful.domain.s3_object import PutSuccess
 from effectful.domain.token_result import TokenValid
 from effectful.effects.auth import ValidateToken
-from effectful.effects.cache import GetCachedProfile, PutCachedProfile
+from effectful.effects.cache import GetCachedProfile, GetOrCompute, PutCachedProfile
 from effectful.effects.database import GetUserById, SaveChatMessage
 from effectful.effects.messaging import PublishMessage
 from effectful.effects.storage import PutObject
@@ -49,6 +50,7 @@ from effectful.interpreters.metrics import MetricsInterpreter
 from effectful.interpreters.system import SystemInterpreter
 from effectful.interpreters.websocket import WebSocketInterpreter
 from effectful.interpreters.errors import UnhandledEffectError
+from effectful.programs.program_types import AllEffects, EffectResult
 
 
 class TestCompositeInterpreter:
@@ -85,6 +87,42 @@ class TestCompositeInterpreter:
         mock_ws.is_open.assert_called_once()
         mock_ws.send_text.assert_called_once_with("hello")
 
+    @pytest.mark.asyncio()
+    async def test_get_or_compute_runs_sub_program_with_all_interpreters(
+        self, mocker: MockerFixture
+    ) -> None:
+        """GetOrCompute sub-programs can yield database effects and populate the cache."""
+        user = User(id=uuid4(), email="alice@example.com", name="Alice")
+        mock_ws = mocker.AsyncMock(spec=WebSocketConnection)
+        mock_user_repo = mocker.AsyncMock(spec=UserRepository)
+        mock_user_repo.get_by_id.return_value = UserFound(user=user, source="database")
+        mock_msg_repo = mocker.AsyncMock(spec=ChatMessageRepository)
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+        mock_cache.get_values.return_value = (
+            CacheMiss(key="name", reason="not_found"),
+            CacheMiss(key="name:xfetch-delta", reason="not_found"),
+        )
+
+        interpreter = create_composite_interpreter(
+            websocket_connection=mock_ws,
+            user_repo=mock_user_repo,
+            message_repo=mock_msg_repo,
+            cache=mock_cache,
+        )
+
+        def load_name() -> Generator[AllEffects, EffectResult, EffectResult]:
+            found = yield GetUserById(user_id=user.id)
+            assert isinstance(found, User)
+            return found.name.encode()
+
+        result = await interpreter.interpret(
+            GetOrCompute(key="name", program=load_name(), ttl_seconds=60)
+        )
+
+        assert result == Ok(EffectReturn(value=b"Alice", effect_name="GetOrCompute"))
+        [(entries, ttl, tags)] = [call.args for call in mock_cache.put_values.await_args_list]
+        assert entries[0] == ("name", b"Alice") and ttl == 60 and tags == ()
+
     @pytest.mark.asyncio()
     async def test_metrics_interpreter_unhandled_passes_through(
         self, mocker: MockerFixture
@@ -212,7 +250,7 @@ class TestCompositeInterpreter:
                 pytest.fail(f"Expected Ok with GetCachedProfile, got {get_result}")
 
         # Verify cache was used
-        mock_cache.put_profile.assert_called_once_with(user_id, profile, 300)
+        mock_cache.put_profile.assert_called_once_with(user_id, profile, 300, ())
         mock_cache.get_profile.assert_called_once_with(user_id)
 
     @pytest.mark.asyncio()
@@ -396,6 +434,27 @@ class TestCompositeInterpreter:
         assert isinstance(interpreter.database, DatabaseInterpreter)
         assert isinstance(interpreter.cache, CacheInterpreter)
 
+    def test_create_composite_interpreter_with_read_through_cache(
+        self, mocker: MockerFixture
+    ) -> None:
+        """read_through_cache=True wraps the database interpreter with the cache."""
+        mock_cache = mocker.AsyncMock(spec=ProfileCache)
+
+        interpreter = create_composite_interpreter(
+            websocket_connection=mocker.AsyncMock(spec=WebSocketConnection),
+            user_repo=mocker.AsyncMock(spec=UserRepository),
+            message_repo=mocker.AsyncMock(spec=ChatMessageRepository),
+            cache=mock_cache,
+            read_through_cache=True,
+        )
+
+        from effectful.interpreters.database import DatabaseInterpreter
+        from effectful.interpreters.read_through import ReadThroughCacheInterpreter
+
+        assert isinstance(interpreter.database, ReadThroughCacheInterpreter)
+        assert isinstance(interpreter.database.inner, DatabaseInterpreter)
+        assert interpreter.database.cache is mock_cache
+
     @pytest.mark.asyncio()
     async def test_interpret_messaging_effect(self, mocker: MockerFixture) -> None:
         """Composite interpreter should delegate Messaging effects when configured."""
@@ -5,11 +5,15 @@ Tests cover:
 - User lookup (found/not found)
 - Message saving
 - Message listing
+- Upserts and version-checked updates
 - Database errors and retryability
+- Transactions (commit, rollback, configuration errors)
+- Negative caching of UserNotFound lookups
 - Unhandled effects
 - Immutability
 """
 
+from collections.abc import Generator
 from dataclasses import FrozenInstanceError
 from datetime import datetime
 from uuid import uuid4
@@ -18,23 +22,41 @@ import pytest
 from pytest_mock import MockerFixture
 
 from effectful.algebraic.effect_return import EffectReturn
+from effectful.adapters.negative_cache import InMemoryNegativeCache
 from effectful.algebraic.result import Err, Ok
 from effectful.domain.message import ChatMessage
 from effectful.domain.optional_value import Absent, Provided
-from effectful.domain.user import User, UserFound, UserNotFound
+from effectful.domain.user import (
+    User,
+    UserEmailExists,
+    UserFound,
+    UserNotFound,
+    UserVersionConflict,
+)
 from effectful.effects.database import (
     CreateUser,
+    DatabaseEffect,
     DeleteUser,
     GetUserById,
     ListMessagesForUser,
     ListUsers,
     SaveChatMessage,
+    Transaction,
     UpdateUser,
+    UpdateUserIf,
+    UpsertUser,
 )
 from effectful.effects.websocket import SendText
-from effectful.infrastructure.repositories import ChatMessageRepository, UserRepository
+from effectful.infrastructure.cache import NegativeLookupCache
+from effectful.infrastructure.repositories import (
+    ChatMessageRepository,
+    TransactionManager,
+    UnitOfWork,
+    UserRepository,
+)
 from effectful.interpreters.database import DatabaseInterpreter
 from effectful.interpreters.errors import DatabaseError, UnhandledEffectError
+from effectful.programs.program_types import EffectResult
 
 
 class TestDatabaseInterpreter:
@@ -568,3 +590,461 @@ class TestDatabaseInterpreter:
                 assert e == effect
             case _:
                 pytest.fail(f"Expected DatabaseError, got {result}")
+
+    @pytest.mark.asyncio()
+    async def test_upsert_user_success(self, mocker: MockerFixture) -> None:
+        """Interpreter should return the created User from upsert."""
+        user = User(id=uuid4(), email="alice@example.com", name="Alice")
+
+        mock_user_repo = mocker.AsyncMock(spec=UserRepository)
+        mock_user_repo.upsert_user.return_value = user
+        mock_msg_repo = mocker.AsyncMock(spec=ChatMessageRepository)
+
+        interpreter = DatabaseInterpreter(user_repo=mock_user_repo, message_repo=mock_msg_repo)
+
+        effect = UpsertUser(email="alice@example.com", name="Alice", password_hash="hash")
+        result = await interpreter.interpret(effect)
+
+        match result:
+            case Ok(EffectReturn(value=returned, effect_name="UpsertUser")):
+                assert returned == user
+            case _:
+                pytest.fail(f"Expected Ok with User, got {result}")
+
+        mock_user_repo.upsert_user.assert_called_once_with("alice@example.com", "Alice", "hash")
+
+    @pytest.mark.asyncio()
+    async def test_upsert_user_email_exists_is_ok(self, mocker: MockerFixture) -> None:
+        """A taken email is returned as the UserEmailExists ADT, not an error."""
+        existing = User(id=uuid4(), email="alice@example.com", name="Alice")
+        taken = UserEmailExists(email="alice@example.com", current=existing)
+
+        mock_user_repo = mocker.AsyncMock(spec=UserRepository)
+        mock_user_repo.upsert_user.return_value = taken
+        mock_msg_repo = mocker.AsyncMock(spec=ChatMessageRepository)
+
+        interpreter = DatabaseInterpreter(user_repo=mock_user_repo, message_repo=mock_msg_repo)
+
+        result = await interpreter.interpret(
+            UpsertUser(email="alice@example.com", name="Mallory", password_hash="hash")
+        )
+
+        assert result == Ok(EffectReturn(value=taken, effect_name="UpsertUser"))
+
+    @pytest.mark.asyncio()
+    async def test_update_user_if_applied(self, mocker: MockerFixture) -> None:
+        """Interpreter should return the updated User when the version matches."""
+        user_id = uuid4()
+        updated_user = User(id=user_id, email="a@example.com", name="New", version=4)
+
+        mock_user_repo = mocker.AsyncMock(spec=UserRepository)
+        mock_user_repo.update_user_if.return_value = UserFound(user=updated_user, source="database")
+        mock_msg_repo = mocker.AsyncMock(spec=ChatMessageRepository)
+
+        interpreter = DatabaseInterpreter(user_repo=mock_user_repo, message_repo=mock_msg_repo)
+
+        effect = UpdateUserIf(user_id=user_id, expected_version=3, name="New")
+        result = await interpreter.interpret(effect)
+
+        match result:
+            case Ok(EffectReturn(value=User(version=4), effect_name="UpdateUserIf")):
+                pass  # Success
+            case _:
+                pytest.fail(f"Expected Ok with updated User, got {result}")
+
+        mock_user_repo.update_user_if.assert_called_once_with(
+            user_id, 3, Absent(), Provided(value="New")
+        )
+
+    @pytest.mark.asyncio()
+    async def test_update_user_if_version_conflict(self, mocker: MockerFixture) -> None:
+        """Interpreter should return UserVersionConflict as a value, not an error."""
+        user_id = uuid4()
+        current = User(id=user_id, email="a@example.com", name="Other", version=5)
+
+        mock_user_repo = mocker.AsyncMock(spec=UserRepository)
+        mock_user_repo.update_user_if.return_value = UserVersionConflict(
+            user_id=user_id, expected_version=3, current=current
+        )
+        mock_msg_repo = mocker.AsyncMock(spec=ChatMessageRepository)
+
+        interpreter = DatabaseInterpreter(user_repo=mock_user_repo, message_repo=mock_msg_repo)
+
+        effect = UpdateUserIf(user_id=user_id, expected_version=3, name="New")
+        result = await interpreter.interpret(effect)
+
+        match result:
+            case Ok(
+                EffectReturn(
+                    value=UserVersionConflict(expected_version=3, current=User(version=5)),
+                    effect_name="UpdateUserIf",
+                )
+            ):
+                pass  # Success
+            case _:
+                pytest.fail(f"Expected Ok with UserVersionConflict, got {result}")
+
+
+def _register_program(
+    email: str, name: str
+) -> Generator[DatabaseEffect, EffectResult, EffectResult]:
+    """Create a user and greet them - two writes that must commit together."""
+    user = yield CreateUser(email=email, name=name, password_hash="hash")
+    assert isinstance(user, User)
+    message = yield SaveChatMessage(user_id=user.id, text="Welcome!")
+    return message
+
+
+class TestDatabaseInterpreterTransaction:
+    """Tests for Transaction effect handling in DatabaseInterpreter."""
+
+    @pytest.mark.asyncio()
+    async def test_transaction_commits_and_returns_program_value(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Sub-program effects should run on the unit of work and commit once."""
+        user = User(id=uuid4(), email="new@example.com", name="New User")
+        message = ChatMessage(
+            id=uuid4(), user_id=user.id, text="Welcome!", created_at=datetime.now()
+        )
+
+        # Outer repositories must not be touched inside the transaction
+        mock_user_repo = mocker.AsyncMock(spec=UserRepository)
+        mock_msg_repo = mocker.AsyncMock(spec=ChatMessageRepository)
+
+        tx_user_repo = mocker.AsyncMock(spec=UserRepository)
+        tx_user_repo.create_user.return_value = user
+        tx_msg_repo = mocker.AsyncMock(spec=ChatMessageRepository)
+        tx_msg_repo.save_message.return_value = message
+        mock_uow = mocker.AsyncMock(spec=UnitOfWork)
+        mock_uow.user_repo = tx_user_repo
+        mock_uow.message_repo = tx_msg_repo
+        mock_manager = mocker.AsyncMock(spec=TransactionManager)
+        mock_manager.begin.return_value = mock_uow
+
+        interpreter = DatabaseInterpreter(
+            user_repo=mock_user_repo,
+            message_repo=mock_msg_repo,
+            transaction_manager=mock_manager,
+        )
+
+        result = await interpreter.interpret(
+            Transaction(program=_register_program("new@example.com", "New User"))
+        )
+
+        match result:
+            case Ok(EffectReturn(value=value, effect_name="Transaction")):
+                assert value == message
+            case _:
+                pytest.fail(f"Expected Ok with message, got {result}")
+
+        tx_user_repo.create_user.assert_called_once_with("new@example.com", "New User", "hash")
+        tx_msg_repo.save_message.assert_called_once_with(user.id, "Welcome!")
+        mock_user_repo.create_user.assert_not_called()
+        mock_msg_repo.save_message.assert_not_called()
+        mock_uow.commit.assert_awaited_once()
+        mock_uow.rollback.assert_not_awaited()
+
+    @pytest.mark.asyncio()
+    async def test_transaction_rolls_back_on_failed_effect(self, mocker: MockerFixture) -> None:
+        """First failing effect should roll back and surface its own error."""
+        user = User(id=uuid4(), email="new@example.com", name="New User")
+
+        tx_user_repo = mocker.AsyncMock(spec=UserRepository)
+        tx_user_repo.create_user.return_value = user
+        tx_msg_repo = mocker.AsyncMock(spec=ChatMessageRepository)
+        tx_msg_repo.save_message.side_effect = Exception("connection reset")
+        mock_uow = mocker.AsyncMock(spec=UnitOfWork)
+        mock_uow.user_repo = tx_user_repo
+        mock_uow.message_repo = tx_msg_repo
+        mock_manager = mocker.AsyncMock(spec=TransactionManager)
+        mock_manager.begin.return_value = mock_uow
+
+        interpreter = DatabaseInterpreter(
+            user_repo=mocker.AsyncMock(spec=UserRepository),
+            message_repo=mocker.AsyncMock(spec=ChatMessageRepository),
+            transaction_manager=mock_manager,
+        )
+
+        result = await interpreter.interpret(
+            Transaction(program=_register_program("new@example.com", "New User"))
+        )
+
+        match result:
+            case Err(DatabaseError(effect=SaveChatMessage(), db_error="connection reset")):
+                pass
+            case _:
+                pytest.fail(f"Expected DatabaseError from SaveChatMessage, got {result}")
+
+        mock_uow.rollback.assert_awaited_once()
+        mock_uow.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio()
+    async def test_transaction_commit_failure_returns_database_error(
+        self, mocker: MockerFixture
+    ) -> None:
+        """A failed COMMIT should be reported as DatabaseError for the Transaction."""
+        user = User(id=uuid4(), email="new@example.com", name="New User")
+        message = ChatMessage(
+            id=uuid4(), user_id=user.id, text="Welcome!", created_at=datetime.now()
+        )
+
+        tx_user_repo = mocker.AsyncMock(spec=UserRepository)
+        tx_user_repo.create_user.return_value = user
+        tx_msg_repo = mocker.AsyncMock(spec=ChatMessageRepository)
+        tx_msg_repo.save_message.return_value = message
+        mock_uow = mocker.AsyncMock(spec=UnitOfWork)
+        mock_uow.user_repo = tx_user_repo
+        mock_uow.message_repo = tx_msg_repo
+        mock_uow.commit.side_effect = Exception("serialization failure")
+        mock_manager = mocker.AsyncMock(spec=TransactionManager)
+        mock_manager.begin.return_value = mock_uow
+
+        interpreter = DatabaseInterpreter(
+            user_repo=mocker.AsyncMock(spec=UserRepository),
+            message_repo=mocker.AsyncMock(spec=ChatMessageRepository),
+            transaction_manager=mock_manager,
+        )
+
+        effect = Transaction(program=_register_program("new@example.com", "New User"))
+        result = await interpreter.interpret(effect)
+
+        match result:
+            case Err(DatabaseError(effect=e, db_error="serialization failure")):
+                assert e == effect
+            case _:
+                pytest.fail(f"Expected DatabaseError, got {result}")
+
+    @pytest.mark.asyncio()
+    async def test_transaction_without_manager_returns_error(self, mocker: MockerFixture) -> None:
+        """Transaction needs a transaction manager; without one nothing runs."""
+        mock_user_repo = mocker.AsyncMock(spec=UserRepository)
+        interpreter = DatabaseInterpreter(
+            user_repo=mock_user_repo,
+            message_repo=mocker.AsyncMock(spec=ChatMessageRepository),
+        )
+
+        result = await interpreter.interpret(
+            Transaction(program=_register_program("new@example.com", "New User"))
+        )
+
+        match result:
+            case Err(DatabaseError(is_retryable=False)):
+                pass
+            case _:
+                pytest.fail(f"Expected non-retryable DatabaseError, got {result}")
+
+        mock_user_repo.create_user.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_transaction_rejects_non_database_effects(self, mocker: MockerFixture) -> None:
+        """Non-database effects inside a transaction roll back as unhandled."""
+
+        def leaky_program() -> Generator[DatabaseEffect, EffectResult, EffectResult]:
+            yield SendText(text="not allowed")  # type: ignore[misc]
+            return None
+
+        mock_uow = mocker.AsyncMock(spec=UnitOfWork)
+        mock_uow.user_repo = mocker.AsyncMock(spec=UserRepository)
+        mock_uow.message_repo = mocker.AsyncMock(spec=ChatMessageRepository)
+        mock_manager = mocker.AsyncMock(spec=TransactionManager)
+        mock_manager.begin.return_value = mock_uow
+
+        interpreter = DatabaseInterpreter(
+            user_repo=mocker.AsyncMock(spec=UserRepository),
+            message_repo=mocker.AsyncMock(spec=ChatMessageRepository),
+            transaction_manager=mock_manager,
+        )
+
+        result = await interpreter.interpret(Transaction(program=leaky_program()))
+
+        match result:
+            case Err(UnhandledEffectError(effect=SendText())):
+                pass
+            case _:
+                pytest.fail(f"Expected UnhandledEffectError, got {result}")
+
+        mock_uow.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio()
+    async def test_nested_transaction_begins_on_unit_of_work(self, mocker: MockerFixture) -> None:
+        """Nested Transaction effects should start savepoints of the outer unit of work."""
+        user = User(id=uuid4(), email="new@example.com", name="New User")
+
+        def outer_program() -> Generator[DatabaseEffect, EffectResult, EffectResult]:
+            inner = yield Transaction(program=_register_program("new@example.com", "New User"))
+            return inner
+
+        nested_uow = mocker.AsyncMock(spec=UnitOfWork)
+        nested_uow.user_repo = mocker.AsyncMock(spec=UserRepository)
+        nested_uow.user_repo.create_user.return_value = user
+        nested_uow.message_repo = mocker.AsyncMock(spec=ChatMessageRepository)
+        outer_uow = mocker.AsyncMock(spec=UnitOfWork)
+        outer_uow.begin.return_value = nested_uow
+        mock_manager = mocker.AsyncMock(spec=TransactionManager)
+        mock_manager.begin.return_value = outer_uow
+
+        interpreter = DatabaseInterpreter(
+            user_repo=mocker.AsyncMock(spec=UserRepository),
+            message_repo=mocker.AsyncMock(spec=ChatMessageRepository),
+            transaction_manager=mock_manager,
+        )
+
+        result = await interpreter.interpret(Transaction(program=outer_program()))
+
+        assert isinstance(result, Ok)
+        mock_manager.begin.assert_awaited_once()
+        outer_uow.begin.assert_awaited_once()
+        nested_uow.commit.assert_awaited_once()
+        outer_uow.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio()
+    async def test_sub_program_exception_survives_failed_rollback(
+        self, mocker: MockerFixture
+    ) -> None:
+        """An exception from the sub-program should propagate even if rollback fails."""
+
+        def raising_program() -> Generator[DatabaseEffect, EffectResult, EffectResult]:
+            yield GetUserById(user_id=uuid4())
+            raise KeyError("bug in program")
+
+        mock_uow = mocker.AsyncMock(spec=UnitOfWork)
+        mock_uow.user_repo = mocker.AsyncMock(spec=UserRepository)
+        mock_uow.user_repo.get_by_id.return_value = UserNotFound(
+            user_id=uuid4(), reason="does_not_exist"
+        )
+        mock_uow.message_repo = mocker.AsyncMock(spec=ChatMessageRepository)
+        mock_uow.rollback.side_effect = ConnectionError("connection lost")
+        mock_manager = mocker.AsyncMock(spec=TransactionManager)
+        mock_manager.begin.return_value = mock_uow
+
+        interpreter = DatabaseInterpreter(
+            user_repo=mocker.AsyncMock(spec=UserRepository),
+            message_repo=mocker.AsyncMock(spec=ChatMessageRepository),
+            transaction_manager=mock_manager,
+        )
+
+        with pytest.raises(KeyError, match="bug in program"):
+            await interpreter.interpret(Transaction(program=raising_program()))
+
+        mock_uow.rollback.assert_awaited_once()
+
+
+class TestDatabaseInterpreterNegativeCache:
+    """Tests for DatabaseInterpreter with a negative cache."""
+
+    @pytest.mark.asyncio()
+    async def test_repeated_missing_user_lookups_skip_repository(
+        self, mocker: MockerFixture
+    ) -> None:
+        """A remembered UserNotFound is returned without querying the repository."""
+        user_id = uuid4()
+        not_found = UserNotFound(user_id=user_id, reason="deleted")
+        mock_user_repo = mocker.AsyncMock(spec=UserRepository)
+        mock_user_repo.get_by_id.return_value = not_found
+        mock_msg_repo = mocker.AsyncMock(spec=ChatMessageRepository)
+        interpreter = DatabaseInterpreter(
+            user_repo=mock_user_repo,
+            message_repo=mock_msg_repo,
+            negative_cache=InMemoryNegativeCache(),
+        )
+
+        first = await interpreter.interpret(GetUserById(user_id=user_id))
+        second = await interpreter.interpret(GetUserById(user_id=user_id))
+
+        assert first == second == Ok(EffectReturn(value=not_found, effect_name="GetUserById"))
+        mock_user_repo.get_by_id.assert_called_once_with(user_id)
+
+    @pytest.mark.asyncio()
+    async def test_create_and_upsert_forget_remembered_miss(self, mocker: MockerFixture) -> None:
+        """Creating a user drops any negative entry for its ID."""
+        user = User(id=uuid4(), email="new@example.com", name="New")
+        mock_user_repo = mocker.AsyncMock(spec=UserRepository)
+        mock_user_repo.create_user.return_value = user
+        mock_user_repo.upsert_user.return_value = user
+        mock_user_repo.get_by_id.side_effect = [
+            UserNotFound(user_id=user.id, reason="does_not_exist"),
+            UserFound(user=user, source="database"),
+            UserNotFound(user_id=user.id, reason="does_not_exist"),
+            UserFound(user=user, source="database"),
+        ]
+        mock_msg_repo = mocker.AsyncMock(spec=ChatMessageRepository)
+        interpreter = DatabaseInterpreter(
+            user_repo=mock_user_repo,
+            message_repo=mock_msg_repo,
+            negative_cache=InMemoryNegativeCache(),
+        )
+
+        for write in (
+            CreateUser(email=user.email, name=user.name, password_hash="h"),
+            UpsertUser(email=user.email, name=user.name, password_hash="h"),
+        ):
+            await interpreter.interpret(GetUserById(user_id=user.id))
+            await interpreter.interpret(write)
+            result = await interpreter.interpret(GetUserById(user_id=user.id))
+            assert result == Ok(EffectReturn(value=user, effect_name="GetUserById"))
+
+        assert mock_user_repo.get_by_id.call_count == 4
+
+    @pytest.mark.asyncio()
+    async def test_transaction_forgets_miss_only_after_commit(self, mocker: MockerFixture) -> None:
+        """Users created in a Transaction are forgotten after commit, never on rollback."""
+        user = User(id=uuid4(), email="new@example.com", name="New")
+        message = ChatMessage(
+            id=uuid4(), user_id=user.id, text="Welcome!", created_at=datetime.now()
+        )
+        tx_user_repo = mocker.AsyncMock(spec=UserRepository)
+        tx_user_repo.create_user.return_value = user
+        tx_msg_repo = mocker.AsyncMock(spec=ChatMessageRepository)
+        tx_msg_repo.save_message.side_effect = [message, ConnectionError("connection reset")]
+        mock_uow = mocker.AsyncMock(spec=UnitOfWork)
+        mock_uow.user_repo = tx_user_repo
+        mock_uow.message_repo = tx_msg_repo
+        mock_manager = mocker.AsyncMock(spec=TransactionManager)
+        mock_manager.begin.return_value = mock_uow
+        mock_negative_cache = mocker.AsyncMock(spec=NegativeLookupCache)
+        forgotten_at_commit: list[int] = []
+        mock_uow.commit.side_effect = lambda: forgotten_at_commit.append(
+            mock_negative_cache.forget.await_count
+        )
+        interpreter = DatabaseInterpreter(
+            user_repo=mocker.AsyncMock(spec=UserRepository),
+            message_repo=mocker.AsyncMock(spec=ChatMessageRepository),
+            transaction_manager=mock_manager,
+            negative_cache=mock_negative_cache,
+        )
+
+        committed = await interpreter.interpret(
+            Transaction(program=_register_program(user.email, user.name))
+        )
+        rolled_back = await interpreter.interpret(
+            Transaction(program=_register_program(user.email, user.name))
+        )
+
+        assert isinstance(committed, Ok) and isinstance(rolled_back, Err)
+        assert forgotten_at_commit == [0]
+        mock_negative_cache.forget.assert_awaited_once_with(f"user:{user.id}")
+
+    @pytest.mark.asyncio()
+    async def test_negative_cache_failure_falls_back_to_repository(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Errors from the negative cache never fail the lookup."""
+        user_id = uuid4()
+        not_found = UserNotFound(user_id=user_id, reason="does_not_exist")
+        mock_user_repo = mocker.AsyncMock(spec=UserRepository)
+        mock_user_repo.get_by_id.return_value = not_found
+        mock_msg_repo = mocker.AsyncMock(spec=ChatMessageRepository)
+        mock_negative_cache = mocker.AsyncMock(spec=NegativeLookupCache)
+        mock_negative_cache.get_miss.side_effect = ConnectionError("down")
+        mock_negative_cache.put_miss.side_effect = ConnectionError("down")
+        interpreter = DatabaseInterpreter(
+            user_repo=mock_user_repo,
+            message_repo=mock_msg_repo,
+            negative_cache=mock_negative_cache,
+        )
+
+        result = await interpreter.interpret(GetUserById(user_id=user_id))
+
+        assert result == Ok(EffectReturn(value=not_found, effect_name="GetUserById"))
+        mock_user_repo.get_by_id.assert_called_once_with(user_id)
@@ -3,6 +3,7 @@
 This module tests the MessagingInterpreter using pytest mocks (via pytest-mock).
 Tests cover:
 - Message publishing (success, domain failures, infrastructure errors)
+- Value publishing and payload decoding with message codecs
 - Message consumption (success, timeout, errors)
 - Message acknowledgment (success, errors)
 - Negative acknowledgment (success, errors)
@@ -19,7 +20,13 @@ from pytest_mock import MockerFixture
 
 from effectful.algebraic.effect_return import EffectReturn
 from effectful.algebraic.result import Err, Ok
+from effectful.adapters.message_codecs import (
+    JsonMessageCodec,
+    SchemaTaggedCodec,
+    TopicCodecRegistry,
+)
 from effectful.domain.message_envelope import (
+    CONTENT_TYPE_PROPERTY,
     AcknowledgeFailure,
     AcknowledgeSuccess,
     ConsumeTimeout,
@@ -31,11 +38,16 @@ from effectful.domain.message_envelope import (
     PublishSuccess,
 )
 from effectful.effects.messaging import (
+    AcknowledgeBatch,
     AcknowledgeMessage,
+    ConsumeBatch,
     ConsumeMessage,
     NegativeAcknowledge,
     PublishMessage,
+    PublishMessages,
+    PublishValue,
 )
+from effectful.domain.optional_value import Absent, Provided
 from effectful.effects.websocket import SendText
 from effectful.infrastructure.messaging import MessageConsumer, MessageProducer
 from effectful.interpreters.errors import MessagingError, UnhandledEffectError
@@ -180,6 +192,99 @@ class TestPublishMessage:
         mock_producer.publish.assert_called_once_with("events", b"data", properties=None)
 
 
+class TestPublishMessages:
+    """Tests for PublishMessages effect handling."""
+
+    @pytest.mark.asyncio()
+    async def test_publish_messages_returns_aligned_results(self, mocker: MockerFixture) -> None:
+        """Interpreter should return the producer's per-message results unchanged."""
+        results = (
+            PublishSuccess(message_id="msg-1", topic="events"),
+            PublishFailure(topic="events", reason="message_too_large"),
+        )
+        mock_producer = mocker.AsyncMock(spec=MessageProducer)
+        mock_producer.publish_many.return_value = results
+        interpreter = MessagingInterpreter(
+            producer=mock_producer, consumer=mocker.AsyncMock(spec=MessageConsumer)
+        )
+
+        result = await interpreter.interpret(
+            PublishMessages(topic="events", payloads=[b"a", b"b"], properties={"k": "v"})
+        )
+
+        assert result == Ok(EffectReturn(value=results, effect_name="PublishMessages"))
+        mock_producer.publish_many.assert_awaited_once_with(
+            "events", (b"a", b"b"), properties={"k": "v"}
+        )
+
+    @pytest.mark.asyncio()
+    async def test_publish_messages_infrastructure_error(self, mocker: MockerFixture) -> None:
+        """Interpreter should return MessagingError when the producer raises."""
+        mock_producer = mocker.AsyncMock(spec=MessageProducer)
+        mock_producer.publish_many.side_effect = ConnectionError("Connection refused")
+        interpreter = MessagingInterpreter(
+            producer=mock_producer, consumer=mocker.AsyncMock(spec=MessageConsumer)
+        )
+        effect = PublishMessages(topic="events", payloads=[b"a"])
+
+        result = await interpreter.interpret(effect)
+
+        match result:
+            case Err(MessagingError(effect=e, is_retryable=True)):
+                assert e == effect
+            case _:
+                pytest.fail(f"Expected retryable MessagingError, got {result}")
+
+
+class TestPublishValue:
+    """Tests for PublishValue effect handling."""
+
+    @pytest.mark.asyncio()
+    async def test_publish_value_encodes_with_topic_codec(self, mocker: MockerFixture) -> None:
+        """Interpreter should encode the value and send the codec's content type."""
+        codec = JsonMessageCodec()
+        mock_producer = mocker.AsyncMock(spec=MessageProducer)
+        mock_producer.publish.return_value = PublishSuccess(message_id="msg-1", topic="events")
+        interpreter = MessagingInterpreter(
+            producer=mock_producer,
+            consumer=mocker.AsyncMock(spec=MessageConsumer),
+            codecs=TopicCodecRegistry({"events": codec}),
+        )
+
+        result = await interpreter.interpret(
+            PublishValue(topic="events", value={"id": 1}, properties={"source": "web"})
+        )
+
+        assert result == Ok(EffectReturn(value="msg-1", effect_name="PublishValue"))
+        mock_producer.publish.assert_awaited_once_with(
+            "events",
+            b'{"id":1}',
+            properties={"source": "web", CONTENT_TYPE_PROPERTY: "application/json"},
+        )
+
+    @pytest.mark.asyncio()
+    async def test_publish_value_without_codec_is_not_retryable(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Interpreter should return a non-retryable MessagingError when no codec applies."""
+        mock_producer = mocker.AsyncMock(spec=MessageProducer)
+        interpreter = MessagingInterpreter(
+            producer=mock_producer,
+            consumer=mocker.AsyncMock(spec=MessageConsumer),
+            codecs=TopicCodecRegistry({"events": JsonMessageCodec()}),
+        )
+        effect = PublishValue(topic="audit", value=1)
+
+        result = await interpreter.interpret(effect)
+
+        match result:
+            case Err(MessagingError(effect=e, is_retryable=False)):
+                assert e == effect
+            case _:
+                pytest.fail(f"Expected non-retryable MessagingError, got {result}")
+        mock_producer.publish.assert_not_awaited()
+
+
 class TestConsumeMessage:
     """Tests for ConsumeMessage effect handling."""
 
@@ -213,6 +318,34 @@ class TestConsumeMessage:
         # Verify mock was called correctly
         mock_consumer.receive.assert_called_once_with("my-sub", 5000)
 
+    @pytest.mark.asyncio()
+    async def test_consume_message_decodes_value(self, mocker: MockerFixture) -> None:
+        """Interpreter should decode payloads with the codec for their content type."""
+        codec = SchemaTaggedCodec(2, JsonMessageCodec())
+        envelope = MessageEnvelope(
+            message_id="msg-1",
+            payload=codec.encode({"event": "login"}),
+            properties={CONTENT_TYPE_PROPERTY: codec.content_type},
+            publish_time=datetime.now(UTC),
+            topic="user-events",
+        )
+        mock_consumer = mocker.AsyncMock(spec=MessageConsumer)
+        mock_consumer.receive.return_value = envelope
+        interpreter = MessagingInterpreter(
+            producer=mocker.AsyncMock(spec=MessageProducer),
+            consumer=mock_consumer,
+            codecs=TopicCodecRegistry({}, decoders=[codec]),
+        )
+
+        result = await interpreter.interpret(ConsumeMessage(subscription="my-sub"))
+
+        match result:
+            case Ok(EffectReturn(value=MessageEnvelope() as msg, effect_name="ConsumeMessage")):
+                assert msg.value == Provided(value={"event": "login"})
+                assert msg.payload == envelope.payload
+            case _:
+                pytest.fail(f"Expected Ok with decoded MessageEnvelope, got {result}")
+
     @pytest.mark.asyncio()
     async def test_consume_message_timeout(self, mocker: MockerFixture) -> None:
         """Interpreter should return ConsumeTimeout on timeout (no messages available)."""
@@ -289,6 +422,101 @@ class TestConsumeMessage:
                 pytest.fail(f"Expected MessagingError, got {result}")
 
 
+class TestBatchConsumeAndAcknowledge:
+    """Tests for ConsumeBatch and AcknowledgeBatch effect handling."""
+
+    @pytest.mark.asyncio()
+    async def test_consume_batch_returns_envelopes(self, mocker: MockerFixture) -> None:
+        """Interpreter should return the consumer's envelopes as one tuple."""
+        envelope = MessageEnvelope(
+            message_id="msg-1",
+            payload=b"data",
+            properties={},
+            publish_time=datetime.now(UTC),
+            topic="events",
+        )
+        mock_consumer = mocker.AsyncMock(spec=MessageConsumer)
+        mock_consumer.receive_batch.return_value = (envelope,)
+        interpreter = MessagingInterpreter(
+            producer=mocker.AsyncMock(spec=MessageProducer), consumer=mock_consumer
+        )
+
+        result = await interpreter.interpret(
+            ConsumeBatch(subscription="events/worker", max_messages=10, max_wait_ms=20)
+        )
+
+        assert result == Ok(EffectReturn(value=(envelope,), effect_name="ConsumeBatch"))
+        mock_consumer.receive_batch.assert_awaited_once_with("events/worker", 10, 20)
+
+    @pytest.mark.asyncio()
+    async def test_consume_batch_marks_undecodable_envelopes(self, mocker: MockerFixture) -> None:
+        """Envelopes that fail to decode or have no codec are returned with Absent values."""
+        envelopes = tuple(
+            MessageEnvelope(
+                message_id=f"msg-{i}",
+                payload=payload,
+                properties=properties,
+                publish_time=datetime.now(UTC),
+                topic="events",
+            )
+            for i, (payload, properties) in enumerate(
+                [
+                    (b"[1,2]", {}),
+                    (b"not json", {}),
+                    (b"text", {CONTENT_TYPE_PROPERTY: "text/plain"}),
+                ]
+            )
+        )
+        mock_consumer = mocker.AsyncMock(spec=MessageConsumer)
+        mock_consumer.receive_batch.return_value = envelopes
+        interpreter = MessagingInterpreter(
+            producer=mocker.AsyncMock(spec=MessageProducer),
+            consumer=mock_consumer,
+            codecs=TopicCodecRegistry({"events": JsonMessageCodec()}),
+        )
+
+        result = await interpreter.interpret(ConsumeBatch(subscription="events/worker"))
+
+        match result:
+            case Ok(EffectReturn(value=tuple() as decoded, effect_name="ConsumeBatch")):
+                assert [e.value for e in decoded] == [
+                    Provided(value=[1, 2]),
+                    Absent(reason="decode_failed"),
+                    Absent(reason="no_codec"),
+                ]
+            case _:
+                pytest.fail(f"Expected Ok with envelopes, got {result}")
+
+    @pytest.mark.asyncio()
+    async def test_acknowledge_batch_passes_cumulative_flag(self, mocker: MockerFixture) -> None:
+        """Interpreter should forward the IDs and cumulative flag and return aligned results."""
+        results = (AcknowledgeSuccess(message_id="a"), AcknowledgeSuccess(message_id="b"))
+        mock_consumer = mocker.AsyncMock(spec=MessageConsumer)
+        mock_consumer.acknowledge_batch.return_value = results
+        interpreter = MessagingInterpreter(
+            producer=mocker.AsyncMock(spec=MessageProducer), consumer=mock_consumer
+        )
+
+        result = await interpreter.interpret(AcknowledgeBatch(["a", "b"], cumulative=True))
+
+        assert result == Ok(EffectReturn(value=results, effect_name="AcknowledgeBatch"))
+        mock_consumer.acknowledge_batch.assert_awaited_once_with(("a", "b"), cumulative=True)
+
+    @pytest.mark.asyncio()
+    async def test_consume_batch_infrastructure_error(self, mocker: MockerFixture) -> None:
+        """Interpreter should return MessagingError when the consumer raises."""
+        mock_consumer = mocker.AsyncMock(spec=MessageConsumer)
+        mock_consumer.receive_batch.side_effect = ConnectionError("Connection refused")
+        interpreter = MessagingInterpreter(
+            producer=mocker.AsyncMock(spec=MessageProducer), consumer=mock_consumer
+        )
+
+        result = await interpreter.interpret(ConsumeBatch(subscription="events/worker"))
+
+        assert isinstance(result, Err)
+        assert isinstance(result.error, MessagingError)
+
+
 class TestAcknowledgeMessage:
     """Tests for AcknowledgeMessage effect handling."""
 
@@ -0,0 +1,212 @@
+"""Tests for the read-through caching interpreter.
+
+Tests ReadThroughCacheInterpreter with a mocked inner interpreter and
+ProfileCache, and an in-memory metrics collector for hit/miss counts.
+"""
+
+from collections.abc import Generator
+from uuid import uuid4
+
+import pytest
+from pytest_mock import MockerFixture
+
+from effectful.adapters.in_memory_metrics import InMemoryMetricsCollector
+from effectful.algebraic.effect_return import EffectReturn
+from effectful.algebraic.result import Err, Ok
+from effectful.domain.cache_result import CacheHit, CacheMiss
+from effectful.domain.metrics_result import QuerySuccess
+from effectful.domain.optional_value import Absent
+from effectful.domain.user import User, UserNotFound
+from effectful.effects.database import (
+    CreateUser,
+    DatabaseEffect,
+    DeleteUser,
+    GetUserById,
+    ListUsers,
+    SaveChatMessage,
+    Transaction,
+    UpdateUser,
+)
+from effectful.infrastructure.cache import ProfileCache
+from effectful.interpreters.base import EffectInterpreter
+from effectful.interpreters.errors import DatabaseError
+from effectful.interpreters.read_through import (
+    USER_BY_ID,
+    USER_LIST,
+    USER_LIST_TAG,
+    ReadThroughCacheInterpreter,
+)
+from effectful.observability.framework_metrics import FRAMEWORK_METRICS
+from effectful.programs.program_types import EffectResult
+
+
+def _drive(
+    program: Generator[DatabaseEffect, EffectResult, EffectResult], user: User
+) -> EffectResult:
+    """Run a Transaction sub-program the way DatabaseInterpreter would."""
+    value: EffectResult = None
+    try:
+        while True:
+            match program.send(value):
+                case Transaction(program=nested):
+                    value = _drive(nested, user)
+                case CreateUser():
+                    value = user
+                case _:
+                    value = None
+    except StopIteration as stop:
+        returned: EffectResult = stop.value
+        return returned
+
+
+class TestReadThroughCacheInterpreter:
+    """Tests for ReadThroughCacheInterpreter."""
+
+    @pytest.mark.asyncio()
+    async def test_miss_runs_inner_and_caches_then_hit_skips_inner(
+        self, mocker: MockerFixture
+    ) -> None:
+        """The first read populates the cache; the second is served from it."""
+        user = User(id=uuid4(), name="Alice", email="alice@example.com", version=3)
+        effect = GetUserById(user_id=user.id)
+        inner = mocker.AsyncMock(spec=EffectInterpreter)
+        inner.interpret.return_value = Ok(EffectReturn(value=user, effect_name="GetUserById"))
+        cache = mocker.AsyncMock(spec=ProfileCache)
+        cache.get_value.return_value = CacheMiss(key="k", reason="not_found")
+        collector = InMemoryMetricsCollector()
+        await collector.register_metrics(FRAMEWORK_METRICS)
+        interpreter = ReadThroughCacheInterpreter(
+            inner=inner, cache=cache, metrics_collector=collector
+        )
+
+        first = await interpreter.interpret(effect)
+        key, payload, ttl, tags = cache.put_value.await_args.args
+        cache.get_value.return_value = CacheHit(value=payload, ttl_remaining=ttl)
+        second = await interpreter.interpret(effect)
+
+        assert first == second == Ok(EffectReturn(value=user, effect_name="GetUserById"))
+        assert (key, ttl, tags) == (f"db:user:{user.id}", USER_BY_ID.ttl_seconds, USER_BY_ID.tags)
+        inner.interpret.assert_awaited_once_with(effect)
+        for outcome in ("hit", "miss"):
+            counts = await collector.query_metrics(
+                "effectful_read_through_lookups_total",
+                {"effect_type": "GetUserById", "result": outcome},
+            )
+            assert isinstance(counts, QuerySuccess)
+            assert list(counts.metrics.values()) == [1.0]
+
+    @pytest.mark.asyncio()
+    async def test_user_lists_are_cached_under_tag(self, mocker: MockerFixture) -> None:
+        """ListUsers pages are keyed by limit/offset and tagged for invalidation."""
+        users = [User(id=uuid4(), name="Bob", email="bob@example.com")]
+        inner = mocker.AsyncMock(spec=EffectInterpreter)
+        inner.interpret.return_value = Ok(EffectReturn(value=users, effect_name="ListUsers"))
+        cache = mocker.AsyncMock(spec=ProfileCache)
+        cache.get_value.return_value = CacheMiss(key="k", reason="expired")
+        interpreter = ReadThroughCacheInterpreter(inner=inner, cache=cache)
+
+        await interpreter.interpret(ListUsers(limit=10, offset=20))
+        key, payload, ttl, tags = cache.put_value.await_args.args
+
+        assert key == "db:users:10:20"
+        assert (ttl, tags) == (USER_LIST.ttl_seconds, (USER_LIST_TAG,))
+        assert USER_LIST.decode(payload) == users
+
+    @pytest.mark.asyncio()
+    async def test_not_found_and_errors_are_not_cached(self, mocker: MockerFixture) -> None:
+        """UserNotFound results and inner errors pass through without a cache write."""
+        user_id = uuid4()
+        effect = GetUserById(user_id=user_id)
+        not_found = UserNotFound(user_id=user_id, reason="does_not_exist")
+        error = DatabaseError(effect=effect, db_error="timeout", is_retryable=True)
+        inner = mocker.AsyncMock(spec=EffectInterpreter)
+        inner.interpret.side_effect = [
+            Ok(EffectReturn(value=not_found, effect_name="GetUserById")),
+            Err(error),
+        ]
+        cache = mocker.AsyncMock(spec=ProfileCache)
+        cache.get_value.return_value = CacheMiss(key="k", reason="not_found")
+        interpreter = ReadThroughCacheInterpreter(inner=inner, cache=cache)
+
+        assert await interpreter.interpret(effect) == Ok(
+            EffectReturn(value=not_found, effect_name="GetUserById")
+        )
+        assert await interpreter.interpret(effect) == Err(error)
+        cache.put_value.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_writes_invalidate_user_and_lists(self, mocker: MockerFixture) -> None:
+        """Successful user writes drop the user's entry and every cached list page."""
+        user = User(id=uuid4(), name="Carol", email="carol@example.com")
+        inner = mocker.AsyncMock(spec=EffectInterpreter)
+        inner.interpret.side_effect = [
+            Ok(EffectReturn(value=user, effect_name="CreateUser")),
+            Ok(EffectReturn(value=user, effect_name="UpdateUser")),
+        ]
+        cache = mocker.AsyncMock(spec=ProfileCache)
+        interpreter = ReadThroughCacheInterpreter(inner=inner, cache=cache)
+
+        await interpreter.interpret(CreateUser(email=user.email, name=user.name, password_hash="h"))
+        await interpreter.interpret(
+            UpdateUser(user_id=user.id, email=Absent(), name=Absent(reason="unchanged"))
+        )
+
+        assert [call.args for call in cache.invalidate.await_args_list] == [
+            (f"db:user:{user.id}",)
+        ] * 2
+        assert [call.args for call in cache.invalidate_tag.await_args_list] == [
+            (USER_LIST_TAG,)
+        ] * 2
+
+    @pytest.mark.asyncio()
+    async def test_writes_in_transaction_invalidate_after_commit(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Users written inside a (nested) Transaction are invalidated once it commits."""
+        user = User(id=uuid4(), name="Erin", email="erin@example.com")
+        deleted_id = uuid4()
+
+        def delete_program() -> Generator[DatabaseEffect, EffectResult, EffectResult]:
+            yield DeleteUser(user_id=deleted_id)
+            return None
+
+        def register_program() -> Generator[DatabaseEffect, EffectResult, EffectResult]:
+            created = yield CreateUser(email=user.email, name=user.name, password_hash="h")
+            yield Transaction(program=delete_program())
+            return created
+
+        async def commit(effect: Transaction) -> Ok[EffectReturn[EffectResult]]:
+            cache.invalidate.assert_not_awaited()
+            return Ok(EffectReturn(value=_drive(effect.program, user), effect_name="Transaction"))
+
+        inner = mocker.AsyncMock(spec=EffectInterpreter)
+        inner.interpret.side_effect = commit
+        cache = mocker.AsyncMock(spec=ProfileCache)
+        interpreter = ReadThroughCacheInterpreter(inner=inner, cache=cache)
+
+        result = await interpreter.interpret(Transaction(program=register_program()))
+
+        assert result == Ok(EffectReturn(value=user, effect_name="Transaction"))
+        assert {call.args for call in cache.invalidate.await_args_list} == {
+            (f"db:user:{user.id}",),
+            (f"db:user:{deleted_id}",),
+        }
+
+    @pytest.mark.asyncio()
+    async def test_cache_failures_fall_back_to_inner(self, mocker: MockerFixture) -> None:
+        """A failing cache never fails the read; other effects pass straight through."""
+        user = User(id=uuid4(), name="Dan", email="dan@example.com")
+        inner = mocker.AsyncMock(spec=EffectInterpreter)
+        inner.interpret.return_value = Ok(EffectReturn(value=user, effect_name="GetUserById"))
+        cache = mocker.AsyncMock(spec=ProfileCache)
+        cache.get_value.side_effect = ConnectionError("down")
+        cache.put_value.side_effect = ConnectionError("down")
+        interpreter = ReadThroughCacheInterpreter(inner=inner, cache=cache, user_list=None)
+
+        result = await interpreter.interpret(GetUserById(user_id=user.id))
+        await interpreter.interpret(ListUsers())
+        await interpreter.interpret(SaveChatMessage(user_id=user.id, text="hi"))
+
+        assert result == Ok(EffectReturn(value=user, effect_name="GetUserById"))
+        assert inner.interpret.await_count == 3
+        assert cache.get_value.await_count == 1
@@ -0,0 +1,360 @@
+"""Tests for the message-processing worker.
+
+Tests MessageWorker with a mocked MessageConsumer and a mocked interpreter
+whose GetUserById results decide how each message is settled.
+"""
+
+import asyncio
+from collections.abc import Generator
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from pytest_mock import MockerFixture
+
+from effectful.adapters.in_memory_metrics import InMemoryMetricsCollector
+from effectful.algebraic.effect_return import EffectReturn
+from effectful.algebraic.result import Err, Ok, Result
+from effectful.domain.message_envelope import (
+    AcknowledgeSuccess,
+    ConsumeFailure,
+    MessageEnvelope,
+    NackSuccess,
+)
+from effectful.effects.base import Effect
+from effectful.effects.database import GetUserById
+from effectful.infrastructure.messaging import MessageConsumer
+from effectful.interpreters.base import EffectInterpreter
+from effectful.interpreters.errors import DatabaseError, InterpreterError
+from effectful.observability.framework_metrics import FRAMEWORK_METRICS
+from effectful.programs.message_worker import MessageWorker
+from effectful.programs.program_types import AllEffects, EffectResult
+
+_LOOKUP = GetUserById(user_id=uuid4())
+
+
+def _envelope(message_id: str, key: str = "") -> MessageEnvelope:
+    """Envelope whose payload is its ID."""
+    return MessageEnvelope(
+        message_id=message_id,
+        payload=message_id.encode(),
+        properties={"key": key},
+        publish_time=datetime.now(UTC),
+        topic="events",
+    )
+
+
+def _lookup(envelope: MessageEnvelope) -> Generator[AllEffects, EffectResult, str]:
+    """Handler program yielding one database effect."""
+    yield _LOOKUP
+    return envelope.message_id
+
+
+def _consumer(mocker: MockerFixture, *batches: tuple[MessageEnvelope, ...]) -> AsyncMock:
+    """Consumer returning batches in order, then empty batches."""
+    consumer: AsyncMock = mocker.AsyncMock(spec=MessageConsumer)
+    remaining = list(batches)
+
+    async def receive_batch(
+        subscription: str, max_messages: int, max_wait_ms: int
+    ) -> tuple[MessageEnvelope, ...]:
+        return remaining.pop(0) if remaining else ()
+
+    consumer.receive_batch.side_effect = receive_batch
+    consumer.acknowledge.side_effect = lambda message_id: AcknowledgeSuccess(message_id)
+    consumer.negative_acknowledge.side_effect = lambda message_id, delay_ms: NackSuccess(message_id)
+    return consumer
+
+
+class TestMessageWorker:
+    """Tests for MessageWorker."""
+
+    @pytest.mark.asyncio()
+    async def test_settles_each_message_from_program_outcome(self, mocker: MockerFixture) -> None:
+        """Ok acks, retryable errors and exceptions nack with delay, permanent errors nack."""
+        consumer = _consumer(mocker, tuple(_envelope(f"m{i}") for i in range(4)))
+        interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        interpreter.interpret.side_effect = [
+            Ok(EffectReturn(value=None, effect_name="GetUserById")),
+            Err(DatabaseError(effect=_LOOKUP, db_error="timeout", is_retryable=True)),
+            Err(DatabaseError(effect=_LOOKUP, db_error="syntax", is_retryable=False)),
+            RuntimeError("handler bug"),
+        ]
+        collector = InMemoryMetricsCollector()
+        await collector.register_metrics(FRAMEWORK_METRICS)
+        worker = MessageWorker(
+            consumer,
+            interpreter,
+            "events/worker",
+            _lookup,
+            retry_delay_ms=250,
+            metrics_collector=collector,
+        )
+
+        await worker.poll()
+        await worker.drain()
+
+        consumer.acknowledge.assert_awaited_once_with("m0")
+        assert [call.args for call in consumer.negative_acknowledge.await_args_list] == [
+            ("m1",),
+            ("m2",),
+            ("m3",),
+        ]
+        assert {c.kwargs["delay_ms"] for c in consumer.negative_acknowledge.await_args_list} == {
+            250
+        }
+        assert collector.counters["effectful_worker_messages_total"] == {
+            f"result={result},subscription=events/worker": 1.0
+            for result in ("ok", "retry", "failed", "error")
+        }
+        assert collector.gauges["effectful_worker_messages_in_flight"] == {
+            "subscription=events/worker": 0.0
+        }
+        assert (
+            "subscription=events/worker"
+            in collector.histograms["effectful_worker_message_lag_seconds"]
+        )
+
+    @pytest.mark.asyncio()
+    async def test_permanent_failures_can_be_acknowledged(self, mocker: MockerFixture) -> None:
+        """With ack_permanent_failures, non-retryable errors drop the message."""
+        consumer = _consumer(mocker, (_envelope("m0"),))
+        interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        interpreter.interpret.return_value = Err(
+            DatabaseError(effect=_LOOKUP, db_error="syntax", is_retryable=False)
+        )
+        worker = MessageWorker(
+            consumer, interpreter, "events/worker", _lookup, ack_permanent_failures=True
+        )
+
+        await worker.poll()
+        await worker.drain()
+
+        consumer.acknowledge.assert_awaited_once_with("m0")
+        consumer.negative_acknowledge.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_receives_only_as_many_messages_as_free_slots(
+        self, mocker: MockerFixture
+    ) -> None:
+        """At most concurrency programs run; batches never exceed free slots."""
+        consumer = _consumer(
+            mocker, (_envelope("m0"), _envelope("m1")), (_envelope("m2"),), (_envelope("m3"),)
+        )
+        release = asyncio.Event()
+        running = 0
+        peak = 0
+
+        async def interpret(effect: Effect) -> Result[EffectReturn[EffectResult], InterpreterError]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+            return Ok(EffectReturn(value=None, effect_name="GetUserById"))
+
+        interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        interpreter.interpret.side_effect = interpret
+        worker = MessageWorker(consumer, interpreter, "events/worker", _lookup, concurrency=3)
+
+        assert await worker.poll() == 2
+        assert await worker.poll() == 1
+        blocked = asyncio.create_task(worker.poll())
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        release.set()
+        assert await blocked == 1
+        await worker.drain()
+
+        assert peak == 3
+        assert [call.args[1] for call in consumer.receive_batch.await_args_list] == [3, 1, 3]
+        assert consumer.acknowledge.await_count == 4
+
+    @pytest.mark.asyncio()
+    async def test_ordering_key_serializes_messages_with_same_key(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Messages sharing a key run one at a time in receive order; other keys overlap."""
+        consumer = _consumer(
+            mocker, (_envelope("a1", key="a"), _envelope("b1", key="b"), _envelope("a2", key="a"))
+        )
+        events: list[str] = []
+
+        def handler(envelope: MessageEnvelope) -> Generator[AllEffects, EffectResult, None]:
+            events.append(f"start {envelope.message_id}")
+            yield _LOOKUP
+            events.append(f"end {envelope.message_id}")
+
+        async def interpret(effect: Effect) -> Result[EffectReturn[EffectResult], InterpreterError]:
+            await asyncio.sleep(0.01)
+            return Ok(EffectReturn(value=None, effect_name="GetUserById"))
+
+        interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        interpreter.interpret.side_effect = interpret
+        worker = MessageWorker(
+            consumer,
+            interpreter,
+            "events/worker",
+            handler,
+            ordering_key=lambda envelope: envelope.properties["key"],
+        )
+
+        await worker.poll()
+        await worker.drain()
+
+        assert events.index("end a1") < events.index("start a2")
+        assert events.index("start b1") < events.index("end a1")
+
+    @pytest.mark.asyncio()
+    async def test_ordering_key_retries_in_place_before_later_messages(
+        self, mocker: MockerFixture
+    ) -> None:
+        """A retryable failure is retried before the next message with its key starts."""
+        consumer = _consumer(mocker, (_envelope("a1", key="a"), _envelope("a2", key="a")))
+        events: list[str] = []
+
+        def handler(envelope: MessageEnvelope) -> Generator[AllEffects, EffectResult, None]:
+            events.append(f"start {envelope.message_id}")
+            yield _LOOKUP
+
+        interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        interpreter.interpret.side_effect = [
+            Err(DatabaseError(effect=_LOOKUP, db_error="timeout", is_retryable=True)),
+            RuntimeError("connection reset"),
+            Ok(EffectReturn(value=None, effect_name="GetUserById")),
+            Ok(EffectReturn(value=None, effect_name="GetUserById")),
+        ]
+        worker = MessageWorker(
+            consumer,
+            interpreter,
+            "events/worker",
+            handler,
+            retry_delay_ms=1,
+            ordering_key=lambda envelope: envelope.properties["key"],
+        )
+
+        await worker.poll()
+        await worker.drain()
+
+        assert events == ["start a1", "start a1", "start a1", "start a2"]
+        assert [call.args for call in consumer.acknowledge.await_args_list] == [("a1",), ("a2",)]
+        consumer.negative_acknowledge.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_stuck_key_does_not_starve_other_keys(self, mocker: MockerFixture) -> None:
+        """Messages queued behind a retrying key take no slot; other keys still run."""
+        consumer = _consumer(
+            mocker,
+            (_envelope("a1", key="a"), _envelope("a2", key="a")),
+            (_envelope("a3", key="a"), _envelope("b1", key="b")),
+        )
+        started: list[str] = []
+
+        def handler(envelope: MessageEnvelope) -> Generator[AllEffects, EffectResult, None]:
+            started.append(envelope.message_id)
+            yield _LOOKUP
+
+        async def interpret(effect: Effect) -> Result[EffectReturn[EffectResult], InterpreterError]:
+            if started[-1] == "b1":
+                return Ok(EffectReturn(value=None, effect_name="GetUserById"))
+            return Err(DatabaseError(effect=_LOOKUP, db_error="timeout", is_retryable=True))
+
+        interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        interpreter.interpret.side_effect = interpret
+        worker = MessageWorker(
+            consumer,
+            interpreter,
+            "events/worker",
+            handler,
+            concurrency=2,
+            retry_delay_ms=1,
+            ordering_key=lambda envelope: envelope.properties["key"],
+        )
+
+        assert await worker.poll() == 2
+        assert await asyncio.wait_for(worker.poll(), timeout=1) == 2
+        await asyncio.sleep(0.02)
+
+        consumer.acknowledge.assert_awaited_once_with("b1")
+        assert set(started) == {"a1", "b1"}
+        worker.stop()
+        await worker.drain()
+
+    @pytest.mark.asyncio()
+    async def test_stop_nacks_retrying_message_and_its_key_followers(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Once stopped, a retrying message and later messages with its key are nacked."""
+        consumer = _consumer(
+            mocker, (_envelope("a1", key="a"), _envelope("a2", key="a"), _envelope("b1", key="b"))
+        )
+        started: list[str] = []
+
+        def handler(envelope: MessageEnvelope) -> Generator[AllEffects, EffectResult, None]:
+            started.append(envelope.message_id)
+            yield _LOOKUP
+
+        async def interpret(effect: Effect) -> Result[EffectReturn[EffectResult], InterpreterError]:
+            if started[-1] == "b1":
+                return Ok(EffectReturn(value=None, effect_name="GetUserById"))
+            return Err(DatabaseError(effect=_LOOKUP, db_error="timeout", is_retryable=True))
+
+        interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        interpreter.interpret.side_effect = interpret
+        worker = MessageWorker(
+            consumer,
+            interpreter,
+            "events/worker",
+            handler,
+            retry_delay_ms=1,
+            ordering_key=lambda envelope: envelope.properties["key"],
+        )
+
+        await worker.poll()
+        await asyncio.sleep(0.02)
+        worker.stop()
+        await worker.drain()
+
+        assert "a2" not in started
+        consumer.acknowledge.assert_awaited_once_with("b1")
+        assert [call.args for call in consumer.negative_acknowledge.await_args_list] == [
+            ("a1",),
+            ("a2",),
+        ]
+
+    @pytest.mark.asyncio()
+    async def test_run_backs_off_on_failure_and_stops_after_draining(
+        self, mocker: MockerFixture
+    ) -> None:
+        """run() keeps polling through receive failures until stop() is called."""
+        consumer = mocker.AsyncMock(spec=MessageConsumer)
+        consumer.receive_batch.side_effect = [
+            ConsumeFailure(subscription="events/worker", reason="broker_unreachable"),
+            (_envelope("m0"),),
+        ] + [()] * 1000
+        interpreter = mocker.AsyncMock(spec=EffectInterpreter)
+        interpreter.interpret.return_value = Ok(EffectReturn(value=None, effect_name="GetUserById"))
+        worker = MessageWorker(consumer, interpreter, "events/worker", _lookup, max_wait_ms=1)
+
+        runner = asyncio.create_task(worker.run())
+        await asyncio.sleep(0.02)
+        worker.stop()
+        await asyncio.wait_for(runner, timeout=1)
+
+        consumer.acknowledge.assert_awaited_once_with("m0")
+
+    @pytest.mark.parametrize(("concurrency", "batch_size"), [(0, 1), (1, 0)])
+    def test_rejects_invalid_settings(
+        self, mocker: MockerFixture, concurrency: int, batch_size: int
+    ) -> None:
+        """concurrency and batch_size must be positive."""
+        with pytest.raises(ValueError):
+            MessageWorker(
+                mocker.AsyncMock(spec=MessageConsumer),
+                mocker.AsyncMock(spec=EffectInterpreter),
+                "events/worker",
+                _lookup,
+                concurrency=concurrency,
+                batch_size=batch_size,
+            )
@@ -227,7 +227,7 @@ class TestChatWorkflowIntegration:
             case Ok(outcome):
                 assert outcome == "db_hit"
                 mock_ws.send_text.assert_called_once_with("Hello Bob (from DB, cached)")
-                mock_cache.put_profile.assert_called_once_with(user_id, profile, 300)
+                mock_cache.put_profile.assert_called_once_with(user_id, profile, 300, ())
             case Err(error):
                 pytest.fail(f"Expected Ok('db_hit'), got Err({error})")
 